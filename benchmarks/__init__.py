@@ -0,0 +1,21 @@
+"""
+Performance benchmarks for the seleensim engine.
+
+Design Principles:
+- Scaling, not single points: each benchmark sweeps one dimension
+  (sites, runs, constraints, contention) so regressions show up as a
+  change in slope, not just a constant
+- Stdlib only: wall time from time.perf_counter, peak memory from
+  tracemalloc (which also tracks NumPy buffers); no extra dependencies
+- Baselines in the repo: results are compared against baseline.json
+  and the command exits non-zero on a regression
+
+Usage:
+    python -m benchmarks                      # quick suite vs. baseline
+    python -m benchmarks --suite full         # 10k sites, 100k runs
+    python -m benchmarks --filter engine.run  # subset by name
+    python -m benchmarks --save-baseline      # record a new baseline
+
+Baselines are machine-specific: record them on the machine that runs
+the release check (the baseline's metadata notes where it came from).
+"""
@@ -0,0 +1,61 @@
+"""
+Command-line entry point: python -m benchmarks [options].
+"""
+
+import argparse
+import os
+import sys
+
+from benchmarks.cases import SUITES, suite_cases
+from benchmarks.harness import compare, load_baseline, run_case, save_baseline
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--suite", choices=SUITES, default="quick")
+    parser.add_argument("--filter", default="", help="Only run cases whose key contains this")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Record results in the baseline instead of comparing")
+    parser.add_argument("--time-tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown (default 0.25 = 25%%)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25,
+                        help="Allowed relative peak-memory growth")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in suite_cases(args.suite) if args.filter in case.key]
+    baseline = load_baseline(args.baseline)
+
+    results = []
+    print(f"{'case':<72} {'seconds':>10} {'peak MiB':>9} {'events/s':>10} {'vs base':>8}")
+    for case in cases:
+        result = run_case(case)
+        results.append(result)
+        reference = baseline.get(result.key)
+        change = f"{result.seconds / reference.seconds:.2f}x" if reference else "new"
+        rate = f"{result.events_per_second:,.0f}" if result.events_per_second else "-"
+        print(
+            f"{result.key:<72} {result.seconds:>10.4f} "
+            f"{result.peak_memory_bytes / 2**20:>9.1f} {rate:>10} {change:>8}"
+        )
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\nRecorded {len(results)} results in {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
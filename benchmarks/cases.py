@@ -0,0 +1,482 @@
+"""
+Benchmark cases, grouped into suites.
+
+Each builder returns the cases of one benchmark across its scaling
+dimension. The quick suite is meant for every change; the full suite
+reaches 10k sites and 100k runs and takes several minutes.
+"""
+
+from typing import List
+
+import numpy as np
+
+from seleensim.constraints import (
+    BudgetThrottlingConstraint,
+    Constraint,
+    ConstraintResult,
+    LinearResponseCurve,
+    ResourceCapacityConstraint,
+    TemporalPrecedenceConstraint,
+    compose_constraint_results,
+)
+from seleensim.distributions import Bernoulli, Gamma, LogNormal, Triangular
+from seleensim.enrollment import simulate_enrollment
+from seleensim.entities import PatientFlow, Site, Trial
+from seleensim.output_schema import create_enhanced_output
+from seleensim.patient_flow import compile_flow, simulate_patient_flow
+from seleensim.scenarios import ScenarioProfile, apply_scenario, clear_scenario_cache
+from seleensim.scheduler import SCHEDULERS
+from seleensim.seeding import SeedPlan
+from seleensim.simulation import Event, SimulationEngine, SimulationState
+
+from benchmarks.harness import BenchmarkCase, quiet
+
+
+SUITES = ("quick", "full")
+
+
+def make_trial(num_sites: int) -> Trial:
+    """Trial with num_sites sites of staggered activation."""
+    return Trial(
+        trial_id=f"BENCH_{num_sites}",
+        target_enrollment=100,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:05d}",
+                activation_time=Triangular(30 + i % 50, 45 + i % 50, 90 + i % 50),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(num_sites)
+        ],
+        patient_flow=PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+    )
+
+
+class PassThroughConstraint(Constraint):
+    """Applies to every event and is always satisfied: pure evaluation overhead."""
+
+    def evaluate(self, state, event) -> ConstraintResult:
+        return ConstraintResult.satisfied("Pass-through")
+
+
+class StepDelayConstraint(Constraint):
+    """Delays every event by one day until day `until`: a reschedule storm."""
+
+    def __init__(self, until: float):
+        self.until = until
+
+    def evaluate(self, state, event) -> ConstraintResult:
+        if event.time < self.until:
+            return ConstraintResult.delayed_by(1.0, "Step delay")
+        return ConstraintResult.satisfied("Past step delay")
+
+
+def make_constraints(count: int) -> list:
+    """
+    count constraints: every other one is evaluated on every event
+    (PassThroughConstraint); the rest are built-in temporal, budget and
+    resource constraints that dispatch skips for site activations.
+    """
+    constraints = []
+    for i in range(count):
+        kind = i % 6
+        if kind % 2 == 0:
+            constraints.append(PassThroughConstraint())
+        elif kind == 1:
+            constraints.append(TemporalPrecedenceConstraint("site_activation", "enrollment"))
+        elif kind == 3:
+            constraints.append(BudgetThrottlingConstraint(10000.0, LinearResponseCurve(min_speed_ratio=0.5)))
+        else:
+            constraints.append(ResourceCapacityConstraint(f"RESOURCE_{i}"))
+    return constraints
+
+
+def _run_engine(inputs) -> int:
+    engine, trial, num_runs = inputs
+    results = engine.run(trial, num_runs=num_runs, retain_runs="none")
+    return int(round(results.mean_events_processed * num_runs))
+
+
+def distribution_cases(suite: str) -> List[BenchmarkCase]:
+    """Distribution.sample (per call) and sample_array (vectorized)."""
+    distributions = {
+        "triangular": Triangular(30, 45, 90),
+        "triangular_bounded": Triangular(30, 45, 90, bounds=(35, 80)),
+        "lognormal": LogNormal(50, 10),
+        "gamma": Gamma(2, 1.5),
+        "bernoulli": Bernoulli(0.15),
+    }
+    calls = 2000 if suite == "quick" else 20000
+    array_size = 10_000 if suite == "quick" else 100_000
+
+    def sample_calls(dist):
+        for seed in range(calls):
+            dist.sample(seed)
+
+    def sample_array(inputs):
+        dist, seeds = inputs
+        dist.sample_array(seeds)
+
+    cases = []
+    for name, dist in distributions.items():
+        cases.append(BenchmarkCase(
+            name="distribution.sample",
+            params={"distribution": name, "calls": calls},
+            setup=lambda dist=dist: dist,
+            body=sample_calls
+        ))
+        cases.append(BenchmarkCase(
+            name="distribution.sample_array",
+            params={"distribution": name, "size": array_size},
+            setup=lambda dist=dist: (dist, np.arange(array_size)),
+            body=sample_array
+        ))
+    return cases
+
+
+def engine_site_cases(suite: str) -> List[BenchmarkCase]:
+    """SimulationEngine.run scaling with the number of sites."""
+    sites = (10, 100, 1000) if suite == "quick" else (10, 100, 1000, 10000)
+    num_runs = 10
+    return [
+        BenchmarkCase(
+            name="engine.run/sites",
+            params={"sites": n, "runs": num_runs},
+            setup=lambda n=n: (SimulationEngine(master_seed=42), make_trial(n), num_runs),
+            body=_run_engine,
+            repeat=3 if n < 10000 else 1
+        )
+        for n in sites
+    ]
+
+
+def engine_run_cases(suite: str) -> List[BenchmarkCase]:
+    """SimulationEngine.run scaling with the number of runs."""
+    runs = (100, 1000) if suite == "quick" else (100, 1000, 10000, 100000)
+    return [
+        BenchmarkCase(
+            name="engine.run/runs",
+            params={"sites": 10, "runs": n},
+            setup=lambda n=n: (SimulationEngine(master_seed=42), make_trial(10), n),
+            body=_run_engine,
+            repeat=3 if n < 10000 else 1
+        )
+        for n in runs
+    ]
+
+
+def engine_constraint_cases(suite: str) -> List[BenchmarkCase]:
+    """SimulationEngine.run scaling with the number of constraints."""
+    counts = (0, 3, 12) if suite == "quick" else (0, 3, 12, 48)
+    return [
+        BenchmarkCase(
+            name="engine.run/constraints",
+            params={"constraints": k, "sites": 100, "runs": 50},
+            setup=lambda k=k: (
+                SimulationEngine(master_seed=42, constraints=make_constraints(k)), make_trial(100), 50
+            ),
+            body=_run_engine
+        )
+        for k in counts
+    ]
+
+
+def engine_reschedule_cases(suite: str) -> List[BenchmarkCase]:
+    """SimulationEngine.run under reschedule storms (events delayed day by day)."""
+    horizons = (200, 500) if suite == "quick" else (200, 500, 1000, 2000)
+    return [
+        BenchmarkCase(
+            name="engine.run/reschedules",
+            params={"until_day": until, "sites": 100, "runs": 5},
+            setup=lambda until=until: (
+                SimulationEngine(master_seed=42, constraints=[StepDelayConstraint(until)]),
+                make_trial(100), 5
+            ),
+            body=_run_engine
+        )
+        for until in horizons
+    ]
+
+
+def contention_cases(suite: str) -> List[BenchmarkCase]:
+    """
+    Resource contention: queueing allocations on one resource.
+
+    Each allocation asks when the resource is next free and books it
+    from then, the access pattern of ResourceCapacityConstraint under
+    load. Fewer units means longer queues.
+    """
+    allocations = (1000, 10000) if suite == "quick" else (1000, 10000, 100000)
+
+    def body(inputs):
+        capacity, starts, durations = inputs
+        state = SimulationState(initial_budget=float('inf'), resource_capacities={"R": capacity})
+        for i, (start, duration) in enumerate(zip(starts, durations)):
+            available = state.get_resource_availability("R", start)
+            begin = start if available is None else available
+            state.allocate_resource("R", begin, begin + duration, f"E{i}")
+
+    cases = []
+    for n in allocations:
+        for capacity in (1, 8):
+            def setup(n=n, capacity=capacity):
+                rng = np.random.default_rng(0)
+                starts = np.sort(rng.uniform(0, n, size=n)).tolist()
+                durations = rng.uniform(0.5, 4.0, size=n).tolist()
+                return capacity, starts, durations
+            cases.append(BenchmarkCase(
+                name="resource.contention",
+                params={"allocations": n, "capacity": capacity},
+                setup=setup,
+                body=body
+            ))
+    return cases
+
+
+def scheduler_cases(suite: str) -> List[BenchmarkCase]:
+    """
+    Scheduler hold model: fill the queue, then pop the earliest event and
+    reschedule it 1-30 days later, once per pending event, then drain.
+
+    Event times are whole days over two years, the dense day-granularity
+    pattern of enrollment and visit events. Compare schedulers at equal
+    pending counts to find the crossover.
+    """
+    pending = (1000, 10000, 100000) if suite == "quick" else (1000, 10000, 100000, 300000)
+
+    def setup(scheduler, n):
+        rng = np.random.default_rng(0)
+        events = [
+            Event(f"E{i}", "visit", "SITE", time)
+            for i, time in enumerate(rng.integers(0, 730, size=n).astype(float).tolist())
+        ]
+        delays = rng.integers(1, 31, size=n).astype(float).tolist()
+        return SCHEDULERS[scheduler], events, delays
+
+    def body(inputs):
+        factory, events, delays = inputs
+        queue = factory()
+        for event in events:
+            queue.push(event)
+        for delay in delays:
+            event = queue.pop()
+            queue.reschedule(event, event.time + delay)
+        while queue:
+            queue.pop()
+
+    return [
+        BenchmarkCase(
+            name="scheduler.hold",
+            params={"scheduler": scheduler, "pending": n},
+            setup=lambda scheduler=scheduler, n=n: setup(scheduler, n),
+            body=body,
+            repeat=3 if n < 300000 else 1
+        )
+        for n in pending
+        for scheduler in SCHEDULERS
+    ]
+
+
+def enrollment_cases(suite: str) -> List[BenchmarkCase]:
+    """simulate_enrollment to a 2,000-patient target, scaling with sites."""
+    sites = (10, 100, 1000) if suite == "quick" else (10, 100, 1000, 10000)
+    num_runs = 100
+    target = 2000
+
+    def setup(n):
+        base = make_trial(n)
+        trial = Trial(base.trial_id, target, base.sites, base.patient_flow)
+        activation = 30.0 + np.arange(n) % 50
+        return trial, activation, SeedPlan.for_trial(42, trial)
+
+    def body(inputs):
+        trial, activation, plan = inputs
+        for run_id in range(num_runs):
+            simulate_enrollment(trial, activation, 730.0, plan, run_id)
+
+    return [
+        BenchmarkCase(
+            name="enrollment.simulate",
+            params={"sites": n, "target": target, "runs": num_runs},
+            setup=lambda n=n: setup(n),
+            body=body
+        )
+        for n in sites
+    ]
+
+
+def patient_flow_cases(suite: str) -> List[BenchmarkCase]:
+    """simulate_patient_flow through screening, treatment and dropout branches."""
+    patients = (2000, 20000) if suite == "quick" else (2000, 20000, 200000)
+    num_runs = 100
+
+    def setup(n):
+        base = make_trial(1)
+        flow = PatientFlow(
+            flow_id="BRANCHING_FLOW",
+            states={"enrolled", "screening", "treatment", "completed", "dropout"},
+            initial_state="enrolled",
+            terminal_states={"completed", "dropout"},
+            transition_times={
+                ("enrolled", "screening"): Triangular(3, 7, 14),
+                ("screening", "treatment"): Triangular(1, 3, 7),
+                ("screening", "dropout"): Triangular(1, 2, 5),
+                ("treatment", "completed"): LogNormal(180, 0.25),
+                ("treatment", "dropout"): LogNormal(90, 0.4)
+            },
+            transition_probabilities={
+                ("screening", "treatment"): Bernoulli(0.85),
+                ("screening", "dropout"): Bernoulli(0.15),
+                ("treatment", "completed"): Bernoulli(0.8),
+                ("treatment", "dropout"): Bernoulli(0.2)
+            }
+        )
+        trial = Trial(base.trial_id, n, base.sites, flow)
+        entry = np.linspace(30.0, 400.0, n)
+        return trial, entry, SeedPlan.for_trial(42, trial), compile_flow(flow)
+
+    def body(inputs):
+        trial, entry, plan, table = inputs
+        for run_id in range(num_runs):
+            simulate_patient_flow(trial, entry, 730.0, plan, run_id, table=table)
+
+    return [
+        BenchmarkCase(
+            name="patient_flow.simulate",
+            params={"patients": n, "runs": num_runs},
+            setup=lambda n=n: setup(n),
+            body=body,
+            repeat=3 if n < 200000 else 1
+        )
+        for n in patients
+    ]
+
+
+def scenario_cases(suite: str) -> List[BenchmarkCase]:
+    """apply_scenario on cold caches, scaling with trial size."""
+    sites = (10, 100, 1000) if suite == "quick" else (10, 100, 1000, 10000)
+    num_scenarios = 50
+
+    def body(inputs):
+        trial, scenarios = inputs
+        clear_scenario_cache()
+        for scenario in scenarios:
+            apply_scenario(trial, scenario)
+
+    def setup(n):
+        scenarios = [
+            ScenarioProfile(
+                scenario_id=f"DELAY_{j}",
+                description="Delay one site",
+                version="1.0.0",
+                site_overrides={
+                    f"SITE_{j % n:05d}": {
+                        "activation_time": {
+                            "type": "distribution_scale",
+                            "parameters": {"scale_factor": 1.0 + j / 100}
+                        }
+                    }
+                }
+            )
+            for j in range(num_scenarios)
+        ]
+        return make_trial(n), scenarios
+
+    return [
+        BenchmarkCase(
+            name="scenarios.apply_scenario",
+            params={"sites": n, "scenarios": num_scenarios},
+            setup=lambda n=n: setup(n),
+            body=body
+        )
+        for n in sites
+    ]
+
+
+def composition_cases(suite: str) -> List[BenchmarkCase]:
+    """compose_constraint_results scaling with results per event."""
+    counts = (1, 10, 100)
+    compositions = 1000 if suite == "quick" else 10000
+
+    def setup(k):
+        results = []
+        for i in range(k):
+            kind = i % 4
+            if kind == 0:
+                results.append(ConstraintResult.satisfied())
+            elif kind == 1:
+                results.append(ConstraintResult.delayed_by(float(i), f"Delay {i}"))
+            elif kind == 2:
+                results.append(ConstraintResult.modified({"duration": float(i)}, f"Modified {i}"))
+            else:
+                results.append(ConstraintResult.invalid_until(float(i), f"Blocked {i}"))
+        return results
+
+    def body(results):
+        for _ in range(compositions):
+            compose_constraint_results(results)
+
+    return [
+        BenchmarkCase(
+            name="constraints.compose_results",
+            params={"results": k, "compositions": compositions},
+            setup=lambda k=k: setup(k),
+            body=body
+        )
+        for k in counts
+    ]
+
+
+def output_cases(suite: str) -> List[BenchmarkCase]:
+    """create_enhanced_output scaling with the number of runs."""
+    runs = (100, 1000) if suite == "quick" else (100, 1000, 10000)
+
+    def setup(n):
+        trial = make_trial(10)
+        with quiet():
+            results = SimulationEngine(master_seed=42).run(trial, num_runs=n)
+        return trial, results
+
+    def body(inputs):
+        trial, results = inputs
+        create_enhanced_output("BENCH", trial, None, None, results.run_results, 42, 0.0, results=results)
+
+    return [
+        BenchmarkCase(
+            name="output.create_enhanced_output",
+            params={"runs": n},
+            setup=lambda n=n: setup(n),
+            body=body
+        )
+        for n in runs
+    ]
+
+
+BUILDERS = (
+    distribution_cases,
+    engine_site_cases,
+    engine_run_cases,
+    engine_constraint_cases,
+    engine_reschedule_cases,
+    scheduler_cases,
+    enrollment_cases,
+    patient_flow_cases,
+    contention_cases,
+    scenario_cases,
+    composition_cases,
+    output_cases,
+)
+
+
+def suite_cases(suite: str) -> List[BenchmarkCase]:
+    """All cases of a suite."""
+    if suite not in SUITES:
+        raise ValueError(f"suite must be one of {SUITES}, got {suite!r}")
+    return [case for builder in BUILDERS for case in builder(suite)]
@@ -0,0 +1,197 @@
+"""
+Benchmark timing, memory measurement and baseline comparison.
+"""
+
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import gc
+import json
+import math
+import os
+import platform
+import time
+import tracemalloc
+
+import numpy as np
+
+
+# Differences below these are noise, whatever the relative change
+MIN_TIME_DELTA_SECONDS = 0.005
+MIN_MEMORY_DELTA_BYTES = 1 << 20
+
+# Short bodies are looped until one timing sample lasts at least this long
+MIN_SAMPLE_SECONDS = 0.1
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    One benchmark at one point of its scaling dimension.
+
+    setup() builds the inputs (not timed); body(inputs) is the timed
+    work and may return the number of simulation events it processed.
+    """
+    name: str
+    params: Dict[str, Any]
+    setup: Callable[[], Any]
+    body: Callable[[Any], Optional[int]]
+    repeat: int = 3
+
+    @property
+    def key(self) -> str:
+        args = ",".join(f"{k}={v}" for k, v in self.params.items())
+        return f"{self.name}[{args}]"
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one case: best wall time, peak traced memory, event rate."""
+    key: str
+    name: str
+    params: Dict[str, Any]
+    seconds: float
+    peak_memory_bytes: int
+    events_per_second: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "BenchmarkResult":
+        return BenchmarkResult(**data)
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline allows."""
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+    def __str__(self) -> str:
+        return f"{self.key}: {self.metric} {self.baseline:.4g} → {self.current:.4g} ({self.ratio:.2f}x)"
+
+
+@contextmanager
+def quiet():
+    """Silence engine progress output while measuring."""
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        yield
+
+
+def run_case(case: BenchmarkCase) -> BenchmarkResult:
+    """
+    Measure one case.
+
+    Wall time per body call is the best of case.repeat samples; like
+    timeit, short bodies are called several times per sample and the
+    garbage collector is paused while timing. Peak memory is measured
+    in a separate call under tracemalloc, which would otherwise distort
+    the timings.
+    """
+    inputs = case.setup()
+
+    with quiet():
+        start = time.perf_counter()
+        events = case.body(inputs)
+        first = time.perf_counter() - start
+    number = max(1, math.ceil(MIN_SAMPLE_SECONDS / first)) if first > 0 else 1
+
+    best = first
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(case.repeat):
+            with quiet():
+                start = time.perf_counter()
+                for _ in range(number):
+                    case.body(inputs)
+                best = min(best, (time.perf_counter() - start) / number)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        with quiet():
+            case.body(inputs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        key=case.key,
+        name=case.name,
+        params=case.params,
+        seconds=best,
+        peak_memory_bytes=peak,
+        events_per_second=events / best if events is not None and best > 0 else None
+    )
+
+
+def compare(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    time_tolerance: float = 0.25,
+    memory_tolerance: float = 0.25
+) -> List[Regression]:
+    """
+    Regressions of results against a baseline.
+
+    A metric regresses if it exceeds the baseline by more than the
+    relative tolerance and by more than the noise floor
+    (MIN_TIME_DELTA_SECONDS, MIN_MEMORY_DELTA_BYTES). Cases missing
+    from the baseline are not compared.
+    """
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.key)
+        if reference is None:
+            continue
+        if (result.seconds > reference.seconds * (1 + time_tolerance)
+                and result.seconds - reference.seconds > MIN_TIME_DELTA_SECONDS):
+            regressions.append(Regression(result.key, "seconds", reference.seconds, result.seconds))
+        if (result.peak_memory_bytes > reference.peak_memory_bytes * (1 + memory_tolerance)
+                and result.peak_memory_bytes - reference.peak_memory_bytes > MIN_MEMORY_DELTA_BYTES):
+            regressions.append(Regression(
+                result.key, "peak_memory_bytes",
+                reference.peak_memory_bytes, result.peak_memory_bytes
+            ))
+    return regressions
+
+
+def environment() -> Dict[str, Any]:
+    """Where a baseline was recorded."""
+    return {
+        "recorded_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    """Baseline results by case key ({} if the file does not exist)."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r") as f:
+        data = json.load(f)
+    return {key: BenchmarkResult.from_dict(entry) for key, entry in data["results"].items()}
+
+
+def save_baseline(path: str, results: List[BenchmarkResult]):
+    """Record results in the baseline file, keeping entries for other cases."""
+    entries = {key: result.to_dict() for key, result in load_baseline(path).items()}
+    entries.update({result.key: result.to_dict() for result in results})
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": entries}, f, indent=2, sort_keys=True)
+        f.write("\n")
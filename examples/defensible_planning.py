@@ -81,7 +81,8 @@ def run_simulation_with_enhanced_output():
         constraints=None,
         run_results=results.run_results,
         master_seed=42,
-        execution_duration=execution_duration
+        execution_duration=execution_duration,
+        results=results
     )
 
     print(f"\nSimulation complete:")
@@ -273,7 +274,8 @@ def demonstrate_scenario_comparison(base_output):
         constraints=None,
         run_results=delayed_results.run_results,
         master_seed=42,
-        execution_duration=execution_duration
+        execution_duration=execution_duration,
+        results=delayed_results
     )
 
     # Compare
@@ -0,0 +1,651 @@
+"""
+Streaming, memory-bounded aggregation of simulation runs.
+
+Design Principles:
+- Memory flat in the number of runs (sketches + bounded retention)
+- Mergeable: partial aggregates combine into the aggregate of the union
+- Order-independent: merging in any order gives identical results,
+  so serial, parallel and sharded executions agree exactly
+- Deterministic: no hidden randomness in sketching or retention
+
+Sketch choice:
+    Quantiles use a logarithmic-bucket sketch (DDSketch). Each value maps
+    to a bucket whose width is proportional to its magnitude, giving a
+    guaranteed relative accuracy. Unlike t-digest or KLL, merging two
+    sketches is plain bucket-count addition, which is exactly associative
+    and commutative. That is what keeps sharded results identical to a
+    single-node run.
+"""
+
+from dataclasses import dataclass, field
+from fractions import Fraction
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional, Tuple
+import heapq
+import math
+
+
+# Per-run metrics tracked by StreamingAggregator (RunResult attribute names)
+AGGREGATED_METRICS = (
+    "completion_time",
+    "total_cost",
+    "events_processed",
+    "events_rescheduled",
+    "constraint_violations",
+)
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with relative-accuracy guarantee.
+
+    Any quantile estimate x' of a true quantile x satisfies
+    |x' - x| <= relative_accuracy * |x|. Count, min, max, mean and std
+    are tracked exactly (sums are kept as exact rationals so that merge
+    order cannot change the last bits).
+
+    Infinite values (e.g. the completion time of a run whose events were
+    rescheduled to inf by an unsatisfiable constraint) are counted and
+    ranked exactly, as np.percentile ranks them. NaN values have no rank;
+    they are counted in nan_count and left out of every statistic.
+
+    Example:
+        sketch = QuantileSketch()
+        for t in completion_times:
+            sketch.add(t)
+        sketch.percentile(90)  # within 1% of np.percentile(completion_times, 90)
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Initialize empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+                               (0 < relative_accuracy < 1).
+
+        Raises:
+            ValueError: If relative_accuracy is out of range.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(
+                f"relative_accuracy must be in (0, 1), got {relative_accuracy}"
+            )
+
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._inv_log_gamma = 1.0 / math.log(self._gamma)
+
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero_count = 0
+        self._positive_inf_count = 0
+        self._negative_inf_count = 0
+        self.nan_count = 0
+
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._sum = Fraction(0)
+        self._sum_sq = Fraction(0)
+
+    @property
+    def infinite_count(self) -> int:
+        """Observations that were +inf or -inf."""
+        return self._positive_inf_count + self._negative_inf_count
+
+    def add(self, value: float):
+        """Add one observation (NaN is only counted, see nan_count)."""
+        if math.isnan(value):
+            self.nan_count += 1
+            return
+
+        if math.isinf(value):
+            if value > 0:
+                self._positive_inf_count += 1
+            else:
+                self._negative_inf_count += 1
+        elif value > 0:
+            key = self._key(value)
+            self._positive[key] = self._positive.get(key, 0) + 1
+        elif value < 0:
+            key = self._key(-value)
+            self._negative[key] = self._negative.get(key, 0) + 1
+        else:
+            self._zero_count += 1
+
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if math.isinf(value):
+            return
+        exact = Fraction(value)
+        self._sum += exact
+        self._sum_sq += exact * exact
+
+    def merge(self, other: "QuantileSketch"):
+        """
+        Merge another sketch into this one (in place).
+
+        Raises:
+            ValueError: If sketches use different relative accuracy.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"Cannot merge sketches with different relative_accuracy "
+                f"({self.relative_accuracy} vs {other.relative_accuracy})"
+            )
+
+        for key, n in other._positive.items():
+            self._positive[key] = self._positive.get(key, 0) + n
+        for key, n in other._negative.items():
+            self._negative[key] = self._negative.get(key, 0) + n
+        self._zero_count += other._zero_count
+        self._positive_inf_count += other._positive_inf_count
+        self._negative_inf_count += other._negative_inf_count
+        self.nan_count += other.nan_count
+
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._sum += other._sum
+        self._sum_sq += other._sum_sq
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the q-th quantile (q in [0, 1]).
+
+        Uses the same rank convention as np.percentile's default (linear
+        interpolation between order statistics), so results are directly
+        comparable with exact aggregation.
+
+        Raises:
+            ValueError: If q not in [0, 1] or sketch is empty.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"quantile must be in [0, 1], got {q}")
+        if self.count == 0:
+            raise ValueError("Cannot compute quantile of empty sketch")
+
+        rank = q * (self.count - 1)
+        lower_rank = math.floor(rank)
+        upper_rank = math.ceil(rank)
+
+        lower = self._value_at_rank(lower_rank)
+        if upper_rank == lower_rank:
+            return lower
+        upper = self._value_at_rank(upper_rank)
+        return lower + (upper - lower) * (rank - lower_rank)
+
+    def percentile(self, p: float) -> float:
+        """Estimate the p-th percentile (p in [0, 100])."""
+        if not 0 <= p <= 100:
+            raise ValueError(f"percentile must be in [0, 100], got {p}")
+        return self.quantile(p / 100)
+
+    def percentile_interval(self, p: float, confidence: float = 0.95) -> Tuple[float, float]:
+        """
+        Confidence interval for the true p-th percentile.
+
+        Order-statistic interval (see order_statistic_ranks), widened by
+        the sketch's relative accuracy so that bucket rounding can never
+        make the interval look tighter than it is.
+        """
+        if self.count == 0:
+            raise ValueError("Cannot compute interval of empty sketch")
+        lower_rank, upper_rank = order_statistic_ranks(self.count, p, confidence)
+        lower = self._value_at_rank(lower_rank)
+        upper = self._value_at_rank(upper_rank)
+        a = self.relative_accuracy
+        if math.isfinite(lower):
+            lower = self._clamp(lower - a * abs(lower))
+        if math.isfinite(upper):
+            upper = self._clamp(upper + a * abs(upper))
+        return lower, upper
+
+    def mean(self) -> float:
+        """Exact mean of all observations (inf or nan if any were infinite, as np.mean)."""
+        if self.count == 0:
+            raise ValueError("Cannot compute mean of empty sketch")
+        if self.infinite_count:
+            return self._infinite_mean()
+        return float(self._sum / self.count)
+
+    def std(self) -> float:
+        """Exact population standard deviation (matches np.std default)."""
+        if self.count == 0:
+            raise ValueError("Cannot compute std of empty sketch")
+        if self.infinite_count:
+            return math.nan
+        mean = self._sum / self.count
+        variance = self._sum_sq / self.count - mean * mean
+        return math.sqrt(max(0.0, float(variance)))
+
+    def _infinite_mean(self) -> float:
+        if self._positive_inf_count and self._negative_inf_count:
+            return math.nan
+        return math.inf if self._positive_inf_count else -math.inf
+
+    def _key(self, magnitude: float) -> int:
+        """Bucket index for a positive magnitude."""
+        return math.ceil(math.log(magnitude) * self._inv_log_gamma)
+
+    def _bucket_value(self, key: int) -> float:
+        """Representative value of a bucket (minimizes relative error)."""
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def _value_at_rank(self, rank: int) -> float:
+        """Value of the rank-th order statistic (0-based), clamped to [min, max]."""
+        if rank <= 0:
+            return self.min
+        if rank >= self.count - 1:
+            return self.max
+
+        seen = self._negative_inf_count
+        if seen > rank:
+            return -math.inf
+        # Negative values: largest magnitude first
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._clamp(-self._bucket_value(key))
+
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._clamp(self._bucket_value(key))
+
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(self.max, max(self.min, value))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, QuantileSketch):
+            return NotImplemented
+        return (
+            self.relative_accuracy == other.relative_accuracy
+            and self.count == other.count
+            and self._positive == other._positive
+            and self._negative == other._negative
+            and self._zero_count == other._zero_count
+            and self._positive_inf_count == other._positive_inf_count
+            and self._negative_inf_count == other._negative_inf_count
+            and self.nan_count == other.nan_count
+            and self.min == other.min
+            and self.max == other.max
+            and self._sum == other._sum
+            and self._sum_sq == other._sum_sq
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"QuantileSketch(count={self.count}, "
+            f"relative_accuracy={self.relative_accuracy}, "
+            f"buckets={len(self._positive) + len(self._negative)})"
+        )
+
+
+class RetentionPolicy:
+    """
+    Decides which full RunResults (with timelines) are kept in memory.
+
+    Policies:
+        "all"          Keep every run (exact aggregation, unbounded memory)
+        "none"         Keep no runs (sketches only)
+        "sample:k"     Keep a deterministic pseudo-random sample of k runs
+        "extremes:k"   Keep the k fastest and k slowest runs by completion time
+
+    All policies are order-independent and mergeable: the runs retained
+    from merged partial policies equal those retained by one policy that
+    saw every run.
+    """
+
+    MODES = ("all", "none", "sample", "extremes")
+
+    def __init__(self, spec: str = "all"):
+        """
+        Parse retention specification.
+
+        Args:
+            spec: One of "all", "none", "sample:k", "extremes:k" (k >= 1)
+
+        Raises:
+            ValueError: If spec is malformed.
+        """
+        mode, _, arg = spec.partition(":")
+        if mode not in self.MODES:
+            raise ValueError(
+                f"retain_runs must be one of 'all', 'none', 'sample:k', 'extremes:k', got {spec!r}"
+            )
+
+        k = None
+        if mode in ("sample", "extremes"):
+            try:
+                k = int(arg)
+            except ValueError:
+                raise ValueError(f"retain_runs {spec!r} requires an integer k") from None
+            if k < 1:
+                raise ValueError(f"retain_runs k must be >= 1, got {k}")
+        elif arg:
+            raise ValueError(f"retain_runs {mode!r} takes no argument, got {spec!r}")
+
+        self.spec = spec
+        self.mode = mode
+        self.k = k
+
+        self._runs: Dict[int, Any] = {}
+        # Bounded heaps of (key, tie_break, run_id); heap[0] is the next to evict
+        self._sample_heap: List[Tuple[int, int, int]] = []
+        self._fast_heap: List[Tuple[float, int, int]] = []
+        self._slow_heap: List[Tuple[float, int, int]] = []
+        # run_id -> number of heaps holding it
+        self._holds: Dict[int, int] = {}
+
+    def offer(self, run: Any):
+        """Consider a run for retention."""
+        if self.mode == "none":
+            return
+        if self.mode == "all":
+            self._runs[run.run_id] = run
+            return
+
+        run_id = run.run_id
+        if self.mode == "sample":
+            self._push(self._sample_heap, (-_run_priority(run_id), -run_id, run_id))
+        else:
+            self._push(self._fast_heap, (-run.completion_time, -run_id, run_id))
+            self._push(self._slow_heap, (run.completion_time, run_id, run_id))
+
+        if run_id in self._holds:
+            self._runs[run_id] = run
+
+    def merge(self, other: "RetentionPolicy"):
+        """Merge runs retained by another policy with the same spec."""
+        if other.spec != self.spec:
+            raise ValueError(
+                f"Cannot merge retention policies {self.spec!r} and {other.spec!r}"
+            )
+        for run in other._runs.values():
+            self.offer(run)
+
+    def retained(self) -> List[Any]:
+        """Retained runs in run_id order."""
+        return [self._runs[run_id] for run_id in sorted(self._runs)]
+
+    def _push(self, heap: List[tuple], item: tuple):
+        """Insert item into a bounded heap, evicting the worst entry if full."""
+        if len(heap) < self.k:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            evicted = heapq.heapreplace(heap, item)[2]
+            self._release(evicted)
+        else:
+            return
+        self._holds[item[2]] = self._holds.get(item[2], 0) + 1
+
+    def _release(self, run_id: int):
+        remaining = self._holds[run_id] - 1
+        if remaining:
+            self._holds[run_id] = remaining
+        else:
+            del self._holds[run_id]
+            self._runs.pop(run_id, None)
+
+
+def _run_priority(run_id: int) -> int:
+    """
+    Deterministic pseudo-random priority for run sampling (SplitMix64 finalizer).
+
+    Bottom-k by priority is a uniform sample that does not depend on the
+    order runs arrive in.
+    """
+    mask = (1 << 64) - 1
+    z = (run_id + 0x9E3779B97F4A7C15) & mask
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+    return z ^ (z >> 31)
+
+
+class StreamingAggregator:
+    """
+    Accumulates run outcomes into sketches as each run finishes.
+
+    Tracks a QuantileSketch per metric in AGGREGATED_METRICS and hands full
+    RunResults to a RetentionPolicy, so memory depends on the policy, not
+    on the number of runs.
+
+    Aggregators are mergeable: shards of runs can be aggregated separately
+    (in other processes or on other machines) and merged afterwards with
+    results identical to aggregating every run in one place.
+    """
+
+    def __init__(self, retain_runs: str = "all", relative_accuracy: float = 0.01):
+        """
+        Initialize empty aggregator.
+
+        Args:
+            retain_runs: Retention policy spec (see RetentionPolicy)
+            relative_accuracy: Quantile sketch accuracy
+        """
+        self.retention = RetentionPolicy(retain_runs)
+        self.relative_accuracy = relative_accuracy
+        self.sketches: Dict[str, QuantileSketch] = {
+            metric: QuantileSketch(relative_accuracy) for metric in AGGREGATED_METRICS
+        }
+        self.num_runs = 0
+
+    @property
+    def retain_runs(self) -> str:
+        return self.retention.spec
+
+    def add(self, run: Any):
+        """Fold one RunResult into the aggregate."""
+        for metric, sketch in self.sketches.items():
+            sketch.add(getattr(run, metric))
+        self.num_runs += 1
+        self.retention.offer(run)
+
+    def merge(self, other: "StreamingAggregator"):
+        """Merge another aggregator into this one (in place)."""
+        for metric, sketch in self.sketches.items():
+            sketch.merge(other.sketches[metric])
+        self.num_runs += other.num_runs
+        self.retention.merge(other.retention)
+
+    def retained_runs(self) -> List[Any]:
+        """Retained RunResults in run_id order."""
+        return self.retention.retained()
+
+    def sketch_snapshot(self) -> "StreamingAggregator":
+        """
+        Copy of the sketches alone (retain_runs="none").
+
+        Costs O(sketch size) regardless of the number of runs, so it suits
+        frequent interim estimates while this aggregator keeps growing.
+        """
+        snapshot = StreamingAggregator("none", self.relative_accuracy)
+        for metric, sketch in self.sketches.items():
+            snapshot.sketches[metric].merge(sketch)
+        snapshot.num_runs = self.num_runs
+        return snapshot
+
+    def percentile(self, metric: str, p: float) -> float:
+        """Sketch estimate of a metric percentile."""
+        return self.sketches[metric].percentile(p)
+
+    def mean(self, metric: str) -> float:
+        """Exact mean of a metric."""
+        return self.sketches[metric].mean()
+
+    def percentile_interval(
+        self, metric: str, p: float, confidence: float = 0.95
+    ) -> Tuple[float, float]:
+        """
+        Confidence interval for a metric percentile.
+
+        Exact order statistics when every run is retained, otherwise the
+        (conservatively widened) sketch interval.
+        """
+        if self.retain_runs == "all":
+            values = sorted(getattr(run, metric) for run in self.retained_runs())
+            if not values:
+                raise ValueError("Cannot compute interval of empty aggregate")
+            lower_rank, upper_rank = order_statistic_ranks(len(values), p, confidence)
+            return float(values[lower_rank]), float(values[upper_rank])
+        return self.sketches[metric].percentile_interval(p, confidence)
+
+
+def order_statistic_ranks(n: int, p: float, confidence: float = 0.95) -> Tuple[int, int]:
+    """
+    0-based ranks of the order statistics bracketing the p-th percentile.
+
+    Distribution-free: the number of observations below the true
+    percentile is Binomial(n, p/100), so [x(lower), x(upper)] covers it
+    with (approximately) the requested confidence whatever the shape of
+    the outcome distribution. Uses the normal approximation to the
+    binomial, rounded outward.
+
+    Raises:
+        ValueError: If n < 1, p not in [0, 100] or confidence not in (0, 1)
+    """
+    if n < 1:
+        raise ValueError(f"n must be >= 1, got {n}")
+    if not 0 <= p <= 100:
+        raise ValueError(f"percentile must be in [0, 100], got {p}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+
+    q = p / 100
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    spread = z * math.sqrt(n * q * (1 - q))
+    # 1-based ranks floor(nq - spread) and ceil(nq + spread) + 1, made 0-based
+    lower = math.floor(n * q - spread) - 1
+    upper = math.ceil(n * q + spread)
+    return max(0, lower), min(n - 1, upper)
+
+
+@dataclass
+class PercentileInterval:
+    """Confidence interval for one percentile of one metric."""
+    metric: str
+    percentile: float
+    estimate: float
+    lower: float
+    upper: float
+
+    @property
+    def half_width(self) -> float:
+        return (self.upper - self.lower) / 2
+
+    @property
+    def relative_half_width(self) -> float:
+        """Half-width as a fraction of |estimate| (inf if estimate is 0 and interval is not)."""
+        if self.estimate == 0:
+            return 0.0 if self.half_width == 0 else math.inf
+        return self.half_width / abs(self.estimate)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "metric": self.metric,
+            "percentile": self.percentile,
+            "estimate": self.estimate,
+            "lower": self.lower,
+            "upper": self.upper,
+            "half_width": self.half_width,
+            "relative_half_width": self.relative_half_width,
+        }
+
+
+@dataclass
+class PrecisionReport:
+    """
+    Achieved precision of percentile estimates.
+
+    target_half_width and converged are set by adaptive runs
+    (SimulationEngine.run_adaptive); fixed-size runs report the
+    intervals only.
+    """
+    num_runs: int
+    confidence: float
+    intervals: List[PercentileInterval] = field(default_factory=list)
+    target_half_width: Optional[float] = None
+    converged: Optional[bool] = None
+
+    @property
+    def max_relative_half_width(self) -> float:
+        """Worst relative half-width across all tracked percentiles."""
+        return max((i.relative_half_width for i in self.intervals), default=0.0)
+
+    def interval(self, metric: str, percentile: float) -> PercentileInterval:
+        """Interval for one metric percentile (KeyError if not tracked)."""
+        for interval in self.intervals:
+            if interval.metric == metric and interval.percentile == percentile:
+                return interval
+        raise KeyError((metric, percentile))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_runs": self.num_runs,
+            "confidence": self.confidence,
+            "target_half_width": self.target_half_width,
+            "converged": self.converged,
+            "max_relative_half_width": self.max_relative_half_width,
+            "intervals": [i.to_dict() for i in self.intervals],
+        }
+
+    @staticmethod
+    def measure(
+        aggregator: StreamingAggregator,
+        metrics: Tuple[str, ...] = ("completion_time", "total_cost"),
+        percentiles: Tuple[float, ...] = (10, 50, 90),
+        confidence: float = 0.95,
+        target_half_width: Optional[float] = None
+    ) -> "PrecisionReport":
+        """
+        Measure percentile intervals of an aggregate.
+
+        Args:
+            aggregator: Runs so far
+            metrics: Metrics to track (AGGREGATED_METRICS names)
+            percentiles: Percentiles to track (0-100)
+            confidence: Interval confidence level
+            target_half_width: Relative half-width target (sets converged)
+        """
+        intervals = []
+        for metric in metrics:
+            for p in percentiles:
+                if aggregator.retain_runs == "all":
+                    estimate = _exact_percentile(aggregator, metric, p)
+                else:
+                    estimate = aggregator.percentile(metric, p)
+                lower, upper = aggregator.percentile_interval(metric, p, confidence)
+                intervals.append(PercentileInterval(metric, p, estimate, lower, upper))
+
+        report = PrecisionReport(
+            num_runs=aggregator.num_runs,
+            confidence=confidence,
+            intervals=intervals,
+            target_half_width=target_half_width
+        )
+        if target_half_width is not None:
+            report.converged = report.max_relative_half_width <= target_half_width
+        return report
+
+
+def _exact_percentile(aggregator: StreamingAggregator, metric: str, p: float) -> float:
+    """np.percentile-compatible (linear) percentile over retained runs."""
+    values = sorted(getattr(run, metric) for run in aggregator.retained_runs())
+    rank = p / 100 * (len(values) - 1)
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return float(values[lower])
+    return float(values[lower] + (values[upper] - values[lower]) * (rank - lower))
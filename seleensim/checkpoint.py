@@ -0,0 +1,172 @@
+"""
+Checkpoint and resume for long Monte Carlo jobs.
+
+Design Principles:
+- Cheap to resume: runs are seeded by master_seed + run_id alone, so a
+  checkpoint only needs which run IDs finished and the aggregate so far
+- Identical results: aggregators merge exactly (sketch sums are exact
+  fractions, retention is keyed by run_id), so a resumed job returns
+  the same SimulationResults as an uninterrupted one
+- Crash-safe writes: checkpoints are written to a temporary file in the
+  same directory and atomically renamed over the previous one
+- Refuse mismatches: resuming with a different trial, seed or run
+  configuration raises instead of silently mixing results
+
+Format:
+    A pickled RunCheckpoint. Pickle is used because the aggregate holds
+    arbitrary RunResults (timelines, constraint explanations); only load
+    checkpoints you wrote yourself. Each save rewrites the whole
+    aggregate, so long jobs should use a bounded retain_runs policy.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import pickle
+import tempfile
+
+from seleensim.aggregation import StreamingAggregator
+
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class RunCheckpoint:
+    """
+    Progress of one SimulationEngine.run() job.
+
+    config identifies the job (trial fingerprint, seed, run count,
+    budget, sampling, retention); completed holds finished run IDs as
+    sorted, disjoint [start, stop) intervals.
+    """
+    config: Dict[str, Any]
+    aggregator: StreamingAggregator
+    completed: List[Tuple[int, int]] = field(default_factory=list)
+    version: int = CHECKPOINT_VERSION
+
+    @property
+    def num_completed(self) -> int:
+        return sum(stop - start for start, stop in self.completed)
+
+    def mark_completed(self, run_ids: range):
+        """Record a finished contiguous range of run IDs (coalescing intervals)."""
+        intervals = sorted(self.completed + [(run_ids.start, run_ids.stop)])
+        merged = [intervals[0]]
+        for start, stop in intervals[1:]:
+            if start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+            else:
+                merged.append((start, stop))
+        self.completed = merged
+
+    def remaining(self, num_runs: int) -> List[range]:
+        """Contiguous ranges of run IDs in range(num_runs) not yet completed."""
+        ranges = []
+        start = 0
+        for done_start, done_stop in self.completed:
+            if done_start > start:
+                ranges.append(range(start, min(done_start, num_runs)))
+            start = max(start, done_stop)
+        if start < num_runs:
+            ranges.append(range(start, num_runs))
+        return [r for r in ranges if len(r)]
+
+    def check_config(self, config: Dict[str, Any]):
+        """
+        Raise if this checkpoint belongs to a different job.
+
+        Raises:
+            ValueError: If any configuration entry differs
+        """
+        mismatched = sorted(
+            key for key in set(self.config) | set(config)
+            if self.config.get(key) != config.get(key)
+        )
+        if mismatched:
+            details = ", ".join(
+                f"{key}: checkpoint {self.config.get(key)!r} vs run {config.get(key)!r}"
+                for key in mismatched
+            )
+            raise ValueError(f"Checkpoint does not match this run ({details})")
+
+    def save(self, path: str):
+        """Atomically write the checkpoint to path."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "RunCheckpoint":
+        """
+        Read a checkpoint written by save().
+
+        Raises:
+            ValueError: If the file is not a checkpoint (of this class) of a
+                        supported version
+        """
+        with open(path, "rb") as f:
+            checkpoint = pickle.load(f)
+        if not isinstance(checkpoint, cls):
+            raise ValueError(f"{path} is not a {cls.__name__}")
+        if checkpoint.version != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"Unsupported checkpoint version {checkpoint.version} "
+                f"(expected {CHECKPOINT_VERSION})"
+            )
+        return checkpoint
+
+
+@dataclass
+class PartialResults(RunCheckpoint):
+    """
+    Result artifact of one run-ID range of a larger job.
+
+    Produced by SimulationEngine.run_range() on each machine and combined
+    by seleensim.distributed.merge_results(). shards records where and
+    when each range ran (hostname, run range, start time, duration).
+    """
+    shards: List[Dict[str, Any]] = field(default_factory=list)
+
+
+class CheckpointWriter:
+    """
+    Saves a RunCheckpoint every `every` completed runs.
+
+    The engine calls completed() after folding runs into the aggregate
+    the checkpoint holds, so every save is a consistent snapshot.
+    """
+
+    def __init__(self, checkpoint: RunCheckpoint, path: Optional[str], every: int):
+        """
+        Args:
+            checkpoint: Checkpoint to update (shares the run's aggregator)
+            path: File to write, or None to track progress without saving
+            every: Save after at least this many newly completed runs
+        """
+        self.checkpoint = checkpoint
+        self.path = path
+        self.every = every
+        self._unsaved = 0
+
+    def completed(self, run_ids: range):
+        """Record finished run IDs, saving if enough runs accumulated."""
+        self.checkpoint.mark_completed(run_ids)
+        self._unsaved += len(run_ids)
+        if self._unsaved >= self.every:
+            self.flush()
+
+    def flush(self):
+        """Save now (no-op without a path)."""
+        if self.path is not None:
+            self.checkpoint.save(self.path)
+        self._unsaved = 0
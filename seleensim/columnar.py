@@ -0,0 +1,327 @@
+"""
+Columnar binary storage for simulation output.
+
+Design Principles:
+- Columns, not records: each per-run metric and each timeline field is
+  one contiguous NumPy array, stored as its own .npy file
+- Memory-mapped reads: open_columnar() maps columns lazily, so a
+  100k-run result set can be sliced and filtered without loading it
+- Small manifest: provenance, input specification, aggregated results
+  and column layout live in one JSON file, readable by any tool
+- Same content as JSON output: EnhancedSimulationOutput round-trips
+  through either format
+
+Layout:
+    <dir>/manifest.json          format version, provenance, input spec,
+                                 aggregated results, column dtypes/shapes,
+                                 timeline string tables
+    <dir>/runs/<metric>.npy      one value per run (RUN_COLUMNS)
+    <dir>/timeline/<field>.npy   all runs' timeline rows, concatenated
+    <dir>/timeline/offsets.npy   run i owns rows offsets[i]:offsets[i+1]
+    <dir>/timeline/details.json  sparse rendered row details
+
+Why not .npz or Parquet:
+    .npz members cannot be memory-mapped, and Parquet needs pyarrow,
+    which is not a dependency. Plain .npy files load with mmap_mode="r"
+    and are readable from any NumPy-aware tool.
+"""
+
+from typing import Any, Dict, List, Optional
+import json
+import os
+
+import numpy as np
+
+from seleensim.timeline import Timeline
+
+
+FORMAT_NAME = "seleensim-columnar"
+FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+
+# Per-run columns and their dtypes
+RUN_COLUMNS = {
+    "run_id": np.int64,
+    "seed": np.int64,
+    "completion_time": np.float64,
+    "total_cost": np.float64,
+    "events_processed": np.int64,
+    "events_rescheduled": np.int64,
+    "constraint_violations": np.int64,
+}
+
+# Timeline columns (Timeline.from_columns arguments) and their dtypes
+TIMELINE_COLUMNS = {
+    "times": np.float64,
+    "event_type_codes": np.int32,
+    "entity_codes": np.int32,
+    "reason_codes": np.int8,
+    "args": np.float64,
+}
+
+
+def write_columnar(dirpath: str, output: Any, run_results: Optional[List[Any]] = None):
+    """
+    Write simulation output as a columnar directory.
+
+    Timeline columns are streamed run by run into preallocated
+    memory-mapped files, so peak memory stays at one run's timeline.
+    The manifest is written last: a directory without one is incomplete.
+
+    Args:
+        dirpath: Directory to write (created if missing)
+        output: EnhancedSimulationOutput
+        run_results: RunResult objects. If given, per-run metrics and
+                     timelines come from them; otherwise per-run metrics
+                     come from output.single_run_results (no timelines)
+
+    Raises:
+        ValueError: If neither run_results nor output.single_run_results is available
+    """
+    if run_results is not None:
+        rows = [{name: getattr(r, name) for name in RUN_COLUMNS} for r in run_results]
+    elif output.single_run_results is not None:
+        rows = output.single_run_results
+    else:
+        raise ValueError(
+            "No per-run results to write: pass run_results or create the output "
+            "with single_run_results"
+        )
+
+    os.makedirs(os.path.join(dirpath, "runs"), exist_ok=True)
+    manifest_path = os.path.join(dirpath, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    run_columns = {}
+    for name, dtype in RUN_COLUMNS.items():
+        column = np.array([row[name] for row in rows], dtype=dtype)
+        relpath = f"runs/{name}.npy"
+        np.save(os.path.join(dirpath, relpath), column)
+        run_columns[name] = {"file": relpath, "dtype": column.dtype.str, "shape": list(column.shape)}
+
+    timeline = None
+    if run_results is not None and all(isinstance(r.timeline, Timeline) for r in run_results):
+        timeline = _write_timelines(dirpath, [r.timeline for r in run_results])
+
+    manifest = {
+        "format": FORMAT_NAME,
+        "format_version": FORMAT_VERSION,
+        "num_runs": len(rows),
+        "provenance": output.provenance.to_dict(),
+        "input_specification": output.input_specification.to_dict(),
+        "aggregated_results": output.aggregated_results.to_dict(),
+        "run_columns": run_columns,
+        "timeline": timeline,
+    }
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+
+def _write_timelines(dirpath: str, timelines: List[Timeline]) -> Dict[str, Any]:
+    """Concatenate timelines under global string tables; return the manifest entry."""
+    os.makedirs(os.path.join(dirpath, "timeline"), exist_ok=True)
+
+    offsets = np.zeros(len(timelines) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(t) for t in timelines])
+    total = int(offsets[-1])
+    np.save(os.path.join(dirpath, "timeline", "offsets.npy"), offsets)
+
+    columns = {}
+    for name, dtype in TIMELINE_COLUMNS.items():
+        path = os.path.join(dirpath, "timeline", f"{name}.npy")
+        if total:
+            columns[name] = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(total,))
+        else:
+            np.save(path, np.empty(0, dtype=dtype))
+
+    event_types: Dict[str, int] = {}
+    entities: Dict[str, int] = {}
+    details: Dict[str, str] = {}
+    for timeline, start in zip(timelines, offsets):
+        size = len(timeline)
+        if not size:
+            continue
+        # Remap per-run codes onto the global string tables
+        type_map = np.array(
+            [event_types.setdefault(value, len(event_types)) for value in timeline.event_types],
+            dtype=np.int32
+        )
+        entity_map = np.array(
+            [entities.setdefault(value, len(entities)) for value in timeline.entities],
+            dtype=np.int32
+        )
+        stop = start + size
+        columns["times"][start:stop] = timeline.times
+        columns["event_type_codes"][start:stop] = type_map[timeline.event_type_codes]
+        columns["entity_codes"][start:stop] = entity_map[timeline.entity_codes]
+        columns["reason_codes"][start:stop] = timeline.reason_codes
+        columns["args"][start:stop] = timeline.args
+        for row, detail in timeline._details.items():
+            details[str(int(start) + row)] = str(detail)
+
+    for column in columns.values():
+        column.flush()
+    del columns
+
+    with open(os.path.join(dirpath, "timeline", "details.json"), 'w') as f:
+        json.dump(details, f)
+
+    return {
+        "num_rows": total,
+        "offsets": "timeline/offsets.npy",
+        "columns": {
+            name: {"file": f"timeline/{name}.npy", "dtype": np.dtype(dtype).str}
+            for name, dtype in TIMELINE_COLUMNS.items()
+        },
+        "details": "timeline/details.json",
+        "event_types": list(event_types),
+        "entities": list(entities),
+    }
+
+
+class ColumnarResults:
+    """
+    Memory-mapped reader for a columnar output directory.
+
+    Columns are mapped on first access and never copied unless sliced
+    into a new array by the caller.
+
+    Example:
+        results = open_columnar("out/")
+        late = results.column("completion_time") > 365
+        late_runs = results.column("run_id")[late]
+        timeline = results.timeline(int(np.argmax(results.column("total_cost"))))
+    """
+
+    def __init__(self, dirpath: str, mmap: bool = True):
+        """
+        Open a columnar directory.
+
+        Args:
+            dirpath: Directory written by write_columnar()
+            mmap: Memory-map columns (False loads them into memory)
+
+        Raises:
+            FileNotFoundError: If the directory has no manifest
+            ValueError: If the manifest has an unknown format or version
+        """
+        self.dirpath = dirpath
+        self._mmap_mode = "r" if mmap else None
+        with open(os.path.join(dirpath, MANIFEST_FILE), 'r') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("format") != FORMAT_NAME:
+            raise ValueError(f"{dirpath} is not a {FORMAT_NAME} directory")
+        if self.manifest.get("format_version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported {FORMAT_NAME} version {self.manifest.get('format_version')} "
+                f"(expected {FORMAT_VERSION})"
+            )
+        self._arrays: Dict[str, np.ndarray] = {}
+        # Sorted global detail rows and their texts, loaded on first timeline()
+        self._detail_rows: Optional[np.ndarray] = None
+        self._detail_texts: List[str] = []
+
+    @property
+    def provenance(self):
+        from seleensim.output_schema import ProvenanceRecord
+        return ProvenanceRecord(**self.manifest["provenance"])
+
+    @property
+    def input_specification(self):
+        from seleensim.output_schema import InputSpecification
+        return InputSpecification(**self.manifest["input_specification"])
+
+    @property
+    def aggregated_results(self):
+        from seleensim.output_schema import AggregatedResults
+        return AggregatedResults.from_dict(self.manifest["aggregated_results"])
+
+    @property
+    def has_timelines(self) -> bool:
+        return self.manifest["timeline"] is not None
+
+    def __len__(self) -> int:
+        return self.manifest["num_runs"]
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        One per-run column (memory-mapped, read-only).
+
+        Raises:
+            KeyError: If name is not a stored column
+        """
+        if name not in self.manifest["run_columns"]:
+            raise KeyError(f"Unknown column {name!r}; available: {list(self.manifest['run_columns'])}")
+        return self._load(self.manifest["run_columns"][name]["file"])
+
+    def run(self, index: int) -> Dict[str, Any]:
+        """Per-run metrics of one run as a dict (like single_run_results entries)."""
+        if not -len(self) <= index < len(self):
+            raise IndexError("run index out of range")
+        return {name: self.column(name)[index].item() for name in self.manifest["run_columns"]}
+
+    def runs(self) -> List[Dict[str, Any]]:
+        """All per-run metrics as dicts (materializes every column)."""
+        columns = {name: self.column(name).tolist() for name in self.manifest["run_columns"]}
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+    def timeline(self, index: int) -> Timeline:
+        """
+        Timeline of one run, backed by memory-mapped column slices.
+
+        Raises:
+            ValueError: If no timelines were stored
+        """
+        entry = self.manifest["timeline"]
+        if entry is None:
+            raise ValueError("No timelines stored (write with run_results to include them)")
+        if not -len(self) <= index < len(self):
+            raise IndexError("run index out of range")
+        index %= len(self)
+
+        offsets = self._load(entry["offsets"])
+        start, stop = int(offsets[index]), int(offsets[index + 1])
+        if self._detail_rows is None:
+            with open(os.path.join(self.dirpath, entry["details"]), 'r') as f:
+                stored = sorted((int(row), text) for row, text in json.load(f).items())
+            self._detail_rows = np.array([row for row, _ in stored], dtype=np.int64)
+            self._detail_texts = [text for _, text in stored]
+        first, last = np.searchsorted(self._detail_rows, [start, stop])
+        details = {
+            int(self._detail_rows[i]) - start: self._detail_texts[i]
+            for i in range(first, last)
+        }
+        columns = {
+            name: self._load(spec["file"])[start:stop]
+            for name, spec in entry["columns"].items()
+        }
+        return Timeline.from_columns(
+            event_types=entry["event_types"],
+            entities=entry["entities"],
+            details=details,
+            **columns
+        )
+
+    def to_output(self, include_single_runs: bool = True):
+        """Rebuild an EnhancedSimulationOutput (per-run metrics as dicts)."""
+        from seleensim.output_schema import EnhancedSimulationOutput
+        return EnhancedSimulationOutput(
+            provenance=self.provenance,
+            input_specification=self.input_specification,
+            aggregated_results=self.aggregated_results,
+            single_run_results=self.runs() if include_single_runs else None
+        )
+
+    def _load(self, relpath: str) -> np.ndarray:
+        array = self._arrays.get(relpath)
+        if array is None:
+            array = np.load(os.path.join(self.dirpath, relpath), mmap_mode=self._mmap_mode)
+            self._arrays[relpath] = array
+        return array
+
+
+def open_columnar(dirpath: str, mmap: bool = True) -> ColumnarResults:
+    """Open a columnar output directory for reading (see ColumnarResults)."""
+    return ColumnarResults(dirpath, mmap=mmap)
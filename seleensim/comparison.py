@@ -0,0 +1,283 @@
+"""
+Paired scenario comparison with common random numbers.
+
+Design Principles:
+- Paired: every scenario runs the same run IDs under the same master seed
+  with counter seeding, so run i of each scenario sees the same uniform
+  for every shared (run, entity, purpose); differences between scenarios
+  come from the scenario, not from unrelated noise
+- Deltas, not levels: the question is "how much does the scenario change
+  the outcome", answered per run and then summarized
+- Honest intervals: Student-t interval on the per-run differences, plus
+  the variance reduction achieved relative to independent runs
+- Engine unaware: scenarios are still applied up front (apply_scenario);
+  the engine only ever sees Trials
+
+Why pairing matters:
+    Var(B - S) = Var(B) + Var(S) - 2·Cov(B, S). Independent runs have
+    Cov = 0; common random numbers make B and S strongly positively
+    correlated, so the difference is far less noisy and a defensible
+    comparison needs far fewer runs.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import Executor
+import math
+
+import numpy as np
+from scipy import stats
+
+from seleensim.scenarios import ScenarioProfile, apply_scenario
+from seleensim.simulation import ProgressCallback, SimulationEngine, SimulationResults
+
+
+# Metrics compared by default (RunResult attribute names)
+COMPARED_METRICS = ("completion_time", "total_cost")
+
+
+@dataclass
+class PairedDelta:
+    """
+    Mean per-run difference (scenario - baseline) of one metric.
+
+    Example:
+        delta = comparison.delta("DELAYED_ACTIVATION", "completion_time")
+        delta.mean_delta           # +18.4 days on average
+        (delta.lower, delta.upper) # 95% CI (16.9, 19.9)
+        delta.variance_reduction   # 37.2x fewer runs than independent sampling
+    """
+    scenario_id: str
+    metric: str
+    baseline_mean: float
+    mean_delta: float
+    lower: float
+    upper: float
+    std_error: float
+    num_runs: int
+    confidence: float
+
+    # Var(independent difference) / Var(paired difference)
+    variance_reduction: float
+
+    @property
+    def is_significant(self) -> bool:
+        """True if the interval excludes zero."""
+        return self.lower > 0 or self.upper < 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scenario_id": self.scenario_id,
+            "metric": self.metric,
+            "baseline_mean": self.baseline_mean,
+            "mean_delta": self.mean_delta,
+            "lower": self.lower,
+            "upper": self.upper,
+            "std_error": self.std_error,
+            "num_runs": self.num_runs,
+            "confidence": self.confidence,
+            "variance_reduction": self.variance_reduction,
+            "is_significant": self.is_significant,
+        }
+
+
+@dataclass
+class ScenarioComparison:
+    """
+    Results of comparing scenarios against a baseline on paired runs.
+
+    results holds the full SimulationResults per scenario (baseline under
+    baseline_id); deltas holds one PairedDelta per (scenario, metric).
+    """
+    baseline_id: str
+    master_seed: int
+    num_runs: int
+    confidence: float
+    results: Dict[str, SimulationResults]
+    deltas: List[PairedDelta]
+
+    def delta(self, scenario_id: str, metric: str) -> PairedDelta:
+        """Paired delta for one scenario and metric (KeyError if not compared)."""
+        for delta in self.deltas:
+            if delta.scenario_id == scenario_id and delta.metric == metric:
+                return delta
+        raise KeyError((scenario_id, metric))
+
+    def summary(self) -> str:
+        """Human-readable table of paired deltas."""
+        lines = [
+            f"Scenario Comparison vs {self.baseline_id} "
+            f"({self.num_runs} paired runs, seed={self.master_seed}, "
+            f"{self.confidence:.0%} CI):",
+        ]
+        for delta in self.deltas:
+            marker = "*" if delta.is_significant else " "
+            lines.append(
+                f"  {marker} {delta.scenario_id} {delta.metric}: "
+                f"{delta.mean_delta:+,.1f} [{delta.lower:+,.1f}, {delta.upper:+,.1f}] "
+                f"(variance reduction {delta.variance_reduction:.1f}x)"
+            )
+        lines.append("  (* interval excludes zero)")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "baseline_id": self.baseline_id,
+            "master_seed": self.master_seed,
+            "num_runs": self.num_runs,
+            "confidence": self.confidence,
+            "deltas": [delta.to_dict() for delta in self.deltas],
+        }
+
+
+def paired_delta_interval(
+    baseline: Sequence[float],
+    scenario: Sequence[float],
+    confidence: float = 0.95
+) -> Tuple[float, float, float, float, float]:
+    """
+    Student-t interval for the mean of paired differences.
+
+    Args:
+        baseline: Per-run baseline values
+        scenario: Per-run scenario values (same runs, same order)
+        confidence: Interval confidence level
+
+    Returns:
+        (mean_delta, lower, upper, std_error, variance_reduction)
+
+    Raises:
+        ValueError: If lengths differ, fewer than 2 pairs, or confidence
+                    not in (0, 1)
+    """
+    if len(baseline) != len(scenario):
+        raise ValueError(
+            f"Need paired values, got {len(baseline)} baseline and {len(scenario)} scenario"
+        )
+    if len(baseline) < 2:
+        raise ValueError(f"Need at least 2 paired runs, got {len(baseline)}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+
+    baseline = np.asarray(baseline, dtype=float)
+    scenario = np.asarray(scenario, dtype=float)
+    differences = scenario - baseline
+    n = len(differences)
+
+    mean_delta = float(differences.mean())
+    paired_var = float(differences.var(ddof=1))
+    std_error = math.sqrt(paired_var / n)
+    t = float(stats.t.ppf(0.5 + confidence / 2, n - 1))
+
+    independent_var = float(baseline.var(ddof=1) + scenario.var(ddof=1))
+    if paired_var > 0:
+        variance_reduction = independent_var / paired_var
+    else:
+        variance_reduction = math.inf if independent_var > 0 else 1.0
+
+    return (
+        mean_delta,
+        mean_delta - t * std_error,
+        mean_delta + t * std_error,
+        std_error,
+        variance_reduction,
+    )
+
+
+def compare_scenarios(
+    base_trial: Any,
+    scenarios: Sequence[ScenarioProfile],
+    num_runs: int = 200,
+    master_seed: int = 42,
+    constraints: Optional[List[Any]] = None,
+    confidence: float = 0.95,
+    metrics: Tuple[str, ...] = COMPARED_METRICS,
+    initial_budget: float = float('inf'),
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    baseline_id: str = "BASELINE",
+    progress: ProgressCallback = None
+) -> ScenarioComparison:
+    """
+    Run a baseline and a set of scenarios on common random numbers.
+
+    Every trial (baseline and apply_scenario(base_trial, s) for each s)
+    runs run IDs 0..num_runs-1 under the same master seed with
+    sampling="coupled" (the engine's default counter seeding; "coupled"
+    rejects the legacy scheme). Each run's inputs are keyed by (run,
+    entity, purpose) alone, so runs pair across scenarios even when a scenario
+    changes parameters, bounds or distribution families, or adds and
+    removes other entities.
+
+    Args:
+        base_trial: Baseline Trial
+        scenarios: Scenarios to compare against the baseline
+        num_runs: Paired runs per trial (>= 2)
+        master_seed: Shared master seed
+        constraints: Constraints applied to every trial
+        confidence: Confidence level of delta intervals
+        metrics: RunResult metrics to compare
+        initial_budget: Starting budget for each run
+        workers: As in SimulationEngine.run()
+        executor: As in SimulationEngine.run()
+        baseline_id: Key of the baseline in ScenarioComparison.results
+        progress: As in SimulationEngine.run(), for every trial run
+                  (default None = silent)
+
+    Returns:
+        ScenarioComparison with per-scenario results and paired deltas
+
+    Raises:
+        ValueError: If num_runs < 2 or scenario IDs collide
+    """
+    if num_runs < 2:
+        raise ValueError(f"num_runs must be >= 2 for paired intervals, got {num_runs}")
+    scenario_ids = [scenario.scenario_id for scenario in scenarios]
+    if len(set(scenario_ids)) != len(scenario_ids) or baseline_id in scenario_ids:
+        raise ValueError(f"Scenario IDs must be unique and differ from {baseline_id!r}")
+
+    engine = SimulationEngine(master_seed=master_seed, constraints=constraints)
+
+    def run(trial):
+        return engine.run(
+            trial, num_runs=num_runs, initial_budget=initial_budget,
+            workers=workers, executor=executor, sampling="coupled",
+            progress=progress
+        )
+
+    results = {baseline_id: run(base_trial)}
+    for scenario in scenarios:
+        results[scenario.scenario_id] = run(apply_scenario(base_trial, scenario))
+
+    baseline_runs = results[baseline_id].run_results
+    deltas = []
+    for scenario_id in scenario_ids:
+        scenario_runs = results[scenario_id].run_results
+        for metric in metrics:
+            baseline_values = [getattr(run, metric) for run in baseline_runs]
+            mean_delta, lower, upper, std_error, reduction = paired_delta_interval(
+                baseline_values,
+                [getattr(run, metric) for run in scenario_runs],
+                confidence
+            )
+            deltas.append(PairedDelta(
+                scenario_id=scenario_id,
+                metric=metric,
+                baseline_mean=float(np.mean(baseline_values)),
+                mean_delta=mean_delta,
+                lower=lower,
+                upper=upper,
+                std_error=std_error,
+                num_runs=num_runs,
+                confidence=confidence,
+                variance_reduction=reduction
+            ))
+
+    return ScenarioComparison(
+        baseline_id=baseline_id,
+        master_seed=master_seed,
+        num_runs=num_runs,
+        confidence=confidence,
+        results=results,
+        deltas=deltas
+    )
@@ -23,10 +23,60 @@ Invariant: Constraints evaluate, engine orchestrates.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, FrozenSet, Iterable, Mapping, Tuple, Union
 
+from seleensim.seeding import PURPOSE_BUDGET_THROTTLING, derive_seed
 
-@dataclass
+
+class Explanation:
+    """
+    Lazily rendered explanation: a str.format template plus its arguments.
+
+    Constraints produce an explanation for every evaluation, but it is only
+    read when an event is rescheduled or modified (or when a user inspects a
+    result). Formatting is deferred until str() is called, then cached.
+
+    Example:
+        Explanation("Resource {} at capacity, next available at T={:.1f}", rid, t)
+    """
+    __slots__ = ("template", "args", "_text")
+
+    def __init__(self, template: str, *args: Any):
+        self.template = template
+        self.args = args
+        self._text: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = self._render()
+        return self._text
+
+    def _render(self) -> str:
+        return self.template.format(*self.args) if self.args else self.template
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Explanation, str)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f"Explanation({str(self)!r})"
+
+
+class _JoinedExplanation(Explanation):
+    """Explanations of composed results; template is the separator."""
+    __slots__ = ()
+
+    def _render(self) -> str:
+        parts = [text for text in map(str, self.args) if text]
+        return self.template.join(parts) if parts else "All constraints satisfied"
+
+
+@dataclass(init=False)
 class ConstraintResult:
     """
     Result of evaluating a constraint against an event.
@@ -36,7 +86,9 @@ class ConstraintResult:
         earliest_valid_time: Absolute time when event becomes valid (if not valid now)
         delay: Relative delay imposed beyond validity check (e.g., resource wait)
         parameter_overrides: Modifications to event parameters (e.g., throttled duration)
-        explanation: Human-readable reason for constraint effect
+        explanation: Human-readable reason for constraint effect. May be given as
+                     a str or a lazily rendered Explanation; always reads back
+                     as str (rendered on first access).
 
     Composition:
         Engine computes: new_time = max(earliest_valid_time, proposed_time + delay)
@@ -73,12 +125,60 @@ class ConstraintResult:
     is_valid: bool
     earliest_valid_time: Optional[float]
     delay: float
-    parameter_overrides: Dict[str, Any]
-    explanation: str
+    parameter_overrides: Mapping[str, Any]
+    explanation: Union[str, Explanation]
+
+    def __init__(
+        self,
+        is_valid: bool,
+        earliest_valid_time: Optional[float],
+        delay: float,
+        parameter_overrides: Mapping[str, Any],
+        explanation: Union[str, Explanation]
+    ):
+        self.is_valid = is_valid
+        self.earliest_valid_time = earliest_valid_time
+        self.delay = delay
+        self.parameter_overrides = parameter_overrides
+        self._explanation = explanation
+
+    @property
+    def explanation(self) -> str:
+        """Explanation text (an Explanation is rendered on first read)."""
+        explanation = self._explanation
+        if isinstance(explanation, Explanation):
+            return str(explanation)
+        return explanation
+
+    @explanation.setter
+    def explanation(self, explanation: Union[str, Explanation]):
+        self._explanation = explanation
+
+    @property
+    def explanation_record(self) -> Union[str, Explanation]:
+        """Explanation as given (not rendered), for deferred logging."""
+        return self._explanation
+
+    @property
+    def is_no_op(self) -> bool:
+        """True if the result neither blocks, delays nor modifies the event."""
+        return (
+            self.is_valid
+            and self.earliest_valid_time is None
+            and self.delay == 0.0
+            and not self.parameter_overrides
+        )
 
     @staticmethod
-    def satisfied(explanation: str = "Constraint satisfied") -> "ConstraintResult":
-        """Factory for fully satisfied constraint (no effects)."""
+    def satisfied(explanation: Union[str, Explanation] = "Constraint satisfied") -> "ConstraintResult":
+        """
+        Factory for fully satisfied constraint (no effects).
+
+        The default result is a shared instance with read-only
+        parameter_overrides; treat results as read-only.
+        """
+        if isinstance(explanation, str) and explanation == "Constraint satisfied":
+            return _SATISFIED
         return ConstraintResult(
             is_valid=True,
             earliest_valid_time=None,
@@ -88,7 +188,7 @@ class ConstraintResult:
         )
 
     @staticmethod
-    def invalid_until(time: float, explanation: str) -> "ConstraintResult":
+    def invalid_until(time: float, explanation: Union[str, Explanation]) -> "ConstraintResult":
         """Factory for validity violation (hard gate)."""
         return ConstraintResult(
             is_valid=False,
@@ -99,7 +199,7 @@ class ConstraintResult:
         )
 
     @staticmethod
-    def delayed_by(delay: float, explanation: str) -> "ConstraintResult":
+    def delayed_by(delay: float, explanation: Union[str, Explanation]) -> "ConstraintResult":
         """Factory for feasibility delay (soft constraint)."""
         return ConstraintResult(
             is_valid=True,
@@ -110,7 +210,7 @@ class ConstraintResult:
         )
 
     @staticmethod
-    def modified(overrides: Dict[str, Any], explanation: str) -> "ConstraintResult":
+    def modified(overrides: Dict[str, Any], explanation: Union[str, Explanation]) -> "ConstraintResult":
         """Factory for parameter modification (throttling)."""
         return ConstraintResult(
             is_valid=True,
@@ -121,6 +221,70 @@ class ConstraintResult:
         )
 
 
+# Shared results for the common "nothing to do" cases (overrides read-only,
+# so no caller can change what later callers receive)
+_SATISFIED = ConstraintResult(
+    is_valid=True,
+    earliest_valid_time=None,
+    delay=0.0,
+    parameter_overrides=MappingProxyType({}),
+    explanation="Constraint satisfied"
+)
+
+_ALL_SATISFIED = ConstraintResult(
+    is_valid=True,
+    earliest_valid_time=None,
+    delay=0.0,
+    parameter_overrides=MappingProxyType({}),
+    explanation="All constraints satisfied"
+)
+
+
+@dataclass(frozen=True)
+class Applicability:
+    """
+    Declares which events a constraint can affect.
+
+    The engine uses this to skip constraints that would only return
+    ConstraintResult.satisfied() for an event. It must never exclude an
+    event the constraint could act on: skipping is only valid when
+    evaluate() would have been a no-op.
+
+    Attributes:
+        event_types: Event types the constraint applies to (None = any)
+        resources: Applies only to events requiring one of these resources
+                   (None = regardless of resources)
+        zero_duration: Applies to events with zero (or no) duration
+        requires_predecessors: Applies only to events with predecessors
+    """
+    event_types: Optional[FrozenSet[str]] = None
+    resources: Optional[FrozenSet[str]] = None
+    zero_duration: bool = True
+    requires_predecessors: bool = False
+
+    def matches(
+        self,
+        event_type: str,
+        has_duration: bool,
+        required_resources: FrozenSet[str],
+        has_predecessors: bool
+    ) -> bool:
+        """Could the constraint affect an event with these properties?"""
+        if self.event_types is not None and event_type not in self.event_types:
+            return False
+        if self.resources is not None and self.resources.isdisjoint(required_resources):
+            return False
+        if not self.zero_duration and not has_duration:
+            return False
+        if self.requires_predecessors and not has_predecessors:
+            return False
+        return True
+
+
+# Default: constraint may affect any event
+ALWAYS_APPLICABLE = Applicability()
+
+
 class Constraint(ABC):
     """
     Base class for all constraints.
@@ -154,6 +318,15 @@ class Constraint(ABC):
         """
         pass
 
+    def applicability(self) -> Applicability:
+        """
+        Which events this constraint can affect (used for engine dispatch).
+
+        Override to let the engine skip evaluate() for events the constraint
+        would only report as satisfied. Default: applies to every event.
+        """
+        return ALWAYS_APPLICABLE
+
 
 # =============================================================================
 # Validity Constraints (Hard Gates)
@@ -188,6 +361,10 @@ class TemporalPrecedenceConstraint(Constraint):
         self.predecessor_event_type = predecessor_event_type
         self.dependent_event_type = dependent_event_type
 
+    def applicability(self) -> Applicability:
+        """Applies only to the dependent event type."""
+        return Applicability(event_types=frozenset([self.dependent_event_type]))
+
     def evaluate(self, state: Any, event: Any) -> ConstraintResult:
         """
         Check if predecessor has completed before dependent event.
@@ -201,7 +378,7 @@ class TemporalPrecedenceConstraint(Constraint):
         """
         # Only applies to dependent event type
         if event.event_type != self.dependent_event_type:
-            return ConstraintResult.satisfied(f"Not applicable to {event.event_type}")
+            return ConstraintResult.satisfied(Explanation("Not applicable to {}", event.event_type))
 
         # Check if predecessor completed
         predecessor_completion = state.get_completion_time(
@@ -213,9 +390,9 @@ class TemporalPrecedenceConstraint(Constraint):
             # Predecessor not scheduled yet - invalid
             return ConstraintResult.invalid_until(
                 time=float('inf'),  # Unknown when it will complete
-                explanation=(
-                    f"{self.dependent_event_type} requires {self.predecessor_event_type} "
-                    f"for entity {event.entity_id}, but predecessor not scheduled"
+                explanation=Explanation(
+                    "{} requires {} for entity {}, but predecessor not scheduled",
+                    self.dependent_event_type, self.predecessor_event_type, event.entity_id
                 )
             )
 
@@ -223,17 +400,16 @@ class TemporalPrecedenceConstraint(Constraint):
             # Predecessor completes after proposed event time - invalid
             return ConstraintResult.invalid_until(
                 time=predecessor_completion,
-                explanation=(
-                    f"{self.dependent_event_type} cannot occur before "
-                    f"{self.predecessor_event_type} completes "
-                    f"(completes at T={predecessor_completion:.1f})"
+                explanation=Explanation(
+                    "{} cannot occur before {} completes (completes at T={:.1f})",
+                    self.dependent_event_type, self.predecessor_event_type, predecessor_completion
                 )
             )
 
         # Predecessor completed before event time - valid
-        return ConstraintResult.satisfied(
-            f"{self.predecessor_event_type} completed at T={predecessor_completion:.1f}"
-        )
+        return ConstraintResult.satisfied(Explanation(
+            "{} completed at T={:.1f}", self.predecessor_event_type, predecessor_completion
+        ))
 
 
 class PredecessorConstraint(Constraint):
@@ -254,6 +430,10 @@ class PredecessorConstraint(Constraint):
           "Predecessor" is unambiguous and DAG-friendly.
     """
 
+    def applicability(self) -> Applicability:
+        """Applies only to events with predecessors."""
+        return Applicability(requires_predecessors=True)
+
     def evaluate(self, state: Any, event: Any) -> ConstraintResult:
         """
         Check if all predecessor activities have completed.
@@ -286,9 +466,9 @@ class PredecessorConstraint(Constraint):
             # Some predecessors not scheduled
             return ConstraintResult.invalid_until(
                 time=float('inf'),
-                explanation=(
-                    f"Activity {event.activity_id} requires predecessors "
-                    f"{incomplete_predecessors}, but they are not scheduled"
+                explanation=Explanation(
+                    "Activity {} requires predecessors {}, but they are not scheduled",
+                    event.activity_id, incomplete_predecessors
                 )
             )
 
@@ -299,16 +479,17 @@ class PredecessorConstraint(Constraint):
             # Some predecessor completes after proposed event time
             return ConstraintResult.invalid_until(
                 time=latest_completion,
-                explanation=(
-                    f"Activity {event.activity_id} cannot start until all predecessors "
-                    f"complete (latest completes at T={latest_completion:.1f})"
+                explanation=Explanation(
+                    "Activity {} cannot start until all predecessors complete "
+                    "(latest completes at T={:.1f})",
+                    event.activity_id, latest_completion
                 )
             )
 
         # All predecessors completed before event time
-        return ConstraintResult.satisfied(
-            f"All predecessors completed by T={latest_completion:.1f}"
-        )
+        return ConstraintResult.satisfied(Explanation(
+            "All predecessors completed by T={:.1f}", latest_completion
+        ))
 
 
 # =============================================================================
@@ -544,6 +725,10 @@ class ResourceCapacityConstraint(Constraint):
         self.resource_id = resource_id
         self.capacity_response = capacity_response or NoCapacityDegradation()
 
+    def applicability(self) -> Applicability:
+        """Applies only to events requiring this resource."""
+        return Applicability(resources=frozenset([self.resource_id]))
+
     def evaluate(self, state: Any, event: Any) -> ConstraintResult:
         """
         Check if resource has sufficient capacity at event time.
@@ -565,7 +750,7 @@ class ResourceCapacityConstraint(Constraint):
             return ConstraintResult.satisfied("No resources required")
 
         if self.resource_id not in event.required_resources:
-            return ConstraintResult.satisfied(f"Does not require {self.resource_id}")
+            return ConstraintResult.satisfied(Explanation("Does not require {}", self.resource_id))
 
         # Check resource availability at proposed time (queueing logic)
         available_time = state.get_resource_availability(self.resource_id, event.time)
@@ -584,22 +769,21 @@ class ResourceCapacityConstraint(Constraint):
             #               explanation=f"{self.resource_id} at {utilization:.0%} utilization, "
             #                          f"work {multiplier:.1f}x slower"
             #           )
-            return ConstraintResult.satisfied(f"{self.resource_id} available")
+            return ConstraintResult.satisfied(Explanation("{} available", self.resource_id))
 
         if available_time <= event.time:
             # Resource becomes available before or at event time
-            return ConstraintResult.satisfied(
-                f"{self.resource_id} available at T={available_time:.1f}"
-            )
+            return ConstraintResult.satisfied(Explanation(
+                "{} available at T={:.1f}", self.resource_id, available_time
+            ))
 
         # Resource not available until later - impose delay
         delay = available_time - event.time
         return ConstraintResult.delayed_by(
             delay=delay,
-            explanation=(
-                f"Resource {self.resource_id} at capacity, "
-                f"next available at T={available_time:.1f} "
-                f"(delay of {delay:.1f})"
+            explanation=Explanation(
+                "Resource {} at capacity, next available at T={:.1f} (delay of {:.1f})",
+                self.resource_id, available_time, delay
             )
         )
 
@@ -750,7 +934,12 @@ class BudgetThrottlingConstraint(Constraint):
         Week 7: Compare results (NO CODE CHANGE)
     """
 
-    def __init__(self, budget_per_day: float, response_curve: BudgetResponseCurve):
+    def __init__(
+        self,
+        budget_per_day: float,
+        response_curve: BudgetResponseCurve,
+        event_types: Optional[Iterable[str]] = None
+    ):
         """
         Initialize budget throttling constraint.
 
@@ -758,9 +947,15 @@ class BudgetThrottlingConstraint(Constraint):
             budget_per_day: Daily budget rate available
             response_curve: How budget availability affects execution speed
                 (Linear, Threshold, Stochastic, etc.)
+            event_types: Event types subject to throttling (None = all events)
         """
         self.budget_per_day = budget_per_day
         self.response_curve = response_curve
+        self.event_types = frozenset(event_types) if event_types is not None else None
+
+    def applicability(self) -> Applicability:
+        """Applies to events with non-zero duration (of the configured types)."""
+        return Applicability(event_types=self.event_types, zero_duration=False)
 
     def evaluate(self, state: Any, event: Any) -> ConstraintResult:
         """
@@ -774,6 +969,10 @@ class BudgetThrottlingConstraint(Constraint):
         Returns:
             ConstraintResult with parameter_overrides for throttled duration
         """
+        # Only applies to configured event types
+        if self.event_types is not None and event.event_type not in self.event_types:
+            return ConstraintResult.satisfied(Explanation("Not applicable to {}", event.event_type))
+
         # Only applies to events with duration
         if not hasattr(event, 'duration'):
             return ConstraintResult.satisfied("No duration to throttle")
@@ -791,10 +990,9 @@ class BudgetThrottlingConstraint(Constraint):
 
                 return ConstraintResult.modified(
                     overrides={"duration": throttled_duration},
-                    explanation=(
-                        f"Budget throttling applied (cached): "
-                        f"duration={throttled_duration:.1f} "
-                        f"(multiplier={cached_multiplier:.2f})"
+                    explanation=Explanation(
+                        "Budget throttling applied (cached): duration={:.1f} (multiplier={:.2f})",
+                        throttled_duration, cached_multiplier
                     )
                 )
 
@@ -807,10 +1005,14 @@ class BudgetThrottlingConstraint(Constraint):
         budget_ratio = available_budget / required_budget if required_budget > 0 else 1.0
 
         # Generate deterministic seed for this event+constraint combination
-        # Use event_id to ensure same event gets same multiplier on re-evaluation
-        import hashlib
-        seed_string = f"{event.event_id}_budget_throttling"
-        event_seed = int(hashlib.sha256(seed_string.encode()).hexdigest(), 16) % (2**31)
+        # Derived from the event's own seed when it carries one; otherwise
+        # (legacy seed scheme) from event_id, so re-evaluation gets the same multiplier
+        if getattr(event, 'seed', None) is not None:
+            event_seed = derive_seed(event.seed, PURPOSE_BUDGET_THROTTLING)
+        else:
+            import hashlib
+            seed_string = f"{event.event_id}_budget_throttling"
+            event_seed = int(hashlib.sha256(seed_string.encode()).hexdigest(), 16) % (2**31)
 
         # Sample duration multiplier from response curve
         # ARCHITECTURAL FIX: No hardcoded formula here, behavior is injected
@@ -829,11 +1031,10 @@ class BudgetThrottlingConstraint(Constraint):
         # Return modified parameters
         return ConstraintResult.modified(
             overrides={"duration": throttled_duration},
-            explanation=(
-                f"Budget throttling applied: "
-                f"duration={throttled_duration:.1f} days "
-                f"(multiplier={duration_multiplier:.2f}, "
-                f"budget_ratio={budget_ratio:.2f})"
+            explanation=Explanation(
+                "Budget throttling applied: duration={:.1f} days "
+                "(multiplier={:.2f}, budget_ratio={:.2f})",
+                throttled_duration, duration_multiplier, budget_ratio
             )
         )
 
@@ -854,6 +1055,9 @@ def compose_constraint_results(results: List[ConstraintResult]) -> ConstraintRes
         4. parameter_overrides = MERGE all overrides (later wins on conflict)
         5. explanation = CONCAT all explanations
 
+    When no constraint fired (every result a no-op), the shared "All
+    constraints satisfied" result is returned without composing anything.
+
     Args:
         results: List of ConstraintResults from different constraints
 
@@ -878,24 +1082,33 @@ def compose_constraint_results(results: List[ConstraintResult]) -> ConstraintRes
     if not results:
         return ConstraintResult.satisfied("No constraints evaluated")
 
-    # Compose validity (AND operation)
-    is_valid = all(r.is_valid for r in results)
-
-    # Compose earliest_valid_time (MAX operation)
-    valid_times = [r.earliest_valid_time for r in results if r.earliest_valid_time is not None]
-    earliest_valid_time = max(valid_times) if valid_times else None
+    # Composing one result is the identity (common after dispatch)
+    if len(results) == 1 and results[0].explanation_record:
+        return results[0]
 
-    # Compose delays (MAX operation)
-    delay = max(r.delay for r in results)
-
-    # Merge parameter overrides (later wins)
-    parameter_overrides = {}
+    # Single pass: AND validity, MAX earliest_valid_time, MAX delay, MERGE overrides
+    is_valid = True
+    earliest_valid_time = None
+    delay = results[0].delay
+    parameter_overrides: Dict[str, Any] = {}
     for r in results:
-        parameter_overrides.update(r.parameter_overrides)
-
-    # Concatenate explanations
-    explanations = [r.explanation for r in results if r.explanation]
-    explanation = "; ".join(explanations) if explanations else "All constraints satisfied"
+        if not r.is_valid:
+            is_valid = False
+        if r.earliest_valid_time is not None and (
+            earliest_valid_time is None or r.earliest_valid_time > earliest_valid_time
+        ):
+            earliest_valid_time = r.earliest_valid_time
+        if r.delay > delay:
+            delay = r.delay
+        if r.parameter_overrides:
+            parameter_overrides.update(r.parameter_overrides)  # Later wins
+
+    # No constraint fired: nothing to explain
+    if is_valid and earliest_valid_time is None and delay == 0.0 and not parameter_overrides:
+        return _ALL_SATISFIED
+
+    # Concatenate explanations (deferred until read)
+    explanation = _JoinedExplanation("; ", *[r.explanation_record for r in results])
 
     return ConstraintResult(
         is_valid=is_valid,
@@ -904,3 +1117,83 @@ def compose_constraint_results(results: List[ConstraintResult]) -> ConstraintRes
         parameter_overrides=parameter_overrides,
         explanation=explanation
     )
+
+
+# =============================================================================
+# Constraint Dispatch
+# =============================================================================
+
+
+class ConstraintIndex:
+    """
+    Dispatch table mapping event properties to the constraints that apply.
+
+    Built once per job (alongside its EventCatalog) from each constraint's
+    applicability(). Catalog events are keyed by an int packing their
+    type_code with has_duration and has_predecessors, so the per-event
+    lookup allocates no key tuple; other events (no type code, or required
+    resources some constraint declares) are keyed by (event_type,
+    has_duration, has_predecessors[, required resources]). The applicable
+    constraints for a key are computed on first sight and cached,
+    preserving the original constraint order (override merging is
+    order-sensitive). Events no constraint applies to get the shared empty
+    tuple, so the engine can skip evaluation entirely.
+
+    Type codes are only meaningful within one EventCatalog, so use an index
+    with the events of a single catalog.
+
+    Constraints that do not subclass Constraint (duck-typed) are treated as
+    always applicable.
+    """
+
+    def __init__(self, constraints: Iterable[Any]):
+        self.constraints: Tuple[Any, ...] = tuple(constraints)
+        self._applicability: Tuple[Applicability, ...] = tuple(
+            c.applicability() if isinstance(c, Constraint) else ALWAYS_APPLICABLE
+            for c in self.constraints
+        )
+        # Resources only matter for dispatch if some constraint declares them
+        self._resource_aware = any(a.resources is not None for a in self._applicability)
+        self._cache: Dict[tuple, Tuple[Any, ...]] = {}
+        self._code_cache: Dict[int, Tuple[Any, ...]] = {}
+
+    def select(self, event: Any) -> Tuple[Any, ...]:
+        """Constraints that may affect event, in original order (empty tuple if none)."""
+        has_duration = getattr(event, 'duration', 0.0) != 0.0
+        has_predecessors = bool(getattr(event, 'predecessors', None))
+        required = getattr(event, 'required_resources', None) if self._resource_aware else None
+        type_code = getattr(event, 'type_code', -1)
+
+        if type_code >= 0 and not required:
+            code_key = (type_code << 2) | (has_predecessors << 1) | has_duration
+            selected = self._code_cache.get(code_key)
+            if selected is None:
+                selected = self._match(event.event_type, has_duration, frozenset(), has_predecessors)
+                self._code_cache[code_key] = selected
+            return selected
+
+        if required:
+            key = (event.event_type, has_duration, has_predecessors, frozenset(required))
+        else:
+            key = (event.event_type, has_duration, has_predecessors)
+
+        selected = self._cache.get(key)
+        if selected is None:
+            resources = key[3] if len(key) == 4 else frozenset()
+            selected = self._match(event.event_type, has_duration, resources, has_predecessors)
+            self._cache[key] = selected
+        return selected
+
+    def _match(
+        self,
+        event_type: str,
+        has_duration: bool,
+        resources: FrozenSet[str],
+        has_predecessors: bool
+    ) -> Tuple[Any, ...]:
+        """Constraints whose applicability matches, in original order."""
+        return tuple(
+            constraint
+            for constraint, applicability in zip(self.constraints, self._applicability)
+            if applicability.matches(event_type, has_duration, resources, has_predecessors)
+        )
@@ -0,0 +1,150 @@
+"""
+Distributed execution by run-ID range.
+
+Design Principles:
+- No coordinator: each machine runs SimulationEngine.run_range() on its
+  own disjoint slice of range(num_runs) and saves a PartialResults file;
+  any machine can merge the files afterwards
+- Equal to a single node: runs are seeded by master_seed + run_id alone
+  and aggregators merge exactly, so merged results equal
+  SimulationEngine.run() with the same arguments
+- Refuse silent errors: partials from different jobs, overlapping
+  ranges (double counting) and missing ranges raise
+
+Workflow:
+    # on machine k
+    partial = engine.run_range(trial, range(k * 2500, (k + 1) * 2500), num_runs=10000)
+    partial.save(f"part{k}.pkl")
+
+    # anywhere
+    results = merge_results([f"part{k}.pkl" for k in range(4)])
+"""
+
+from typing import Any, List, Optional, Sequence, Union
+
+from seleensim.aggregation import StreamingAggregator, PrecisionReport
+from seleensim.checkpoint import PartialResults
+from seleensim.scenarios import fingerprint
+from seleensim.simulation import SimulationEngine, SimulationResults
+
+
+def combine_partials(partials: Sequence[Union[PartialResults, str]]) -> PartialResults:
+    """
+    Combine partial results into one (coverage may still be incomplete).
+
+    Useful for merging hierarchically, e.g. per rack and then globally.
+
+    Args:
+        partials: PartialResults objects or paths to saved ones
+
+    Returns:
+        PartialResults covering the union of the inputs' run IDs
+
+    Raises:
+        ValueError: If no partials are given, they come from different
+                    jobs, or their run-ID ranges overlap
+    """
+    loaded = [PartialResults.load(p) if isinstance(p, str) else p for p in partials]
+    if not loaded:
+        raise ValueError("Need at least one partial result to combine")
+
+    config = loaded[0].config
+    combined = PartialResults(
+        config=dict(config),
+        aggregator=StreamingAggregator(config["retain_runs"])
+    )
+    for partial in loaded:
+        partial.check_config(config)
+        for start, stop in partial.completed:
+            overlap = [
+                (s, e) for s, e in combined.completed if s < stop and start < e
+            ]
+            if overlap:
+                raise ValueError(
+                    f"Run IDs [{start}, {stop}) overlap already merged ranges {overlap}"
+                )
+            combined.mark_completed(range(start, stop))
+        combined.aggregator.merge(partial.aggregator)
+        combined.shards.extend(partial.shards)
+    return combined
+
+
+def merge_results(
+    partials: Sequence[Union[PartialResults, str]],
+    measure_precision: bool = False
+) -> SimulationResults:
+    """
+    Merge partial results covering a whole job into SimulationResults.
+
+    Args:
+        partials: PartialResults objects or paths to saved ones, jointly
+                  covering range(num_runs) exactly once
+        measure_precision: As in SimulationEngine.run()
+
+    Returns:
+        SimulationResults equal to a single-node SimulationEngine.run()
+
+    Raises:
+        ValueError: If partials are incompatible, overlap or leave run IDs missing
+    """
+    combined = combine_partials(partials)
+    config = combined.config
+
+    missing = combined.remaining(config["num_runs"])
+    if missing:
+        raise ValueError(
+            f"Partial results do not cover all {config['num_runs']} runs; missing "
+            + ", ".join(f"[{r.start}, {r.stop})" for r in missing)
+        )
+
+    engine = SimulationEngine(master_seed=config["master_seed"], seed_scheme=config["seed_scheme"])
+    aggregator = combined.aggregator
+    precision = PrecisionReport.measure(aggregator) if measure_precision else None
+    return engine._aggregate(aggregator, config["sampling"], precision)
+
+
+def merged_output(
+    partials: Sequence[Union[PartialResults, str]],
+    simulation_id: str,
+    trial: Any,
+    scenario: Optional[Any] = None,
+    constraints: Optional[List[Any]] = None
+):
+    """
+    Merge partial results into an EnhancedSimulationOutput.
+
+    Execution duration is the summed duration of all shards.
+
+    Args:
+        partials: As in merge_results(); must retain all runs
+        simulation_id: Unique identifier
+        trial: Trial the partials were run on (checked by fingerprint)
+        scenario: Optional scenario profile (for the input specification)
+        constraints: Optional constraints (for the input specification)
+
+    Raises:
+        ValueError: As in merge_results(), or if trial does not match the
+                    partials or runs were not all retained
+    """
+    from seleensim.output_schema import create_enhanced_output
+
+    combined = combine_partials(partials)
+    config = combined.config
+    if config["retain_runs"] != "all":
+        raise ValueError(
+            f'merged_output needs retain_runs="all", partials used {config["retain_runs"]!r}'
+        )
+    if fingerprint(trial) != config["trial"]:
+        raise ValueError("trial does not match the trial the partial results were run on")
+
+    results = merge_results([combined], measure_precision=True)
+    return create_enhanced_output(
+        simulation_id=simulation_id,
+        trial=trial,
+        scenario=scenario,
+        constraints=constraints,
+        run_results=results.run_results,
+        master_seed=results.master_seed,
+        execution_duration=sum(shard["duration_seconds"] for shard in combined.shards),
+        results=results
+    )
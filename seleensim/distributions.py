@@ -6,12 +6,34 @@ Design principles:
 - Intuitive, domain-agnostic parameterizations
 - Serializable to JSON for calibration workflows
 - No fitted state or hidden assumptions
+
+Seeds:
+    sample(seed) draws from np.random.default_rng(seed), as it always
+    has: unbounded samples are bit-identical to earlier versions.
+    sample_array(seeds) and sample_many() hash one uniform per seed
+    instead (seed_scheme="counter", no Generator per seed), so their
+    values differ from sample(seed); seed_scheme="legacy" makes them
+    loop over sample() and reproduce it element-wise.
+
+Bounds:
+    Bounded distributions are sampled exactly from the truncated
+    distribution by inverse CDF: one uniform draw u maps to
+    ppf(F(min) + u * (F(max) - F(min))). Cost is O(1) however tight the
+    bounds are. Legacy rejection sampling remains available through
+    truncation="rejection" (with seed_scheme="legacy" for arrays), to
+    reproduce bounded results from earlier versions.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple, Union
 import numpy as np
-from scipy import stats
+from scipy import stats, special
+
+from seleensim.seeding import _GOLDEN, SEED_SCHEMES, hashed_uniforms
+
+
+# How bounded distributions are sampled
+TRUNCATION_METHODS = ("inverse_cdf", "rejection")
 
 
 class Distribution(ABC):
@@ -31,7 +53,7 @@ class Distribution(ABC):
 
         Args:
             bounds: Optional (min, max) tuple to constrain samples.
-                   Enforced via rejection sampling.
+                   Enforced by sampling the truncated distribution (inverse CDF).
 
         Raises:
             ValueError: If bounds are invalid (min >= max).
@@ -43,18 +65,156 @@ class Distribution(ABC):
                 raise ValueError(f"bounds min must be < max, got {bounds}")
         self.bounds = bounds
 
-    @abstractmethod
-    def sample(self, seed: int) -> float:
+        # (upper_tail, p_low, p_high) of the bounds, computed on first bounded sample
+        self._truncation: Optional[Tuple[bool, float, float]] = None
+
+    def sample(self, seed: int, truncation: str = "inverse_cdf") -> float:
         """
-        Generate a single sample.
+        Generate a single sample from np.random.default_rng(seed).
+
+        Unbounded samples are bit-identical to earlier versions. Bounded
+        ones map one uniform draw of the same Generator through the
+        truncated inverse CDF, or repeat earlier versions' rejection
+        sampling with truncation="rejection".
 
         Args:
             seed: Random seed for reproducibility.
+            truncation: One of TRUNCATION_METHODS.
 
         Returns:
             A single sampled value, respecting bounds if set.
         """
-        pass
+        if truncation not in TRUNCATION_METHODS:
+            raise ValueError(f"truncation must be one of {TRUNCATION_METHODS}, got {truncation!r}")
+        rng = np.random.default_rng(seed)
+        if self.bounds is None or truncation == "rejection":
+            return float(self._apply_bounds_rejection(rng, lambda: self._draw(rng)))
+        return float(self._sample_truncated(rng.random()))
+
+    def sample_batch(self, rng_or_seed: Union[np.random.Generator, int], n: int) -> np.ndarray:
+        """
+        Generate n samples from a single random stream.
+
+        Args:
+            rng_or_seed: NumPy Generator to draw from, or an integer seed
+                         (a fresh Generator is created from it).
+            n: Number of samples.
+
+        Returns:
+            Array of shape (n,), respecting bounds if set.
+
+        Note:
+            Deterministic given the seed (or Generator state), but element i
+            is NOT equal to sample(seed + i). Use sample_array() when each
+            value must reproduce an independent per-seed sample.
+        """
+        if n < 0:
+            raise ValueError(f"n must be >= 0, got {n}")
+        if isinstance(rng_or_seed, np.random.Generator):
+            rng = rng_or_seed
+        else:
+            rng = np.random.default_rng(rng_or_seed)
+        return self._apply_bounds_batch(rng, n)
+
+    def sample_array(self, seeds: Union[np.ndarray, Sequence[int]],
+                     truncation: str = "inverse_cdf",
+                     seed_scheme: str = "counter") -> np.ndarray:
+        """
+        Generate one sample per seed.
+
+        Deterministic per seed, whatever the other seeds. Under the counter
+        scheme, uniforms are hashed from the seed array in one vectorized
+        call (seed_uniforms) and mapped by a single inverse CDF; values
+        differ from sample(seed). The legacy scheme calls sample(seed, truncation)
+        for each seed (one Generator each), reproducing it exactly.
+
+        Args:
+            seeds: Non-negative integer seeds of any shape (e.g. (num_sites,)
+                   for one run, or (num_runs, num_sites) for all runs at once).
+            truncation: "inverse_cdf" (default) or "rejection" (legacy
+                        scheme only).
+            seed_scheme: "counter" (default) or "legacy" (see SEED_SCHEMES).
+
+        Returns:
+            Float array with the same shape as seeds.
+
+        Raises:
+            ValueError: If truncation or seed_scheme is unknown, or rejection
+                        is requested under the counter scheme.
+        """
+        if truncation not in TRUNCATION_METHODS:
+            raise ValueError(f"truncation must be one of {TRUNCATION_METHODS}, got {truncation!r}")
+        if seed_scheme not in SEED_SCHEMES:
+            raise ValueError(f"seed_scheme must be one of {SEED_SCHEMES}, got {seed_scheme!r}")
+
+        seeds = np.asarray(seeds, dtype=np.uint64)
+        if seed_scheme == "counter":
+            if truncation != "inverse_cdf":
+                raise ValueError(
+                    "truncation='rejection' draws from per-seed Generators; use seed_scheme='legacy'"
+                )
+            return self.from_uniform(seed_uniforms(seeds))
+
+        out = np.empty(seeds.shape, dtype=float)
+        flat = out.reshape(-1)
+        for i, seed in enumerate(seeds.reshape(-1).tolist()):
+            flat[i] = self.sample(seed, truncation)
+        return out
+
+    def ppf(self, q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Inverse CDF (quantile function) of the unbounded distribution.
+
+        Args:
+            q: Probability or array of probabilities in [0, 1].
+
+        Returns:
+            float for scalar q, otherwise array of q's shape.
+
+        Raises:
+            ValueError: If any q not in [0, 1].
+        """
+        q = np.asarray(q, dtype=float)
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError("ppf probabilities must be in [0, 1]")
+        x = np.asarray(self._ppf(q), dtype=float)
+        return float(x) if x.ndim == 0 else x
+
+    def from_uniform(self, u: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Map uniforms in [0, 1) to samples by inverse CDF, respecting bounds.
+
+        Used to drive sampling from designed point sets (Sobol, Latin
+        hypercube): stratification of u carries over to the samples.
+
+        Args:
+            u: Uniform value(s) in [0, 1).
+
+        Returns:
+            Float array of u's shape.
+        """
+        u = np.asarray(u, dtype=float)
+        if self.bounds is not None:
+            return self._sample_truncated(u)
+        return np.asarray(self._ppf(u), dtype=float)
+
+    def _ppf(self, q: np.ndarray) -> np.ndarray:
+        """Vectorized inverse CDF (subclasses override with closed forms / ufuncs)."""
+        return self._dist.ppf(q)
+
+    def _isf(self, q: np.ndarray) -> np.ndarray:
+        """Vectorized inverse survival function (accurate in the upper tail)."""
+        return self._dist.isf(q)
+
+    def _draw(self, rng: np.random.Generator, size: Optional[int] = None):
+        """
+        Draw unbounded variate(s) from rng.
+
+        Subclasses override this with the NumPy primitive scipy's frozen
+        distribution would use, so results match `_dist.rvs(random_state=rng)`
+        exactly without its per-call overhead.
+        """
+        return self._dist.rvs(size=size, random_state=rng)
 
     @abstractmethod
     def mean(self) -> float:
@@ -88,9 +248,51 @@ class Distribution(ABC):
         """
         pass
 
-    def _apply_bounds(self, rng: np.random.Generator, sample_fn, max_attempts: int = 1000) -> float:
+    def _sample_truncated(self, u: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        Map uniforms u in [0, 1) to the distribution truncated to bounds.
+
+        Works on whichever tail keeps precision: CDF below the median,
+        survival function above it (so bounds deep in the upper tail do not
+        collapse to 1.0 - 1.0).
+        """
+        upper_tail, p_low, p_high = self._truncation_bounds()
+        q = p_low + np.asarray(u, dtype=float) * (p_high - p_low)
+        x = self._isf(q) if upper_tail else self._ppf(q)
+        return np.clip(x, self.bounds[0], self.bounds[1])
+
+    def _truncation_bounds(self) -> Tuple[bool, float, float]:
+        """
+        Precomputed probabilities of the bounds, cached on first use.
+
+        Returns:
+            (upper_tail, p_low, p_high): p are survival probabilities if
+            upper_tail, else CDF values; sampling maps u onto [p_low, p_high].
+
+        Raises:
+            RuntimeError: If the bounds contain no probability mass.
+        """
+        if self._truncation is None:
+            min_val, max_val = self.bounds
+            cdf_low = float(self._dist.cdf(min_val))
+            if cdf_low > 0.5:
+                # Upper tail: isf is decreasing, so sf(max) maps to max
+                truncation = (True, float(self._dist.sf(max_val)), float(self._dist.sf(min_val)))
+            else:
+                truncation = (False, cdf_low, float(self._dist.cdf(max_val)))
+
+            if not truncation[2] > truncation[1]:
+                raise RuntimeError(
+                    f"Could not generate sample within bounds {self.bounds}: "
+                    f"the distribution has no probability mass there. Bounds may be too tight."
+                )
+            self._truncation = truncation
+        return self._truncation
+
+    def _apply_bounds_rejection(self, rng: np.random.Generator, sample_fn,
+                                max_attempts: int = 1000) -> float:
         """
-        Apply bounds via rejection sampling.
+        Apply bounds via rejection sampling (legacy, truncation="rejection").
 
         Args:
             rng: NumPy random generator.
@@ -117,6 +319,18 @@ class Distribution(ABC):
             f"after {max_attempts} attempts. Bounds may be too tight."
         )
 
+    def _apply_bounds_batch(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        """
+        Sample n values from rng: direct draws if unbounded, else inverse
+        CDF of the truncated distribution from n uniform draws.
+
+        Raises:
+            RuntimeError: If the bounds contain no probability mass.
+        """
+        if self.bounds is None:
+            return np.asarray(self._draw(rng, n), dtype=float)
+        return self._sample_truncated(rng.random(n))
+
 
 class Triangular(Distribution):
     """
@@ -152,15 +366,25 @@ class Triangular(Distribution):
         self.low = low
         self.mode = mode
         self.high = high
+        self._c = (mode - low) / (high - low)
         self._dist = stats.triang(
-            c=(mode - low) / (high - low),
+            c=self._c,
             loc=low,
             scale=high - low
         )
 
-    def sample(self, seed: int) -> float:
-        rng = np.random.default_rng(seed)
-        return self._apply_bounds(rng, lambda: self._dist.rvs(random_state=rng))
+    def _draw(self, rng: np.random.Generator, size: Optional[int] = None):
+        return rng.triangular(0, self._c, 1, size) * (self.high - self.low) + self.low
+
+    def _ppf(self, q: np.ndarray) -> np.ndarray:
+        c = self._c
+        standard = np.where(q < c, np.sqrt(q * c), 1 - np.sqrt((1 - q) * (1 - c)))
+        return standard * (self.high - self.low) + self.low
+
+    def _isf(self, q: np.ndarray) -> np.ndarray:
+        c = self._c
+        standard = np.where(q <= 1 - c, 1 - np.sqrt(q * (1 - c)), np.sqrt((1 - q) * c))
+        return standard * (self.high - self.low) + self.low
 
     def mean(self) -> float:
         return (self.low + self.mode + self.high) / 3
@@ -220,11 +444,17 @@ class LogNormal(Distribution):
         self.sigma = np.sqrt(np.log(1 + variance / mean**2))
         self.mu = np.log(mean) - 0.5 * self.sigma**2
 
-        self._dist = stats.lognorm(s=self.sigma, scale=np.exp(self.mu))
+        self._scale = np.exp(self.mu)
+        self._dist = stats.lognorm(s=self.sigma, scale=self._scale)
 
-    def sample(self, seed: int) -> float:
-        rng = np.random.default_rng(seed)
-        return self._apply_bounds(rng, lambda: self._dist.rvs(random_state=rng))
+    def _draw(self, rng: np.random.Generator, size: Optional[int] = None):
+        return np.exp(self.sigma * rng.standard_normal(size)) * self._scale
+
+    def _ppf(self, q: np.ndarray) -> np.ndarray:
+        return np.exp(self.sigma * special.ndtri(q)) * self._scale
+
+    def _isf(self, q: np.ndarray) -> np.ndarray:
+        return np.exp(-self.sigma * special.ndtri(q)) * self._scale
 
     def mean(self) -> float:
         return self.mean_val
@@ -282,9 +512,14 @@ class Gamma(Distribution):
         self.scale = scale
         self._dist = stats.gamma(a=shape, scale=scale)
 
-    def sample(self, seed: int) -> float:
-        rng = np.random.default_rng(seed)
-        return self._apply_bounds(rng, lambda: self._dist.rvs(random_state=rng))
+    def _draw(self, rng: np.random.Generator, size: Optional[int] = None):
+        return rng.standard_gamma(self.shape, size) * self.scale
+
+    def _ppf(self, q: np.ndarray) -> np.ndarray:
+        return special.gammaincinv(self.shape, q) * self.scale
+
+    def _isf(self, q: np.ndarray) -> np.ndarray:
+        return special.gammainccinv(self.shape, q) * self.scale
 
     def mean(self) -> float:
         return self.shape * self.scale
@@ -336,9 +571,11 @@ class Bernoulli(Distribution):
         self.p = p
         self._dist = stats.bernoulli(p=p)
 
-    def sample(self, seed: int) -> float:
-        rng = np.random.default_rng(seed)
-        return float(self._dist.rvs(random_state=rng))
+    def _draw(self, rng: np.random.Generator, size: Optional[int] = None):
+        return rng.binomial(1, self.p, size)
+
+    def _ppf(self, q: np.ndarray) -> np.ndarray:
+        return (np.asarray(q) > 1 - self.p).astype(float)
 
     def mean(self) -> float:
         return self.p
@@ -358,6 +595,61 @@ class Bernoulli(Distribution):
         }
 
 
+def seed_uniforms(seeds: Union[np.ndarray, Sequence[int]]) -> np.ndarray:
+    """
+    Uniform in (0, 1) of each seed: the first SplitMix64 output from it.
+
+    The uniform behind every counter-scheme sample: pushing it through
+    from_uniform() gives the value sample_array() draws from that seed. Vectorized integer hashing (seleensim.seeding), no
+    Generator per seed.
+
+    Returns:
+        Float array with the same shape as seeds (a 0-d array for a scalar).
+    """
+    seeds = np.asarray(seeds, dtype=np.uint64)
+    with np.errstate(over='ignore'):
+        return hashed_uniforms(seeds + np.uint64(_GOLDEN))
+
+
+def sample_many(distributions: Sequence[Distribution],
+                seeds: Union[np.ndarray, Sequence[int]],
+                truncation: str = "inverse_cdf",
+                seed_scheme: str = "counter") -> np.ndarray:
+    """
+    Sample a heterogeneous list of distributions, one seed each.
+
+    Equivalent to [d.sample_array([s], ...)[0] for d, s in zip(distributions,
+    seeds)], but entries sharing the same Distribution object are drawn in
+    a single sample_array() call.
+
+    Args:
+        distributions: Distribution for each output slot.
+        seeds: Seed for each output slot (same length as distributions).
+        truncation: How bounded distributions are sampled (see TRUNCATION_METHODS).
+        seed_scheme: As in sample_array().
+
+    Returns:
+        Float array of shape (len(distributions),).
+    """
+    seeds = np.asarray(seeds, dtype=np.uint64)
+    if len(distributions) != len(seeds):
+        raise ValueError(
+            f"Need one seed per distribution, got {len(seeds)} seeds "
+            f"for {len(distributions)} distributions"
+        )
+
+    groups: Dict[int, List[int]] = {}
+    for i, dist in enumerate(distributions):
+        groups.setdefault(id(dist), []).append(i)
+
+    out = np.empty(len(distributions), dtype=float)
+    for indices in groups.values():
+        out[indices] = distributions[indices[0]].sample_array(
+            seeds[indices], truncation, seed_scheme
+        )
+    return out
+
+
 def from_dict(data: Dict[str, Any]) -> Distribution:
     """
     Deserialize distribution from dict.
@@ -159,8 +159,8 @@ class Activity:
             "type": "Activity",
             "activity_id": self.activity_id,
             "duration": self.duration.to_dict(),
-            "dependencies": list(self.dependencies),
-            "required_resources": list(self.required_resources),
+            "dependencies": sorted(self.dependencies),
+            "required_resources": sorted(self.required_resources),
             "success_probability": self.success_probability.to_dict() if self.success_probability else None
         }
 
@@ -332,9 +332,9 @@ class PatientFlow:
         return {
             "type": "PatientFlow",
             "flow_id": self.flow_id,
-            "states": list(self.states),
+            "states": sorted(self.states),
             "initial_state": self.initial_state,
-            "terminal_states": list(self.terminal_states),
+            "terminal_states": sorted(self.terminal_states),
             "transition_times": {
                 f"{from_s}->{to_s}": dist.to_dict()
                 for (from_s, to_s), dist in self.transition_times.items()
@@ -0,0 +1,249 @@
+"""
+Engine instrumentation and structured progress reporting.
+
+Design Principles:
+- Opt-in: an engine without instruments takes no timings and makes no
+  hook calls, so uninstrumented runs cost exactly what they did before
+- Observation only: hooks see events, constraint results and timings
+  but cannot change them; instrumented runs produce identical results
+- Parallel-safe: each run shard gets its own spawned instrument, and
+  the shards' instruments are merged back into the engine's, like
+  StreamingAggregator
+- Structured progress: run() reports ProgressUpdate objects to a
+  callback instead of printing; print_progress reproduces the console
+  output. run_iter() and arun() yield the same updates with partial
+  results attached
+
+Hooks (Instrument methods, all optional):
+    run_started(run_id)
+    event_dequeued(event, queue_size)          before each event is processed
+    constraint_evaluated(name, event, seconds, result)
+    event_rescheduled(event, new_time)
+    run_finished(run_id, events_processed, seconds)
+
+Example:
+    profiler = EngineProfiler()
+    engine = SimulationEngine(constraints=constraints, instruments=[profiler])
+    engine.run(trial, num_runs=200, workers=4)
+    print(profiler.report())     # which constraint is slow?
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class ProgressUpdate:
+    """
+    One progress report from a simulation job.
+
+    stage: "started", "resumed", "runs_completed", "batch_completed",
+        "finished" or "cancelled"
+    completed_runs / total_runs: Progress so far (total_runs is the run
+        budget for adaptive runs)
+    message: Human-readable rendering (what print_progress prints)
+    detail: Stage-specific extras (e.g. worst half-width of an adaptive batch)
+    results: SimulationResults aggregated over the runs completed so far
+        (run_iter() and arun() updates only; None before the first run)
+    """
+    stage: str
+    completed_runs: int
+    total_runs: int
+    message: str
+    detail: Dict[str, Any] = field(default_factory=dict)
+    results: Optional[Any] = None
+
+    @property
+    def fraction(self) -> float:
+        return self.completed_runs / self.total_runs if self.total_runs else 1.0
+
+
+def print_progress(update: ProgressUpdate):
+    """Default progress callback: print each update's message."""
+    print(update.message)
+
+
+class Instrument:
+    """
+    Base class for engine hooks. Override the hooks you need.
+
+    Instruments must be picklable (they travel to worker processes) and
+    implement spawn() and merge() so that per-shard copies can be
+    combined: spawn() returns an empty instrument with the same
+    configuration, merge(other) folds a spawned copy's data into self.
+    """
+
+    def run_started(self, run_id: int):
+        pass
+
+    def event_dequeued(self, event: Any, queue_size: int):
+        pass
+
+    def constraint_evaluated(self, name: str, event: Any, seconds: float, result: Any):
+        pass
+
+    def event_rescheduled(self, event: Any, new_time: float):
+        pass
+
+    def run_finished(self, run_id: int, events_processed: int, seconds: float):
+        pass
+
+    def spawn(self) -> "Instrument":
+        return type(self)()
+
+    def merge(self, other: "Instrument"):
+        pass
+
+
+@dataclass
+class ConstraintTiming:
+    """Evaluate() calls and cumulative wall time of one constraint."""
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+@dataclass
+class RunProfile:
+    """
+    Per-run throughput and event-queue size.
+
+    queue_samples: (simulation time, queue size) every sample_every
+    dequeued events, plus the first event
+    """
+    run_id: int
+    events_processed: int = 0
+    seconds: float = 0.0
+    max_queue_size: int = 0
+    queue_samples: List[Tuple[float, int]] = field(default_factory=list)
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events_processed / self.seconds if self.seconds > 0 else 0.0
+
+
+@dataclass
+class RescheduleStats:
+    """Reschedules of one event type: total, and the longest loop of a single event."""
+    event_type: str
+    reschedules: int = 0
+    max_per_event: int = 0
+
+
+class EngineProfiler(Instrument):
+    """
+    Built-in instrument: per-constraint timing, throughput, queue size
+    and reschedule loops.
+
+    Constraints are named "<ClassName>#<position in engine.constraints>".
+    """
+
+    def __init__(self, sample_every: int = 100):
+        """
+        Args:
+            sample_every: Record the queue size every this many dequeued events
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+        self.sample_every = sample_every
+        self.constraints: Dict[str, ConstraintTiming] = {}
+        self.runs: Dict[int, RunProfile] = {}
+        self.reschedules: Dict[str, RescheduleStats] = {}
+        self._current: Optional[RunProfile] = None
+        self._run_reschedules: Dict[Tuple[str, str], int] = {}
+
+    # Hooks
+
+    def run_started(self, run_id: int):
+        self._current = RunProfile(run_id)
+        self._run_reschedules = {}
+
+    def event_dequeued(self, event: Any, queue_size: int):
+        run = self._current
+        if queue_size > run.max_queue_size:
+            run.max_queue_size = queue_size
+        if run.events_processed % self.sample_every == 0:
+            run.queue_samples.append((event.time, queue_size))
+        run.events_processed += 1
+
+    def constraint_evaluated(self, name: str, event: Any, seconds: float, result: Any):
+        timing = self.constraints.get(name)
+        if timing is None:
+            timing = self.constraints[name] = ConstraintTiming(name)
+        timing.calls += 1
+        timing.seconds += seconds
+
+    def event_rescheduled(self, event: Any, new_time: float):
+        stats = self.reschedules.get(event.event_type)
+        if stats is None:
+            stats = self.reschedules[event.event_type] = RescheduleStats(event.event_type)
+        stats.reschedules += 1
+        key = (event.event_type, event.event_id)
+        count = self._run_reschedules.get(key, 0) + 1
+        self._run_reschedules[key] = count
+        if count > stats.max_per_event:
+            stats.max_per_event = count
+
+    def run_finished(self, run_id: int, events_processed: int, seconds: float):
+        run = self._current
+        run.events_processed = events_processed
+        run.seconds = seconds
+        self.runs[run_id] = run
+        self._current = None
+
+    # Merging
+
+    def spawn(self) -> "EngineProfiler":
+        return EngineProfiler(self.sample_every)
+
+    def merge(self, other: "EngineProfiler"):
+        for name, timing in other.constraints.items():
+            mine = self.constraints.setdefault(name, ConstraintTiming(name))
+            mine.calls += timing.calls
+            mine.seconds += timing.seconds
+        for event_type, stats in other.reschedules.items():
+            mine = self.reschedules.setdefault(event_type, RescheduleStats(event_type))
+            mine.reschedules += stats.reschedules
+            mine.max_per_event = max(mine.max_per_event, stats.max_per_event)
+        self.runs.update(other.runs)
+
+    # Reporting
+
+    def slowest_constraints(self) -> List[ConstraintTiming]:
+        """Constraint timings, most cumulative time first."""
+        return sorted(self.constraints.values(), key=lambda t: t.seconds, reverse=True)
+
+    def events_per_second(self) -> float:
+        """Overall throughput across profiled runs."""
+        seconds = sum(run.seconds for run in self.runs.values())
+        events = sum(run.events_processed for run in self.runs.values())
+        return events / seconds if seconds > 0 else 0.0
+
+    def report(self) -> str:
+        """Human-readable profile."""
+        lines = [
+            f"Engine profile ({len(self.runs)} runs, "
+            f"{self.events_per_second():,.0f} events/sec):"
+        ]
+        if self.runs:
+            max_queue = max(run.max_queue_size for run in self.runs.values())
+            lines.append(f"  Max event queue size: {max_queue}")
+        if self.constraints:
+            lines.append("  Constraints (by cumulative time):")
+            for timing in self.slowest_constraints():
+                lines.append(
+                    f"    {timing.name}: {timing.calls} calls, {timing.seconds * 1000:.1f} ms "
+                    f"({timing.mean_seconds * 1e6:.1f} µs/call)"
+                )
+        if self.reschedules:
+            lines.append("  Reschedules (by event type):")
+            for stats in sorted(self.reschedules.values(), key=lambda s: s.reschedules, reverse=True):
+                lines.append(
+                    f"    {stats.event_type}: {stats.reschedules} total, "
+                    f"max {stats.max_per_event} for one event"
+                )
+        return "\n".join(lines)
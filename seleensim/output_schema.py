@@ -49,6 +49,15 @@ class ProvenanceRecord:
     hostname: Optional[str] = None
     user: Optional[str] = None
 
+    # Seed derivation ("counter" or "legacy"; records without it predate counter seeds)
+    seed_scheme: str = "legacy"
+
+    # Input sampling method ("random", "coupled", "sobol" or "lhs")
+    sampling: str = "random"
+
+    # Achieved percentile precision (PrecisionReport.to_dict()), if measured
+    precision: Optional[Dict[str, Any]] = None
+
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to JSON."""
         return asdict(self)
@@ -61,7 +70,10 @@ class ProvenanceRecord:
         initial_budget: float,
         execution_duration_seconds: float,
         seleensim_version: str = "0.1.0",
-        include_environment: bool = False
+        include_environment: bool = False,
+        seed_scheme: str = "counter",
+        sampling: str = "random",
+        precision: Optional[Dict[str, Any]] = None
     ) -> "ProvenanceRecord":
         """
         Factory method to create provenance record.
@@ -74,6 +86,9 @@ class ProvenanceRecord:
             execution_duration_seconds: Runtime
             seleensim_version: Software version
             include_environment: Whether to capture hostname/user
+            seed_scheme: Engine seed derivation scheme used
+            sampling: Input sampling method used
+            precision: Achieved percentile precision (PrecisionReport.to_dict())
 
         Returns:
             ProvenanceRecord with captured metadata
@@ -103,7 +118,10 @@ class ProvenanceRecord:
             initial_budget=initial_budget,
             execution_duration_seconds=execution_duration_seconds,
             hostname=hostname,
-            user=user
+            user=user,
+            seed_scheme=seed_scheme,
+            sampling=sampling,
+            precision=precision
         )
 
 
@@ -327,15 +345,7 @@ class EnhancedSimulationOutput:
         input_spec = InputSpecification(**data["input_specification"])
 
         # Aggregated results
-        agg_data = data["aggregated_results"]
-        agg_results = AggregatedResults(
-            num_runs=agg_data["num_runs"],
-            completion_time=PercentileDistribution(**agg_data["completion_time"]),
-            total_cost=PercentileDistribution(**agg_data["total_cost"]),
-            events_processed=PercentileDistribution(**agg_data["events_processed"]),
-            events_rescheduled=PercentileDistribution(**agg_data["events_rescheduled"]),
-            constraint_violations=PercentileDistribution(**agg_data["constraint_violations"])
-        )
+        agg_results = AggregatedResults.from_dict(data["aggregated_results"])
 
         return EnhancedSimulationOutput(
             provenance=provenance,
@@ -344,6 +354,25 @@ class EnhancedSimulationOutput:
             single_run_results=data.get("single_run_results")
         )
 
+    def to_columnar(self, dirpath: str, run_results: Optional[List[Any]] = None):
+        """
+        Save output as a columnar directory (see seleensim.columnar).
+
+        Args:
+            dirpath: Directory to write (created if missing)
+            run_results: RunResult objects; if given, per-run metrics come
+                         from them and their timelines are stored too.
+                         Otherwise single_run_results are stored.
+        """
+        from seleensim.columnar import write_columnar
+        write_columnar(dirpath, self, run_results)
+
+    @staticmethod
+    def from_columnar(dirpath: str) -> "EnhancedSimulationOutput":
+        """Load output from a columnar directory (single runs as dicts, like from_json)."""
+        from seleensim.columnar import open_columnar
+        return open_columnar(dirpath).to_output(include_single_runs=True)
+
 
 @dataclass
 class AggregatedResults:
@@ -377,6 +406,18 @@ class AggregatedResults:
             "constraint_violations": self.constraint_violations.to_dict()
         }
 
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "AggregatedResults":
+        """Deserialize from to_dict() output."""
+        return AggregatedResults(
+            num_runs=data["num_runs"],
+            completion_time=PercentileDistribution(**data["completion_time"]),
+            total_cost=PercentileDistribution(**data["total_cost"]),
+            events_processed=PercentileDistribution(**data["events_processed"]),
+            events_rescheduled=PercentileDistribution(**data["events_rescheduled"]),
+            constraint_violations=PercentileDistribution(**data["constraint_violations"])
+        )
+
     def summary(self) -> str:
         """Human-readable summary for reporting."""
         return (
@@ -407,7 +448,11 @@ def create_enhanced_output(
     constraints: Optional[List[Any]],
     run_results: List[Any],
     master_seed: int,
-    execution_duration: float
+    execution_duration: float,
+    seed_scheme: Optional[str] = None,
+    sampling: Optional[str] = None,
+    precision: Optional[Dict[str, Any]] = None,
+    results: Optional[Any] = None
 ) -> EnhancedSimulationOutput:
     """
     Create enhanced simulation output from basic results.
@@ -420,10 +465,28 @@ def create_enhanced_output(
         run_results: List of RunResult objects
         master_seed: Random seed
         execution_duration: Runtime in seconds
+        seed_scheme: Engine seed derivation scheme (default: results.seed_scheme)
+        sampling: Input sampling method (default: results.sampling, else "random")
+        precision: Achieved precision (default: results.precision, if measured)
+        results: SimulationResults run_results came from, to take the
+                 provenance fields above from
 
     Returns:
         EnhancedSimulationOutput with full traceability
+
+    Raises:
+        ValueError: If neither seed_scheme nor results is given (the
+                    record would have to guess how seeds were derived)
     """
+    if results is not None:
+        seed_scheme = seed_scheme or results.seed_scheme
+        sampling = sampling or results.sampling
+        if precision is None and results.precision is not None:
+            precision = results.precision.to_dict()
+    if seed_scheme is None:
+        raise ValueError(
+            "Pass results (the SimulationResults) or seed_scheme to record how seeds were derived"
+        )
     # Create provenance
     provenance = ProvenanceRecord.create(
         simulation_id=simulation_id,
@@ -431,7 +494,10 @@ def create_enhanced_output(
         master_seed=master_seed,
         initial_budget=float('inf'),
         execution_duration_seconds=execution_duration,
-        include_environment=False
+        include_environment=False,
+        seed_scheme=seed_scheme,
+        sampling=sampling or "random",
+        precision=precision
     )
 
     # Create input specification
@@ -0,0 +1,442 @@
+"""
+Cohort-vectorized execution of a PatientFlow state machine.
+
+Design Principles:
+- Cohorts, not patients: every step advances all patients still in
+  flight at once, as NumPy arrays; branch choices and delays are drawn in
+  one vectorized call per transition, never per patient object
+- The flow stays declarative: PatientFlow only describes states and
+  transitions; compile_flow turns it into index tables and this module
+  executes them (the entity gains no behavior)
+- Explicit semantics: how transition_times and transition_probabilities
+  are read is stated below, and flows they cannot describe are rejected
+  at compile time rather than guessed at
+- Common random numbers: patient k's draws at step j hash (run seed, k, j),
+  so they do not depend on how many other patients there are
+
+Semantics:
+    Each patient enters flow.initial_state at its entry time (e.g. an
+    EnrollmentResult's times) and moves along transition_times edges
+    until it reaches a terminal state or the horizon.
+    - Branch: a state with one outgoing edge always takes it. A state
+      with several needs a transition_probabilities entry per edge, and
+      the means of each state's entries must sum to 1. An entry is drawn
+      once per run (inverse CDF of a uniform hashed from the run and the
+      edge, as for the other per-run inputs) and each state's draws are
+      renormalized to sum to 1; patients then choose branches with the
+      run's probabilities. A Bernoulli(p) entry states the probability p
+      itself (its 0/1 outcome is the per-patient branch choice), so it is
+      the same in every run.
+    - Delay: drawn per patient and transition from the edge's
+      transition_times Distribution (inverse CDF, bounds respected).
+    - Horizon: a transition that would happen after the horizon does not
+      happen; the patient is counted in its current state at the horizon.
+    - A non-terminal state without outgoing edges holds its patients.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from seleensim.distributions import Bernoulli, Distribution, sample_many
+from seleensim.seeding import (
+    PURPOSE_FLOW_PROBABILITIES,
+    PURPOSE_PATIENT_FLOW,
+    SeedPlan,
+    entity_key,
+    hashed_uniforms,
+    mix64_array,
+)
+
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+# Allowed deviation of a state's branch probabilities from a total of 1
+PROBABILITY_TOLERANCE = 1e-9
+
+# Terminal states counted as dropouts unless others are given (the
+# dropout state of the bundled example flows)
+DEFAULT_DROPOUT_STATES = ("dropout",)
+
+
+@dataclass
+class FlowTable:
+    """
+    A PatientFlow compiled to index tables.
+
+    state_names: States in index order (sorted)
+    terminal: Whether each state is terminal
+    edge_to: Target state of each edge (edges sorted by (from, to))
+    edge_delays: Delay Distribution of each edge
+    branch_edges: Per state, its edges padded with -1 (num_states x max out-degree)
+    branch_cumulative: Per state, cumulative branch probabilities at the
+                       means (last real entry exactly 1, padding inf)
+    out_degree: Number of outgoing edges of each state
+    edge_probabilities: Branch probability of each edge at its mean (1 for
+                        a state's only edge)
+    drawn_edges: Edges whose probability is drawn per run
+    drawn_probabilities: Distribution of each of drawn_edges
+    drawn_keys: Entity key of each of drawn_edges (seeds its draws)
+    """
+    flow_id: str
+    state_names: List[str]
+    initial_state: int
+    terminal: np.ndarray
+    edge_to: np.ndarray
+    edge_delays: List[Distribution]
+    branch_edges: np.ndarray
+    branch_cumulative: np.ndarray
+    out_degree: np.ndarray
+    edge_probabilities: np.ndarray
+    drawn_edges: np.ndarray
+    drawn_probabilities: List[Distribution]
+    drawn_keys: np.ndarray
+
+    def state_index(self, name: str) -> int:
+        return self.state_names.index(name)
+
+
+def compile_flow(flow: Any) -> FlowTable:
+    """
+    Compile a PatientFlow into index tables for execution.
+
+    Raises:
+        ValueError: If a branching state lacks probabilities, probabilities
+                    do not sum to 1, or a probability has no transition time
+    """
+    state_names = sorted(flow.states)
+    index = {name: i for i, name in enumerate(state_names)}
+    edges = sorted(flow.transition_times)
+
+    for edge in flow.transition_probabilities:
+        if edge not in flow.transition_times:
+            raise ValueError(
+                f"transition_probabilities[{edge}] has no transition_times entry to draw its delay from"
+            )
+
+    outgoing: Dict[str, List[int]] = {}
+    for e, (from_state, _) in enumerate(edges):
+        outgoing.setdefault(from_state, []).append(e)
+
+    width = max((len(e) for e in outgoing.values()), default=1)
+    branch_edges = np.full((len(state_names), width), -1, dtype=np.int64)
+    branch_cumulative = np.full((len(state_names), width), np.inf)
+    out_degree = np.zeros(len(state_names), dtype=np.int64)
+    edge_probabilities = np.ones(len(edges))
+    drawn_edges: List[int] = []
+
+    for from_state, state_edges in outgoing.items():
+        s = index[from_state]
+        out_degree[s] = len(state_edges)
+        branch_edges[s, :len(state_edges)] = state_edges
+        if len(state_edges) == 1:
+            probabilities = np.ones(1)
+        else:
+            missing = [edges[e] for e in state_edges if edges[e] not in flow.transition_probabilities]
+            if missing:
+                raise ValueError(
+                    f"State '{from_state}' branches, so every outgoing transition needs "
+                    f"transition_probabilities; missing {missing}"
+                )
+            probabilities = np.array(
+                [flow.transition_probabilities[edges[e]].mean() for e in state_edges]
+            )
+            drawn_edges.extend(
+                e for e in state_edges
+                if not isinstance(flow.transition_probabilities[edges[e]], Bernoulli)
+            )
+        if abs(probabilities.sum() - 1.0) > PROBABILITY_TOLERANCE:
+            raise ValueError(
+                f"Transition probabilities out of '{from_state}' must sum to 1, got {probabilities.sum()}"
+            )
+        edge_probabilities[state_edges] = probabilities
+        cumulative = np.cumsum(probabilities)
+        cumulative[-1] = 1.0
+        branch_cumulative[s, :len(state_edges)] = cumulative
+
+    drawn_edges.sort()
+    return FlowTable(
+        flow_id=flow.flow_id,
+        state_names=state_names,
+        initial_state=index[flow.initial_state],
+        terminal=np.array([name in flow.terminal_states for name in state_names]),
+        edge_to=np.array([index[to_state] for _, to_state in edges], dtype=np.int64),
+        edge_delays=[flow.transition_times[edge] for edge in edges],
+        branch_edges=branch_edges,
+        branch_cumulative=branch_cumulative,
+        out_degree=out_degree,
+        edge_probabilities=edge_probabilities,
+        drawn_edges=np.array(drawn_edges, dtype=np.int64),
+        drawn_probabilities=[flow.transition_probabilities[edges[e]] for e in drawn_edges],
+        drawn_keys=np.array(
+            [entity_key(f"{flow.flow_id}:{edges[e][0]}->{edges[e][1]}") for e in drawn_edges],
+            dtype=np.uint64
+        )
+    )
+
+
+def draw_branch_cumulative(table: FlowTable, seed_plan: SeedPlan, run_id: int) -> np.ndarray:
+    """
+    Cumulative branch probabilities of one run (see Semantics).
+
+    Each drawn edge's probability is sampled with the seed of (run, edge)
+    and each state's probabilities are renormalized to sum to 1. Flows
+    whose probabilities are all fixed return table.branch_cumulative.
+
+    Returns:
+        Array shaped like table.branch_cumulative
+
+    Raises:
+        ValueError: If a draw is negative or a state's draws are all zero
+    """
+    if not len(table.drawn_edges):
+        return table.branch_cumulative
+
+    probabilities = table.edge_probabilities.copy()
+    probabilities[table.drawn_edges] = sample_many(
+        table.drawn_probabilities,
+        seed_plan.entity_seeds(run_id, table.drawn_keys, PURPOSE_FLOW_PROBABILITIES)
+    )
+    if np.any(probabilities < 0):
+        raise ValueError(
+            f"Transition probabilities of flow '{table.flow_id}' must be >= 0, "
+            f"drew {probabilities.min()} in run {run_id}"
+        )
+
+    real = table.branch_edges >= 0
+    rows = np.where(real, probabilities[table.branch_edges], 0.0)
+    totals = rows.sum(axis=1)
+    branching = table.out_degree > 0
+    if np.any(totals[branching] <= 0):
+        raise ValueError(
+            f"Transition probabilities of flow '{table.flow_id}' drew all zero "
+            f"out of a state in run {run_id}"
+        )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cumulative = np.cumsum(rows, axis=1) / totals[:, None]
+    cumulative[~real] = np.inf
+    last = np.flatnonzero(branching)
+    cumulative[last, table.out_degree[last] - 1] = 1.0
+    return cumulative
+
+
+@dataclass
+class FlowResult:
+    """
+    Patients' paths through a flow in one run.
+
+    Patients are indexed by their position in entry_times. A visit is one
+    stay of one patient in one state; visit_ends is inf for stays still
+    ongoing at the horizon. Patients entering after the horizon have no
+    visits and final_states -1.
+    """
+    state_names: List[str]
+    horizon: float
+    entry_times: np.ndarray
+    final_states: np.ndarray
+    final_times: np.ndarray
+    visit_patients: np.ndarray
+    visit_states: np.ndarray
+    visit_starts: np.ndarray
+    visit_ends: np.ndarray
+    dropout_states: List[str]
+
+    @property
+    def num_patients(self) -> int:
+        return len(self.entry_times)
+
+    def state_counts(self) -> Dict[str, int]:
+        """Patients in each state at the horizon."""
+        counts = np.bincount(self.final_states[self.final_states >= 0], minlength=len(self.state_names))
+        return dict(zip(self.state_names, counts.tolist()))
+
+    @property
+    def dropout_mask(self) -> np.ndarray:
+        """Whether each patient ended in a dropout state."""
+        dropout = [self.state_names.index(name) for name in self.dropout_states]
+        return np.isin(self.final_states, dropout)
+
+    @property
+    def dropout_count(self) -> int:
+        return int(self.dropout_mask.sum())
+
+    def occupancy(self, at_times: Sequence[float]) -> Dict[str, np.ndarray]:
+        """
+        Patients in each state at each of at_times (occupancy curves).
+
+        Returns:
+            State name -> counts, one per time
+        """
+        at_times = np.asarray(at_times, dtype=float)
+        curves = {}
+        for s, name in enumerate(self.state_names):
+            in_state = self.visit_states == s
+            starts = np.sort(self.visit_starts[in_state])
+            ends = np.sort(self.visit_ends[in_state])
+            curves[name] = (
+                np.searchsorted(starts, at_times, side="right")
+                - np.searchsorted(ends, at_times, side="right")
+            )
+        return curves
+
+
+def run_flow(
+    table: FlowTable,
+    entry_times: Sequence[float],
+    horizon: float,
+    seed: int,
+    dropout_states: Optional[Sequence[str]] = None,
+    max_steps: int = 1000,
+    branch_cumulative: Optional[np.ndarray] = None
+) -> FlowResult:
+    """
+    Advance a cohort of patients through a compiled flow.
+
+    Args:
+        table: Compiled flow (compile_flow)
+        entry_times: When each patient enters the initial state
+        horizon: Last time of interest
+        seed: Run seed (e.g. from SeedPlan, see simulate_patient_flow)
+        dropout_states: States counted by dropout_count (None =
+                        DEFAULT_DROPOUT_STATES present in the flow)
+        max_steps: Transitions per patient before giving up (guards
+                   against cycles of zero-length delays)
+        branch_cumulative: Branch probabilities of this run
+                           (draw_branch_cumulative; None = the means,
+                           table.branch_cumulative)
+
+    Returns:
+        FlowResult
+
+    Raises:
+        ValueError: If a dropout state is unknown, or patients are still
+                    moving before the horizon after max_steps transitions
+    """
+    if dropout_states is None:
+        dropout_states = [name for name in DEFAULT_DROPOUT_STATES if name in table.state_names]
+    unknown = [name for name in dropout_states if name not in table.state_names]
+    if unknown:
+        raise ValueError(f"dropout_states not in flow '{table.flow_id}': {unknown}")
+
+    if branch_cumulative is None:
+        branch_cumulative = table.branch_cumulative
+
+    entry = np.asarray(entry_times, dtype=float)
+    n = len(entry)
+    with np.errstate(over='ignore'):
+        patient_keys = mix64_array(
+            np.uint64(seed) + np.arange(1, n + 1, dtype=np.uint64) * _GOLDEN
+        )
+
+    state = np.full(n, -1, dtype=np.int64)
+    time = entry.copy()
+    entered = np.flatnonzero(entry <= horizon)
+    state[entered] = table.initial_state
+
+    visit_patients = [entered]
+    visit_states = [state[entered]]
+    visit_starts = [entry[entered]]
+
+    initial_moves = not table.terminal[table.initial_state] and table.out_degree[table.initial_state] > 0
+    moving = entered if initial_moves else entered[:0]
+    for step in range(max_steps):
+        if not len(moving):
+            break
+        keys = patient_keys[moving] ^ np.uint64(2 * step + 1)
+        u_branch = hashed_uniforms(keys)
+        u_delay = hashed_uniforms(keys ^ np.uint64(0x5555555555555555))
+
+        current = state[moving]
+        slot = (u_branch[:, None] >= branch_cumulative[current]).sum(axis=1)
+        edge = table.branch_edges[current, slot]
+
+        delay = np.empty(len(moving))
+        for e in np.unique(edge).tolist():
+            taken = edge == e
+            delay[taken] = table.edge_delays[e].from_uniform(u_delay[taken])
+        new_time = time[moving] + delay
+
+        moves = new_time <= horizon
+        moving = moving[moves]
+        target = table.edge_to[edge[moves]]
+        state[moving] = target
+        time[moving] = new_time[moves]
+        visit_patients.append(moving)
+        visit_states.append(target)
+        visit_starts.append(time[moving])
+
+        still = ~table.terminal[target] & (table.out_degree[target] > 0)
+        moving = moving[still]
+    else:
+        if len(moving):
+            raise ValueError(
+                f"{len(moving)} patients still moving after max_steps={max_steps} transitions "
+                f"(cycle of zero-length delays in flow '{table.flow_id}'?)"
+            )
+
+    patients = np.concatenate(visit_patients)
+    states = np.concatenate(visit_states)
+    starts = np.concatenate(visit_starts)
+    # Visits were recorded step by step, so a stable sort by patient keeps
+    # each patient's visits in order; a visit ends when the next one starts
+    order = np.argsort(patients, kind="stable")
+    patients, states, starts = patients[order], states[order], starts[order]
+    ends = np.full(len(starts), np.inf)
+    same_patient = patients[1:] == patients[:-1]
+    ends[:-1][same_patient] = starts[1:][same_patient]
+
+    final_times = np.where(state >= 0, time, np.nan)
+    return FlowResult(
+        state_names=table.state_names,
+        horizon=horizon,
+        entry_times=entry,
+        final_states=state,
+        final_times=final_times,
+        visit_patients=patients,
+        visit_states=states,
+        visit_starts=starts,
+        visit_ends=ends,
+        dropout_states=list(dropout_states)
+    )
+
+
+def simulate_patient_flow(
+    trial_spec: Any,
+    entry_times: Sequence[float],
+    horizon: float,
+    seed_plan: SeedPlan,
+    run_id: int,
+    table: Optional[FlowTable] = None,
+    dropout_states: Optional[Sequence[str]] = None
+) -> FlowResult:
+    """
+    Patients' paths through a trial's patient flow in one run.
+
+    Example:
+        enrollment = simulate_enrollment(trial, activation_times, 720.0, plan, run_id)
+        flow = simulate_patient_flow(trial, enrollment.times, 720.0, plan, run_id)
+        flow.occupancy(np.arange(0, 721, 30))["treatment"]
+        flow.dropout_count
+
+    Args:
+        trial_spec: Trial specification (patient_flow)
+        entry_times: When each patient enters the flow (e.g. enrollment times)
+        horizon: Last time of interest
+        seed_plan: Seed plan of the trial
+        run_id: Run identifier
+        table: Precompiled trial_spec.patient_flow (None = compile here;
+               pass one to reuse it across runs)
+        dropout_states: As in run_flow
+
+    Returns:
+        FlowResult
+    """
+    flow = trial_spec.patient_flow
+    if table is None:
+        table = compile_flow(flow)
+    seed = seed_plan.seed(run_id, entity_key(flow.flow_id), PURPOSE_PATIENT_FLOW)
+    branch_cumulative = draw_branch_cumulative(table, seed_plan, run_id)
+    return run_flow(
+        table, entry_times, horizon, seed, dropout_states, branch_cumulative=branch_cumulative
+    )
@@ -9,14 +9,33 @@ Design Principles:
 - Supports calibration workflow (base improves, scenarios remain relative)
 
 Key Guarantee: Scenarios are pre-processing layer. Engine never sees them.
+
+Performance:
+- Structural sharing: entities without overrides are reused by reference;
+  only overridden entities are rebuilt (and validated by their own
+  constructors). Every derived Trial is still built through Trial's own
+  constructor, so Trial validation always runs (it is linear in the
+  number of entities).
+- Memoization: derived trials are cached by (base fingerprint, scenario
+  fingerprint), so sweeps that revisit a scenario do not re-apply its
+  overrides. Each call returns its own Trial with its own entity lists
+  (the frozen entities are shared), so mutating one result's lists never
+  leaks into another caller's. Call clear_scenario_cache() after mutating
+  a base trial's lists in place.
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from enum import Enum
+import hashlib
 import json
 import copy
+import threading
+import weakref
+
+import numpy as np
 
 from seleensim.entities import Site, Trial, PatientFlow, Activity, Resource
 from seleensim.distributions import (
@@ -145,7 +164,10 @@ def apply_scenario(base_trial: Trial, scenario: ScenarioProfile) -> Trial:
         scenario: Explicit override profile
 
     Returns:
-        New Trial specification with overrides applied
+        New Trial specification with overrides applied (unchanged entities
+        are shared with base_trial; repeated calls with an equal base and
+        scenario reuse the memoized entities but return a new Trial with
+        new lists each time)
 
     Example:
         base = Trial(...)
@@ -162,10 +184,71 @@ def apply_scenario(base_trial: Trial, scenario: ScenarioProfile) -> Trial:
         # modified has overrides
         assert modified.sites[0].activation_time == scaled_dist
     """
+    index = _trial_index(base_trial)
+    key = (index.fingerprint, _scenario_fingerprint(scenario))
+    with _CACHE_LOCK:
+        cached = _SCENARIO_CACHE.get(key)
+        if cached is not None:
+            _SCENARIO_CACHE.move_to_end(key)
+    if cached is not None:
+        return _copy_trial(cached)
+
+    modified_trial = _build_scenario_trial(base_trial, scenario, index)
+
+    with _CACHE_LOCK:
+        _SCENARIO_CACHE[key] = modified_trial
+        while len(_SCENARIO_CACHE) > SCENARIO_CACHE_SIZE:
+            _SCENARIO_CACHE.popitem(last=False)
+
+    # The cached instance is never handed out, so callers cannot alter it
+    return _copy_trial(modified_trial)
+
+
+def clear_scenario_cache():
+    """Drop all memoized scenario trials and trial fingerprints."""
+    with _CACHE_LOCK:
+        _SCENARIO_CACHE.clear()
+        _FINGERPRINTS.clear()
+
+
+# Maximum number of memoized derived trials (least recently used evicted)
+SCENARIO_CACHE_SIZE = 128
+
+_SCENARIO_CACHE: "OrderedDict[Tuple[str, str], Trial]" = OrderedDict()
+# Guards _SCENARIO_CACHE and _FINGERPRINTS. Reentrant: a weak reference
+# callback can run (on garbage collection) while this thread holds it.
+_CACHE_LOCK = threading.RLock()
+
+# id(trial) → (weak reference, _TrialIndex); fingerprinting a large trial
+# serializes it, so each trial object is indexed once
+_FINGERPRINTS: Dict[int, Tuple[Any, "_TrialIndex"]] = {}
+
+
+@dataclass(frozen=True)
+class _TrialIndex:
+    """Content fingerprint and entity positions of one base trial."""
+    fingerprint: str
+    sites: Dict[str, int]
+    activities: Dict[str, int]
+    resources: Dict[str, int]
+
+
+def _build_scenario_trial(
+    base_trial: Trial,
+    scenario: ScenarioProfile,
+    index: "_TrialIndex"
+) -> Trial:
+    """Apply overrides, rebuilding only the entities they touch."""
     # Apply overrides by constructing new entities
-    modified_sites = _apply_site_overrides(base_trial.sites, scenario.site_overrides)
-    modified_activities = _apply_activity_overrides(base_trial.activities, scenario.activity_overrides)
-    modified_resources = _apply_resource_overrides(base_trial.resources, scenario.resource_overrides)
+    modified_sites = _apply_site_overrides(
+        base_trial.sites, scenario.site_overrides, index.sites
+    )
+    modified_activities = _apply_activity_overrides(
+        base_trial.activities, scenario.activity_overrides, index.activities
+    )
+    modified_resources = _apply_resource_overrides(
+        base_trial.resources, scenario.resource_overrides, index.resources
+    )
     modified_flow = _apply_flow_overrides(base_trial.patient_flow, scenario.flow_overrides)
 
     # Apply trial-level overrides
@@ -173,9 +256,11 @@ def apply_scenario(base_trial: Trial, scenario: ScenarioProfile) -> Trial:
         base_trial.target_enrollment,
         scenario.trial_overrides.get("target_enrollment")
     )
+    if target_enrollment <= 0:
+        raise ValueError(f"target_enrollment must be > 0, got {target_enrollment}")
 
-    # Construct new Trial (immutable)
-    modified_trial = Trial(
+    # Construct new Trial (immutable, validated)
+    return Trial(
         trial_id=f"{base_trial.trial_id}__{scenario.scenario_id}",
         target_enrollment=target_enrollment,
         sites=modified_sites,
@@ -184,22 +269,130 @@ def apply_scenario(base_trial: Trial, scenario: ScenarioProfile) -> Trial:
         resources=modified_resources
     )
 
-    return modified_trial
+
+def _copy_trial(trial: Trial) -> Trial:
+    """New Trial with new entity lists (the frozen entities are shared)."""
+    return Trial(
+        trial_id=trial.trial_id,
+        target_enrollment=trial.target_enrollment,
+        sites=list(trial.sites),
+        patient_flow=trial.patient_flow,
+        activities=list(trial.activities),
+        resources=list(trial.resources)
+    )
+
+
+def _trial_index(trial: Trial) -> _TrialIndex:
+    """Fingerprint and entity positions of a trial, computed once per trial object."""
+    trial_id = id(trial)
+    with _CACHE_LOCK:
+        entry = _FINGERPRINTS.get(trial_id)
+    if entry is not None and entry[0]() is trial:
+        return entry[1]
+
+    # Serialize outside the lock; concurrent callers at worst compute the
+    # same index twice
+    index = _TrialIndex(
+        fingerprint=fingerprint(trial.to_dict()),
+        sites=_positions(trial.sites, "site_id"),
+        activities=_positions(trial.activities, "activity_id"),
+        resources=_positions(trial.resources, "resource_id")
+    )
+
+    def forget(ref):
+        with _CACHE_LOCK:
+            current = _FINGERPRINTS.get(trial_id)
+            if current is not None and current[0] is ref:
+                del _FINGERPRINTS[trial_id]
+
+    with _CACHE_LOCK:
+        _FINGERPRINTS[trial_id] = (weakref.ref(trial, forget), index)
+    return index
+
+
+def _positions(entities: List[Any], id_field: str) -> Dict[str, int]:
+    return {getattr(entity, id_field): i for i, entity in enumerate(entities)}
+
+
+def _scenario_fingerprint(scenario: ScenarioProfile) -> str:
+    """Content hash of a scenario's overrides (metadata excluded)."""
+    return fingerprint({
+        "scenario_id": scenario.scenario_id,
+        "site_overrides": scenario.site_overrides,
+        "activity_overrides": scenario.activity_overrides,
+        "resource_overrides": scenario.resource_overrides,
+        "flow_overrides": scenario.flow_overrides,
+        "trial_overrides": scenario.trial_overrides,
+    })
+
+
+def fingerprint(data: Any) -> str:
+    """
+    Content hash of a specification, stable across processes and sessions.
+
+    Used to recognise the same trial, scenario or constraint set in
+    checkpoints, partial results and the scenario cache. JSON values are
+    hashed as they are; beyond those:
+    - objects with to_dict() (entities, distributions, scenarios) by
+      their dict
+    - sets in a canonical order
+    - plain configuration objects (constraints, response curves) by
+      qualified class name and attributes, recursively
+
+    Args:
+        data: Value to fingerprint
+
+    Returns:
+        SHA-256 hex digest
+
+    Raises:
+        TypeError: If data holds a value with no stable content, such as
+                   a function, class or object without attributes; give
+                   such objects a to_dict() method
+    """
+    return hashlib.sha256(_canonical_json(data).encode()).hexdigest()
+
+
+def _canonical_json(data: Any) -> str:
+    return json.dumps(data, sort_keys=True, default=_fingerprint_default)
+
+
+def _fingerprint_default(value: Any) -> Any:
+    """JSON fallback of fingerprint() (see there for the rules)."""
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=_canonical_json)
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    if callable(value) or not hasattr(value, "__dict__"):
+        # Functions, classes and the like hash by identity at best
+        raise TypeError(
+            f"Cannot fingerprint {type(value).__name__} {value!r}: "
+            "only JSON values, sets and objects with to_dict() or plain attributes"
+        )
+    cls = type(value)
+    return {"type": f"{cls.__module__}.{cls.__qualname__}", **vars(value)}
 
 
 def _apply_site_overrides(
     base_sites: List[Site],
-    overrides: Dict[str, Dict[str, Any]]
+    overrides: Dict[str, Dict[str, Any]],
+    positions: Optional[Dict[str, int]] = None
 ) -> List[Site]:
-    """Apply overrides to site list, returning new list."""
+    """Apply overrides to site list, returning new list (unchanged sites shared)."""
     if not overrides:
         return base_sites
+    if positions is None:
+        positions = _positions(base_sites, "site_id")
 
-    modified_sites = []
-    for site in base_sites:
-        if site.site_id in overrides:
+    modified_sites = list(base_sites)
+    for site_id, site_overrides in overrides.items():
+        if site_id in positions:
             # Apply overrides to this site
-            site_overrides = overrides[site.site_id]
+            site = base_sites[positions[site_id]]
 
             # Build kwargs for new Site
             kwargs = {
@@ -222,26 +415,26 @@ def _apply_site_overrides(
                 )
             }
 
-            modified_sites.append(Site(**kwargs))
-        else:
-            # No overrides for this site
-            modified_sites.append(site)
+            modified_sites[positions[site_id]] = Site(**kwargs)
 
     return modified_sites
 
 
 def _apply_activity_overrides(
     base_activities: List[Activity],
-    overrides: Dict[str, Dict[str, Any]]
+    overrides: Dict[str, Dict[str, Any]],
+    positions: Optional[Dict[str, int]] = None
 ) -> List[Activity]:
-    """Apply overrides to activity list, returning new list."""
+    """Apply overrides to activity list, returning new list (unchanged activities shared)."""
     if not overrides:
         return base_activities
+    if positions is None:
+        positions = _positions(base_activities, "activity_id")
 
-    modified_activities = []
-    for activity in base_activities:
-        if activity.activity_id in overrides:
-            activity_overrides = overrides[activity.activity_id]
+    modified_activities = list(base_activities)
+    for activity_id, activity_overrides in overrides.items():
+        if activity_id in positions:
+            activity = base_activities[positions[activity_id]]
 
             kwargs = {
                 "activity_id": activity.activity_id,
@@ -257,25 +450,26 @@ def _apply_activity_overrides(
                 ) if activity.success_probability else None
             }
 
-            modified_activities.append(Activity(**kwargs))
-        else:
-            modified_activities.append(activity)
+            modified_activities[positions[activity_id]] = Activity(**kwargs)
 
     return modified_activities
 
 
 def _apply_resource_overrides(
     base_resources: List[Resource],
-    overrides: Dict[str, Dict[str, Any]]
+    overrides: Dict[str, Dict[str, Any]],
+    positions: Optional[Dict[str, int]] = None
 ) -> List[Resource]:
-    """Apply overrides to resource list, returning new list."""
+    """Apply overrides to resource list, returning new list (unchanged resources shared)."""
     if not overrides:
         return base_resources
+    if positions is None:
+        positions = _positions(base_resources, "resource_id")
 
-    modified_resources = []
-    for resource in base_resources:
-        if resource.resource_id in overrides:
-            resource_overrides = overrides[resource.resource_id]
+    modified_resources = list(base_resources)
+    for resource_id, resource_overrides in overrides.items():
+        if resource_id in positions:
+            resource = base_resources[positions[resource_id]]
 
             kwargs = {
                 "resource_id": resource.resource_id,
@@ -294,9 +488,7 @@ def _apply_resource_overrides(
                 ) if resource.utilization_rate else None
             }
 
-            modified_resources.append(Resource(**kwargs))
-        else:
-            modified_resources.append(resource)
+            modified_resources[positions[resource_id]] = Resource(**kwargs)
 
     return modified_resources
 
@@ -382,7 +574,7 @@ def _scale_distribution(dist: Distribution, scale_factor: float) -> Distribution
     elif isinstance(dist, LogNormal):
         # Scale mean, keep cv
         return LogNormal(
-            mean=dist.mean * scale_factor,
+            mean=dist.mean_val * scale_factor,
             cv=dist.cv,
             bounds=dist.bounds
         )
@@ -412,7 +604,7 @@ def _shift_distribution(dist: Distribution, shift: float) -> Distribution:
     elif isinstance(dist, LogNormal):
         # Shift mean, keep cv
         return LogNormal(
-            mean=dist.mean + shift,
+            mean=dist.mean_val + shift,
             cv=dist.cv,
             bounds=dist.bounds
         )
@@ -438,7 +630,7 @@ def _modify_distribution_params(dist: Distribution, param_overrides: Dict[str, A
         )
     elif isinstance(dist, LogNormal):
         return LogNormal(
-            mean=param_overrides.get("mean", dist.mean),
+            mean=param_overrides.get("mean", dist.mean_val),
             cv=param_overrides.get("cv", dist.cv),
             bounds=dist.bounds
         )
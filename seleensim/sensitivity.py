@@ -0,0 +1,501 @@
+"""
+Global sensitivity analysis over distribution parameters.
+
+Design Principles:
+- Parameters, not scenarios: the analyst names the distribution
+  parameters to vary and their ranges; design points become
+  ScenarioProfiles (distribution_param overrides) behind the scenes
+- Batched and parallel: every design point is one scenario of a single
+  run_sweep, so all (point, run shard) units share one process pool
+- Common random numbers: all design points run with sampling="coupled",
+  so the output is a smooth function of the parameters instead of
+  parameters plus Monte Carlo noise
+- Deterministic: designs and bootstrap resamples are seeded from the
+  master seed
+
+Methods:
+    tornado()          One-at-a-time swings from low to high, others at
+                       base values. 2k evaluations. Ranks main effects,
+                       blind to interactions.
+    morris_screening() Elementary effects along random trajectories.
+                       r(k+1) evaluations. Cheap screening: mu* ranks
+                       importance, sigma flags nonlinearity/interaction.
+    sobol_indices()    Saltelli design, first-order (Saltelli 2010) and
+                       total (Jansen) Sobol indices with bootstrap CIs.
+                       N(k+2) evaluations.
+
+Output:
+    Each design point is summarized by one percentile of one run metric
+    (default: P90 of completion time) over num_runs coupled runs.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from concurrent.futures import Executor
+
+import numpy as np
+
+from seleensim.sampling import design_uniforms
+from seleensim.scenarios import ScenarioProfile, _trial_index
+from seleensim.seeding import PURPOSE_SENSITIVITY
+from seleensim.sweep import run_sweep
+
+
+# Entity types that can carry sensitivity parameters → ScenarioProfile field
+ENTITY_OVERRIDES = {
+    "site": "site_overrides",
+    "activity": "activity_overrides",
+    "resource": "resource_overrides",
+}
+
+
+@dataclass(frozen=True)
+class SensitivityParameter:
+    """
+    One distribution parameter varied over [low, high].
+
+    Example:
+        SensitivityParameter("site", "SITE_001", "activation_time", "mode", 40, 70)
+        # name: "SITE_001.activation_time.mode"
+
+    Ranges are sampled independently, so they must keep every
+    combination valid (e.g. a Triangular mode range inside [low, high]).
+    """
+    entity_type: str
+    entity_id: str
+    field: str
+    param: str
+    low: float
+    high: float
+
+    def __post_init__(self):
+        if self.entity_type not in ENTITY_OVERRIDES:
+            raise ValueError(
+                f"entity_type must be one of {tuple(ENTITY_OVERRIDES)}, got {self.entity_type!r}"
+            )
+        if not self.low < self.high:
+            raise ValueError(f"low must be < high, got [{self.low}, {self.high}]")
+
+    @property
+    def name(self) -> str:
+        return f"{self.entity_id}.{self.field}.{self.param}"
+
+    def value(self, unit: float) -> float:
+        """Map a unit-interval coordinate to the parameter range."""
+        return self.low + unit * (self.high - self.low)
+
+
+@dataclass
+class TornadoBar:
+    """Output swing of one parameter from its low to its high value."""
+    parameter: str
+    output_low: float
+    output_high: float
+
+    @property
+    def swing(self) -> float:
+        return abs(self.output_high - self.output_low)
+
+
+@dataclass
+class MorrisEffect:
+    """Elementary-effect statistics of one parameter (unit-range scale)."""
+    parameter: str
+    mu: float
+    mu_star: float
+    sigma: float
+
+
+@dataclass
+class SobolIndex:
+    """First-order and total Sobol indices of one parameter, with CIs."""
+    parameter: str
+    first_order: float
+    first_order_ci: Tuple[float, float]
+    total_order: float
+    total_order_ci: Tuple[float, float]
+
+
+@dataclass
+class SensitivityResult:
+    """
+    Result of a sensitivity analysis.
+
+    effects holds TornadoBar, MorrisEffect or SobolIndex entries,
+    ranked most influential first.
+    """
+    method: str
+    metric: str
+    percentile: float
+    num_evaluations: int
+    effects: List[Any]
+    baseline_output: Optional[float] = None
+
+    def ranking(self) -> List[str]:
+        """Parameter names, most influential first."""
+        return [effect.parameter for effect in self.effects]
+
+    def effect(self, parameter: str) -> Any:
+        """Effect entry of one parameter (KeyError if not analyzed)."""
+        for effect in self.effects:
+            if effect.parameter == parameter:
+                return effect
+        raise KeyError(parameter)
+
+    def summary(self) -> str:
+        """Human-readable ranking."""
+        lines = [
+            f"Sensitivity ({self.method}) of P{self.percentile:g} {self.metric} "
+            f"({self.num_evaluations} design points):"
+        ]
+        for effect in self.effects:
+            if isinstance(effect, TornadoBar):
+                detail = (
+                    f"swing {effect.swing:.1f} "
+                    f"({effect.output_low:.1f} → {effect.output_high:.1f})"
+                )
+            elif isinstance(effect, MorrisEffect):
+                detail = f"mu* {effect.mu_star:.2f}, sigma {effect.sigma:.2f}"
+            else:
+                detail = (
+                    f"S1 {effect.first_order:.2f} "
+                    f"[{effect.first_order_ci[0]:.2f}, {effect.first_order_ci[1]:.2f}], "
+                    f"ST {effect.total_order:.2f} "
+                    f"[{effect.total_order_ci[0]:.2f}, {effect.total_order_ci[1]:.2f}]"
+                )
+            lines.append(f"  {effect.parameter}: {detail}")
+        return "\n".join(lines)
+
+
+def evaluate_design(
+    base_trial: Any,
+    parameters: Sequence[SensitivityParameter],
+    unit_points: np.ndarray,
+    num_runs: int = 50,
+    master_seed: int = 42,
+    metric: str = "completion_time",
+    percentile: float = 90,
+    constraints: Optional[List[Any]] = None,
+    initial_budget: float = float('inf'),
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None
+) -> np.ndarray:
+    """
+    Simulate every design point and summarize each by one percentile.
+
+    Args:
+        base_trial: Base Trial
+        parameters: Parameters (design columns, in order)
+        unit_points: (n_points, len(parameters)) coordinates in [0, 1]
+        num_runs: Coupled runs per design point
+        master_seed: Master seed (shared by all points)
+        metric: RunResult metric to summarize
+        percentile: Percentile of the metric (0-100)
+        constraints: Constraints applied to every point
+        initial_budget: Starting budget for each run
+        workers: As in run_sweep()
+        executor: As in run_sweep()
+
+    Returns:
+        Array of shape (n_points,)
+
+    Raises:
+        ValueError: If unit_points has the wrong shape, or a parameter
+                    targets an entity that is not in base_trial
+    """
+    unit_points = np.asarray(unit_points, dtype=float)
+    if unit_points.ndim != 2 or unit_points.shape[1] != len(parameters):
+        raise ValueError(
+            f"unit_points must have shape (n, {len(parameters)}), got {unit_points.shape}"
+        )
+    _check_parameters(base_trial, parameters)
+
+    scenarios = [
+        _design_scenario(f"SA_{i:06d}", parameters, point)
+        for i, point in enumerate(unit_points)
+    ]
+    sweep = run_sweep(
+        base_trial, scenarios, num_runs=num_runs, master_seed=master_seed,
+        constraints=constraints, initial_budget=initial_budget, workers=workers,
+        executor=executor, sampling="coupled", include_baseline=False
+    )
+
+    runs = sweep.runs_by_scenario()
+    outputs = np.empty(len(scenarios))
+    for i, scenario in enumerate(scenarios):
+        values = [row[metric] for row in runs[scenario.scenario_id]]
+        outputs[i] = np.percentile(values, percentile)
+    return outputs
+
+
+def tornado(
+    base_trial: Any,
+    parameters: Sequence[SensitivityParameter],
+    **evaluate_kwargs: Any
+) -> SensitivityResult:
+    """
+    One-at-a-time tornado ranking.
+
+    Each parameter is set to its low and then its high value while all
+    other parameters keep their base-trial values.
+
+    Args:
+        base_trial: Base Trial
+        parameters: Parameters to swing
+        **evaluate_kwargs: Passed to evaluate_design (num_runs, metric, ...)
+
+    Returns:
+        SensitivityResult with TornadoBar effects, widest swing first
+    """
+    k = len(parameters)
+    # NaN = "leave at base value"; rows: p0 low, p0 high, p1 low, ...
+    points = np.full((2 * k, k), np.nan)
+    for i in range(k):
+        points[2 * i, i] = 0.0
+        points[2 * i + 1, i] = 1.0
+
+    outputs = evaluate_design(base_trial, parameters, points, **evaluate_kwargs)
+    baseline = evaluate_design(base_trial, [], np.empty((1, 0)), **evaluate_kwargs)[0]
+
+    bars = [
+        TornadoBar(parameter.name, float(outputs[2 * i]), float(outputs[2 * i + 1]))
+        for i, parameter in enumerate(parameters)
+    ]
+    bars.sort(key=lambda bar: bar.swing, reverse=True)
+    return SensitivityResult(
+        method="tornado",
+        metric=evaluate_kwargs.get("metric", "completion_time"),
+        percentile=evaluate_kwargs.get("percentile", 90),
+        num_evaluations=2 * k + 1,
+        effects=bars,
+        baseline_output=float(baseline)
+    )
+
+
+def morris_screening(
+    base_trial: Any,
+    parameters: Sequence[SensitivityParameter],
+    num_trajectories: int = 10,
+    levels: int = 4,
+    **evaluate_kwargs: Any
+) -> SensitivityResult:
+    """
+    Morris elementary-effects screening.
+
+    Each trajectory starts at a random point of a `levels`-level grid and
+    moves one parameter at a time (random order) by delta = levels /
+    (2 (levels - 1)) of its range. Effects are on the unit-range scale,
+    so they compare directly across parameters.
+
+    Args:
+        base_trial: Base Trial
+        parameters: Parameters to screen
+        num_trajectories: Number of trajectories r
+        levels: Grid levels (even, >= 2)
+        **evaluate_kwargs: Passed to evaluate_design (num_runs, master_seed, ...)
+
+    Returns:
+        SensitivityResult with MorrisEffect entries, largest mu* first
+
+    Raises:
+        ValueError: If num_trajectories < 1 or levels is not an even number >= 2
+    """
+    if num_trajectories < 1:
+        raise ValueError(f"num_trajectories must be >= 1, got {num_trajectories}")
+    if levels < 2 or levels % 2:
+        raise ValueError(f"levels must be an even number >= 2, got {levels}")
+
+    k = len(parameters)
+    rng = _rng(evaluate_kwargs.get("master_seed", 42))
+    delta = levels / (2 * (levels - 1))
+    # Start levels that leave room for a +delta step
+    starts = np.arange(levels // 2) / (levels - 1)
+
+    trajectories = []
+    for _ in range(num_trajectories):
+        point = rng.choice(starts, size=k)
+        trajectory = [point.copy()]
+        for i in rng.permutation(k):
+            point[i] += delta
+            trajectory.append(point.copy())
+        trajectories.append(np.array(trajectory))
+
+    outputs = evaluate_design(
+        base_trial, parameters, np.concatenate(trajectories), **evaluate_kwargs
+    ).reshape(num_trajectories, k + 1)
+
+    elementary = np.empty((num_trajectories, k))
+    for t, trajectory in enumerate(trajectories):
+        for step in range(k):
+            moved = int(np.argmax(trajectory[step + 1] != trajectory[step]))
+            elementary[t, moved] = (outputs[t, step + 1] - outputs[t, step]) / delta
+
+    effects = [
+        MorrisEffect(
+            parameter=parameter.name,
+            mu=float(elementary[:, i].mean()),
+            mu_star=float(np.abs(elementary[:, i]).mean()),
+            sigma=float(elementary[:, i].std(ddof=1)) if num_trajectories > 1 else 0.0
+        )
+        for i, parameter in enumerate(parameters)
+    ]
+    effects.sort(key=lambda effect: effect.mu_star, reverse=True)
+    return SensitivityResult(
+        method="morris",
+        metric=evaluate_kwargs.get("metric", "completion_time"),
+        percentile=evaluate_kwargs.get("percentile", 90),
+        num_evaluations=num_trajectories * (k + 1),
+        effects=effects
+    )
+
+
+def sobol_indices(
+    base_trial: Any,
+    parameters: Sequence[SensitivityParameter],
+    num_samples: int = 64,
+    num_bootstrap: int = 200,
+    confidence: float = 0.95,
+    **evaluate_kwargs: Any
+) -> SensitivityResult:
+    """
+    First-order and total Sobol indices from a Saltelli design.
+
+    Two independent (num_samples, k) matrices A and B are taken from one
+    scrambled Sobol sequence of dimension 2k; AB_i is A with column i from
+    B. With f the simulated output:
+
+        V     = Var(f(A) ∪ f(B))
+        S_i   = mean(f(B) · (f(AB_i) - f(A))) / V     (Saltelli 2010)
+        ST_i  = mean((f(A) - f(AB_i))²) / (2V)        (Jansen 1999)
+
+    Confidence intervals are bootstrap percentile intervals over the
+    num_samples rows.
+
+    Args:
+        base_trial: Base Trial
+        parameters: Parameters to analyze
+        num_samples: Base sample size N (a power of two keeps the Sobol
+                     design balanced); N(k+2) design points are simulated
+        num_bootstrap: Bootstrap resamples for the CIs
+        confidence: CI confidence level
+        **evaluate_kwargs: Passed to evaluate_design (num_runs, master_seed, ...)
+
+    Returns:
+        SensitivityResult with SobolIndex entries, largest total index first
+
+    Raises:
+        ValueError: If num_samples < 2, num_bootstrap < 1 or confidence not in (0, 1)
+    """
+    if num_samples < 2:
+        raise ValueError(f"num_samples must be >= 2, got {num_samples}")
+    if num_bootstrap < 1:
+        raise ValueError(f"num_bootstrap must be >= 1, got {num_bootstrap}")
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+
+    k = len(parameters)
+    master_seed = evaluate_kwargs.get("master_seed", 42)
+    design = design_uniforms("sobol", num_samples, 2 * k, master_seed)
+    a, b = design[:, :k], design[:, k:]
+    ab = []
+    for i in range(k):
+        ab_i = a.copy()
+        ab_i[:, i] = b[:, i]
+        ab.append(ab_i)
+
+    outputs = evaluate_design(
+        base_trial, parameters, np.concatenate([a, b] + ab), **evaluate_kwargs
+    )
+    f_a = outputs[:num_samples]
+    f_b = outputs[num_samples:2 * num_samples]
+    f_ab = outputs[2 * num_samples:].reshape(k, num_samples)
+
+    first, total = _sobol_estimates(f_a, f_b, f_ab)
+
+    rng = _rng(master_seed)
+    boot_first = np.empty((num_bootstrap, k))
+    boot_total = np.empty((num_bootstrap, k))
+    for r in range(num_bootstrap):
+        rows = rng.integers(0, num_samples, size=num_samples)
+        boot_first[r], boot_total[r] = _sobol_estimates(f_a[rows], f_b[rows], f_ab[:, rows])
+
+    tail = (1 - confidence) / 2 * 100
+    indices = [
+        SobolIndex(
+            parameter=parameter.name,
+            first_order=float(first[i]),
+            first_order_ci=_percentile_ci(boot_first[:, i], tail),
+            total_order=float(total[i]),
+            total_order_ci=_percentile_ci(boot_total[:, i], tail)
+        )
+        for i, parameter in enumerate(parameters)
+    ]
+    indices.sort(key=lambda index: index.total_order, reverse=True)
+    return SensitivityResult(
+        method="sobol",
+        metric=evaluate_kwargs.get("metric", "completion_time"),
+        percentile=evaluate_kwargs.get("percentile", 90),
+        num_evaluations=num_samples * (k + 2),
+        effects=indices
+    )
+
+
+def _sobol_estimates(
+    f_a: np.ndarray, f_b: np.ndarray, f_ab: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """(first-order, total) index estimates; zeros if the output is constant."""
+    variance = np.var(np.concatenate([f_a, f_b]))
+    if variance == 0:
+        return np.zeros(len(f_ab)), np.zeros(len(f_ab))
+    first = np.mean(f_b * (f_ab - f_a), axis=1) / variance
+    total = 0.5 * np.mean((f_a - f_ab) ** 2, axis=1) / variance
+    return first, total
+
+
+def _percentile_ci(samples: np.ndarray, tail: float) -> Tuple[float, float]:
+    return float(np.percentile(samples, tail)), float(np.percentile(samples, 100 - tail))
+
+
+def _rng(master_seed: int) -> np.random.Generator:
+    return np.random.default_rng(np.random.SeedSequence(master_seed, spawn_key=(PURPOSE_SENSITIVITY,)))
+
+
+def _check_parameters(base_trial: Any, parameters: Sequence[SensitivityParameter]):
+    """Every parameter must target an existing entity."""
+    index = _trial_index(base_trial)
+    positions = {
+        "site": index.sites,
+        "activity": index.activities,
+        "resource": index.resources,
+    }
+    for parameter in parameters:
+        if parameter.entity_id not in positions[parameter.entity_type]:
+            raise ValueError(
+                f"Parameter {parameter.name} targets unknown {parameter.entity_type} "
+                f"{parameter.entity_id!r}"
+            )
+
+
+def _design_scenario(
+    scenario_id: str,
+    parameters: Sequence[SensitivityParameter],
+    point: np.ndarray
+) -> ScenarioProfile:
+    """ScenarioProfile setting each parameter to its value at a design point (NaN = base)."""
+    overrides: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {
+        field: {} for field in ENTITY_OVERRIDES.values()
+    }
+    for parameter, unit in zip(parameters, point):
+        if np.isnan(unit):
+            continue
+        entity = overrides[ENTITY_OVERRIDES[parameter.entity_type]].setdefault(parameter.entity_id, {})
+        spec = entity.setdefault(parameter.field, {"type": "distribution_param", "parameters": {}})
+        spec["parameters"][parameter.param] = parameter.value(float(unit))
+
+    return ScenarioProfile(
+        scenario_id=scenario_id,
+        description="Sensitivity design point",
+        version="1.0.0",
+        created_at="",
+        **overrides
+    )
@@ -14,27 +14,56 @@ Single Run vs Aggregated:
 - Both needed: Single runs for debugging/understanding, aggregated for planning/decisions
 """
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set
-from collections import defaultdict
-import heapq
+from types import MappingProxyType
+from typing import AbstractSet, Callable, Iterator, List, Dict, Any, Mapping, Optional, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from datetime import datetime
+import asyncio
 import hashlib
+import inspect
+import math
+import os
+import socket
+import threading
+import time
 import numpy as np
 
+from seleensim.distributions import sample_many
+from seleensim.aggregation import StreamingAggregator, QuantileSketch, PrecisionReport
+from seleensim.timeline import Timeline
+from seleensim.allocation import ResourceIndex
+from seleensim.seeding import SEED_SCHEMES, PURPOSE_SITE_ACTIVATION, SeedPlan
+from seleensim.sampling import SAMPLING_METHODS, RunInputs, SampledInputs
+from seleensim.checkpoint import CheckpointWriter, PartialResults, RunCheckpoint
+from seleensim.scenarios import fingerprint
+from seleensim.instrumentation import Instrument, ProgressUpdate, print_progress
+from seleensim.scheduler import Scheduler, SchedulerSpec, scheduler_factory
 from seleensim.constraints import (
     Constraint,
+    ConstraintIndex,
     ConstraintResult,
     compose_constraint_results
 )
 
 
-@dataclass
+# Progress callback: receives a ProgressUpdate (None = silent)
+ProgressCallback = Optional[Callable[[ProgressUpdate], None]]
+
+
+@dataclass(slots=True)
 class Event:
     """
     Simulation event to be processed at specific time.
 
     Events are processed in time order. Each event may generate downstream events.
 
+    Slotted, and built to be shared rather than copied: events from an
+    EventCatalog reference the catalog's immutable metadata, and the
+    engine reschedules an event by moving it in its Scheduler (see
+    seleensim.scheduler) instead of copying it.
+
     Attributes:
         event_id: Unique identifier
         event_type: Type of event (e.g., "site_activation", "enrollment")
@@ -44,7 +73,11 @@ class Event:
         execution_parameters: Cached throttling/modifications (idempotent)
         required_resources: Resources needed for this event
         predecessors: Event IDs that must complete before this
-        metadata: Additional event-specific data
+        metadata: Additional event-specific data (read-only mapping for
+                  catalog events; copied on the first override)
+        seed: Base seed for event-level randomness (None = legacy derivation)
+        type_code: Interned event type from the EventCatalog (-1 = none)
+        entity_code: Interned entity ID from the EventCatalog (-1 = none)
     """
     event_id: str
     event_type: str
@@ -52,26 +85,37 @@ class Event:
     time: float
     duration: float = 0.0
     execution_parameters: Dict[str, Any] = field(default_factory=dict)
-    required_resources: Set[str] = field(default_factory=set)
-    predecessors: Set[str] = field(default_factory=set)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    required_resources: AbstractSet[str] = frozenset()
+    predecessors: AbstractSet[str] = frozenset()
+    metadata: Mapping[str, Any] = field(default_factory=dict)
+    seed: Optional[int] = None
+    type_code: int = -1
+    entity_code: int = -1
 
     def __lt__(self, other):
         """Priority queue comparison (earlier time = higher priority)."""
         return self.time < other.time
 
     def reschedule(self, new_time: float) -> "Event":
-        """Create rescheduled copy of event (immutable pattern)."""
+        """
+        Rescheduled copy of event.
+
+        Shallow: the copy shares the original's containers, since the
+        original is dropped once rescheduled.
+        """
         return Event(
-            event_id=self.event_id,
-            event_type=self.event_type,
-            entity_id=self.entity_id,
-            time=new_time,
-            duration=self.duration,
-            execution_parameters=self.execution_parameters.copy(),
-            required_resources=self.required_resources.copy(),
-            predecessors=self.predecessors.copy(),
-            metadata=self.metadata.copy()
+            self.event_id,
+            self.event_type,
+            self.entity_id,
+            new_time,
+            self.duration,
+            self.execution_parameters,
+            self.required_resources,
+            self.predecessors,
+            self.metadata,
+            self.seed,
+            self.type_code,
+            self.entity_code
         )
 
     def apply_overrides(self, overrides: Dict[str, Any]):
@@ -80,9 +124,104 @@ class Event:
             if hasattr(self, key):
                 setattr(self, key, value)
             else:
+                if isinstance(self.metadata, MappingProxyType):
+                    # Shared catalog metadata: copy on write
+                    self.metadata = dict(self.metadata)
                 self.metadata[key] = value
 
 
+@dataclass(frozen=True)
+class EventSpec:
+    """Static, run-independent part of an event (shared by every run)."""
+    event_id: str
+    event_type: str
+    entity_id: str
+    type_code: int
+    entity_code: int
+    metadata: Mapping[str, Any]
+
+    def __post_init__(self):
+        # Read-only view, so events can share it safely
+        if not isinstance(self.metadata, MappingProxyType):
+            object.__setattr__(self, "metadata", MappingProxyType(dict(self.metadata)))
+
+    def __reduce__(self):
+        # Mapping proxies cannot be pickled; rebuild from a plain dict
+        return (EventSpec, (
+            self.event_id, self.event_type, self.entity_id,
+            self.type_code, self.entity_code, dict(self.metadata)
+        ))
+
+
+class EventCatalog:
+    """
+    Immutable event specifications of a trial, with interned type and
+    entity IDs.
+
+    Built once per trial and shared by all of its runs: a run's events
+    only add their sampled time and seed to a spec referenced by index.
+
+    Example:
+        catalog = EventCatalog.for_trial(trial)
+        event = catalog.event(0, time=42.0)   # first site's activation
+    """
+
+    def __init__(self):
+        self.specs: List[EventSpec] = []
+        self.event_types: List[str] = []
+        self.entities: List[str] = []
+        self._type_codes: Dict[str, int] = {}
+        self._entity_codes: Dict[str, int] = {}
+
+    def add(
+        self,
+        event_id: str,
+        event_type: str,
+        entity_id: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Register an event specification; returns its index."""
+        type_code = self._type_codes.get(event_type)
+        if type_code is None:
+            type_code = self._type_codes[event_type] = len(self.event_types)
+            self.event_types.append(event_type)
+        entity_code = self._entity_codes.get(entity_id)
+        if entity_code is None:
+            entity_code = self._entity_codes[entity_id] = len(self.entities)
+            self.entities.append(entity_id)
+        self.specs.append(EventSpec(
+            event_id, event_type, entity_id, type_code, entity_code, metadata or {}
+        ))
+        return len(self.specs) - 1
+
+    def event(self, index: int, time: float, seed: Optional[int] = None) -> Event:
+        """Event of spec index at time, referencing (not copying) the spec's data."""
+        spec = self.specs[index]
+        return Event(
+            spec.event_id,
+            spec.event_type,
+            spec.entity_id,
+            time,
+            metadata=spec.metadata,
+            seed=seed,
+            type_code=spec.type_code,
+            entity_code=spec.entity_code
+        )
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    @staticmethod
+    def for_trial(trial_spec: Any) -> "EventCatalog":
+        """Catalog of a trial's initial events: one activation per site, in site order."""
+        catalog = EventCatalog()
+        for site in trial_spec.sites:
+            catalog.add(
+                f"activation_{site.site_id}", "site_activation", site.site_id, {"site": site}
+            )
+        return catalog
+
+
 class SimulationState:
     """
     Tracks current state of simulation run.
@@ -97,7 +236,20 @@ class SimulationState:
     Pure data structure - no business logic.
     """
 
-    def __init__(self, initial_budget: float = float('inf')):
+    def __init__(
+        self,
+        initial_budget: float = float('inf'),
+        resource_capacities: Optional[Dict[str, Optional[int]]] = None
+    ):
+        """
+        Args:
+            initial_budget: Starting budget
+            resource_capacities: resource_id -> concurrent holders (None = unlimited).
+                                 Resources not listed are exclusive (capacity 1).
+                                 The engine passes Trial.resources' capacities,
+                                 so a declared Resource(capacity=None) is never
+                                 busy.
+        """
         self.current_time: float = 0.0
         self.budget_spent: float = 0.0
         self.budget_available: float = initial_budget
@@ -108,11 +260,12 @@ class SimulationState:
         # Activity completions: activity_id -> completion_time
         self._activity_completions: Dict[str, float] = {}
 
-        # Resource allocations: resource_id -> [(start_time, end_time, event_id), ...]
-        self._resource_allocations: Dict[str, List[tuple]] = defaultdict(list)
+        # Resource allocations: resource_id -> interval index of holders
+        self._resource_capacities: Dict[str, Optional[int]] = dict(resource_capacities or {})
+        self._resource_indexes: Dict[str, ResourceIndex] = {}
 
-        # Timeline: list of (time, event_type, entity_id, description)
-        self.timeline: List[tuple] = []
+        # Timeline: columnar rows read back as (time, event_type, entity_id, description)
+        self.timeline: Timeline = Timeline()
 
         # Metrics tracking
         self.metrics: Dict[str, Any] = {
@@ -130,13 +283,8 @@ class SimulationState:
             activity_id = getattr(event, 'activity_id', event.event_id)
             self._activity_completions[activity_id] = self.current_time
 
-        # Add to timeline
-        self.timeline.append((
-            self.current_time,
-            event.event_type,
-            event.entity_id,
-            f"{event.event_type} completed"
-        ))
+        # Add to timeline (description rendered on read)
+        self.timeline.record(self.current_time, event.event_type, event.entity_id)
 
         self.metrics["events_processed"] += 1
 
@@ -149,28 +297,39 @@ class SimulationState:
         return self._activity_completions.get(activity_id)
 
     def allocate_resource(self, resource_id: str, start_time: float, end_time: float, event_id: str):
-        """Allocate resource for time period."""
-        self._resource_allocations[resource_id].append((start_time, end_time, event_id))
+        """Allocate one unit of resource for time period [start_time, end_time)."""
+        index = self._resource_indexes.get(resource_id)
+        if index is None:
+            index = ResourceIndex(self._resource_capacities.get(resource_id, 1))
+            self._resource_indexes[resource_id] = index
+        index.allocate(start_time, end_time, event_id)
 
     def get_resource_availability(self, resource_id: str, requested_time: float) -> Optional[float]:
         """
         Get next time when resource becomes available.
 
+        A resource is busy while all of its units are held. Busy stretches
+        that touch count as one, so holders booked back to back give the
+        end of the chain, not the end of the first holder. O(log n) in the
+        number of allocations.
+
         Returns:
             None if available immediately at requested_time
             float (future time) if resource busy
         """
-        allocations = self._resource_allocations.get(resource_id, [])
-
-        # Check if any allocation overlaps with requested_time
-        for start, end, _ in allocations:
-            if start <= requested_time < end:
-                # Resource busy, find earliest end time after requested_time
-                future_allocations = [end for s, e, _ in allocations if s <= requested_time < e]
-                return max(future_allocations) if future_allocations else None
+        index = self._resource_indexes.get(resource_id)
+        if index is None:
+            return None
+        return index.next_free_time(requested_time)
 
-        # Available immediately
-        return None
+    def get_resource_utilization(self, resource_id: str, time: float) -> float:
+        """
+        Fraction of resource capacity held at time (0.0 for unlimited resources).
+        """
+        index = self._resource_indexes.get(resource_id)
+        if index is None or index.capacity is None:
+            return 0.0
+        return index.usage_at(time) / index.capacity
 
     def spend_budget(self, amount: float):
         """Spend budget."""
@@ -200,7 +359,7 @@ class RunResult:
     seed: int
     completion_time: float
     total_cost: float
-    timeline: List[tuple]
+    timeline: Timeline  # Any sequence of (time, event_type, entity_id, description)
     metrics: Dict[str, Any]
 
     # Additional tracking
@@ -226,11 +385,19 @@ class SimulationResults:
     Aggregated results across N simulation runs.
 
     Captures:
-    - All individual run results (for inspection)
+    - Individual run results (for inspection; all runs unless a
+      retention policy was requested)
     - Aggregated statistics (P10/P50/P90)
     - Summary metrics
+    - Mergeable quantile sketches per metric
 
     This shows the DISTRIBUTION of outcomes across uncertainty space.
+
+    Retention:
+        retain_runs="all" keeps every RunResult and computes statistics
+        exactly. Any other policy ("none", "sample:k", "extremes:k") keeps
+        only the selected runs and computes statistics from the sketches
+        (percentiles within the sketch's relative accuracy).
     """
     num_runs: int
     master_seed: int
@@ -248,6 +415,19 @@ class SimulationResults:
     mean_events_processed: float
     mean_events_rescheduled: float
 
+    # Streaming aggregation
+    retain_runs: str = "all"
+    sketches: Optional[Dict[str, QuantileSketch]] = None
+
+    # Input sampling method ("random", "coupled", "sobol" or "lhs")
+    sampling: str = "random"
+
+    # Achieved percentile precision (confidence intervals)
+    precision: Optional[PrecisionReport] = None
+
+    # Seed derivation of the engine that ran it ("counter" or "legacy")
+    seed_scheme: str = "counter"
+
     def summary(self) -> str:
         """Human-readable summary of aggregated results."""
         return (
@@ -266,8 +446,32 @@ class SimulationResults:
             f"Average Events:\n"
             f"  Processed: {self.mean_events_processed:.1f}\n"
             f"  Rescheduled: {self.mean_events_rescheduled:.1f}"
+            + self._precision_summary()
         )
 
+    def _precision_summary(self) -> str:
+        if self.precision is None:
+            return ""
+        line = (
+            f"\n\nPrecision ({self.precision.confidence:.0%} CI): "
+            f"worst half-width ±{self.precision.max_relative_half_width:.1%}"
+        )
+        if self.precision.converged is not None:
+            target = f"±{self.precision.target_half_width:.1%}"
+            line += f" (target {target} {'met' if self.precision.converged else 'not met'})"
+        return line
+
+    @property
+    def incomplete_runs(self) -> int:
+        """
+        Runs whose completion time is not finite (events rescheduled to
+        inf by a constraint that can never be met).
+        """
+        if self.sketches is not None:
+            sketch = self.sketches["completion_time"]
+            return sketch.infinite_count + sketch.nan_count
+        return sum(1 for run in self.run_results if not math.isfinite(run.completion_time))
+
     def get_run(self, run_id: int) -> Optional[RunResult]:
         """Get specific run result for inspection."""
         for run in self.run_results:
@@ -294,7 +498,14 @@ class SimulationEngine:
     - No optimization or learning
     """
 
-    def __init__(self, master_seed: int = 42, constraints: Optional[List[Constraint]] = None):
+    def __init__(
+        self,
+        master_seed: int = 42,
+        constraints: Optional[List[Constraint]] = None,
+        seed_scheme: str = "counter",
+        instruments: Optional[List[Instrument]] = None,
+        scheduler: SchedulerSpec = "heap"
+    ):
         """
         Initialize simulation engine.
 
@@ -303,11 +514,49 @@ class SimulationEngine:
                         Each run gets seed: master_seed + run_id
             constraints: List of constraints to evaluate during simulation
                         If None, no constraint evaluation performed (MVP mode)
+            seed_scheme: How per-event seeds are derived:
+                        "counter" (default): keyed integer mixing of
+                            (run, entity, purpose), see seleensim.seeding
+                        "legacy": SHA-256 of run seed + event ID, reproduces
+                            results from earlier versions exactly
+            instruments: Hooks observing every run (see
+                        seleensim.instrumentation, e.g. EngineProfiler).
+                        Parallel shards use spawned copies that are merged
+                        back into these instruments.
+            scheduler: Pending-event queue of each run: "heap" (default),
+                       "calendar", or a zero-argument factory returning a
+                       seleensim.scheduler.Scheduler (module-level, so it
+                       can be pickled for worker processes). All schedulers
+                       give identical results.
+
+        Raises:
+            ValueError: If seed_scheme or scheduler is unknown
         """
+        if seed_scheme not in SEED_SCHEMES:
+            raise ValueError(f"seed_scheme must be one of {SEED_SCHEMES}, got {seed_scheme!r}")
+
         self.master_seed = master_seed
         self.constraints = constraints or []
+        self.seed_scheme = seed_scheme
+        self.instruments = list(instruments or [])
+        self.scheduler = scheduler
+        self._new_scheduler = scheduler_factory(scheduler)
 
-    def run(self, trial_spec: Any, num_runs: int = 100, initial_budget: float = float('inf')) -> SimulationResults:
+    def run(
+        self,
+        trial_spec: Any,
+        num_runs: int = 100,
+        initial_budget: float = float('inf'),
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        retain_runs: str = "all",
+        sampling: str = "random",
+        checkpoint: Optional[str] = None,
+        checkpoint_every: int = 100,
+        resume_from: Optional[str] = None,
+        progress: ProgressCallback = print_progress,
+        measure_precision: bool = False
+    ) -> SimulationResults:
         """
         Execute N Monte Carlo simulation runs.
 
@@ -315,50 +564,699 @@ class SimulationEngine:
             trial_spec: Trial specification (Trial entity)
             num_runs: Number of simulation runs
             initial_budget: Starting budget for each run
+            workers: Number of worker processes. None or 1 runs serially;
+                     > 1 shards run IDs across a ProcessPoolExecutor
+            executor: Existing concurrent.futures.Executor to shard runs
+                      across instead of creating a pool (not shut down here)
+            retain_runs: Which RunResults to keep in memory: "all" (default),
+                         "none", "sample:k" or "extremes:k". Anything but
+                         "all" keeps memory flat in num_runs.
+            sampling: How stochastic inputs are drawn: "random" (default,
+                      independent per-event draws), "coupled" (the same
+                      draws, required to pair runs across scenarios; not
+                      available under seed_scheme="legacy"), "sobol" (scrambled Sobol
+                      design) or "lhs" (Latin hypercube design). Designed
+                      sampling pushes one design row per run through each
+                      input's inverse CDF.
+            checkpoint: File to save progress to (completed run IDs and the
+                        aggregate so far, see seleensim.checkpoint). Written
+                        atomically every checkpoint_every runs and at the end.
+            checkpoint_every: Completed runs between checkpoint saves
+            resume_from: Checkpoint file of an interrupted run with the same
+                         trial and arguments; its completed runs are skipped.
+                         May be the same file as checkpoint.
+            progress: Callback receiving ProgressUpdates (default prints
+                      them; None = silent)
+            measure_precision: Attach a PrecisionReport (percentile
+                               confidence intervals) to the results. Off
+                               by default: it costs an extra sort of the
+                               retained runs per tracked metric.
 
         Returns:
             SimulationResults with individual runs and aggregated statistics
+
+        Determinism:
+            Each run is seeded by master_seed + run_id alone, and results are
+            reassembled in run_id order, so parallel execution returns
+            results identical to the serial path for any worker count.
+            Designed sampling generates the whole design from master_seed
+            up front and hands each shard its own rows. For the same
+            reasons, a resumed run returns results identical to an
+            uninterrupted one.
+
+        Raises:
+            ValueError: If options are invalid or resume_from belongs to a
+                        different trial or configuration
+            TypeError: If checkpointing and a constraint cannot be
+                       fingerprinted (see seleensim.scenarios.fingerprint)
+        """
+        self._validate_run_options(workers, sampling)
+        if checkpoint_every < 1:
+            raise ValueError(f"checkpoint_every must be >= 1, got {checkpoint_every}")
+
+        # Fingerprinting serializes the trial: only pay for it when checkpointing
+        config = {}
+        if checkpoint or resume_from is not None:
+            config = self._checkpoint_config(trial_spec, num_runs, initial_budget, retain_runs, sampling)
+        if resume_from is not None:
+            state = RunCheckpoint.load(resume_from)
+            state.check_config(config)
+        else:
+            state = RunCheckpoint(config, StreamingAggregator(retain_runs))
+        aggregator = state.aggregator
+        writer = CheckpointWriter(state, checkpoint, checkpoint_every) if checkpoint else None
+        inputs = self._sampled_inputs(trial_spec, num_runs, sampling)
+
+        _report(
+            progress, "started", 0, num_runs,
+            f"Starting {num_runs} simulation runs (master_seed={self.master_seed})..."
+        )
+        if state.num_completed:
+            _report(
+                progress, "resumed", state.num_completed, num_runs,
+                f"  Resuming: {state.num_completed}/{num_runs} runs already complete"
+            )
+
+        with self._run_pool(workers, executor) as (pool, num_shards):
+            for run_ids in state.remaining(num_runs):
+                self._run_range(
+                    pool, num_shards, trial_spec, run_ids, initial_budget,
+                    aggregator, inputs, total_runs=num_runs, checkpoint=writer,
+                    progress=progress
+                )
+
+        if writer is not None:
+            writer.flush()
+
+        _report(
+            progress, "finished", aggregator.num_runs, num_runs,
+            f"All runs complete. Aggregating results..."
+        )
+
+        return self._aggregate(aggregator, sampling, _measured(aggregator, measure_precision))
+
+    def run_iter(
+        self,
+        trial_spec: Any,
+        num_runs: int = 100,
+        initial_budget: float = float('inf'),
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        retain_runs: str = "all",
+        sampling: str = "random",
+        update_every: int = 10,
+        cancel: Optional[Any] = None,
+        exact_updates: bool = False,
+        measure_precision: bool = False
+    ) -> Iterator[ProgressUpdate]:
+        """
+        Execute N runs like run(), yielding progress with partial results.
+
+        Yields a "started" update, a "runs_completed" update whenever at
+        least update_every more runs have completed (serial runs are
+        counted one by one, parallel runs per shard), and finally a
+        "finished" update whose results equal run() with the same
+        arguments. Every update after the first run carries the
+        SimulationResults of the runs completed so far.
+
+        "runs_completed" results are sketch estimates (retain_runs="none",
+        no precision report): they cost O(sketch size) per update, so a
+        long job does not re-sort every retained run at each update.
+        Exact results (and precision, if measure_precision) are computed
+        for the final ("finished" or "cancelled") update only, unless
+        exact_updates.
+
+        Example:
+            for update in engine.run_iter(trial, num_runs=1000, workers=4):
+                widget.value = update.fraction
+            results = update.results
+
+        Args:
+            trial_spec: Trial specification (Trial entity)
+            num_runs: As in run()
+            initial_budget: As in run()
+            workers: As in run()
+            executor: As in run()
+            retain_runs: As in run()
+            sampling: As in run()
+            update_every: Completed runs between "runs_completed" updates
+            cancel: Cancellation token, anything with is_set() (e.g.
+                    threading.Event). Checked after every run (serial) or
+                    shard (parallel); once set, the iterator yields a
+                    "cancelled" update with the partial results and stops.
+            exact_updates: Give "runs_completed" updates exact results
+                           too (as run() would return for the runs so
+                           far; costs O(runs) per update)
+            measure_precision: As in run(), for every exact update
+
+        Closing the iterator early (break, close()) also stops execution:
+        parallel shards not yet started are cancelled.
+
+        Raises:
+            ValueError: If options are invalid
+        """
+        self._validate_run_options(workers, sampling)
+        if update_every < 1:
+            raise ValueError(f"update_every must be >= 1, got {update_every}")
+
+        aggregator = StreamingAggregator(retain_runs)
+        inputs = self._sampled_inputs(trial_spec, num_runs, sampling)
+
+        def update(stage, message):
+            results = None
+            if aggregator.num_runs and stage == "runs_completed" and not exact_updates:
+                results = self._aggregate(aggregator.sketch_snapshot(), sampling)
+            elif aggregator.num_runs:
+                results = self._aggregate(
+                    aggregator, sampling, _measured(aggregator, measure_precision)
+                )
+            return ProgressUpdate(stage, aggregator.num_runs, num_runs, message, results=results)
+
+        yield update(
+            "started",
+            f"Starting {num_runs} simulation runs (master_seed={self.master_seed})..."
+        )
+
+        with self._run_pool(workers, executor) as (pool, num_shards):
+            runs = self._iter_range(
+                pool, num_shards, trial_spec, range(num_runs), initial_budget, aggregator, inputs
+            )
+            try:
+                reported = 0
+                for _ in runs:
+                    if cancel is not None and cancel.is_set():
+                        yield update(
+                            "cancelled",
+                            f"Cancelled after {aggregator.num_runs}/{num_runs} runs."
+                        )
+                        return
+                    if aggregator.num_runs - reported >= update_every and aggregator.num_runs < num_runs:
+                        reported = aggregator.num_runs
+                        yield update(
+                            "runs_completed",
+                            f"  Completed {aggregator.num_runs}/{num_runs} runs..."
+                        )
+            finally:
+                runs.close()
+
+        yield update("finished", f"All runs complete. Aggregating results...")
+
+    async def arun(
+        self,
+        trial_spec: Any,
+        num_runs: int = 100,
+        initial_budget: float = float('inf'),
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        retain_runs: str = "all",
+        sampling: str = "random",
+        update_every: int = 10,
+        progress: ProgressCallback = None,
+        measure_precision: bool = False
+    ) -> SimulationResults:
         """
-        print(f"Starting {num_runs} simulation runs (master_seed={self.master_seed})...")
+        Execute N runs without blocking the asyncio event loop.
+
+        Drives run_iter() in a background thread (runs themselves go to
+        the worker pool as in run()) and returns results identical to
+        run() with the same arguments.
 
-        # Run N independent simulations
-        run_results = []
-        for run_id in range(num_runs):
+        Example:
+            task = asyncio.create_task(engine.arun(trial, 1000, workers=4, progress=push))
+            ...
+            task.cancel()   # stops after the current run or shard
+
+        Args:
+            trial_spec, num_runs, initial_budget, workers, executor,
+            retain_runs, sampling, update_every, measure_precision: As in run_iter()
+            progress: Called on the event loop with each ProgressUpdate
+                      (partial results attached as in run_iter()); may be a coroutine
+                      function. None (default) = no updates.
+
+        Cancellation:
+            Cancelling the awaiting task stops execution cooperatively
+            (after the current run or shard) and waits for the background
+            thread to wind down before CancelledError propagates.
+
+        Raises:
+            ValueError: If options are invalid
+        """
+        loop = asyncio.get_running_loop()
+        cancel = threading.Event()
+        updates = self.run_iter(
+            trial_spec, num_runs, initial_budget, workers, executor,
+            retain_runs, sampling, update_every, cancel,
+            measure_precision=measure_precision
+        )
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def drive():
+            # Exceptions are handed to the event loop rather than lost in the thread
+            try:
+                for update in updates:
+                    loop.call_soon_threadsafe(queue.put_nowait, update)
+            except BaseException as error:
+                loop.call_soon_threadsafe(queue.put_nowait, error)
+
+        driver = loop.run_in_executor(None, drive)
+        try:
+            while True:
+                update = await queue.get()
+                if isinstance(update, BaseException):
+                    raise update
+                if progress is not None:
+                    reported = progress(update)
+                    if inspect.isawaitable(reported):
+                        await reported
+                if update.stage == "finished":
+                    await driver
+                    return update.results
+        except BaseException:
+            cancel.set()
+            await driver
+            raise
+
+    def run_range(
+        self,
+        trial_spec: Any,
+        run_ids: range,
+        num_runs: int,
+        initial_budget: float = float('inf'),
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        retain_runs: str = "all",
+        sampling: str = "random",
+        progress: ProgressCallback = print_progress
+    ) -> PartialResults:
+        """
+        Execute one run-ID range of a larger job, for distributed execution.
+
+        Give each machine a disjoint range of range(num_runs), save each
+        PartialResults (PartialResults.save) and combine them with
+        seleensim.distributed.merge_results() into results equal to
+        run(trial_spec, num_runs, ...) on a single node.
+
+        Example:
+            # machine k of 4
+            shard = range(k * 2500, (k + 1) * 2500)
+            engine.run_range(trial, shard, num_runs=10000).save(f"part{k}.pkl")
+
+        Args:
+            trial_spec: Trial specification (Trial entity)
+            run_ids: Contiguous run IDs to execute (step 1, within num_runs)
+            num_runs: Run count of the whole job (designed sampling builds
+                      its design for the whole job)
+            initial_budget: As in run()
+            workers: As in run()
+            executor: As in run()
+            retain_runs: As in run(); must match across shards
+            sampling: As in run(); must match across shards
+            progress: As in run()
+
+        Returns:
+            PartialResults holding the range's aggregate and provenance
+
+        Raises:
+            ValueError: If run_ids is empty, not contiguous or outside range(num_runs)
+            TypeError: If a constraint cannot be fingerprinted (see
+                       seleensim.scenarios.fingerprint)
+        """
+        if run_ids.step != 1 or len(run_ids) == 0 or run_ids.start < 0 or run_ids.stop > num_runs:
+            raise ValueError(
+                f"run_ids must be a non-empty, contiguous range within range({num_runs}), got {run_ids}"
+            )
+        self._validate_run_options(workers, sampling)
+
+        partial = PartialResults(
+            config=self._checkpoint_config(trial_spec, num_runs, initial_budget, retain_runs, sampling),
+            aggregator=StreamingAggregator(retain_runs)
+        )
+        inputs = self._sampled_inputs(trial_spec, num_runs, sampling)
+
+        _report(
+            progress, "started", 0, len(run_ids),
+            f"Starting runs {run_ids.start}-{run_ids.stop - 1} of {num_runs} (master_seed={self.master_seed})..."
+        )
+
+        started_at = datetime.now().isoformat()
+        start = time.perf_counter()
+        with self._run_pool(workers, executor) as (pool, num_shards):
+            self._run_range(
+                pool, num_shards, trial_spec, run_ids, initial_budget,
+                partial.aggregator, inputs, total_runs=len(run_ids), progress=progress
+            )
+
+        partial.mark_completed(run_ids)
+        partial.shards.append({
+            "run_ids": [run_ids.start, run_ids.stop],
+            "hostname": socket.gethostname(),
+            "started_at": started_at,
+            "duration_seconds": time.perf_counter() - start,
+        })
+        return partial
+
+    def run_adaptive(
+        self,
+        trial_spec: Any,
+        target_half_width: float = 0.02,
+        confidence: float = 0.95,
+        batch_size: int = 100,
+        min_runs: int = 100,
+        max_runs: int = 10000,
+        percentiles: Tuple[float, ...] = (10, 50, 90),
+        initial_budget: float = float('inf'),
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        retain_runs: str = "all",
+        sampling: str = "random",
+        progress: ProgressCallback = print_progress
+    ) -> SimulationResults:
+        """
+        Execute runs in batches until percentile estimates are precise enough.
+
+        After each batch, a confidence interval is computed for each
+        requested percentile of completion time and total cost. Runs stop
+        once every interval's half-width is within target_half_width of its
+        estimate, or when max_runs is reached.
+
+        Args:
+            trial_spec: Trial specification (Trial entity)
+            target_half_width: Target interval half-width, relative to the
+                               percentile estimate (0.02 = ±2%)
+            confidence: Interval confidence level
+            batch_size: Runs per batch (checked after each batch)
+            min_runs: Never stop before this many runs
+            max_runs: Run budget; stop here even if not converged
+            percentiles: Percentiles to track (0-100)
+            initial_budget: Starting budget for each run
+            workers: As in run()
+            executor: As in run()
+            retain_runs: As in run(). Intervals use exact order statistics
+                         with "all", otherwise the sketches (widened by the
+                         sketch accuracy, so targets below it are not met)
+            sampling: As in run(). Designed samplers build a max_runs design
+                      and consume it in order; "sobol" prefixes stay
+                      balanced, "lhs" is only stratified at max_runs.
+            progress: As in run(); each batch also reports a
+                      "batch_completed" update with the worst half-width
+
+        Returns:
+            SimulationResults whose precision field records the achieved
+            intervals and whether the target was met
+
+        Determinism:
+            Run IDs are consumed in order (0, 1, ...) and the stopping rule
+            only looks at completed batches, so the same seed and settings
+            always stop after the same number of runs with the same results.
+
+        Raises:
+            ValueError: If target, confidence, batch size or run limits are invalid
+        """
+        if target_half_width <= 0:
+            raise ValueError(f"target_half_width must be > 0, got {target_half_width}")
+        if not 0 < confidence < 1:
+            raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+        if not 1 <= min_runs <= max_runs:
+            raise ValueError(
+                f"Need 1 <= min_runs <= max_runs, got min_runs={min_runs}, max_runs={max_runs}"
+            )
+        self._validate_run_options(workers, sampling)
+
+        aggregator = StreamingAggregator(retain_runs)
+        inputs = self._sampled_inputs(trial_spec, max_runs, sampling)
+
+        _report(
+            progress, "started", 0, max_runs,
+            f"Starting adaptive simulation (target ±{target_half_width:.1%}, "
+            f"max {max_runs} runs, master_seed={self.master_seed})..."
+        )
+
+        precision = None
+        with self._run_pool(workers, executor) as (pool, num_shards):
+            while aggregator.num_runs < max_runs:
+                start = aggregator.num_runs
+                stop = min(start + batch_size, max_runs)
+                self._run_range(
+                    pool, num_shards, trial_spec, range(start, stop), initial_budget,
+                    aggregator, inputs, total_runs=max_runs, progress=progress
+                )
+
+                precision = PrecisionReport.measure(
+                    aggregator, percentiles=percentiles, confidence=confidence,
+                    target_half_width=target_half_width
+                )
+                _report(
+                    progress, "batch_completed", aggregator.num_runs, max_runs,
+                    f"  {aggregator.num_runs} runs: worst half-width "
+                    f"±{precision.max_relative_half_width:.2%}",
+                    max_relative_half_width=precision.max_relative_half_width,
+                    converged=precision.converged
+                )
+                if precision.converged and aggregator.num_runs >= min_runs:
+                    break
+
+        status = "converged" if precision.converged else "run budget exhausted"
+        _report(
+            progress, "finished", aggregator.num_runs, max_runs,
+            f"Adaptive simulation stopped after {aggregator.num_runs} runs ({status}).",
+            converged=precision.converged
+        )
+
+        return self._aggregate(aggregator, sampling, precision)
+
+    def _validate_run_options(self, workers: Optional[int], sampling: str):
+        """Validate execution options shared by run() and run_adaptive()."""
+        if workers is not None and workers < 1:
+            raise ValueError(f"workers must be >= 1, got {workers}")
+        if sampling not in SAMPLING_METHODS:
+            raise ValueError(f"sampling must be one of {SAMPLING_METHODS}, got {sampling!r}")
+        if sampling == "coupled" and self.seed_scheme == "legacy":
+            raise ValueError('sampling="coupled" requires seed_scheme="counter"')
+
+    def _checkpoint_config(
+        self,
+        trial_spec: Any,
+        num_runs: int,
+        initial_budget: float,
+        retain_runs: str,
+        sampling: str
+    ) -> Dict[str, Any]:
+        """Everything a checkpoint must agree on to be resumed by run()."""
+        return {
+            "trial": fingerprint(trial_spec),
+            "constraints": [fingerprint(c) for c in self.constraints],
+            "master_seed": self.master_seed,
+            "seed_scheme": self.seed_scheme,
+            "num_runs": num_runs,
+            "initial_budget": initial_budget,
+            "retain_runs": retain_runs,
+            "sampling": sampling,
+        }
+
+    def _sampled_inputs(
+        self, trial_spec: Any, num_runs: int, sampling: str
+    ) -> Optional[RunInputs]:
+        """
+        Inputs for runs 0..num_runs-1 (None for random and coupled sampling,
+        which draw per event; see seleensim.sampling).
+        """
+        if sampling in ("random", "coupled"):
+            return None
+        return SampledInputs.generate(trial_spec, num_runs, sampling, self.master_seed)
+
+    @contextmanager
+    def _run_pool(self, workers: Optional[int], executor: Optional[Executor]):
+        """
+        Yield (executor, num_shards) for the requested parallelism.
+
+        None as executor means run serially. A pool created here lives for
+        the whole with-block, so batched runs reuse its workers.
+        """
+        if executor is not None:
+            yield executor, workers or os.cpu_count() or 1
+        elif workers is not None and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                yield pool, workers
+        else:
+            yield None, 1
+
+    def _run_range(
+        self,
+        pool: Optional[Executor],
+        num_shards: int,
+        trial_spec: Any,
+        run_ids: range,
+        initial_budget: float,
+        aggregator: StreamingAggregator,
+        inputs: Optional[RunInputs],
+        total_runs: int,
+        checkpoint: Optional[CheckpointWriter] = None,
+        progress: ProgressCallback = print_progress
+    ):
+        """Execute a contiguous range of run IDs into aggregator."""
+        for completed in self._iter_range(
+            pool, num_shards, trial_spec, run_ids, initial_budget, aggregator, inputs
+        ):
+            if checkpoint is not None:
+                checkpoint.completed(completed)
+
+            # Serial runs report every 10 runs, shards as each completes
+            if pool is not None or aggregator.num_runs % 10 == 0:
+                _report(
+                    progress, "runs_completed", aggregator.num_runs, total_runs,
+                    f"  Completed {aggregator.num_runs}/{total_runs} runs..."
+                )
+
+    def _iter_range(
+        self,
+        pool: Optional[Executor],
+        num_shards: int,
+        trial_spec: Any,
+        run_ids: range,
+        initial_budget: float,
+        aggregator: StreamingAggregator,
+        inputs: Optional[RunInputs]
+    ) -> Iterator[range]:
+        """
+        Execute a contiguous range of run IDs into aggregator, yielding
+        the run IDs folded in after each run (serial) or shard (pool).
+
+        Closing the generator stops execution between runs or shards.
+        """
+        if pool is not None:
+            yield from self._iter_sharded(
+                pool, trial_spec, run_ids, initial_budget, aggregator,
+                num_shards=num_shards, inputs=inputs
+            )
+            return
+
+        # Run independent simulations, folding each into the aggregate
+        seed_plan = self._seed_plan(trial_spec)
+        catalog = EventCatalog.for_trial(trial_spec)
+        constraint_index = ConstraintIndex(self.constraints)
+        for run_id in run_ids:
             run_seed = self.master_seed + run_id
-            result = self._execute_single_run(trial_spec, run_id, run_seed, initial_budget)
-            run_results.append(result)
+            result = self._execute_single_run(
+                trial_spec, run_id, run_seed, initial_budget, seed_plan, inputs,
+                catalog=catalog, constraint_index=constraint_index
+            )
+            aggregator.add(result)
+            yield range(run_id, run_id + 1)
+
+    def _aggregate(
+        self,
+        aggregator: StreamingAggregator,
+        sampling: str = "random",
+        precision: Optional[PrecisionReport] = None
+    ) -> SimulationResults:
+        """
+        Compute aggregated statistics.
+
+        Exact (np.percentile over all runs) when every run was retained,
+        otherwise estimated from the aggregator's sketches.
+        """
+        run_results = aggregator.retained_runs()
 
-            if (run_id + 1) % 10 == 0:
-                print(f"  Completed {run_id + 1}/{num_runs} runs...")
+        if aggregator.retain_runs == "all":
+            completion_times = [r.completion_time for r in run_results]
+            total_costs = [r.total_cost for r in run_results]
 
-        print(f"All runs complete. Aggregating results...")
+            def completion_pct(p):
+                return float(np.percentile(completion_times, p))
 
-        # Aggregate statistics
-        completion_times = [r.completion_time for r in run_results]
-        total_costs = [r.total_cost for r in run_results]
+            def cost_pct(p):
+                return float(np.percentile(total_costs, p))
+
+            mean_processed = float(np.mean([r.events_processed for r in run_results]))
+            mean_rescheduled = float(np.mean([r.events_rescheduled for r in run_results]))
+        else:
+            def completion_pct(p):
+                return aggregator.percentile("completion_time", p)
+
+            def cost_pct(p):
+                return aggregator.percentile("total_cost", p)
+
+            mean_processed = aggregator.mean("events_processed")
+            mean_rescheduled = aggregator.mean("events_rescheduled")
 
         results = SimulationResults(
-            num_runs=num_runs,
+            num_runs=aggregator.num_runs,
             master_seed=self.master_seed,
             run_results=run_results,
-            completion_time_p10=float(np.percentile(completion_times, 10)),
-            completion_time_p50=float(np.percentile(completion_times, 50)),
-            completion_time_p90=float(np.percentile(completion_times, 90)),
-            total_cost_p10=float(np.percentile(total_costs, 10)),
-            total_cost_p50=float(np.percentile(total_costs, 50)),
-            total_cost_p90=float(np.percentile(total_costs, 90)),
-            mean_events_processed=float(np.mean([r.events_processed for r in run_results])),
-            mean_events_rescheduled=float(np.mean([r.events_rescheduled for r in run_results]))
+            completion_time_p10=completion_pct(10),
+            completion_time_p50=completion_pct(50),
+            completion_time_p90=completion_pct(90),
+            total_cost_p10=cost_pct(10),
+            total_cost_p50=cost_pct(50),
+            total_cost_p90=cost_pct(90),
+            mean_events_processed=mean_processed,
+            mean_events_rescheduled=mean_rescheduled,
+            retain_runs=aggregator.retain_runs,
+            sketches=aggregator.sketches,
+            sampling=sampling,
+            precision=precision,
+            seed_scheme=self.seed_scheme
         )
 
         return results
 
+    def _iter_sharded(
+        self,
+        executor: Executor,
+        trial_spec: Any,
+        run_ids: range,
+        initial_budget: float,
+        aggregator: StreamingAggregator,
+        num_shards: int,
+        inputs: Optional[RunInputs] = None
+    ) -> Iterator[range]:
+        """
+        Execute runs as contiguous run_id shards on an executor, yielding
+        each shard's run IDs once it is merged.
+
+        Each shard is aggregated where it runs and merged into aggregator as
+        it completes. Merging is order-independent, so completion order
+        does not affect results. Shards are oversubscribed (several per
+        worker) so that uneven run lengths still balance across the pool.
+        Closing the generator cancels the shards not yet started.
+        """
+        shards = [
+            range(run_ids.start + shard.start, run_ids.start + shard.stop)
+            for shard in _shard_run_ids(len(run_ids), num_shards * _SHARDS_PER_WORKER)
+        ]
+        futures = {
+            executor.submit(
+                _execute_run_shard, self, trial_spec, shard, initial_budget,
+                aggregator.retain_runs,
+                inputs.subset(shard) if inputs is not None else None
+            ): shard
+            for shard in shards
+        }
+
+        try:
+            for future in as_completed(futures):
+                shard_aggregator, shard_instruments = future.result()
+                aggregator.merge(shard_aggregator)
+                for instrument, shard_instrument in zip(self.instruments, shard_instruments):
+                    instrument.merge(shard_instrument)
+                yield futures[future]
+        finally:
+            for future in futures:
+                future.cancel()
+
     def _execute_single_run(
         self,
         trial_spec: Any,
         run_id: int,
         run_seed: int,
-        initial_budget: float
+        initial_budget: float,
+        seed_plan: Optional[SeedPlan] = None,
+        inputs: Optional[RunInputs] = None,
+        instruments: Optional[List[Instrument]] = None,
+        catalog: Optional[EventCatalog] = None,
+        constraint_index: Optional[ConstraintIndex] = None
     ) -> RunResult:
         """
         Execute one simulation run.
@@ -377,33 +1275,76 @@ class SimulationEngine:
             run_id: Run identifier
             run_seed: Random seed for this run
             initial_budget: Starting budget
+            seed_plan: Precomputed seeds for trial_spec (counter scheme;
+                       built on the fly if not given)
+            inputs: Input values covering run_id (None = sample
+                    each input independently from its event seed)
+            instruments: Hooks observing this run (None = self.instruments)
+            catalog: EventCatalog of trial_spec (built on the fly if not given)
+            constraint_index: Dispatch table for self.constraints, shared by
+                              every run on catalog (built on the fly if not given)
 
         Returns:
             RunResult capturing timeline and metrics
         """
+        if seed_plan is None:
+            seed_plan = self._seed_plan(trial_spec)
+        if catalog is None:
+            catalog = EventCatalog.for_trial(trial_spec)
+        if constraint_index is None:
+            constraint_index = ConstraintIndex(self.constraints)
+        hooks = (self.instruments if instruments is None else instruments) or None
+        if hooks:
+            constraint_names = {
+                id(constraint): f"{type(constraint).__name__}#{position}"
+                for position, constraint in enumerate(self.constraints)
+            }
+            for hook in hooks:
+                hook.run_started(run_id)
+            started = time.perf_counter()
+
         # Initialize state
-        state = SimulationState(initial_budget=initial_budget)
+        state = SimulationState(
+            initial_budget=initial_budget,
+            resource_capacities={r.resource_id: r.capacity for r in trial_spec.resources}
+        )
 
         # Initialize event queue (priority queue by time)
-        event_queue = []
+        event_queue = self._new_scheduler()
 
         # Generate initial events from trial specification
         # For MVP: Simple site activation events
-        self._generate_initial_events(trial_spec, run_seed, event_queue)
+        self._generate_initial_events(
+            trial_spec, run_seed, event_queue, run_id, seed_plan, inputs, catalog
+        )
 
         # Process events until queue empty or time limit reached
         max_time = 10000  # Safety limit
         while event_queue and state.current_time < max_time:
             # Pop next event (earliest time)
-            event = heapq.heappop(event_queue)
+            event = event_queue.pop()
 
             # Advance simulation time
             state.current_time = event.time
 
+            if hooks:
+                for hook in hooks:
+                    hook.event_dequeued(event, len(event_queue))
+                self._process_event(
+                    event, state, event_queue, constraint_index, hooks, constraint_names
+                )
+                continue
+
             # Process event (with constraint evaluation, etc.)
-            self._process_event(event, state, event_queue)
+            self._process_event(event, state, event_queue, constraint_index)
+
+        if hooks:
+            elapsed = time.perf_counter() - started
+            for hook in hooks:
+                hook.run_finished(run_id, state.metrics["events_processed"], elapsed)
 
         # Create run result
+        state.timeline.compact()
         result = RunResult(
             run_id=run_id,
             seed=run_seed,
@@ -418,7 +1359,16 @@ class SimulationEngine:
 
         return result
 
-    def _generate_initial_events(self, trial_spec: Any, run_seed: int, event_queue: List[Event]):
+    def _generate_initial_events(
+        self,
+        trial_spec: Any,
+        run_seed: int,
+        event_queue: Scheduler,
+        run_id: int = 0,
+        seed_plan: Optional[SeedPlan] = None,
+        inputs: Optional[RunInputs] = None,
+        catalog: Optional[EventCatalog] = None
+    ):
         """
         Generate initial simulation events from trial specification.
 
@@ -426,30 +1376,58 @@ class SimulationEngine:
 
         Args:
             trial_spec: Trial specification
-            run_seed: Random seed for deterministic sampling
+            run_seed: Random seed for deterministic sampling (legacy scheme)
             event_queue: Event queue to populate
+            run_id: Run identifier (counter scheme)
+            seed_plan: Precomputed seeds for trial_spec (None = legacy scheme)
+            inputs: Input values covering run_id (None = sample
+                    activation times from the event seeds)
+            catalog: EventCatalog of trial_spec (built on the fly if not given)
         """
-        # Sample site activation times using deterministic seeds
-        for idx, site in enumerate(trial_spec.sites):
-            # Deterministic per-event seed
-            event_seed = self._generate_event_seed(run_seed, f"site_activation_{site.site_id}")
-
-            # Sample activation time from distribution
-            activation_time = site.activation_time.sample(event_seed)
-
-            # Create activation event
-            event = Event(
-                event_id=f"activation_{site.site_id}",
-                event_type="site_activation",
-                entity_id=site.site_id,
-                time=activation_time,
-                duration=0.0,
-                metadata={"site": site}
+        sites = trial_spec.sites
+        if catalog is None:
+            catalog = EventCatalog.for_trial(trial_spec)
+
+        # Deterministic per-event seeds, then all activation times in one call
+        if seed_plan is not None:
+            event_seeds = seed_plan.site_seeds(run_id, PURPOSE_SITE_ACTIVATION)
+            carried_seeds = event_seeds.tolist()
+        else:
+            event_seeds = [
+                self._generate_event_seed(run_seed, f"site_activation_{site.site_id}")
+                for site in sites
+            ]
+            carried_seeds = [None] * len(sites)
+        if inputs is not None:
+            # Designed sampling: activation times come from the inputs;
+            # event seeds are still carried for per-event constraint draws
+            activation_times = inputs.site_values(
+                run_id, "activation_time", [site.site_id for site in sites]
             )
+        else:
+            # Legacy scheme: per-seed Generators and rejection sampling for
+            # bounded distributions, as before the counter scheme
+            if seed_plan is None:
+                activation_times = sample_many(
+                    [site.activation_time for site in sites], event_seeds,
+                    truncation="rejection", seed_scheme="legacy"
+                )
+            else:
+                activation_times = sample_many([site.activation_time for site in sites], event_seeds)
 
-            heapq.heappush(event_queue, event)
+        # Catalog specs are the site activations, in site order
+        for index, (activation_time, seed) in enumerate(zip(activation_times.tolist(), carried_seeds)):
+            event_queue.push(catalog.event(index, activation_time, seed))
 
-    def _process_event(self, event: Event, state: SimulationState, event_queue: List[Event]):
+    def _process_event(
+        self,
+        event: Event,
+        state: SimulationState,
+        event_queue: Scheduler,
+        constraint_index: Optional[ConstraintIndex] = None,
+        hooks: Optional[List[Instrument]] = None,
+        constraint_names: Optional[Dict[int, str]] = None
+    ):
         """
         Process single event following canonical orchestration loop.
 
@@ -465,13 +1443,31 @@ class SimulationEngine:
             event: Event to process
             state: Current simulation state
             event_queue: Event queue for downstream events
+            constraint_index: Dispatch table for self.constraints
+                              (built on the fly if not given)
+            hooks: Instruments to notify (None = uninstrumented, untimed)
+            constraint_names: Instrument names of constraints, by id()
         """
-        # Step 1: Evaluate all applicable constraints
-        if self.constraints:
+        # Step 1: Evaluate applicable constraints (events none apply to skip to execution)
+        if constraint_index is None:
+            constraint_index = ConstraintIndex(self.constraints)
+        applicable = constraint_index.select(event)
+
+        if applicable:
             constraint_results = []
-            for constraint in self.constraints:
-                result = constraint.evaluate(state, event)
-                constraint_results.append(result)
+            if hooks:
+                for constraint in applicable:
+                    started = time.perf_counter()
+                    result = constraint.evaluate(state, event)
+                    elapsed = time.perf_counter() - started
+                    name = constraint_names[id(constraint)]
+                    for hook in hooks:
+                        hook.constraint_evaluated(name, event, elapsed, result)
+                    constraint_results.append(result)
+            else:
+                for constraint in applicable:
+                    result = constraint.evaluate(state, event)
+                    constraint_results.append(result)
 
             # Step 2: Compose results
             combined = compose_constraint_results(constraint_results)
@@ -492,19 +1488,24 @@ class SimulationEngine:
             # Step 5: Decision logic
             if new_time > event.time:
                 # Event must be rescheduled
-                event_rescheduled = event.reschedule(new_time)
-                heapq.heappush(event_queue, event_rescheduled)
+                if hooks:
+                    for hook in hooks:
+                        hook.event_rescheduled(event, new_time)
+                # Moved in place (no copy): the queue re-pushes its table slot
+                event_queue.reschedule(event, new_time)
 
                 # Track rescheduling
                 state.metrics["events_rescheduled"] += 1
 
                 # Log reschedule to timeline
-                state.timeline.append((
+                state.timeline.record(
                     state.current_time,
-                    f"{event.event_type}_rescheduled",
+                    event.event_type,
                     event.entity_id,
-                    f"Rescheduled to {new_time:.1f}: {combined.explanation}"
-                ))
+                    Timeline.RESCHEDULED,
+                    arg=new_time,
+                    detail=combined.explanation_record
+                )
 
                 # Track constraint violations if validity failed
                 if earliest_valid_time is not None:
@@ -517,12 +1518,13 @@ class SimulationEngine:
                 event.apply_overrides(parameter_overrides)
 
                 # Log modifications to timeline
-                state.timeline.append((
+                state.timeline.record(
                     state.current_time,
-                    f"{event.event_type}_modified",
+                    event.event_type,
                     event.entity_id,
-                    f"Parameters modified: {combined.explanation}"
-                ))
+                    Timeline.MODIFIED,
+                    detail=combined.explanation_record
+                )
 
         # Step 7: Execute event (record completion)
         state.record_completion(event)
@@ -535,9 +1537,15 @@ class SimulationEngine:
 
         # Step 9: Update state (already done in record_completion)
 
+    def _seed_plan(self, trial_spec: Any) -> Optional[SeedPlan]:
+        """Seed plan for trial_spec under this engine's scheme (None = legacy)."""
+        if self.seed_scheme == "legacy":
+            return None
+        return SeedPlan.for_trial(self.master_seed, trial_spec)
+
     def _generate_event_seed(self, run_seed: int, event_id: str) -> int:
         """
-        Generate deterministic seed for specific event.
+        Generate deterministic seed for specific event (legacy scheme).
 
         Uses hash of run_seed + event_id to ensure:
         - Same run_seed + event_id → same event_seed
@@ -558,6 +1566,71 @@ class SimulationEngine:
         return seed
 
 
+# Shards submitted per worker when running in parallel (load balancing)
+_SHARDS_PER_WORKER = 4
+
+
+def _shard_run_ids(num_runs: int, num_shards: int) -> List[range]:
+    """Split range(num_runs) into at most num_shards contiguous, non-empty ranges."""
+    num_shards = max(1, min(num_shards, num_runs))
+    base, extra = divmod(num_runs, num_shards)
+    shards = []
+    start = 0
+    for i in range(num_shards):
+        size = base + (1 if i < extra else 0)
+        if size:
+            shards.append(range(start, start + size))
+        start += size
+    return shards
+
+
+def _execute_run_shard(
+    engine: SimulationEngine,
+    trial_spec: Any,
+    run_ids: range,
+    initial_budget: float,
+    retain_runs: str,
+    inputs: Optional[RunInputs] = None
+) -> Tuple[StreamingAggregator, List[Instrument]]:
+    """
+    Execute and aggregate a shard of runs (worker-process entry point).
+
+    Module-level so it can be pickled by ProcessPoolExecutor. Returns the
+    shard's aggregate rather than raw runs so that only retained runs
+    travel back to the parent process, plus the shard's spawned
+    instruments (merged into the engine's by the caller).
+    """
+    aggregator = StreamingAggregator(retain_runs)
+    instruments = [instrument.spawn() for instrument in engine.instruments]
+    seed_plan = engine._seed_plan(trial_spec)
+    catalog = EventCatalog.for_trial(trial_spec)
+    constraint_index = ConstraintIndex(engine.constraints)
+    for run_id in run_ids:
+        aggregator.add(engine._execute_single_run(
+            trial_spec, run_id, engine.master_seed + run_id, initial_budget, seed_plan,
+            inputs, instruments, catalog, constraint_index
+        ))
+    return aggregator, instruments
+
+
+def _report(
+    progress: ProgressCallback,
+    stage: str,
+    completed_runs: int,
+    total_runs: int,
+    message: str,
+    **detail: Any
+):
+    """Send a ProgressUpdate to the callback (if any)."""
+    if progress is not None:
+        progress(ProgressUpdate(stage, completed_runs, total_runs, message, detail))
+
+
+def _measured(aggregator: StreamingAggregator, measure_precision: bool) -> Optional[PrecisionReport]:
+    """PrecisionReport of an aggregate if requested, else None."""
+    return PrecisionReport.measure(aggregator) if measure_precision else None
+
+
 def aggregate_statistics(values: List[float], percentiles: List[int] = [10, 50, 90]) -> Dict[int, float]:
     """
     Compute percentile statistics from list of values.
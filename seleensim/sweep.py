@@ -0,0 +1,366 @@
+"""
+Parallel scenario sweeps.
+
+Design Principles:
+- One call for many scenarios: a base trial plus a list or grid of
+  ScenarioProfiles, instead of hand-written apply_scenario/run loops
+- Fine-grained work: every (scenario, run shard) is an independent work
+  unit, so a process pool stays busy across scenarios of uneven cost
+- Ship the spec once: pool workers receive the base trial, scenarios and
+  engine once (process initializer); work units carry only indices
+- Tidy output: one row per (scenario, run), streamed as units complete,
+  plus a per-scenario summary from mergeable sketches
+- Same answers as running each scenario by hand: run IDs, seeds and
+  inputs are exactly those of SimulationEngine.run on the applied trial
+
+Budget levels:
+    ScenarioProfiles do not carry run parameters, so a sweep reads
+    trial_overrides["initial_budget"] (if present) as that scenario's
+    starting budget. apply_scenario ignores the key.
+"""
+
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+import os
+
+from seleensim.aggregation import StreamingAggregator
+from seleensim.constraints import ConstraintIndex
+from seleensim.scenarios import ScenarioProfile, apply_scenario, compose_scenarios
+from seleensim.scheduler import SchedulerSpec
+from seleensim.simulation import EventCatalog, SimulationEngine, _shard_run_ids
+
+
+# Scenario ID of the unmodified base trial in sweep output
+BASELINE_ID = "BASELINE"
+
+# Per-run columns of the tidy table (besides scenario_id and run_id)
+RUN_COLUMNS = (
+    "completion_time",
+    "total_cost",
+    "events_processed",
+    "events_rescheduled",
+    "constraint_violations",
+)
+
+# Work units per worker per scenario (load balancing)
+_UNITS_PER_WORKER = 2
+
+
+def scenario_grid(*axes: Sequence[ScenarioProfile]) -> List[ScenarioProfile]:
+    """
+    Cartesian product of scenario axes, composed with compose_scenarios.
+
+    Example:
+        grid = scenario_grid(
+            [delay_10pct, delay_20pct],        # activation delays
+            [cra_cut_1, cra_cut_2],            # capacity cuts
+            [budget_low, budget_high],         # budget levels
+        )
+        # 8 scenarios, e.g. "DELAY_10__AND__CRA_CUT_1__AND__BUDGET_LOW"
+
+    Args:
+        axes: One or more non-empty sequences of scenarios
+
+    Returns:
+        One composed scenario per combination, first axis varying slowest
+
+    Raises:
+        ValueError: If no axes or an empty axis is given
+    """
+    if not axes or any(len(axis) == 0 for axis in axes):
+        raise ValueError("scenario_grid needs at least one non-empty axis")
+
+    grid = []
+    for combination in product(*axes):
+        scenario = combination[0]
+        for overlay in combination[1:]:
+            scenario = compose_scenarios(scenario, overlay)
+        grid.append(scenario)
+    return grid
+
+
+@dataclass
+class SweepResults:
+    """
+    Results of a scenario sweep.
+
+    rows: Tidy table, one dict per (scenario, run) with scenario_id, run_id
+          and RUN_COLUMNS, ordered by scenario then run_id
+    aggregates: Per-scenario StreamingAggregator (sketches, run counts)
+    """
+    scenario_ids: List[str]
+    num_runs: int
+    master_seed: int
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    aggregates: Dict[str, StreamingAggregator] = field(default_factory=dict)
+
+    def runs_for(self, scenario_id: str) -> List[Dict[str, Any]]:
+        """Rows of one scenario, in run_id order."""
+        return [row for row in self.rows if row["scenario_id"] == scenario_id]
+
+    def runs_by_scenario(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Rows of every scenario, in run_id order, grouped in one pass.
+
+        Prefer this to calling runs_for() per scenario, which scans all
+        rows each time.
+        """
+        grouped: Dict[str, List[Dict[str, Any]]] = {scenario_id: [] for scenario_id in self.scenario_ids}
+        for row in self.rows:
+            grouped.setdefault(row["scenario_id"], []).append(row)
+        return grouped
+
+    def summary_rows(self) -> List[Dict[str, Any]]:
+        """One row per scenario: P10/P50/P90 of completion time and cost."""
+        summary = []
+        for scenario_id in self.scenario_ids:
+            aggregator = self.aggregates[scenario_id]
+            row = {"scenario_id": scenario_id, "num_runs": aggregator.num_runs}
+            for metric in ("completion_time", "total_cost"):
+                for p in (10, 50, 90):
+                    row[f"{metric}_p{p}"] = aggregator.percentile(metric, p)
+            row["mean_events_processed"] = aggregator.mean("events_processed")
+            summary.append(row)
+        return summary
+
+    def summary(self) -> str:
+        """Human-readable per-scenario summary."""
+        lines = [f"Scenario Sweep ({len(self.scenario_ids)} scenarios x {self.num_runs} runs, seed={self.master_seed}):"]
+        for row in self.summary_rows():
+            lines.append(
+                f"  {row['scenario_id']}: completion P50 {row['completion_time_p50']:.1f} "
+                f"/ P90 {row['completion_time_p90']:.1f} days, "
+                f"cost P50 ${row['total_cost_p50']:,.0f}"
+            )
+        return "\n".join(lines)
+
+
+@dataclass
+class _SweepContext:
+    """Everything a worker needs, shipped once per worker."""
+    engine: SimulationEngine
+    base_trial: Any
+    scenarios: List[Optional[ScenarioProfile]]  # None = baseline
+    num_runs: int
+    initial_budget: float
+    sampling: str
+    _prepared: Dict[int, Tuple[Any, Any, Any, Any, Any, float]] = field(default_factory=dict)
+
+    def prepare(self, index: int) -> Tuple[Any, Any, Any, Any, Any, float]:
+        """
+        (trial, seed_plan, catalog, constraint_index, inputs, initial_budget)
+        of a scenario, built once per worker.
+        """
+        prepared = self._prepared.get(index)
+        if prepared is None:
+            scenario = self.scenarios[index]
+            if scenario is None:
+                trial, budget = self.base_trial, self.initial_budget
+            else:
+                trial = apply_scenario(self.base_trial, scenario)
+                budget = scenario.trial_overrides.get("initial_budget", self.initial_budget)
+            prepared = (
+                trial,
+                self.engine._seed_plan(trial),
+                EventCatalog.for_trial(trial),
+                ConstraintIndex(self.engine.constraints),
+                self.engine._sampled_inputs(trial, self.num_runs, self.sampling),
+                budget,
+            )
+            self._prepared[index] = prepared
+        return prepared
+
+
+# Worker-process sweep context, set by _init_worker
+_WORKER_CONTEXT: Optional[_SweepContext] = None
+
+
+def _init_worker(context: _SweepContext):
+    """Process pool initializer: receive the sweep context once."""
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = context
+
+
+def _run_unit(
+    context: Optional[_SweepContext],
+    index: int,
+    run_ids: range
+) -> Tuple[int, List[Tuple], StreamingAggregator]:
+    """
+    Execute one (scenario, run shard) work unit.
+
+    Module-level so it can be pickled. context is None in pool workers
+    (read from the initializer) and passed directly otherwise.
+    """
+    context = context or _WORKER_CONTEXT
+    trial, seed_plan, catalog, constraint_index, inputs, budget = context.prepare(index)
+    engine = context.engine
+
+    rows = []
+    aggregator = StreamingAggregator("none")
+    for run_id in run_ids:
+        result = engine._execute_single_run(
+            trial, run_id, engine.master_seed + run_id, budget, seed_plan, inputs,
+            catalog=catalog, constraint_index=constraint_index
+        )
+        rows.append((run_id,) + tuple(getattr(result, column) for column in RUN_COLUMNS))
+        aggregator.add(result)
+    return index, rows, aggregator
+
+
+def iter_sweep(
+    base_trial: Any,
+    scenarios: Sequence[ScenarioProfile],
+    num_runs: int = 100,
+    master_seed: int = 42,
+    constraints: Optional[List[Any]] = None,
+    initial_budget: float = float('inf'),
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    sampling: str = "random",
+    include_baseline: bool = True,
+    seed_scheme: str = "counter",
+    scheduler: SchedulerSpec = "heap"
+) -> Iterator[Tuple[str, List[Dict[str, Any]], StreamingAggregator]]:
+    """
+    Stream sweep results as work units complete.
+
+    Yields (scenario_id, rows, aggregator) per completed (scenario, run
+    shard) unit, in completion order. See run_sweep for arguments.
+
+    Closing the iterator early (break, close()) cancels the units not yet
+    started, and the sweep's own process pool is shut down without
+    running them.
+    """
+    if num_runs < 1:
+        raise ValueError(f"num_runs must be >= 1, got {num_runs}")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
+    engine = SimulationEngine(
+        master_seed=master_seed, constraints=constraints,
+        seed_scheme=seed_scheme, scheduler=scheduler
+    )
+    engine._validate_run_options(workers, sampling)
+
+    scenario_list: List[Optional[ScenarioProfile]] = list(scenarios)
+    scenario_ids = [scenario.scenario_id for scenario in scenario_list]
+    if include_baseline:
+        scenario_list.insert(0, None)
+        scenario_ids.insert(0, BASELINE_ID)
+    if len(set(scenario_ids)) != len(scenario_ids):
+        raise ValueError(f"Scenario IDs must be unique, got {scenario_ids}")
+
+    context = _SweepContext(
+        engine=engine,
+        base_trial=base_trial,
+        scenarios=scenario_list,
+        num_runs=num_runs,
+        initial_budget=initial_budget,
+        sampling=sampling
+    )
+
+    def to_rows(scenario_id, raw_rows):
+        return [
+            dict(zip(("scenario_id", "run_id") + RUN_COLUMNS, (scenario_id,) + row))
+            for row in raw_rows
+        ]
+
+    if executor is None and (workers is None or workers == 1):
+        for index, scenario_id in enumerate(scenario_ids):
+            _, raw_rows, aggregator = _run_unit(context, index, range(num_runs))
+            yield scenario_id, to_rows(scenario_id, raw_rows), aggregator
+        return
+
+    num_workers = workers or os.cpu_count() or 1
+    shards = _shard_run_ids(num_runs, num_workers * _UNITS_PER_WORKER)
+    units = [(index, shard) for index in range(len(scenario_ids)) for shard in shards]
+
+    if executor is not None:
+        # Foreign executor: no initializer, so each unit carries the context
+        futures = [executor.submit(_run_unit, context, index, shard) for index, shard in units]
+        try:
+            for future in as_completed(futures):
+                index, raw_rows, aggregator = future.result()
+                yield scenario_ids[index], to_rows(scenario_ids[index], raw_rows), aggregator
+        finally:
+            for future in futures:
+                future.cancel()
+        return
+
+    pool = ProcessPoolExecutor(
+        max_workers=num_workers, initializer=_init_worker, initargs=(context,)
+    )
+    try:
+        futures = [pool.submit(_run_unit, None, index, shard) for index, shard in units]
+        for future in as_completed(futures):
+            index, raw_rows, aggregator = future.result()
+            yield scenario_ids[index], to_rows(scenario_ids[index], raw_rows), aggregator
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def run_sweep(
+    base_trial: Any,
+    scenarios: Sequence[ScenarioProfile],
+    num_runs: int = 100,
+    master_seed: int = 42,
+    constraints: Optional[List[Any]] = None,
+    initial_budget: float = float('inf'),
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    sampling: str = "random",
+    include_baseline: bool = True,
+    seed_scheme: str = "counter",
+    scheduler: SchedulerSpec = "heap"
+) -> SweepResults:
+    """
+    Run every scenario of a sweep and collect a tidy results table.
+
+    Args:
+        base_trial: Base Trial (shared with workers once)
+        scenarios: Scenarios to run (e.g. from scenario_grid)
+        num_runs: Runs per scenario
+        master_seed: Master seed shared by all scenarios
+        constraints: Constraints applied to every scenario
+        initial_budget: Starting budget (scenarios may override it via
+                        trial_overrides["initial_budget"])
+        workers: Worker processes. None or 1 runs serially
+        executor: Existing executor to use instead of a process pool
+        sampling: As in SimulationEngine.run() ("coupled" gives common
+                  random numbers across scenarios)
+        include_baseline: Also run the unmodified base trial (BASELINE_ID)
+        seed_scheme: As in SimulationEngine
+        scheduler: As in SimulationEngine
+
+    Returns:
+        SweepResults with rows ordered by scenario then run_id
+
+    Raises:
+        ValueError: If num_runs, workers, sampling, seed_scheme or
+                    scheduler are invalid, or scenario IDs collide
+    """
+    collected: Dict[str, List[Dict[str, Any]]] = {}
+    aggregates: Dict[str, StreamingAggregator] = {}
+    for scenario_id, rows, aggregator in iter_sweep(
+        base_trial, scenarios, num_runs, master_seed, constraints, initial_budget,
+        workers, executor, sampling, include_baseline, seed_scheme, scheduler
+    ):
+        collected.setdefault(scenario_id, []).extend(rows)
+        if scenario_id in aggregates:
+            aggregates[scenario_id].merge(aggregator)
+        else:
+            aggregates[scenario_id] = aggregator
+
+    scenario_ids = ([BASELINE_ID] if include_baseline else []) + [s.scenario_id for s in scenarios]
+    results = SweepResults(
+        scenario_ids=scenario_ids,
+        num_runs=num_runs,
+        master_seed=master_seed,
+        aggregates=aggregates
+    )
+    for scenario_id in scenario_ids:
+        results.rows.extend(sorted(collected[scenario_id], key=lambda row: row["run_id"]))
+    return results
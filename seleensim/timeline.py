@@ -0,0 +1,261 @@
+"""
+Columnar, interned timeline storage for simulation runs.
+
+Design Principles:
+- Compact: one row per entry in preallocated NumPy columns
+  (time, event-type code, entity code, reason code, numeric argument)
+- Interned: event types and entity IDs are stored once per timeline
+- Lazy: human-readable descriptions are rendered only when a row is read
+- Compatible: rows read back as the (time, event_type, entity_id, description)
+  tuples the engine has always produced
+
+Why:
+    The engine records an entry for every completion, reschedule and
+    parameter modification. Building a tuple plus an f-string per entry
+    dominated allocation for long runs and made keeping timelines for
+    every run expensive. Descriptions are almost never read, so they are
+    rendered on demand from a reason code and its arguments.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Union
+import numpy as np
+
+
+class Timeline:
+    """
+    Append-only columnar record of what happened during one run.
+
+    Reading:
+        len(timeline), timeline[i], timeline[a:b] and iteration yield
+        (time, event_type, entity_id, description) tuples, rendered lazily.
+        Column arrays (times, event_type_codes, entity_codes, reason_codes)
+        and string tables (event_types, entities) are available for
+        vectorized analysis without rendering anything.
+
+    Writing:
+        record() is the engine's allocation-light path. append() accepts a
+        ready-made tuple for callers that log custom entries.
+    """
+
+    # Reason codes
+    COMPLETED = 0
+    RESCHEDULED = 1
+    MODIFIED = 2
+    CUSTOM = 3
+
+    # Label suffix appended to the event type for each reason code
+    _LABEL_SUFFIXES = ("", "_rescheduled", "_modified", "")
+
+    def __init__(self, capacity: int = 64):
+        """
+        Initialize empty timeline.
+
+        Args:
+            capacity: Initial number of preallocated rows (grows by doubling).
+        """
+        capacity = max(1, capacity)
+        self._size = 0
+        self._time = np.empty(capacity, dtype=np.float64)
+        self._event_type = np.empty(capacity, dtype=np.int32)
+        self._entity = np.empty(capacity, dtype=np.int32)
+        self._reason = np.empty(capacity, dtype=np.int8)
+        self._arg = np.empty(capacity, dtype=np.float64)
+
+        # Sparse per-row detail (explanations, custom descriptions)
+        self._details: Dict[int, Any] = {}
+
+        # Interned string tables: value -> code, code -> value
+        self._event_type_codes: Dict[str, int] = {}
+        self._entity_codes: Dict[str, int] = {}
+        self.event_types: List[str] = []
+        self.entities: List[str] = []
+
+    def record(
+        self,
+        time: float,
+        event_type: str,
+        entity_id: str,
+        reason: int = COMPLETED,
+        arg: float = 0.0,
+        detail: Any = None
+    ):
+        """
+        Append an entry without rendering its description.
+
+        Args:
+            time: Simulation time of the entry
+            event_type: Event type (interned)
+            entity_id: Entity affected (interned)
+            reason: Reason code (COMPLETED, RESCHEDULED, MODIFIED, CUSTOM)
+            arg: Numeric argument for the description (e.g. new event time)
+            detail: Optional object rendered with str() on read
+                    (e.g. a constraint explanation)
+        """
+        row = self._size
+        if row == len(self._time):
+            self._grow()
+
+        type_code = self._event_type_codes.get(event_type)
+        if type_code is None:
+            type_code = self._event_type_codes[event_type] = len(self.event_types)
+            self.event_types.append(event_type)
+
+        entity_code = self._entity_codes.get(entity_id)
+        if entity_code is None:
+            entity_code = self._entity_codes[entity_id] = len(self.entities)
+            self.entities.append(entity_id)
+
+        self._time[row] = time
+        self._event_type[row] = type_code
+        self._entity[row] = entity_code
+        self._reason[row] = reason
+        self._arg[row] = arg
+        if detail is not None:
+            self._details[row] = detail
+        self._size = row + 1
+
+    def append(self, entry: tuple):
+        """Append a ready-made (time, event_type, entity_id, description) tuple."""
+        time, event_type, entity_id, description = entry
+        self.record(time, event_type, entity_id, self.CUSTOM, detail=description)
+
+    def compact(self):
+        """Release unused preallocated rows (call once the run is finished)."""
+        size = self._size
+        self._time = self._time[:size].copy()
+        self._event_type = self._event_type[:size].copy()
+        self._entity = self._entity[:size].copy()
+        self._reason = self._reason[:size].copy()
+        self._arg = self._arg[:size].copy()
+
+    @staticmethod
+    def from_columns(
+        times: np.ndarray,
+        event_type_codes: np.ndarray,
+        entity_codes: np.ndarray,
+        reason_codes: np.ndarray,
+        args: np.ndarray,
+        event_types: List[str],
+        entities: List[str],
+        details: Optional[Dict[int, Any]] = None
+    ) -> "Timeline":
+        """
+        Wrap existing column arrays (e.g. memory-mapped slices) without copying.
+
+        Codes index event_types/entities. The arrays are only copied if
+        the timeline is appended to later.
+        """
+        timeline = Timeline(capacity=1)
+        timeline._size = len(times)
+        timeline._time = times
+        timeline._event_type = event_type_codes
+        timeline._entity = entity_codes
+        timeline._reason = reason_codes
+        timeline._arg = args
+        timeline._details = dict(details or {})
+        timeline.event_types = list(event_types)
+        timeline.entities = list(entities)
+        timeline._event_type_codes = {value: code for code, value in enumerate(event_types)}
+        timeline._entity_codes = {value: code for code, value in enumerate(entities)}
+        return timeline
+
+    # ------------------------------------------------------------------
+    # Columnar access
+    # ------------------------------------------------------------------
+
+    @property
+    def times(self) -> np.ndarray:
+        """Entry times (read-only view)."""
+        return self._readonly(self._time)
+
+    @property
+    def event_type_codes(self) -> np.ndarray:
+        """Event type codes, indexing event_types (read-only view)."""
+        return self._readonly(self._event_type)
+
+    @property
+    def entity_codes(self) -> np.ndarray:
+        """Entity codes, indexing entities (read-only view)."""
+        return self._readonly(self._entity)
+
+    @property
+    def reason_codes(self) -> np.ndarray:
+        """Reason codes (COMPLETED, RESCHEDULED, MODIFIED, CUSTOM) (read-only view)."""
+        return self._readonly(self._reason)
+
+    @property
+    def args(self) -> np.ndarray:
+        """Numeric description arguments (read-only view)."""
+        return self._readonly(self._arg)
+
+    def detail(self, row: int) -> Any:
+        """Raw (unrendered) detail object for a row, or None."""
+        return self._details.get(self._normalize(row))
+
+    # ------------------------------------------------------------------
+    # Sequence protocol (lazy rendering)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._render(row) for row in range(*index.indices(self._size))]
+        return self._render(self._normalize(index))
+
+    def __iter__(self) -> Iterator[tuple]:
+        for row in range(self._size):
+            yield self._render(row)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Timeline):
+            return len(self) == len(other) and list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Timeline({self._size} entries)"
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _render(self, row: int) -> tuple:
+        reason = int(self._reason[row])
+        event_type = self.event_types[self._event_type[row]]
+        entity_id = self.entities[self._entity[row]]
+        detail = self._details.get(row)
+
+        if reason == self.COMPLETED:
+            description = f"{event_type} completed"
+        elif reason == self.RESCHEDULED:
+            description = f"Rescheduled to {self._arg[row]:.1f}: {detail}"
+        elif reason == self.MODIFIED:
+            description = f"Parameters modified: {detail}"
+        else:
+            description = detail
+
+        label = event_type + self._LABEL_SUFFIXES[reason]
+        return (float(self._time[row]), label, entity_id, description)
+
+    def _normalize(self, row: int) -> int:
+        if row < 0:
+            row += self._size
+        if not 0 <= row < self._size:
+            raise IndexError("timeline index out of range")
+        return row
+
+    def _grow(self):
+        capacity = 2 * len(self._time)
+        for name in ("_time", "_event_type", "_entity", "_reason", "_arg"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _readonly(self, column: np.ndarray) -> np.ndarray:
+        view = column[:self._size]
+        view.flags.writeable = False
+        return view
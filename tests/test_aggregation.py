@@ -0,0 +1,385 @@
+"""
+Tests for streaming aggregation.
+
+Focus areas:
+1. Sketch accuracy: Quantiles within the relative-accuracy guarantee
+2. Mergeability: Merged sketches equal the sketch of all values, in any order
+3. Retention policies: Deterministic, bounded, order-independent
+4. Engine integration: Memory-bounded runs report consistent statistics
+5. Precision: Percentile intervals cover, adaptive runs stop deterministically
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from seleensim.aggregation import (
+    PrecisionReport,
+    QuantileSketch,
+    RetentionPolicy,
+    StreamingAggregator,
+    order_statistic_ranks,
+)
+from seleensim.simulation import RunResult, SimulationEngine
+from seleensim.entities import Site, Trial, PatientFlow
+from seleensim.distributions import Triangular, Gamma, Bernoulli
+
+
+def make_run(run_id, completion_time):
+    return RunResult(
+        run_id=run_id,
+        seed=run_id,
+        completion_time=completion_time,
+        total_cost=0.0,
+        timeline=[],
+        metrics={},
+        events_processed=3,
+        events_rescheduled=run_id % 2,
+        constraint_violations=0
+    )
+
+
+def make_trial():
+    sites = [
+        Site(
+            site_id=f"SITE{i:03d}",
+            activation_time=Triangular(30 + 5 * i, 45 + 5 * i, 90 + 5 * i),
+            enrollment_rate=Gamma(2, 1.5),
+            dropout_rate=Bernoulli(0.15)
+        )
+        for i in range(3)
+    ]
+    flow = PatientFlow(
+        flow_id="FLOW",
+        states={"enrolled", "completed"},
+        initial_state="enrolled",
+        terminal_states={"completed"},
+        transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+    )
+    return Trial(
+        trial_id="TRIAL001",
+        target_enrollment=200,
+        sites=sites,
+        patient_flow=flow
+    )
+
+
+class TestQuantileSketch:
+    """Test QuantileSketch accuracy and merging."""
+
+    def test_percentiles_within_relative_accuracy(self):
+        values = np.random.default_rng(0).lognormal(5, 0.5, 5000)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for v in values:
+            sketch.add(float(v))
+
+        for p in [1, 10, 50, 90, 99]:
+            exact = np.percentile(values, p)
+            assert abs(sketch.percentile(p) - exact) <= 0.011 * exact
+
+    def test_min_max_mean_std_exact(self):
+        values = [3.5, 1.25, 8.0, 0.0, 2.0]
+        sketch = QuantileSketch()
+        for v in values:
+            sketch.add(v)
+
+        assert sketch.percentile(0) == 0.0
+        assert sketch.percentile(100) == 8.0
+        assert sketch.mean() == float(np.mean(values))
+        assert sketch.std() == pytest.approx(float(np.std(values)))
+
+    def test_handles_zero_and_negative_values(self):
+        sketch = QuantileSketch()
+        for v in [-10.0, -1.0, 0.0, 0.0, 1.0, 10.0]:
+            sketch.add(v)
+        assert sketch.percentile(50) == 0.0
+        assert sketch.percentile(20) < 0
+
+    def test_merge_equals_single_sketch_in_any_order(self):
+        values = np.random.default_rng(1).gamma(2, 30, 1000).tolist()
+        whole = QuantileSketch()
+        for v in values:
+            whole.add(v)
+
+        chunks = [values[i:i + 97] for i in range(0, len(values), 97)]
+        random.Random(5).shuffle(chunks)
+        merged = QuantileSketch()
+        for chunk in chunks:
+            part = QuantileSketch()
+            for v in chunk:
+                part.add(v)
+            merged.merge(part)
+
+        assert merged == whole
+        assert merged.percentile(90) == whole.percentile(90)
+        assert merged.mean() == whole.mean()
+
+    def test_merge_requires_same_accuracy(self):
+        with pytest.raises(ValueError, match="different relative_accuracy"):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_infinite_values_ranked_like_np_percentile(self):
+        values = [5.0, float('inf'), 1.0, 3.0, float('inf')]
+        sketch = QuantileSketch()
+        for v in values:
+            sketch.add(v)
+
+        assert sketch.count == 5 and sketch.infinite_count == 2
+        assert sketch.percentile(0) == 1.0
+        assert sketch.percentile(40) == pytest.approx(np.percentile(values, 40), rel=0.01)
+        assert sketch.percentile(100) == float('inf')
+        assert sketch.mean() == float(np.mean(values))
+        assert np.isnan(sketch.std())
+        assert sketch.percentile_interval(90)[1] == float('inf')
+
+    def test_nan_counted_but_not_ranked(self):
+        sketch = QuantileSketch()
+        for v in [2.0, float('nan'), 4.0]:
+            sketch.add(v)
+
+        assert (sketch.count, sketch.nan_count) == (2, 1)
+        assert sketch.mean() == 3.0
+
+    def test_merge_keeps_non_finite_counts(self):
+        left, right, whole = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, v in enumerate([1.0, float('inf'), float('-inf'), float('nan'), 2.0]):
+            (left if i % 2 else right).add(v)
+            whole.add(v)
+        left.merge(right)
+
+        assert left == whole
+        assert left.infinite_count == 2 and left.nan_count == 1
+        assert np.isnan(left.mean())
+
+    def test_empty_sketch_raises(self):
+        with pytest.raises(ValueError, match="empty"):
+            QuantileSketch().percentile(50)
+
+
+class TestRetentionPolicy:
+    """Test run retention policies."""
+
+    @pytest.mark.parametrize("spec", ["some", "sample", "sample:0", "extremes:x", "none:3"])
+    def test_invalid_specs_rejected(self, spec):
+        with pytest.raises(ValueError):
+            RetentionPolicy(spec)
+
+    def test_none_keeps_nothing(self):
+        policy = RetentionPolicy("none")
+        for i in range(10):
+            policy.offer(make_run(i, float(i)))
+        assert policy.retained() == []
+
+    def test_sample_is_bounded_and_order_independent(self):
+        runs = [make_run(i, float(i)) for i in range(200)]
+
+        forward = RetentionPolicy("sample:10")
+        for run in runs:
+            forward.offer(run)
+
+        backward = RetentionPolicy("sample:10")
+        for run in reversed(runs):
+            backward.offer(run)
+
+        kept = [r.run_id for r in forward.retained()]
+        assert len(kept) == 10
+        assert kept == [r.run_id for r in backward.retained()]
+        assert kept == sorted(kept)
+
+    def test_extremes_keeps_fastest_and_slowest(self):
+        policy = RetentionPolicy("extremes:2")
+        times = [50.0, 10.0, 90.0, 30.0, 70.0, 20.0]
+        for i, t in enumerate(times):
+            policy.offer(make_run(i, t))
+
+        kept = sorted(r.completion_time for r in policy.retained())
+        assert kept == [10.0, 20.0, 70.0, 90.0]
+
+    def test_merged_policies_equal_single_policy(self):
+        runs = [make_run(i, float((i * 37) % 101)) for i in range(100)]
+        single = RetentionPolicy("extremes:5")
+        left, right = RetentionPolicy("extremes:5"), RetentionPolicy("extremes:5")
+        for run in runs:
+            single.offer(run)
+            (left if run.run_id % 3 else right).offer(run)
+        left.merge(right)
+
+        assert [r.run_id for r in left.retained()] == [r.run_id for r in single.retained()]
+
+
+class TestEngineStreamingMode:
+    """Test retain_runs integration with SimulationEngine."""
+
+    def setup_method(self):
+        self.trial = make_trial()
+
+    def test_retain_none_drops_runs_but_keeps_statistics(self):
+        engine = SimulationEngine(master_seed=42)
+        exact = engine.run(self.trial, num_runs=200)
+        streamed = engine.run(self.trial, num_runs=200, retain_runs="none")
+
+        assert streamed.run_results == []
+        assert streamed.num_runs == 200
+        assert streamed.completion_time_p90 == pytest.approx(exact.completion_time_p90, rel=0.02)
+        assert streamed.mean_events_processed == exact.mean_events_processed
+        assert streamed.sketches == exact.sketches
+
+    def test_retain_sample_keeps_k_runs(self):
+        engine = SimulationEngine(master_seed=42)
+        results = engine.run(self.trial, num_runs=50, retain_runs="sample:5")
+
+        assert len(results.run_results) == 5
+        for run in results.run_results:
+            assert results.get_run(run.run_id) is run
+
+    def test_streaming_parallel_matches_serial(self):
+        engine = SimulationEngine(master_seed=3)
+        serial = engine.run(self.trial, num_runs=40, retain_runs="extremes:3")
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            parallel = engine.run(
+                self.trial, num_runs=40, workers=3, executor=pool, retain_runs="extremes:3"
+            )
+
+        assert parallel == serial
+
+    def test_invalid_policy_rejected_before_running(self):
+        engine = SimulationEngine(master_seed=42)
+        with pytest.raises(ValueError, match="retain_runs"):
+            engine.run(self.trial, num_runs=5, retain_runs="most")
+
+
+class TestStreamingAggregator:
+    """Test StreamingAggregator bookkeeping."""
+
+    def test_merge_accumulates_counts(self):
+        a, b = StreamingAggregator("none"), StreamingAggregator("none")
+        for i in range(5):
+            a.add(make_run(i, 10.0 + i))
+        for i in range(5, 8):
+            b.add(make_run(i, 10.0 + i))
+        a.merge(b)
+
+        assert a.num_runs == 8
+        assert a.mean("completion_time") == pytest.approx(13.5)
+        assert a.sketches["events_rescheduled"].count == 8
+
+
+class TestPercentileIntervals:
+    """Test order-statistic confidence intervals."""
+
+    def test_ranks_bracket_percentile(self):
+        lower, upper = order_statistic_ranks(1000, 90)
+        assert lower < 900 < upper
+        assert order_statistic_ranks(5, 50) == (0, 4)
+
+        with pytest.raises(ValueError, match="confidence"):
+            order_statistic_ranks(100, 50, confidence=1.0)
+
+    def test_coverage_close_to_nominal(self):
+        rng = np.random.default_rng(11)
+        true_p90 = float(np.exp(1.2815515655446004))  # lognormal(0, 1)
+        covered = 0
+        for _ in range(400):
+            values = np.sort(rng.lognormal(0, 1, size=300))
+            lower, upper = order_statistic_ranks(len(values), 90)
+            covered += values[lower] <= true_p90 <= values[upper]
+        assert 0.92 <= covered / 400 <= 0.99
+
+    def test_sketch_interval_contains_exact_interval(self):
+        exact, streamed = StreamingAggregator("all"), StreamingAggregator("none")
+        rng = random.Random(5)
+        for i in range(500):
+            run = make_run(i, rng.lognormvariate(5, 0.4))
+            exact.add(run)
+            streamed.add(run)
+
+        for p in (10, 50, 90):
+            lo, hi = exact.percentile_interval("completion_time", p)
+            sketch_lo, sketch_hi = streamed.percentile_interval("completion_time", p)
+            assert sketch_lo <= lo and hi <= sketch_hi
+
+    def test_report_serializes(self):
+        aggregator = StreamingAggregator()
+        for i in range(50):
+            aggregator.add(make_run(i, 100.0 + i))
+
+        report = PrecisionReport.measure(aggregator, target_half_width=0.5)
+        data = report.to_dict()
+        assert data["converged"] is True
+        assert len(data["intervals"]) == 6
+        assert report.interval("completion_time", 50).estimate == pytest.approx(124.5)
+
+
+class TestAdaptiveRuns:
+    """Test SimulationEngine.run_adaptive stopping rule."""
+
+    def setup_method(self):
+        self.trial = make_trial()
+
+    def test_stops_when_target_met(self):
+        engine = SimulationEngine(master_seed=42)
+        results = engine.run_adaptive(
+            self.trial, target_half_width=0.05, batch_size=50, min_runs=50, max_runs=5000
+        )
+
+        assert results.precision.converged
+        assert results.precision.max_relative_half_width <= 0.05
+        assert results.num_runs < 5000
+        assert results.num_runs % 50 == 0
+        assert results.precision.num_runs == results.num_runs
+
+    def test_run_budget_caps_runs(self):
+        engine = SimulationEngine(master_seed=42)
+        results = engine.run_adaptive(
+            self.trial, target_half_width=0.001, batch_size=40, min_runs=40, max_runs=100
+        )
+
+        assert results.num_runs == 100
+        assert results.precision.converged is False
+
+    def test_deterministic_and_matches_fixed_run(self):
+        engine = SimulationEngine(master_seed=7)
+        adaptive = engine.run_adaptive(self.trial, target_half_width=0.05, batch_size=50)
+        again = engine.run_adaptive(self.trial, target_half_width=0.05, batch_size=50)
+        fixed = engine.run(self.trial, num_runs=adaptive.num_runs)
+
+        assert adaptive == again
+        assert adaptive.completion_time_p90 == fixed.completion_time_p90
+
+    def test_parallel_matches_serial(self):
+        engine = SimulationEngine(master_seed=3)
+        serial = engine.run_adaptive(self.trial, target_half_width=0.05, batch_size=30)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            parallel = engine.run_adaptive(
+                self.trial, target_half_width=0.05, batch_size=30, workers=3, executor=pool
+            )
+
+        assert parallel == serial
+
+    def test_fixed_run_reports_precision_only_when_asked(self, monkeypatch):
+        engine = SimulationEngine(master_seed=42)
+        measured = []
+        original = PrecisionReport.measure
+        monkeypatch.setattr(
+            PrecisionReport, "measure",
+            staticmethod(lambda aggregator, *a, **k: measured.append(1) or original(aggregator, *a, **k))
+        )
+
+        plain = engine.run(self.trial, num_runs=100, progress=None)
+        assert plain.precision is None and measured == []
+        assert "Precision" not in plain.summary()
+
+        results = engine.run(self.trial, num_runs=100, progress=None, measure_precision=True)
+        assert results.precision.num_runs == 100
+        assert results.precision.converged is None
+        assert "Precision (95% CI)" in results.summary()
+        assert results.run_results == plain.run_results
+
+    def test_invalid_settings(self):
+        engine = SimulationEngine(master_seed=42)
+        with pytest.raises(ValueError, match="target_half_width"):
+            engine.run_adaptive(self.trial, target_half_width=0)
+        with pytest.raises(ValueError, match="min_runs"):
+            engine.run_adaptive(self.trial, min_runs=500, max_runs=100)
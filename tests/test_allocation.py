@@ -0,0 +1,197 @@
+"""
+Tests for the resource allocation interval index.
+
+Focus areas:
+1. Exclusive resources: Matches half-open [start, end) semantics
+2. Multi-unit capacity: Busy only when all k units are held
+3. Correctness: Agrees with a brute-force sweep on random allocations
+4. State integration: Capacities threaded from trial resources, chained
+   holders answer with the end of the chain
+"""
+
+import random
+
+import pytest
+
+from seleensim.allocation import ResourceIndex
+from seleensim.constraints import Constraint, ConstraintResult, ResourceCapacityConstraint
+from seleensim.distributions import Bernoulli, Gamma, Triangular
+from seleensim.entities import PatientFlow, Resource, Site, Trial
+from seleensim.simulation import Event, SimulationEngine, SimulationState
+
+
+def brute_force_next_free(allocations, capacity, time):
+    """Reference: step forward through allocation ends until a unit is free."""
+    t = time
+    while True:
+        holders = [end for start, end in allocations if start <= t < end]
+        if capacity is None or len(holders) < capacity:
+            return None if t == time else t
+        t = min(holders)
+
+
+class TestResourceIndex:
+    """Test ResourceIndex queries."""
+
+    def test_exclusive_resource(self):
+        index = ResourceIndex()
+        index.allocate(10.0, 30.0, "e1")
+
+        assert index.next_free_time(5.0) is None
+        assert index.next_free_time(10.0) == 30.0
+        assert index.next_free_time(15.0) == 30.0
+        assert index.next_free_time(30.0) is None
+
+    def test_back_to_back_allocations_merge(self):
+        index = ResourceIndex()
+        index.allocate(30.0, 50.0, "e2")
+        index.allocate(10.0, 30.0, "e1")
+
+        assert index.next_free_time(15.0) == 50.0
+
+    def test_multi_unit_capacity(self):
+        index = ResourceIndex(capacity=2)
+        index.allocate(0.0, 10.0, "a")
+        assert index.next_free_time(5.0) is None
+
+        index.allocate(5.0, 20.0, "b")
+        assert index.next_free_time(7.0) == 10.0
+        assert index.next_free_time(12.0) is None
+        assert index.usage_at(7.0) == 2
+        assert index.usage_at(12.0) == 1
+        assert index.usage_at(25.0) == 0
+
+    def test_unlimited_capacity_never_busy(self):
+        index = ResourceIndex(capacity=None)
+        for i in range(10):
+            index.allocate(0.0, 100.0, f"e{i}")
+        assert index.next_free_time(50.0) is None
+        assert index.usage_at(50.0) == 10
+
+    def test_zero_length_allocation_holds_nothing(self):
+        index = ResourceIndex()
+        index.allocate(5.0, 5.0, "instant")
+        assert index.next_free_time(5.0) is None
+        assert len(index) == 1
+
+    def test_invalid_inputs(self):
+        with pytest.raises(ValueError, match="capacity"):
+            ResourceIndex(capacity=0)
+        with pytest.raises(ValueError, match="end_time"):
+            ResourceIndex().allocate(10.0, 5.0, "backwards")
+
+    @pytest.mark.parametrize("capacity", [1, 2, 3, 5])
+    def test_matches_brute_force(self, capacity):
+        rng = random.Random(capacity)
+        index = ResourceIndex(capacity=capacity)
+        allocations = []
+        for i in range(150):
+            start = float(rng.randint(0, 200))
+            end = start + rng.randint(1, 40)
+            index.allocate(start, end, f"e{i}")
+            allocations.append((start, end))
+
+            t = float(rng.randint(0, 250))
+            assert index.next_free_time(t) == brute_force_next_free(allocations, capacity, t)
+
+
+class TestStateResourceCapacity:
+    """Test capacity handling in SimulationState."""
+
+    def test_unlisted_resources_are_exclusive(self):
+        state = SimulationState()
+        state.allocate_resource("MONITOR", 0.0, 10.0, "e1")
+        assert state.get_resource_availability("MONITOR", 5.0) == 10.0
+
+    def test_configured_capacity_and_utilization(self):
+        state = SimulationState(resource_capacities={"CRA": 3, "LAB": None})
+        for i in range(3):
+            state.allocate_resource("CRA", float(i), 20.0, f"visit_{i}")
+            state.allocate_resource("LAB", float(i), 20.0, f"sample_{i}")
+
+        assert state.get_resource_availability("CRA", 1.5) is None
+        assert state.get_resource_availability("CRA", 2.5) == 20.0
+        assert state.get_resource_utilization("CRA", 2.5) == 1.0
+        assert state.get_resource_availability("LAB", 2.5) is None
+        assert state.get_resource_utilization("LAB", 2.5) == 0.0
+
+    def test_back_to_back_holders_answer_with_chain_end(self):
+        """One delay to the end of the chain, where a per-holder scan gave one per hop."""
+        state = SimulationState()
+        state.allocate_resource("MONITOR", 10.0, 30.0, "e1")
+        state.allocate_resource("MONITOR", 30.0, 50.0, "e2")
+        state.allocate_resource("MONITOR", 45.0, 60.0, "e3")
+
+        assert state.get_resource_availability("MONITOR", 15.0) == 60.0
+        assert state.get_resource_availability("MONITOR", 60.0) is None
+
+    def test_capacity_constraint_delays_once_to_chain_end(self):
+        event = Event("visit", "monitoring_visit", "SITE001", time=15.0, required_resources={"MONITOR"})
+        state = SimulationState()
+        state.allocate_resource("MONITOR", 10.0, 30.0, "e1")
+        state.allocate_resource("MONITOR", 30.0, 50.0, "e2")
+
+        result = ResourceCapacityConstraint("MONITOR").evaluate(state, event)
+
+        assert result.delay == 35.0
+
+
+class BookAndProbe(Constraint):
+    """Books CRA for every event and records the availability it saw first."""
+
+    def __init__(self):
+        self.answers = []
+
+    def evaluate(self, state, event):
+        self.answers.append(state.get_resource_availability("CRA", event.time))
+        state.allocate_resource("CRA", event.time, event.time + 1000.0, event.event_id)
+        return ConstraintResult.satisfied("Booked CRA")
+
+
+class TestEngineResourceCapacity:
+    """The engine takes capacities from Trial.resources."""
+
+    def make_trial(self, resources):
+        return Trial(
+            trial_id="CAPACITY_TRIAL",
+            target_enrollment=10,
+            sites=[
+                Site(
+                    site_id=f"SITE{i:03d}",
+                    activation_time=Triangular(10 * i + 1, 10 * i + 2, 10 * i + 3),
+                    enrollment_rate=Gamma(2, 1.5),
+                    dropout_rate=Bernoulli(0.15)
+                )
+                for i in range(3)
+            ],
+            patient_flow=PatientFlow(
+                flow_id="FLOW",
+                states={"enrolled", "completed"},
+                initial_state="enrolled",
+                terminal_states={"completed"},
+                transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+            ),
+            resources=resources
+        )
+
+    def probe(self, resources):
+        probe = BookAndProbe()
+        SimulationEngine(master_seed=1, constraints=[probe]).run(
+            self.make_trial(resources), num_runs=1, progress=None
+        )
+        return probe.answers
+
+    def test_undeclared_resource_is_exclusive(self):
+        answers = self.probe([])
+
+        assert answers[0] is None
+        assert answers[1] is not None and answers[2] is not None
+
+    def test_declared_capacity_is_honored(self):
+        answers = self.probe([Resource("CRA", "staff", capacity=2)])
+
+        assert answers[:2] == [None, None]
+        assert answers[2] is not None
+
+    def test_declared_unlimited_resource_is_never_busy(self):
+        assert self.probe([Resource("CRA", "staff")]) == [None, None, None]
@@ -0,0 +1,86 @@
+"""
+Tests for the benchmark harness.
+
+Focus areas:
+1. Measurement: Cases produce timings, peak memory and event rates
+2. Comparison: Regressions beyond tolerance and noise floor are flagged
+3. Baselines: Saving keeps entries of cases that were not re-run
+"""
+
+import pytest
+
+from benchmarks.cases import suite_cases
+from benchmarks.harness import (
+    BenchmarkCase,
+    BenchmarkResult,
+    compare,
+    load_baseline,
+    run_case,
+    save_baseline,
+)
+
+
+def result(key, seconds, memory=0):
+    return BenchmarkResult(key=key, name=key, params={}, seconds=seconds, peak_memory_bytes=memory)
+
+
+class TestMeasurement:
+    """Test running cases."""
+
+    def test_engine_case_reports_event_rate(self):
+        case = next(c for c in suite_cases("quick") if c.key == "engine.run/sites[sites=10,runs=10]")
+        measured = run_case(case)
+
+        assert measured.seconds > 0
+        assert measured.events_per_second > 0
+
+    def test_peak_memory_traced(self):
+        def allocate(size):
+            bytearray(size)
+
+        case = BenchmarkCase(name="alloc", params={}, setup=lambda: 2**22, body=allocate, repeat=1)
+        assert run_case(case).peak_memory_bytes >= 2**22
+
+    def test_unknown_suite(self):
+        with pytest.raises(ValueError, match="suite"):
+            suite_cases("nightly")
+
+
+class TestComparison:
+    """Test regression detection."""
+
+    def test_slowdown_beyond_tolerance(self):
+        baseline = {"a": result("a", 1.0), "b": result("b", 1.0)}
+        regressions = compare([result("a", 1.3), result("b", 1.2)], baseline, time_tolerance=0.25)
+
+        assert [(r.key, r.metric) for r in regressions] == [("a", "seconds")]
+        assert regressions[0].ratio == pytest.approx(1.3)
+
+    def test_noise_floor(self):
+        baseline = {"tiny": result("tiny", 0.001, memory=1000)}
+        assert compare([result("tiny", 0.004, memory=5000)], baseline) == []
+
+    def test_memory_growth(self):
+        baseline = {"a": result("a", 1.0, memory=10 << 20)}
+        regressions = compare([result("a", 1.0, memory=20 << 20)], baseline)
+
+        assert [r.metric for r in regressions] == ["peak_memory_bytes"]
+
+    def test_new_cases_not_compared(self):
+        assert compare([result("new", 100.0)], {}) == []
+
+
+class TestBaselines:
+    """Test baseline files."""
+
+    def test_save_merges_entries(self, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        save_baseline(path, [result("a", 1.0), result("b", 2.0)])
+        save_baseline(path, [result("b", 3.0)])
+
+        baseline = load_baseline(path)
+        assert baseline["a"].seconds == 1.0
+        assert baseline["b"].seconds == 3.0
+
+    def test_missing_baseline_is_empty(self, tmp_path):
+        assert load_baseline(str(tmp_path / "none.json")) == {}
@@ -0,0 +1,296 @@
+"""
+Tests for checkpoint and resume.
+
+Focus areas:
+1. Resume: An interrupted run resumed from its checkpoint equals an
+   uninterrupted run (serial, sharded, designed sampling, bounded retention)
+2. Bookkeeping: Completed intervals coalesce, remaining ranges are exact
+3. Safety: Mismatched configuration is rejected, configuration without a
+   stable fingerprint is refused, failed saves keep the previous checkpoint
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from seleensim.checkpoint import RunCheckpoint
+from seleensim.aggregation import StreamingAggregator
+from seleensim.simulation import SimulationEngine
+from seleensim.constraints import (
+    BudgetThrottlingConstraint,
+    ConstraintResult,
+    LinearCapacityDegradation,
+    LinearResponseCurve,
+    ResourceCapacityConstraint,
+    TemporalPrecedenceConstraint,
+)
+from seleensim.scenarios import fingerprint
+from seleensim.entities import Site, Trial, PatientFlow
+from seleensim.distributions import Triangular, Gamma, Bernoulli
+
+
+def make_trial(target_enrollment=100):
+    return Trial(
+        trial_id="CHECKPOINT_TRIAL",
+        target_enrollment=target_enrollment,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:03d}",
+                activation_time=Triangular(30 + 10 * i, 45 + 10 * i, 90 + 10 * i),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(3)
+        ],
+        patient_flow=PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+    )
+
+
+def make_constraints():
+    return [
+        ResourceCapacityConstraint("CRA", LinearCapacityDegradation(threshold=0.8)),
+        BudgetThrottlingConstraint(
+            1000.0, LinearResponseCurve(), event_types={"enrollment", "site_activation", "visit"}
+        ),
+        TemporalPrecedenceConstraint("site_activation", "enrollment"),
+    ]
+
+
+class CallbackConstraint(TemporalPrecedenceConstraint):
+    """Constraint configured with a function (no stable fingerprint)."""
+
+    def __init__(self, delay_of):
+        super().__init__("site_activation", "enrollment")
+        self.delay_of = delay_of
+
+    def evaluate(self, state, event):
+        return ConstraintResult.satisfied()
+
+
+def run_in_fresh_interpreter(code, hash_seed):
+    """Run code in a new interpreter with the given PYTHONHASHSEED."""
+    env = dict(os.environ, PYTHONHASHSEED=str(hash_seed))
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return subprocess.run(
+        [sys.executable, "-c", code], env=env, cwd=root,
+        check=True, capture_output=True, text=True
+    ).stdout
+
+
+class Interrupted(Exception):
+    pass
+
+
+def interrupt_after(engine, monkeypatch, num_runs_allowed):
+    """Make engine raise once num_runs_allowed runs have executed."""
+    original = engine._execute_single_run
+    calls = []
+
+    def execute(*args, **kwargs):
+        if len(calls) == num_runs_allowed:
+            raise Interrupted()
+        calls.append(args[1])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(engine, "_execute_single_run", execute)
+
+
+def assert_same_results(resumed, uninterrupted):
+    assert resumed.num_runs == uninterrupted.num_runs
+    assert resumed.summary() == uninterrupted.summary()
+    assert [(r.run_id, r.completion_time, r.total_cost) for r in resumed.run_results] == \
+        [(r.run_id, r.completion_time, r.total_cost) for r in uninterrupted.run_results]
+    for metric, sketch in uninterrupted.sketches.items():
+        assert resumed.sketches[metric].mean() == sketch.mean()
+        assert resumed.sketches[metric].percentile(90) == sketch.percentile(90)
+
+
+class TestResume:
+    """Test that resumed runs equal uninterrupted runs."""
+
+    @pytest.mark.parametrize("sampling,retain_runs", [
+        ("random", "all"),
+        ("sobol", "all"),
+        ("random", "extremes:3"),
+    ])
+    def test_serial_resume(self, tmp_path, monkeypatch, sampling, retain_runs):
+        path = str(tmp_path / "job.ckpt")
+        trial = make_trial()
+        uninterrupted = SimulationEngine(master_seed=5).run(
+            trial, num_runs=40, sampling=sampling, retain_runs=retain_runs
+        )
+
+        engine = SimulationEngine(master_seed=5)
+        interrupt_after(engine, monkeypatch, 27)
+        with pytest.raises(Interrupted):
+            engine.run(
+                trial, num_runs=40, sampling=sampling, retain_runs=retain_runs,
+                checkpoint=path, checkpoint_every=10
+            )
+
+        saved = RunCheckpoint.load(path)
+        assert saved.completed == [(0, 20)]
+
+        resumed = SimulationEngine(master_seed=5).run(
+            trial, num_runs=40, sampling=sampling, retain_runs=retain_runs,
+            checkpoint=path, resume_from=path
+        )
+        assert_same_results(resumed, uninterrupted)
+        assert RunCheckpoint.load(path).completed == [(0, 40)]
+
+    def test_sharded_resume(self, tmp_path):
+        path = str(tmp_path / "job.ckpt")
+        trial = make_trial()
+        uninterrupted = SimulationEngine(master_seed=5).run(trial, num_runs=40)
+
+        # Simulate a crash that lost some shards: keep runs 0-9 and 20-29
+        progress = RunCheckpoint(
+            SimulationEngine(master_seed=5)._checkpoint_config(trial, 40, float('inf'), "all", "random"),
+            StreamingAggregator("all")
+        )
+        partial = SimulationEngine(master_seed=5).run(trial, num_runs=40)
+        for run in partial.run_results:
+            if run.run_id < 10 or 20 <= run.run_id < 30:
+                progress.aggregator.add(run)
+        progress.mark_completed(range(0, 10))
+        progress.mark_completed(range(20, 30))
+        progress.save(path)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            resumed = SimulationEngine(master_seed=5).run(
+                trial, num_runs=40, workers=2, executor=executor, resume_from=path
+            )
+        assert_same_results(resumed, uninterrupted)
+
+    def test_resume_completed_checkpoint_runs_nothing(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "job.ckpt")
+        trial = make_trial()
+        finished = SimulationEngine(master_seed=5).run(trial, num_runs=15, checkpoint=path)
+
+        engine = SimulationEngine(master_seed=5)
+        interrupt_after(engine, monkeypatch, 0)
+        resumed = engine.run(trial, num_runs=15, resume_from=path)
+
+        assert_same_results(resumed, finished)
+
+
+class TestCheckpointBookkeeping:
+    """Test completed/remaining run ID tracking."""
+
+    def test_intervals_coalesce(self):
+        progress = RunCheckpoint({}, StreamingAggregator())
+        for shard in (range(10, 20), range(30, 40), range(0, 10), range(20, 30)):
+            progress.mark_completed(shard)
+
+        assert progress.completed == [(0, 40)]
+        assert progress.num_completed == 40
+
+    def test_remaining(self):
+        progress = RunCheckpoint({}, StreamingAggregator())
+        progress.mark_completed(range(5, 10))
+        progress.mark_completed(range(20, 25))
+
+        assert progress.remaining(30) == [range(0, 5), range(10, 20), range(25, 30)]
+        assert progress.remaining(8) == [range(0, 5)]
+
+
+class TestCheckpointSafety:
+    """Test rejected resumes and crash-safe writes."""
+
+    def test_mismatched_trial_rejected(self, tmp_path):
+        path = str(tmp_path / "job.ckpt")
+        SimulationEngine(master_seed=5).run(make_trial(), num_runs=5, checkpoint=path)
+
+        with pytest.raises(ValueError, match="trial"):
+            SimulationEngine(master_seed=5).run(make_trial(120), num_runs=5, resume_from=path)
+
+    def test_mismatched_options_rejected(self, tmp_path):
+        path = str(tmp_path / "job.ckpt")
+        SimulationEngine(master_seed=5).run(make_trial(), num_runs=5, checkpoint=path)
+
+        with pytest.raises(ValueError, match="master_seed"):
+            SimulationEngine(master_seed=6).run(make_trial(), num_runs=5, resume_from=path)
+        with pytest.raises(ValueError, match="num_runs"):
+            SimulationEngine(master_seed=5).run(make_trial(), num_runs=6, resume_from=path)
+
+    def test_mismatched_constraint_parameters_rejected(self, tmp_path):
+        path = str(tmp_path / "job.ckpt")
+        mild = ResourceCapacityConstraint("CRA", LinearCapacityDegradation(threshold=0.8))
+        harsh = ResourceCapacityConstraint("CRA", LinearCapacityDegradation(threshold=0.5))
+        SimulationEngine(master_seed=5, constraints=[mild]).run(
+            make_trial(), num_runs=5, checkpoint=path
+        )
+
+        with pytest.raises(ValueError, match="constraints"):
+            SimulationEngine(master_seed=5, constraints=[harsh]).run(
+                make_trial(), num_runs=5, resume_from=path
+            )
+
+    @pytest.mark.parametrize("hash_seed", [1, 2, 3])
+    def test_resume_in_process_with_other_hash_seed(self, tmp_path, hash_seed):
+        """Set iteration order must not leak into the job fingerprint."""
+        path = str(tmp_path / "job.ckpt")
+        run_in_fresh_interpreter(
+            "from tests.test_checkpoint import make_trial\n"
+            "from seleensim.simulation import SimulationEngine\n"
+            f"SimulationEngine(master_seed=5).run(make_trial(), num_runs=10, checkpoint={path!r})\n",
+            hash_seed
+        )
+
+        resumed = SimulationEngine(master_seed=5).run(make_trial(), num_runs=10, resume_from=path)
+        assert_same_results(resumed, SimulationEngine(master_seed=5).run(make_trial(), num_runs=10))
+
+    def test_fingerprint_independent_of_hash_seed(self):
+        code = (
+            "from tests.test_checkpoint import make_trial, make_constraints\n"
+            "from seleensim.simulation import SimulationEngine\n"
+            "engine = SimulationEngine(constraints=make_constraints())\n"
+            "print(engine._checkpoint_config(make_trial(), 10, 1.0, 'all', 'random'))\n"
+        )
+        configs = {run_in_fresh_interpreter(code, hash_seed) for hash_seed in range(5)}
+        assert len(configs) == 1
+
+    def test_unfingerprintable_constraint_rejected(self, tmp_path):
+        engine = SimulationEngine(master_seed=5, constraints=[CallbackConstraint(lambda event: 0.0)])
+
+        with pytest.raises(TypeError, match="Cannot fingerprint function"):
+            engine.run(make_trial(), num_runs=2, checkpoint=str(tmp_path / "job.ckpt"), progress=None)
+        # Without checkpointing nothing is fingerprinted
+        assert engine.run(make_trial(), num_runs=2, progress=None).num_runs == 2
+
+    @pytest.mark.parametrize("value", [len, make_trial, object(), SimulationEngine])
+    def test_fingerprint_rejects_identity_only_values(self, value):
+        with pytest.raises(TypeError, match="Cannot fingerprint"):
+            fingerprint({"value": value})
+
+    def test_failed_save_keeps_previous_checkpoint(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "job.ckpt")
+        progress = RunCheckpoint({"num_runs": 10}, StreamingAggregator())
+        progress.mark_completed(range(0, 5))
+        progress.save(path)
+
+        def broken_dump(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(pickle, "dump", broken_dump)
+        progress.mark_completed(range(5, 10))
+        with pytest.raises(OSError):
+            progress.save(path)
+        monkeypatch.undo()
+
+        assert RunCheckpoint.load(path).completed == [(0, 5)]
+        assert [p.name for p in tmp_path.iterdir()] == ["job.ckpt"]
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError, match="checkpoint_every"):
+            SimulationEngine().run(make_trial(), num_runs=2, checkpoint_every=0)
@@ -0,0 +1,177 @@
+"""
+Tests for columnar output storage.
+
+Focus areas:
+1. Round trip: EnhancedSimulationOutput survives write/read unchanged
+2. Memory mapping: Columns are read-only memory maps
+3. Timelines: Per-run timelines read back entry for entry
+4. Validation: Missing inputs and foreign directories are rejected
+"""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from seleensim.columnar import ColumnarResults, open_columnar, write_columnar
+from seleensim.entities import Site, Trial, PatientFlow
+from seleensim.distributions import Triangular, Gamma, Bernoulli
+from seleensim.simulation import SimulationEngine
+from seleensim.output_schema import EnhancedSimulationOutput, create_enhanced_output
+
+
+def make_trial():
+    return Trial(
+        trial_id="COLUMNAR_TRIAL",
+        target_enrollment=100,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:03d}",
+                activation_time=Triangular(30, 45, 90),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(3)
+        ],
+        patient_flow=PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+    )
+
+
+@pytest.fixture
+def simulated():
+    trial = make_trial()
+    results = SimulationEngine(master_seed=11).run(trial, num_runs=8)
+    # A custom entry gives run 0 a sparse detail to store
+    results.run_results[0].timeline.append((999.0, "note", "SITE_001", "manual annotation"))
+    output = create_enhanced_output(
+        simulation_id="COLUMNAR",
+        trial=trial,
+        scenario=None,
+        constraints=None,
+        run_results=results.run_results,
+        master_seed=11,
+        execution_duration=0.1,
+        results=results
+    )
+    return output, results.run_results
+
+
+class TestRoundTrip:
+    """Test EnhancedSimulationOutput round trips."""
+
+    def test_output_round_trip(self, simulated, tmp_path):
+        output, run_results = simulated
+        output.to_columnar(str(tmp_path), run_results)
+
+        loaded = EnhancedSimulationOutput.from_columnar(str(tmp_path))
+
+        assert loaded.to_dict() == output.to_dict()
+
+    def test_matches_json_round_trip(self, simulated, tmp_path):
+        output, _ = simulated
+        output.to_json(str(tmp_path / "out.json"))
+        output.to_columnar(str(tmp_path / "columnar"))
+
+        from_json = EnhancedSimulationOutput.from_json(str(tmp_path / "out.json"))
+        from_columnar = EnhancedSimulationOutput.from_columnar(str(tmp_path / "columnar"))
+
+        assert from_columnar.to_dict() == from_json.to_dict()
+
+    def test_manifest_is_plain_json(self, simulated, tmp_path):
+        output, run_results = simulated
+        write_columnar(str(tmp_path), output, run_results)
+
+        with open(tmp_path / "manifest.json") as f:
+            manifest = json.load(f)
+
+        assert manifest["num_runs"] == 8
+        assert manifest["provenance"]["simulation_id"] == "COLUMNAR"
+        assert manifest["run_columns"]["completion_time"]["shape"] == [8]
+        assert manifest["timeline"]["num_rows"] == sum(len(r.timeline) for r in run_results)
+
+
+class TestColumnAccess:
+    """Test memory-mapped column reads."""
+
+    def test_columns_are_read_only_memmaps(self, simulated, tmp_path):
+        output, run_results = simulated
+        write_columnar(str(tmp_path), output, run_results)
+        results = open_columnar(str(tmp_path))
+
+        completion = results.column("completion_time")
+
+        assert isinstance(completion, np.memmap)
+        assert not completion.flags.writeable
+        assert completion.tolist() == [r.completion_time for r in run_results]
+        assert results.run(3) == output.single_run_results[3]
+        assert len(results) == 8
+
+    def test_unknown_column(self, simulated, tmp_path):
+        output, _ = simulated
+        write_columnar(str(tmp_path), output)
+
+        with pytest.raises(KeyError, match="available"):
+            open_columnar(str(tmp_path)).column("patients")
+
+
+class TestTimelines:
+    """Test per-run timeline storage."""
+
+    def test_timelines_read_back_entry_for_entry(self, simulated, tmp_path):
+        output, run_results = simulated
+        write_columnar(str(tmp_path), output, run_results)
+        results = open_columnar(str(tmp_path))
+
+        for i, run in enumerate(run_results):
+            assert list(results.timeline(i)) == list(run.timeline)
+        assert results.timeline(0)[-1] == (999.0, "note", "SITE_001", "manual annotation")
+
+    def test_loaded_timeline_accepts_appends(self, simulated, tmp_path):
+        output, run_results = simulated
+        write_columnar(str(tmp_path), output, run_results)
+
+        timeline = open_columnar(str(tmp_path)).timeline(1)
+        timeline.append((1000.0, "note", "SITE_002", "later"))
+
+        assert timeline[-1] == (1000.0, "note", "SITE_002", "later")
+        assert len(timeline) == len(run_results[1].timeline) + 1
+
+    def test_without_run_results_no_timelines(self, simulated, tmp_path):
+        output, _ = simulated
+        write_columnar(str(tmp_path), output)
+        results = open_columnar(str(tmp_path))
+
+        assert not results.has_timelines
+        with pytest.raises(ValueError, match="No timelines"):
+            results.timeline(0)
+
+
+class TestValidation:
+    """Test rejected inputs."""
+
+    def test_no_per_run_results(self, simulated, tmp_path):
+        output, _ = simulated
+        output.single_run_results = None
+
+        with pytest.raises(ValueError, match="No per-run results"):
+            write_columnar(str(tmp_path), output)
+
+    def test_foreign_directory(self, tmp_path):
+        with open(tmp_path / "manifest.json", "w") as f:
+            json.dump({"format": "other"}, f)
+
+        with pytest.raises(ValueError, match="not a seleensim-columnar"):
+            ColumnarResults(str(tmp_path))
+
+    def test_incomplete_directory(self, tmp_path):
+        os.makedirs(tmp_path / "runs")
+
+        with pytest.raises(FileNotFoundError):
+            open_columnar(str(tmp_path))
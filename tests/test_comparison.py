@@ -0,0 +1,199 @@
+"""
+Tests for paired scenario comparison.
+
+Focus areas:
+1. Coupling: Shared inputs see the same uniforms in every scenario
+2. Paired intervals: Correct t intervals on per-run differences
+3. Variance reduction: Paired deltas are far tighter than independent ones
+4. Validation: Bad run counts and colliding IDs rejected
+"""
+
+import numpy as np
+import pytest
+
+from seleensim.comparison import compare_scenarios, paired_delta_interval
+from seleensim.scenarios import ScenarioProfile
+from seleensim.simulation import SimulationEngine
+from seleensim.entities import Site, Trial, PatientFlow
+from seleensim.distributions import Triangular, Gamma, Bernoulli, LogNormal
+
+
+def make_trial(num_sites=5):
+    flow = PatientFlow(
+        flow_id="FLOW",
+        states={"enrolled", "completed"},
+        initial_state="enrolled",
+        terminal_states={"completed"},
+        transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+    )
+    return Trial(
+        trial_id="TRIAL001",
+        target_enrollment=100,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:03d}",
+                activation_time=Triangular(30 + 5 * i, 60 + 5 * i, 150 + 5 * i),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(num_sites)
+        ],
+        patient_flow=flow
+    )
+
+
+def delay_scenario(site_id="SITE_000", scale_factor=1.05):
+    return ScenarioProfile(
+        scenario_id="DELAYED",
+        description="Slower activation at one site",
+        version="1.0.0",
+        site_overrides={
+            site_id: {
+                "activation_time": {
+                    "type": "distribution_scale",
+                    "parameters": {"scale_factor": scale_factor},
+                    "reason": "Test"
+                }
+            }
+        }
+    )
+
+
+def activation_times(run):
+    return {entity_id: time for time, _, entity_id, _ in run.timeline}
+
+
+class TestCoupledSampling:
+    """Test sampling="coupled" in the engine."""
+
+    def test_unchanged_sites_draw_identical_values(self):
+        base = make_trial()
+        comparison = compare_scenarios(base, [delay_scenario()], num_runs=20)
+        base_runs = comparison.results["BASELINE"].run_results
+        delayed_runs = comparison.results["DELAYED"].run_results
+
+        for base_run, delayed_run in zip(base_runs, delayed_runs):
+            base_times = activation_times(base_run)
+            delayed_times = activation_times(delayed_run)
+            for site_id in ("SITE_001", "SITE_002", "SITE_003", "SITE_004"):
+                assert delayed_times[site_id] == base_times[site_id]
+            # Same uniform through a scaled distribution: never earlier
+            assert delayed_times["SITE_000"] >= base_times["SITE_000"]
+
+    def test_coupling_survives_family_change_and_removed_sites(self):
+        base = make_trial(num_sites=3)
+        smaller = Trial(
+            trial_id="SMALLER",
+            target_enrollment=100,
+            sites=[
+                Site(
+                    site_id="SITE_002",
+                    activation_time=LogNormal(mean=80, cv=0.3),
+                    enrollment_rate=Gamma(2, 1.5),
+                    dropout_rate=Bernoulli(0.15)
+                )
+            ],
+            patient_flow=base.patient_flow
+        )
+        engine = SimulationEngine(master_seed=9)
+        base_runs = engine.run(base, num_runs=30, sampling="coupled").run_results
+        small_runs = engine.run(smaller, num_runs=30, sampling="coupled").run_results
+
+        base_site = [activation_times(r)["SITE_002"] for r in base_runs]
+        small_site = [activation_times(r)["SITE_002"] for r in small_runs]
+        # Both are monotone maps of the same uniforms: identical rank order
+        assert np.array_equal(np.argsort(base_site), np.argsort(small_site))
+
+    @pytest.mark.parametrize("trial", [
+        make_trial(),
+        Trial(
+            trial_id="BOUNDED",
+            target_enrollment=100,
+            sites=[
+                Site(
+                    site_id="SITE_A",
+                    activation_time=Triangular(30, 60, 150, bounds=(40, 120)),
+                    enrollment_rate=Gamma(2, 1.5),
+                    dropout_rate=Bernoulli(0.15)
+                )
+            ],
+            patient_flow=make_trial().patient_flow
+        )
+    ], ids=["unbounded", "bounded"])
+    def test_coupled_matches_random(self, trial):
+        # Counter seeding already keys every draw by (run, entity, purpose)
+        engine = SimulationEngine(master_seed=1)
+        coupled = engine.run(trial, num_runs=10, sampling="coupled", progress=None)
+        independent = engine.run(trial, num_runs=10, progress=None)
+
+        assert [r.completion_time for r in coupled.run_results] == \
+            [r.completion_time for r in independent.run_results]
+        assert [r.timeline for r in coupled.run_results] == \
+            [r.timeline for r in independent.run_results]
+
+    def test_compare_scenarios_passes_progress(self, capsys):
+        updates = []
+        compare_scenarios(make_trial(), [delay_scenario()], num_runs=5, progress=updates.append)
+
+        assert [u.stage for u in updates].count("finished") == 2
+        assert capsys.readouterr().out == ""
+
+    def test_compare_scenarios_silent_by_default(self, capsys):
+        compare_scenarios(make_trial(), [delay_scenario()], num_runs=5)
+
+        assert capsys.readouterr().out == ""
+
+    def test_legacy_scheme_rejected(self):
+        engine = SimulationEngine(master_seed=1, seed_scheme="legacy")
+        with pytest.raises(ValueError, match="coupled"):
+            engine.run(make_trial(), num_runs=2, sampling="coupled")
+
+
+class TestPairedDeltas:
+    """Test paired delta intervals."""
+
+    def test_interval_matches_t_test(self):
+        baseline = [10.0, 12.0, 11.0, 13.0, 9.0]
+        scenario = [11.0, 14.0, 11.5, 15.0, 10.0]
+        mean, lower, upper, std_error, _ = paired_delta_interval(baseline, scenario)
+
+        differences = np.subtract(scenario, baseline)
+        assert mean == pytest.approx(differences.mean())
+        assert std_error == pytest.approx(differences.std(ddof=1) / np.sqrt(5))
+        assert lower == pytest.approx(mean - 2.7764451 * std_error)
+        assert upper == pytest.approx(mean + 2.7764451 * std_error)
+
+    def test_invalid_pairs(self):
+        with pytest.raises(ValueError, match="paired"):
+            paired_delta_interval([1.0, 2.0], [1.0])
+        with pytest.raises(ValueError, match="at least 2"):
+            paired_delta_interval([1.0], [1.0])
+
+    def test_small_effect_detected_with_few_runs(self):
+        comparison = compare_scenarios(make_trial(), [delay_scenario()], num_runs=60)
+        delta = comparison.delta("DELAYED", "completion_time")
+
+        assert delta.mean_delta >= 0
+        assert delta.lower <= delta.mean_delta <= delta.upper
+        assert delta.variance_reduction >= 10
+        assert "DELAYED completion_time" in comparison.summary()
+
+    def test_paired_interval_far_tighter_than_independent(self):
+        base = make_trial()
+        paired = compare_scenarios(base, [delay_scenario()], num_runs=100)
+        paired_delta = paired.delta("DELAYED", "completion_time")
+
+        # Same comparison on unrelated noise: baseline under another seed
+        independent_base = SimulationEngine(master_seed=1042).run(base, num_runs=100)
+        _, lower, upper, _, _ = paired_delta_interval(
+            [r.completion_time for r in independent_base.run_results],
+            [r.completion_time for r in paired.results["DELAYED"].run_results]
+        )
+
+        assert (upper - lower) > 3 * (paired_delta.upper - paired_delta.lower)
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="num_runs"):
+            compare_scenarios(make_trial(), [delay_scenario()], num_runs=1)
+        with pytest.raises(ValueError, match="unique"):
+            compare_scenarios(make_trial(), [delay_scenario(), delay_scenario()], num_runs=5)
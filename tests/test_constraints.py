@@ -19,6 +19,8 @@ from seleensim.constraints import (
     LinearResponseCurve,
     NoCapacityDegradation,
     LinearCapacityDegradation,
+    ConstraintIndex,
+    Explanation,
     compose_constraint_results
 )
 
@@ -728,6 +730,178 @@ class TestConstraintComposition:
         assert combined.parameter_overrides["duration"] == 30  # Modification still applies
 
 
+# =============================================================================
+# Test Lazy Explanations
+# =============================================================================
+
+
+class TestLazyExplanations:
+    """Test deferred explanation rendering."""
+
+    def test_explanation_renders_once_on_first_read(self):
+        class Counted:
+            renders = 0
+
+            def __format__(self, spec):
+                Counted.renders += 1
+                return "X"
+
+        result = ConstraintResult.delayed_by(5.0, Explanation("Waiting on {}", Counted()))
+        assert Counted.renders == 0
+
+        assert result.explanation == "Waiting on X"
+        assert result.explanation == "Waiting on X"
+        assert Counted.renders == 1
+
+    def test_explanation_reads_back_as_str(self):
+        result = ConstraintResult.invalid_until(
+            60.0, Explanation("completes at T={:.1f}", 60.0)
+        )
+        assert isinstance(result.explanation, str)
+        assert "T=60.0" in result.explanation
+        assert isinstance(result.explanation_record, Explanation)
+
+    def test_default_satisfied_is_shared(self):
+        assert ConstraintResult.satisfied() is ConstraintResult.satisfied()
+        assert ConstraintResult.satisfied("Custom") is not ConstraintResult.satisfied()
+        assert ConstraintResult.satisfied().is_no_op
+
+    def test_composed_explanation_is_lazy(self):
+        results = [
+            ConstraintResult.delayed_by(5.0, Explanation("Reason {}", 1)),
+            ConstraintResult.satisfied(""),
+            ConstraintResult.modified({"duration": 3.0}, "Reason 2"),
+        ]
+        combined = compose_constraint_results(results)
+
+        assert isinstance(combined.explanation_record, Explanation)
+        assert combined.explanation == "Reason 1; Reason 2"
+
+    def test_single_result_composes_to_itself(self):
+        result = ConstraintResult.delayed_by(5.0, "Only one")
+        assert compose_constraint_results([result]) is result
+
+    def test_shared_satisfied_overrides_are_read_only(self):
+        with pytest.raises(TypeError):
+            ConstraintResult.satisfied().parameter_overrides["duration"] = 1.0
+        assert not ConstraintResult.satisfied().parameter_overrides
+
+    def test_all_satisfied_composition_is_shared(self):
+        results = [ConstraintResult.satisfied(), ConstraintResult.satisfied("Fine")]
+        combined = compose_constraint_results(results)
+
+        assert combined is compose_constraint_results(list(reversed(results)))
+        assert combined.is_no_op
+        assert combined.explanation == "All constraints satisfied"
+
+    def test_repr_and_equality_use_rendered_explanation(self):
+        lazy = ConstraintResult.delayed_by(5.0, Explanation("Wait {}", 5))
+        eager = ConstraintResult.delayed_by(5.0, "Wait 5")
+
+        assert lazy == eager
+        assert "explanation='Wait 5'" in repr(lazy)
+
+    def test_all_empty_explanations_fall_back(self):
+        combined = compose_constraint_results([
+            ConstraintResult.satisfied(""), ConstraintResult.satisfied("")
+        ])
+        assert combined.explanation == "All constraints satisfied"
+        assert combined.is_no_op
+
+
+# =============================================================================
+# Test Constraint Applicability and Dispatch
+# =============================================================================
+
+
+def is_no_op(result):
+    return (
+        result.is_valid
+        and result.earliest_valid_time is None
+        and result.delay == 0.0
+        and not result.parameter_overrides
+    )
+
+
+class TestConstraintApplicability:
+    """Test applicability declarations and ConstraintIndex dispatch."""
+
+    def setup_method(self):
+        self.state = MockSimulationState()
+        self.state.set_resource_availability("MONITOR", 100.0)
+        self.state.set_available_budget(10)
+        self.constraints = [
+            TemporalPrecedenceConstraint("site_activation", "enrollment"),
+            PredecessorConstraint(),
+            ResourceCapacityConstraint("MONITOR"),
+            BudgetThrottlingConstraint(1000, LinearResponseCurve(min_speed_ratio=0.5)),
+        ]
+        self.events = [
+            MockEvent("e1", "site_activation", "S1", 10.0, duration=0.0,
+                      required_resources=set(), predecessors=set()),
+            MockEvent("e2", "enrollment", "S1", 10.0, duration=0.0,
+                      required_resources=set(), predecessors=set()),
+            MockEvent("e3", "activity", "S1", 10.0, duration=5.0,
+                      required_resources={"MONITOR"}, predecessors={"a0"}, activity_id="a1"),
+            MockEvent("e4", "activity", "S1", 10.0, duration=5.0,
+                      required_resources={"LAB"}, predecessors=set()),
+        ]
+
+    def test_skipped_constraints_would_have_been_no_ops(self):
+        index = ConstraintIndex(self.constraints)
+        for event in self.events:
+            selected = index.select(event)
+            for constraint in self.constraints:
+                if constraint not in selected:
+                    assert is_no_op(constraint.evaluate(self.state, event))
+
+    def test_dispatch_selects_expected_constraints(self):
+        precedence, predecessor, resource, budget = self.constraints
+        index = ConstraintIndex(self.constraints)
+
+        assert index.select(self.events[0]) == ()
+        assert index.select(self.events[1]) == (precedence,)
+        assert index.select(self.events[2]) == (predecessor, resource, budget)
+        assert index.select(self.events[3]) == (budget,)
+
+    def test_dispatch_is_cached_per_event_shape(self):
+        index = ConstraintIndex(self.constraints)
+        first = index.select(self.events[1])
+        again = MockEvent("e9", "enrollment", "S2", 99.0, duration=0.0,
+                          required_resources=set(), predecessors=set())
+        assert index.select(again) is first
+
+    def test_catalog_events_are_keyed_by_type_code(self):
+        precedence = self.constraints[0]
+        index = ConstraintIndex(self.constraints)
+        enrollment = MockEvent("e1", "enrollment", "S1", 10.0, type_code=3)
+
+        assert index.select(enrollment) == (precedence,)
+        assert index._cache == {}
+        assert index.select(MockEvent("e2", "enrollment", "S2", 20.0, type_code=3)) is \
+            index.select(enrollment)
+
+    def test_duck_typed_constraints_always_apply(self):
+        class DuckConstraint:
+            def evaluate(self, state, event):
+                return ConstraintResult.satisfied("duck")
+
+        duck = DuckConstraint()
+        index = ConstraintIndex([duck])
+        assert index.select(self.events[0]) == (duck,)
+
+    def test_budget_throttling_event_types(self):
+        constraint = BudgetThrottlingConstraint(
+            1000, LinearResponseCurve(), event_types=["monitoring_visit"]
+        )
+        event = MockEvent("e1", "activity", "S1", 10.0, duration=5.0)
+
+        assert ConstraintIndex([constraint]).select(event) == ()
+        result = constraint.evaluate(self.state, event)
+        assert is_no_op(result)
+        assert "Not applicable" in result.explanation
+
+
 # =============================================================================
 # Integration Test: Event Lifecycle
 # =============================================================================
@@ -0,0 +1,200 @@
+"""
+Tests for distributed execution by run-ID range.
+
+Focus areas:
+1. Equivalence: Merged partials equal a single-node run
+2. Artifacts: Partials survive save/load and record provenance
+3. Validation: Mismatched, overlapping and incomplete partials are rejected
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import subprocess
+import sys
+
+import pytest
+
+from seleensim.checkpoint import PartialResults
+from seleensim.distributed import combine_partials, merge_results, merged_output
+from seleensim.simulation import SimulationEngine
+from seleensim.output_schema import create_enhanced_output
+from seleensim.entities import Site, Trial, PatientFlow
+from seleensim.distributions import Triangular, Gamma, Bernoulli
+
+
+def make_trial(target_enrollment=100):
+    return Trial(
+        trial_id="DISTRIBUTED_TRIAL",
+        target_enrollment=target_enrollment,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:03d}",
+                activation_time=Triangular(30 + 10 * i, 45 + 10 * i, 90 + 10 * i),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(3)
+        ],
+        patient_flow=PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+    )
+
+
+SHARDS = [range(0, 13), range(13, 20), range(20, 30)]
+
+
+def assert_same_results(merged, single):
+    assert merged.num_runs == single.num_runs
+    assert merged.summary() == single.summary()
+    assert [(r.run_id, r.seed, r.completion_time) for r in merged.run_results] == \
+        [(r.run_id, r.seed, r.completion_time) for r in single.run_results]
+    for metric, sketch in single.sketches.items():
+        assert merged.sketches[metric].mean() == sketch.mean()
+        assert merged.sketches[metric].percentile(50) == sketch.percentile(50)
+
+
+class TestMergeEquivalence:
+    """Test that merged partials equal a single-node run."""
+
+    @pytest.mark.parametrize("sampling,retain_runs", [
+        ("random", "all"),
+        ("lhs", "all"),
+        ("coupled", "sample:5"),
+    ])
+    def test_merge_equals_single_node(self, sampling, retain_runs):
+        trial = make_trial()
+        single = SimulationEngine(master_seed=9).run(
+            trial, num_runs=30, sampling=sampling, retain_runs=retain_runs
+        )
+
+        # Shards may come back in any order
+        partials = [
+            SimulationEngine(master_seed=9).run_range(
+                trial, shard, num_runs=30, sampling=sampling, retain_runs=retain_runs
+            )
+            for shard in reversed(SHARDS)
+        ]
+
+        assert_same_results(merge_results(partials), single)
+
+    def test_saved_partials_with_local_parallelism(self, tmp_path):
+        trial = make_trial()
+        single = SimulationEngine(master_seed=9).run(trial, num_runs=30)
+
+        paths = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for k, shard in enumerate(SHARDS):
+                partial = SimulationEngine(master_seed=9).run_range(
+                    trial, shard, num_runs=30, workers=2, executor=executor
+                )
+                path = str(tmp_path / f"part{k}.pkl")
+                partial.save(path)
+                paths.append(path)
+
+        assert_same_results(merge_results(paths), single)
+
+    def test_partials_from_separate_interpreters(self, tmp_path):
+        """Machines differ in PYTHONHASHSEED; their partials must still merge."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        paths = []
+        for k, shard in enumerate(SHARDS):
+            path = str(tmp_path / f"part{k}.pkl")
+            code = (
+                "from tests.test_distributed import make_trial\n"
+                "from seleensim.simulation import SimulationEngine\n"
+                f"SimulationEngine(master_seed=9).run_range("
+                f"make_trial(), range({shard.start}, {shard.stop}), num_runs=30).save({path!r})\n"
+            )
+            subprocess.run(
+                [sys.executable, "-c", code], cwd=root, check=True,
+                env=dict(os.environ, PYTHONHASHSEED=str(k + 1))
+            )
+            paths.append(path)
+
+        single = SimulationEngine(master_seed=9).run(make_trial(), num_runs=30)
+        assert_same_results(merge_results(paths), single)
+
+    def test_hierarchical_merge(self):
+        trial = make_trial()
+        engine = SimulationEngine(master_seed=9)
+        partials = [engine.run_range(trial, shard, num_runs=30) for shard in SHARDS]
+
+        first_rack = combine_partials(partials[:2])
+        assert first_rack.completed == [(0, 20)]
+
+        assert_same_results(
+            merge_results([first_rack, partials[2]]),
+            merge_results(partials)
+        )
+
+    def test_merged_output_matches_single_node_output(self):
+        trial = make_trial()
+        single = SimulationEngine(master_seed=9).run(trial, num_runs=30)
+        partials = [SimulationEngine(master_seed=9).run_range(trial, s, num_runs=30) for s in SHARDS]
+
+        output = merged_output(partials, "DIST", trial)
+        expected = create_enhanced_output(
+            "DIST", trial, None, None, single.run_results, 9, 0.0, results=single
+        )
+
+        assert output.aggregated_results.to_dict() == expected.aggregated_results.to_dict()
+        assert output.single_run_results == expected.single_run_results
+        assert output.provenance.num_runs == 30
+
+
+class TestPartialArtifacts:
+    """Test partial result contents."""
+
+    def test_provenance_recorded(self, tmp_path):
+        partial = SimulationEngine(master_seed=9).run_range(make_trial(), range(5, 10), num_runs=30)
+        path = str(tmp_path / "part.pkl")
+        partial.save(path)
+
+        loaded = PartialResults.load(path)
+        assert loaded.completed == [(5, 10)]
+        assert loaded.aggregator.num_runs == 5
+        assert loaded.shards[0]["run_ids"] == [5, 10]
+        assert loaded.shards[0]["hostname"]
+        assert loaded.shards[0]["duration_seconds"] >= 0
+
+    def test_invalid_range(self):
+        engine = SimulationEngine()
+        for run_ids in (range(0), range(0, 10, 2), range(25, 35)):
+            with pytest.raises(ValueError, match="run_ids"):
+                engine.run_range(make_trial(), run_ids, num_runs=30)
+
+
+class TestMergeValidation:
+    """Test rejected merges."""
+
+    def test_missing_runs(self):
+        engine = SimulationEngine(master_seed=9)
+        partials = [engine.run_range(make_trial(), s, num_runs=30) for s in (SHARDS[0], SHARDS[2])]
+
+        with pytest.raises(ValueError, match=r"missing \[13, 20\)"):
+            merge_results(partials)
+
+    def test_overlapping_runs(self):
+        engine = SimulationEngine(master_seed=9)
+        partials = [engine.run_range(make_trial(), s, num_runs=30) for s in (range(0, 20), range(15, 30))]
+
+        with pytest.raises(ValueError, match="overlap"):
+            merge_results(partials)
+
+    def test_different_jobs(self):
+        first = SimulationEngine(master_seed=9).run_range(make_trial(), range(0, 15), num_runs=30)
+        second = SimulationEngine(master_seed=10).run_range(make_trial(), range(15, 30), num_runs=30)
+
+        with pytest.raises(ValueError, match="master_seed"):
+            merge_results([first, second])
+
+    def test_merged_output_checks_trial(self):
+        partials = [SimulationEngine(master_seed=9).run_range(make_trial(), s, num_runs=30) for s in SHARDS]
+
+        with pytest.raises(ValueError, match="trial does not match"):
+            merged_output(partials, "DIST", make_trial(120))
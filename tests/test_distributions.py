@@ -7,12 +7,16 @@ Focus areas:
 3. Parameter validation: Invalid parameters fail at construction
 4. Serialization: Round-trip to_dict/from_dict preserves behavior
 5. Statistical properties: Mean and percentiles are reasonable
+6. Batch sampling: Vectorized APIs keep the determinism guarantees
 """
 
 import pytest
 import json
+import numpy as np
+from scipy import stats
 from seleensim.distributions import (
-    Distribution, Triangular, LogNormal, Gamma, Bernoulli, from_dict
+    Distribution, Triangular, LogNormal, Gamma, Bernoulli, from_dict, sample_many,
+    seed_uniforms
 )
 
 
@@ -314,3 +318,163 @@ class TestEdgeCases:
         dist = Gamma(shape=1, scale=5)
         # Mean of exponential is scale
         assert abs(dist.mean() - 5) < 1e-6
+
+
+class TestBatchSampling:
+    """Test vectorized sample_batch / sample_array APIs."""
+
+    DISTRIBUTIONS = [
+        Triangular(low=10, mode=30, high=60),
+        LogNormal(mean=50, cv=0.3),
+        Gamma(shape=2, scale=5),
+        Bernoulli(p=0.3),
+        LogNormal(mean=50, cv=0.3, bounds=(30, 70)),
+    ]
+
+    @pytest.mark.parametrize("dist", DISTRIBUTIONS[:4], ids=lambda d: d.to_dict()["type"])
+    def test_scalar_sample_matches_earlier_versions(self, dist):
+        """sample(seed) is still a scipy draw from default_rng(seed), bit for bit."""
+        for seed in range(100):
+            expected = dist._dist.rvs(random_state=np.random.default_rng(seed))
+            assert dist.sample(seed) == float(expected)
+
+    @pytest.mark.parametrize("dist", DISTRIBUTIONS, ids=lambda d: d.to_dict()["type"])
+    def test_legacy_sample_array_matches_scalar_sample(self, dist):
+        """sample_array(seeds, seed_scheme="legacy")[i] equals sample(seeds[i]) exactly."""
+        seeds = np.arange(200)
+        batch = dist.sample_array(seeds, seed_scheme="legacy")
+        assert batch.tolist() == [dist.sample(int(s)) for s in seeds]
+
+    @pytest.mark.parametrize("dist", DISTRIBUTIONS, ids=lambda d: d.to_dict()["type"])
+    def test_counter_sample_array_is_inverse_cdf_of_seed_uniforms(self, dist):
+        seeds = np.arange(200)
+        assert dist.sample_array(seeds).tolist() == dist.from_uniform(seed_uniforms(seeds)).tolist()
+        assert dist.sample_array(seeds)[17] == dist.sample_array([17])[0]
+
+    def test_sample_array_preserves_shape(self):
+        """2-D seed grids (runs x sites) produce 2-D sample grids."""
+        dist = Triangular(low=10, mode=30, high=60)
+        seeds = np.arange(12).reshape(3, 4)
+        samples = dist.sample_array(seeds)
+        assert samples.shape == (3, 4)
+        assert samples[2, 1] == dist.sample_array([9])[0]
+
+    @pytest.mark.parametrize("dist", DISTRIBUTIONS, ids=lambda d: d.to_dict()["type"])
+    def test_sample_batch_deterministic(self, dist):
+        a = dist.sample_batch(42, 100)
+        b = dist.sample_batch(np.random.default_rng(42), 100)
+        assert a.shape == (100,)
+        assert np.array_equal(a, b)
+
+    def test_sample_batch_respects_bounds(self):
+        dist = Gamma(shape=2, scale=5, bounds=(5, 15))
+        samples = dist.sample_batch(7, 1000)
+        assert np.all((samples >= 5) & (samples <= 15))
+
+    def test_sample_batch_continues_generator_stream(self):
+        """Successive batches from one Generator are different draws."""
+        dist = Triangular(low=10, mode=30, high=60)
+        rng = np.random.default_rng(3)
+        first = dist.sample_batch(rng, 10)
+        second = dist.sample_batch(rng, 10)
+        assert not np.array_equal(first, second)
+
+    def test_sample_batch_rejects_negative_n(self):
+        with pytest.raises(ValueError, match="n must be >= 0"):
+            Triangular(low=10, mode=30, high=60).sample_batch(1, -1)
+
+    def test_sample_many_matches_per_distribution_samples(self):
+        shared = Triangular(low=10, mode=30, high=60)
+        dists = [shared, LogNormal(mean=50, cv=0.3), shared, Gamma(shape=2, scale=5)]
+        seeds = [11, 22, 33, 44]
+        samples = sample_many(dists, seeds)
+        assert samples.tolist() == [d.sample_array([s])[0] for d, s in zip(dists, seeds)]
+        legacy = sample_many(dists, seeds, seed_scheme="legacy")
+        assert legacy.tolist() == [d.sample(s) for d, s in zip(dists, seeds)]
+
+    def test_sample_array_creates_no_generators(self, monkeypatch):
+        def no_generator(*args, **kwargs):
+            raise AssertionError("per-seed Generator created")
+
+        monkeypatch.setattr(np.random, "default_rng", no_generator)
+        for dist in self.DISTRIBUTIONS:
+            assert dist.sample_array(np.arange(50)).shape == (50,)
+
+    def test_seed_uniforms_are_uniform_over_sequential_seeds(self):
+        u = seed_uniforms(np.arange(20000))
+        assert np.all((u > 0) & (u < 1))
+        assert stats.kstest(u, "uniform").pvalue > 0.01
+
+    @pytest.mark.parametrize("dist", DISTRIBUTIONS, ids=lambda d: d.to_dict()["type"])
+    def test_legacy_sample_array_uses_per_seed_generators(self, dist):
+        seeds = [3, 17, 99]
+        expected = []
+        for seed in seeds:
+            rng = np.random.default_rng(seed)
+            expected.append(dist._apply_bounds_rejection(rng, lambda: float(dist._draw(rng))))
+        assert dist.sample_array(seeds, "rejection", seed_scheme="legacy").tolist() == expected
+
+    def test_sample_many_requires_one_seed_per_distribution(self):
+        with pytest.raises(ValueError, match="one seed per distribution"):
+            sample_many([Bernoulli(p=0.5)], [1, 2])
+
+
+class TestTruncatedSampling:
+    """Test inverse-CDF sampling of bounded distributions."""
+
+    UNBOUNDED = [
+        Triangular(low=10, mode=30, high=60),
+        LogNormal(mean=50, cv=0.3),
+        Gamma(shape=2, scale=5),
+        Gamma(shape=0.5, scale=3),
+    ]
+
+    @pytest.mark.parametrize("dist", UNBOUNDED, ids=lambda d: d.to_dict()["type"])
+    def test_ppf_matches_scipy(self, dist):
+        q = np.linspace(0.001, 0.999, 999)
+        np.testing.assert_allclose(dist.ppf(q), dist._dist.ppf(q), rtol=1e-10)
+        assert isinstance(dist.ppf(0.5), float)
+
+    def test_ppf_rejects_invalid_probabilities(self):
+        with pytest.raises(ValueError, match="ppf"):
+            Gamma(shape=2, scale=5).ppf([0.5, 1.5])
+
+    def test_truncated_samples_follow_truncated_distribution(self):
+        dist = LogNormal(mean=50, cv=0.3, bounds=(30, 70))
+        samples = dist.sample_batch(2, 20000)
+
+        low, high = dist._dist.cdf(30), dist._dist.cdf(70)
+        truncated_cdf = lambda x: (dist._dist.cdf(x) - low) / (high - low)
+        assert stats.kstest(samples, truncated_cdf).pvalue > 0.01
+
+    def test_tail_bounds_sample_in_constant_time(self):
+        """Bounds far in the upper tail (rejection would need ~10^5 tries)."""
+        dist = LogNormal(mean=50, cv=0.3, bounds=(150, 160))
+        samples = dist.sample_array(np.arange(500))
+        assert np.all((samples >= 150) & (samples <= 160))
+        assert samples.std() > 0
+
+    def test_scalar_and_legacy_array_agree(self):
+        dist = Gamma(shape=2, scale=5, bounds=(5, 15))
+        seeds = np.arange(100)
+        samples = dist.sample_array(seeds, seed_scheme="legacy")
+        assert samples.tolist() == [dist.sample(int(s)) for s in seeds]
+        assert np.all((samples >= 5) & (samples <= 15))
+
+    def test_legacy_rejection_available(self):
+        dist = Triangular(low=10, mode=30, high=60, bounds=(20, 50))
+        legacy = dist.sample_array([1, 2, 3], truncation="rejection", seed_scheme="legacy")
+        assert np.all((legacy >= 20) & (legacy <= 50))
+        assert not np.array_equal(legacy, dist.sample_array([1, 2, 3], seed_scheme="legacy"))
+
+        assert legacy.tolist() == [dist.sample(s, truncation="rejection") for s in [1, 2, 3]]
+
+        with pytest.raises(ValueError, match="truncation"):
+            dist.sample_array([1], truncation="fastest")
+        with pytest.raises(ValueError, match="truncation"):
+            dist.sample(1, truncation="fastest")
+        with pytest.raises(ValueError, match="seed_scheme='legacy'"):
+            dist.sample_array([1], truncation="rejection")
+        with pytest.raises(ValueError, match="seed_scheme"):
+            dist.sample_array([1], seed_scheme="philox")
+
@@ -0,0 +1,215 @@
+"""
+Tests for vectorized Poisson enrollment.
+
+Focus areas:
+1. Poisson model: Counts and gaps match the stated rate, from activation
+2. Common random numbers: A site's arrivals ignore other sites and the horizon
+3. Limits: max_capacity per site, target_enrollment across sites
+4. Merge: Enrollments are the earliest arrivals, identical to a full-horizon merge
+"""
+
+import numpy as np
+import pytest
+
+import seleensim.enrollment as enrollment
+from seleensim.enrollment import (
+    EnrollmentResult,
+    merge_arrivals,
+    poisson_arrivals,
+    simulate_enrollment,
+)
+from seleensim.distributions import Bernoulli, Gamma, Triangular
+from seleensim.entities import PatientFlow, Site, Trial
+from seleensim.sampling import SampledInputs
+from seleensim.seeding import SeedPlan
+
+
+def make_trial(num_sites=4, target=100, capacities=None):
+    capacities = capacities or [None] * num_sites
+    return Trial(
+        trial_id="ENROLLMENT_TRIAL",
+        target_enrollment=target,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:03d}",
+                activation_time=Triangular(30 + 10 * i, 45 + 10 * i, 90 + 10 * i),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15),
+                max_capacity=capacities[i]
+            )
+            for i in range(num_sites)
+        ],
+        patient_flow=PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+    )
+
+
+class TestPoissonArrivals:
+    def test_mean_count_matches_rate_times_active_span(self):
+        rates = np.full(400, 0.5)
+        starts = np.full(400, 20.0)
+
+        times, index = poisson_arrivals(starts, rates, np.arange(400) + 1, horizon=120.0)
+
+        counts = np.bincount(index, minlength=400)
+        # lambda * (H - a) = 50 per process; mean of 400 within ~4 standard errors
+        assert abs(counts.mean() - 50.0) < 4 * np.sqrt(50.0 / 400)
+        assert abs(counts.var() / counts.mean() - 1.0) < 0.2
+        assert times.min() >= 20.0 and times.max() <= 120.0
+
+    def test_gaps_are_exponential(self):
+        times, _ = poisson_arrivals([0.0], [2.0], [7], horizon=5000.0)
+
+        gaps = np.diff(np.concatenate([[0.0], times]))
+        assert abs(gaps.mean() - 0.5) < 0.02
+        assert abs(np.median(gaps) - 0.5 * np.log(2)) < 0.02
+
+    def test_grouped_by_process_and_ascending(self):
+        times, index = poisson_arrivals([0.0, 5.0, 1.0], [1.0, 3.0, 0.2], [1, 2, 3], horizon=50.0)
+
+        assert np.all(np.diff(index) >= 0)
+        for i in range(3):
+            assert np.all(np.diff(times[index == i]) > 0)
+
+    def test_deterministic(self):
+        first = poisson_arrivals([0.0, 3.0], [1.0, 2.0], [11, 12], horizon=100.0)
+        second = poisson_arrivals([0.0, 3.0], [1.0, 2.0], [11, 12], horizon=100.0)
+
+        assert all(np.array_equal(a, b) for a, b in zip(first, second))
+
+    def test_process_arrivals_ignore_other_processes(self):
+        alone_times, _ = poisson_arrivals([4.0], [1.5], [99], horizon=80.0)
+        times, index = poisson_arrivals([0.0, 4.0, 9.0], [7.0, 1.5, 0.1], [5, 99, 6], horizon=80.0)
+
+        assert np.array_equal(times[index == 1], alone_times)
+
+    def test_shorter_horizon_is_a_prefix(self):
+        long_times, _ = poisson_arrivals([0.0], [3.0], [42], horizon=400.0)
+        short_times, _ = poisson_arrivals([0.0], [3.0], [42], horizon=100.0)
+
+        assert np.array_equal(short_times, long_times[long_times <= 100.0])
+
+    def test_long_horizons_extend_in_chunks(self, monkeypatch):
+        expected, _ = poisson_arrivals([0.0], [1.0], [8], horizon=300.0)
+        monkeypatch.setattr(enrollment, "_MARGIN_SIGMAS", -10.0)
+        monkeypatch.setattr(enrollment, "_CHUNK_MIN", 1)
+
+        chunked, _ = poisson_arrivals([0.0], [1.0], [8], horizon=300.0)
+
+        assert np.array_equal(chunked, expected)
+
+    def test_capacity_limits_arrivals(self):
+        times, index = poisson_arrivals(
+            [0.0, 0.0, 0.0], [1.0, 1.0, 1.0], [1, 2, 3], horizon=100.0, capacities=[5, None, 0]
+        )
+        unlimited, unlimited_index = poisson_arrivals([0.0, 0.0], [1.0, 1.0], [1, 2], horizon=100.0)
+
+        assert np.bincount(index, minlength=3)[[0, 2]].tolist() == [5, 0]
+        assert np.array_equal(times[index == 0], unlimited[unlimited_index == 0][:5])
+
+    def test_inactive_processes_have_no_arrivals(self):
+        times, index = poisson_arrivals([0.0, 150.0], [0.0, 2.0], [1, 2], horizon=100.0)
+
+        assert len(times) == 0 and len(index) == 0
+
+    def test_rejects_negative_rates(self):
+        with pytest.raises(ValueError, match=">= 0"):
+            poisson_arrivals([0.0], [-1.0], [1], horizon=10.0)
+
+    def test_rejects_mismatched_lengths(self):
+        with pytest.raises(ValueError, match="one rate and seed per process"):
+            poisson_arrivals([0.0, 1.0], [1.0], [1, 2], horizon=10.0)
+
+
+class TestMergeArrivals:
+    def test_earliest_across_processes(self):
+        times = np.array([1.0, 4.0, 2.0, 3.0, 0.5])
+        index = np.array([0, 0, 1, 1, 2])
+
+        merged_times, merged_index = merge_arrivals(times, index, 3)
+
+        assert merged_times.tolist() == [0.5, 1.0, 2.0]
+        assert merged_index.tolist() == [2, 0, 1]
+
+
+class TestSimulateEnrollment:
+    def setup_method(self):
+        self.trial = make_trial()
+        self.plan = SeedPlan.for_trial(42, self.trial)
+        self.activation = [30.0, 40.0, 50.0, 60.0]
+
+    def test_stops_at_target(self):
+        result = simulate_enrollment(self.trial, self.activation, 720.0, self.plan, run_id=0)
+
+        assert isinstance(result, EnrollmentResult)
+        assert result.enrolled == 100 and result.reached_target
+        assert np.all(np.diff(result.times) >= 0)
+        assert result.completion_time == result.times[-1]
+        assert result.per_site_counts().sum() == 100
+        assert result.cumulative([0.0, result.completion_time]).tolist() == [0, 100]
+
+    def test_matches_full_horizon_merge(self):
+        rates = [0.3, 1.0, 2.5, 0.05]
+        result = simulate_enrollment(
+            self.trial, self.activation, 720.0, self.plan, run_id=3, rates=rates
+        )
+
+        times, index = poisson_arrivals(
+            self.activation, rates,
+            self.plan.site_seeds(3, enrollment.PURPOSE_ENROLLMENT_ARRIVALS), 720.0
+        )
+        expected_times, expected_index = merge_arrivals(times, index, 100)
+        assert np.array_equal(result.times, expected_times)
+        assert np.array_equal(result.site_indices, expected_index)
+
+    def test_short_of_target_within_horizon(self):
+        result = simulate_enrollment(
+            self.trial, self.activation, 70.0, self.plan, run_id=0, rates=[0.5, 0.5, 0.5, 0.5]
+        )
+
+        assert not result.reached_target
+        assert result.completion_time is None
+        assert result.enrolled < 100
+
+    def test_capacity_caps_site(self):
+        trial = make_trial(capacities=[3, None, None, None])
+        plan = SeedPlan.for_trial(42, trial)
+
+        result = simulate_enrollment(
+            trial, self.activation, 720.0, plan, run_id=0, rates=[5.0, 0.5, 0.5, 0.5]
+        )
+
+        assert result.per_site_counts()[0] == 3
+        assert result.enrolled == 100
+
+    def test_rates_drawn_per_run_and_deterministic(self):
+        first = simulate_enrollment(self.trial, self.activation, 720.0, self.plan, run_id=0)
+        again = simulate_enrollment(self.trial, self.activation, 720.0, self.plan, run_id=0)
+        other = simulate_enrollment(self.trial, self.activation, 720.0, self.plan, run_id=1)
+
+        assert np.array_equal(first.times, again.times)
+        assert np.array_equal(first.rates, again.rates)
+        assert not np.array_equal(first.rates, other.rates)
+
+    def test_designed_rates(self):
+        inputs = SampledInputs.generate(self.trial, 1, "lhs", 42, fields=("enrollment_rate",))
+        site_ids = [site.site_id for site in self.trial.sites]
+        rates = inputs.site_values(0, "enrollment_rate", site_ids)
+
+        result = simulate_enrollment(
+            self.trial, self.activation, 720.0, self.plan, run_id=0, rates=rates
+        )
+
+        assert np.array_equal(result.rates, rates)
+        assert np.all(rates > 0)
+
+    def test_rejects_mismatched_inputs(self):
+        with pytest.raises(ValueError, match="one activation time per site"):
+            simulate_enrollment(self.trial, [30.0], 720.0, self.plan, run_id=0)
+        with pytest.raises(ValueError, match="one rate per site"):
+            simulate_enrollment(self.trial, self.activation, 720.0, self.plan, run_id=0, rates=[1.0])
@@ -0,0 +1,199 @@
+"""
+Tests for engine instrumentation and progress reporting.
+
+Focus areas:
+1. Observation only: Instrumented runs produce identical results
+2. Profiling: Per-constraint counts, throughput, queue size, reschedule loops
+3. Parallel: Shard instruments merge to the same counts as a serial run
+4. Progress: Structured updates reach the callback; None is silent
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from seleensim.constraints import Constraint, ConstraintResult
+from seleensim.distributions import Bernoulli, Gamma, Triangular
+from seleensim.entities import PatientFlow, Site, Trial
+from seleensim.instrumentation import EngineProfiler, Instrument, ProgressUpdate
+from seleensim.simulation import SimulationEngine
+
+
+def make_trial(num_sites=4):
+    return Trial(
+        trial_id="INSTRUMENTED_TRIAL",
+        target_enrollment=100,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:03d}",
+                activation_time=Triangular(30 + 10 * i, 45 + 10 * i, 90 + 10 * i),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(num_sites)
+        ],
+        patient_flow=PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+    )
+
+
+class PassThrough(Constraint):
+    def evaluate(self, state, event):
+        return ConstraintResult.satisfied("Pass-through")
+
+
+class DelayUntil(Constraint):
+    """Delay every event in steps of 25 days until it reaches a start date."""
+
+    def __init__(self, start):
+        self.start = start
+
+    def evaluate(self, state, event):
+        if event.time < self.start:
+            return ConstraintResult.delayed_by(25.0, "Not started yet")
+        return ConstraintResult.satisfied("Started")
+
+
+def summary(results):
+    return [(r.run_id, r.completion_time, r.events_rescheduled) for r in results.run_results]
+
+
+class TestProfiler:
+    def test_profiled_run_matches_unprofiled(self):
+        trial = make_trial()
+        constraints = [PassThrough(), DelayUntil(100)]
+        plain = SimulationEngine(master_seed=42, constraints=constraints)
+        profiled = SimulationEngine(
+            master_seed=42, constraints=constraints, instruments=[EngineProfiler()]
+        )
+
+        expected = plain.run(trial, num_runs=20, progress=None)
+        actual = profiled.run(trial, num_runs=20, progress=None)
+
+        assert summary(actual) == summary(expected)
+
+    def test_counts_constraint_calls_and_events(self):
+        trial = make_trial()
+        profiler = EngineProfiler(sample_every=2)
+        engine = SimulationEngine(
+            master_seed=42, constraints=[PassThrough(), PassThrough()], instruments=[profiler]
+        )
+
+        results = engine.run(trial, num_runs=5, progress=None)
+
+        assert set(profiler.constraints) == {"PassThrough#0", "PassThrough#1"}
+        assert all(t.calls == 5 * 4 for t in profiler.constraints.values())
+        assert sorted(profiler.runs) == [0, 1, 2, 3, 4]
+        for run in results.run_results:
+            profile = profiler.runs[run.run_id]
+            assert profile.events_processed == run.events_processed
+            assert profile.max_queue_size == 3
+            # Queue sampled at the 1st and 3rd dequeued events
+            assert [size for _, size in profile.queue_samples] == [3, 1]
+        assert profiler.events_per_second() > 0
+        assert "PassThrough#0" in profiler.report()
+
+    def test_records_reschedule_loops(self):
+        trial = make_trial()
+        profiler = EngineProfiler()
+        engine = SimulationEngine(
+            master_seed=42, constraints=[DelayUntil(200)], instruments=[profiler]
+        )
+
+        results = engine.run(trial, num_runs=5, progress=None)
+
+        stats = profiler.reschedules["site_activation"]
+        assert stats.reschedules == sum(r.events_rescheduled for r in results.run_results)
+        # Activations at 30-120 days need at least 4 steps of 25 days
+        assert stats.max_per_event >= 4
+
+    def test_parallel_shards_merge_into_engine_instruments(self):
+        trial = make_trial()
+        serial = EngineProfiler()
+        parallel = EngineProfiler()
+        constraints = [PassThrough(), DelayUntil(100)]
+
+        SimulationEngine(master_seed=42, constraints=constraints, instruments=[serial]).run(
+            trial, num_runs=40, progress=None
+        )
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            SimulationEngine(master_seed=42, constraints=constraints, instruments=[parallel]).run(
+                trial, num_runs=40, executor=pool, progress=None
+            )
+
+        assert sorted(parallel.runs) == list(range(40))
+        assert {n: t.calls for n, t in parallel.constraints.items()} == \
+            {n: t.calls for n, t in serial.constraints.items()}
+        assert parallel.reschedules == serial.reschedules
+
+    def test_rejects_invalid_sample_interval(self):
+        with pytest.raises(ValueError, match="sample_every"):
+            EngineProfiler(sample_every=0)
+
+
+class TestCustomInstrument:
+    def test_hooks_called_in_order(self):
+        class Recorder(Instrument):
+            def __init__(self):
+                self.calls = []
+
+            def run_started(self, run_id):
+                self.calls.append(("started", run_id))
+
+            def run_finished(self, run_id, events_processed, seconds):
+                self.calls.append(("finished", run_id, events_processed))
+
+        recorder = Recorder()
+        engine = SimulationEngine(master_seed=42, instruments=[recorder])
+
+        engine.run(make_trial(num_sites=2), num_runs=2, progress=None)
+
+        assert recorder.calls == [
+            ("started", 0), ("finished", 0, 2), ("started", 1), ("finished", 1, 2)
+        ]
+
+
+class TestProgress:
+    def test_callback_receives_structured_updates(self):
+        updates = []
+        engine = SimulationEngine(master_seed=42)
+
+        engine.run(make_trial(), num_runs=25, progress=updates.append)
+
+        assert all(isinstance(u, ProgressUpdate) for u in updates)
+        assert [u.stage for u in updates] == \
+            ["started", "runs_completed", "runs_completed", "finished"]
+        assert [u.completed_runs for u in updates] == [0, 10, 20, 25]
+        assert updates[-1].fraction == 1.0
+        assert updates[1].message == "  Completed 10/25 runs..."
+
+    def test_adaptive_batches_report_half_width(self):
+        updates = []
+        engine = SimulationEngine(master_seed=42)
+
+        engine.run_adaptive(
+            make_trial(), target_half_width=0.5, min_runs=20, batch_size=20,
+            max_runs=100, progress=updates.append
+        )
+
+        batches = [u for u in updates if u.stage == "batch_completed"]
+        assert batches
+        assert "max_relative_half_width" in batches[0].detail
+        assert updates[-1].stage == "finished"
+
+    def test_none_is_silent(self, capsys):
+        SimulationEngine(master_seed=42).run(make_trial(), num_runs=15, progress=None)
+
+        assert capsys.readouterr().out == ""
+
+    def test_default_prints_messages(self, capsys):
+        SimulationEngine(master_seed=42).run(make_trial(), num_runs=10)
+
+        out = capsys.readouterr().out
+        assert "Starting 10 simulation runs (master_seed=42)..." in out
+        assert "All runs complete. Aggregating results..." in out
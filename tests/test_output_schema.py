@@ -222,7 +222,8 @@ class TestEnhancedSimulationOutput:
             constraints=None,
             run_results=results.run_results,
             master_seed=42,
-            execution_duration=1.23
+            execution_duration=1.23,
+            results=results
         )
 
         # Check all components present
@@ -247,7 +248,8 @@ class TestEnhancedSimulationOutput:
             constraints=None,
             run_results=results.run_results,
             master_seed=42,
-            execution_duration=1.0
+            execution_duration=1.0,
+            results=results
         )
 
         # Save to temporary file
@@ -283,7 +285,8 @@ class TestEnhancedSimulationOutput:
             constraints=None,
             run_results=results.run_results,
             master_seed=42,
-            execution_duration=1.0
+            execution_duration=1.0,
+            results=results
         )
 
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -299,6 +302,35 @@ class TestEnhancedSimulationOutput:
         import os
         os.unlink(filepath)
 
+    @pytest.mark.parametrize("seed_scheme,sampling", [
+        ("legacy", "random"),
+        ("counter", "coupled"),
+        ("counter", "lhs"),
+    ])
+    def test_provenance_taken_from_results(self, sample_trial, seed_scheme, sampling):
+        engine = SimulationEngine(master_seed=42, seed_scheme=seed_scheme)
+        results = engine.run(sample_trial, num_runs=4, sampling=sampling, progress=None)
+
+        enhanced = create_enhanced_output(
+            "test_sim_004", sample_trial, None, None, results.run_results, 42, 1.0, results=results
+        )
+
+        assert results.seed_scheme == seed_scheme
+        assert enhanced.provenance.seed_scheme == seed_scheme
+        assert enhanced.provenance.sampling == sampling
+        assert enhanced.provenance.precision is None
+
+    def test_unknown_seed_scheme_rejected(self, sample_trial):
+        results = SimulationEngine(master_seed=42).run(sample_trial, num_runs=2, progress=None)
+
+        with pytest.raises(ValueError, match="seed"):
+            create_enhanced_output("test_sim_005", sample_trial, None, None, results.run_results, 42, 1.0)
+
+        explicit = create_enhanced_output(
+            "test_sim_005", sample_trial, None, None, results.run_results, 42, 1.0, seed_scheme="legacy"
+        )
+        assert explicit.provenance.seed_scheme == "legacy"
+
 
 class TestProvenanceRecord:
     """Test provenance tracking."""
@@ -338,3 +370,20 @@ class TestProvenanceRecord:
 
         assert loaded["simulation_id"] == "test_002"
         assert loaded["master_seed"] == 123
+
+    def test_provenance_records_seed_scheme(self):
+        """New records name their seed scheme; records without one are legacy."""
+        provenance = ProvenanceRecord.create(
+            simulation_id="test_003",
+            num_runs=10,
+            master_seed=1,
+            initial_budget=float('inf'),
+            execution_duration_seconds=1.0
+        )
+        assert provenance.seed_scheme == "counter"
+        assert provenance.sampling == "random"
+        assert provenance.precision is None
+
+        data = provenance.to_dict()
+        del data["seed_scheme"]
+        assert ProvenanceRecord(**data).seed_scheme == "legacy"
@@ -0,0 +1,305 @@
+"""
+Tests for cohort-vectorized patient flow execution.
+
+Focus areas:
+1. Compilation: Index tables, and flows that cannot be executed are rejected
+2. Transitions: Branch frequencies follow probabilities; delays follow times
+   (branch probabilities drawn once per run and renormalized)
+3. Horizon: Late transitions and late entries do not happen
+4. Outputs: Occupancy curves, state counts and dropout counts agree
+5. Common random numbers: A patient's path ignores how many others there are
+"""
+
+import numpy as np
+import pytest
+
+from seleensim.distributions import Bernoulli, Gamma, LogNormal, Triangular
+from seleensim.entities import PatientFlow, Site, Trial
+from seleensim.patient_flow import (
+    FlowResult,
+    compile_flow,
+    draw_branch_cumulative,
+    run_flow,
+    simulate_patient_flow,
+)
+from seleensim.seeding import PURPOSE_PATIENT_FLOW, SeedPlan, entity_key
+
+
+def branching_flow(screen_pass=0.85):
+    return PatientFlow(
+        flow_id="STANDARD_FLOW",
+        states={"enrolled", "screening", "treatment", "completed", "dropout"},
+        initial_state="enrolled",
+        terminal_states={"completed", "dropout"},
+        transition_times={
+            ("enrolled", "screening"): Triangular(3, 7, 14),
+            ("screening", "treatment"): Triangular(1, 3, 7),
+            ("screening", "dropout"): Triangular(1, 2, 5),
+            ("treatment", "completed"): LogNormal(180, 0.25),
+            ("treatment", "dropout"): LogNormal(90, 0.4)
+        },
+        transition_probabilities={
+            ("screening", "treatment"): Bernoulli(screen_pass),
+            ("screening", "dropout"): Bernoulli(round(1 - screen_pass, 10)),
+            ("treatment", "completed"): Bernoulli(0.8),
+            ("treatment", "dropout"): Bernoulli(0.2)
+        }
+    )
+
+
+def uncertain_flow():
+    """branching_flow with screening probabilities uncertain between runs."""
+    flow = branching_flow()
+    probabilities = dict(flow.transition_probabilities)
+    probabilities[("screening", "treatment")] = Triangular(0.6, 0.85, 0.95)
+    probabilities[("screening", "dropout")] = Triangular(0.05, 0.2, 0.35)
+    object.__setattr__(flow, "transition_probabilities", probabilities)
+    return flow
+
+
+def linear_flow():
+    return PatientFlow(
+        flow_id="LINEAR_FLOW",
+        states={"enrolled", "completed"},
+        initial_state="enrolled",
+        terminal_states={"completed"},
+        transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+    )
+
+
+class TestCompileFlow:
+    def test_tables(self):
+        table = compile_flow(branching_flow())
+
+        assert table.state_names == ["completed", "dropout", "enrolled", "screening", "treatment"]
+        assert table.initial_state == 2
+        assert table.terminal.tolist() == [True, True, False, False, False]
+        assert table.out_degree.tolist() == [0, 0, 1, 2, 2]
+        screening = table.state_index("screening")
+        assert table.branch_cumulative[screening].tolist() == pytest.approx([0.15, 1.0])
+
+    def test_branch_without_probabilities_rejected(self):
+        flow = branching_flow()
+        object.__setattr__(flow, "transition_probabilities", {})
+
+        with pytest.raises(ValueError, match="branches"):
+            compile_flow(flow)
+
+    def test_probabilities_must_sum_to_one(self):
+        flow = branching_flow()
+        probabilities = dict(flow.transition_probabilities)
+        probabilities[("treatment", "dropout")] = Bernoulli(0.3)
+        object.__setattr__(flow, "transition_probabilities", probabilities)
+
+        with pytest.raises(ValueError, match="must sum to 1"):
+            compile_flow(flow)
+
+    def test_probability_without_time_rejected(self):
+        flow = linear_flow()
+        object.__setattr__(
+            flow, "transition_probabilities", {("completed", "enrolled"): Bernoulli(1.0)}
+        )
+
+        with pytest.raises(ValueError, match="no transition_times entry"):
+            compile_flow(flow)
+
+
+class TestDrawBranchCumulative:
+    def setup_method(self):
+        self.plan = SeedPlan(42)
+
+    def test_fixed_probabilities_are_the_means(self):
+        table = compile_flow(branching_flow())
+
+        assert len(table.drawn_edges) == 0
+        assert draw_branch_cumulative(table, self.plan, run_id=3) is table.branch_cumulative
+
+    def test_drawn_once_per_run_and_renormalized(self):
+        table = compile_flow(uncertain_flow())
+        screening = table.state_index("screening")
+        treatment = table.state_index("treatment")
+
+        draws = [draw_branch_cumulative(table, self.plan, run_id) for run_id in range(200)]
+
+        first_branch = np.array([d[screening, 0] for d in draws])
+        assert all(d[screening, 1] == 1.0 for d in draws)
+        assert len(np.unique(first_branch)) == 200
+        # Dropout is the first screening edge; its share averages near its mean
+        assert abs(first_branch.mean() - 0.2) < 0.02
+        assert all(np.array_equal(d[treatment], table.branch_cumulative[treatment]) for d in draws)
+        assert np.array_equal(draws[7], draw_branch_cumulative(table, self.plan, run_id=7))
+
+    def test_edge_draws_ignore_other_edges(self):
+        flow = uncertain_flow()
+        probabilities = dict(flow.transition_probabilities)
+        probabilities[("treatment", "completed")] = Triangular(0.7, 0.8, 0.9)
+        probabilities[("treatment", "dropout")] = Triangular(0.1, 0.2, 0.3)
+        object.__setattr__(flow, "transition_probabilities", probabilities)
+        screening = compile_flow(uncertain_flow()).state_index("screening")
+
+        alone = draw_branch_cumulative(compile_flow(uncertain_flow()), self.plan, run_id=5)
+        more = draw_branch_cumulative(compile_flow(flow), self.plan, run_id=5)
+
+        assert np.array_equal(alone[screening], more[screening])
+
+    def test_rejects_negative_draws(self):
+        flow = uncertain_flow()
+        probabilities = dict(flow.transition_probabilities)
+        probabilities[("screening", "dropout")] = Triangular(-0.45, 0.1, 0.95)
+        object.__setattr__(flow, "transition_probabilities", probabilities)
+        table = compile_flow(flow)
+
+        with pytest.raises(ValueError, match=">= 0"):
+            for run_id in range(100):
+                draw_branch_cumulative(table, self.plan, run_id)
+
+
+class TestRunFlow:
+    def test_linear_flow_delays_within_bounds(self):
+        entry = np.linspace(0, 100, 500)
+
+        result = run_flow(compile_flow(linear_flow()), entry, horizon=1000.0, seed=7)
+
+        assert isinstance(result, FlowResult)
+        assert result.state_counts() == {"completed": 500, "enrolled": 0}
+        delays = result.final_times - entry
+        assert delays.min() >= 30 and delays.max() <= 120
+        assert abs(delays.mean() - 70.0) < 2.0
+
+    def test_branch_frequencies_follow_probabilities(self):
+        result = run_flow(compile_flow(branching_flow()), np.zeros(20000), horizon=5000.0, seed=3)
+
+        counts = result.state_counts()
+        # P(dropout) = 0.15 + 0.85 * 0.2 = 0.32
+        assert abs(counts["dropout"] / 20000 - 0.32) < 0.01
+        assert counts["completed"] + counts["dropout"] == 20000
+        assert result.dropout_count == counts["dropout"]
+
+    def test_horizon_stops_transitions_and_entries(self):
+        entry = np.array([0.0, 0.0, 50.0, 200.0])
+
+        result = run_flow(compile_flow(linear_flow()), entry, horizon=100.0, seed=1)
+
+        table_states = result.state_names
+        final = [table_states[s] if s >= 0 else None for s in result.final_states]
+        assert final[3] is None and np.isnan(result.final_times[3])
+        # Entered at 50: at least 30 days to complete, so still enrolled
+        assert final[2] == "enrolled"
+        assert np.all(result.visit_starts <= 100.0)
+
+    def test_occupancy_matches_visits(self):
+        entry = np.linspace(0, 200, 1000)
+        result = run_flow(compile_flow(branching_flow()), entry, horizon=400.0, seed=11)
+        at = np.array([0.0, 50.0, 150.0, 300.0, 400.0])
+
+        curves = result.occupancy(at)
+
+        total = sum(curves.values())
+        assert total.tolist() == np.searchsorted(entry, at, side="right").tolist()
+        at_horizon = {name: int(curve[-1]) for name, curve in curves.items()}
+        assert at_horizon == result.state_counts()
+        assert np.all(np.diff(curves["dropout"]) >= 0)
+
+    def test_non_terminal_dead_end_holds_patients(self):
+        flow = PatientFlow(
+            flow_id="HOLD",
+            states={"enrolled", "waiting", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "waiting"): Triangular(1, 2, 3)}
+        )
+
+        result = run_flow(compile_flow(flow), np.zeros(10), horizon=100.0, seed=1)
+
+        assert result.state_counts()["waiting"] == 10
+
+    def test_zero_delay_cycle_raises(self):
+        flow = PatientFlow(
+            flow_id="LOOP",
+            states={"a", "b"},
+            initial_state="a",
+            terminal_states=set(),
+            transition_times={("a", "b"): Bernoulli(0.0), ("b", "a"): Bernoulli(0.0)}
+        )
+
+        with pytest.raises(ValueError, match="max_steps"):
+            run_flow(compile_flow(flow), np.zeros(3), horizon=10.0, seed=1, max_steps=50)
+
+    def test_dropout_states(self):
+        table = compile_flow(branching_flow())
+        entry = np.zeros(100)
+
+        default = run_flow(table, entry, horizon=5000.0, seed=5)
+        custom = run_flow(table, entry, horizon=5000.0, seed=5, dropout_states=["completed"])
+
+        assert default.dropout_states == ["dropout"]
+        assert custom.dropout_count == 100 - default.dropout_count
+        assert run_flow(compile_flow(linear_flow()), entry, 5000.0, seed=5).dropout_count == 0
+        with pytest.raises(ValueError, match="dropout_states"):
+            run_flow(table, entry, horizon=5000.0, seed=5, dropout_states=["withdrawn"])
+
+    def test_patient_paths_ignore_cohort_size(self):
+        table = compile_flow(branching_flow())
+        entry = np.linspace(0, 100, 300)
+
+        small = run_flow(table, entry[:100], horizon=500.0, seed=9)
+        large = run_flow(table, entry, horizon=500.0, seed=9)
+
+        assert np.array_equal(small.final_states, large.final_states[:100])
+        assert np.array_equal(small.final_times, large.final_times[:100])
+
+
+class TestSimulatePatientFlow:
+    def setup_method(self):
+        self.trial = Trial(
+            trial_id="FLOW_TRIAL",
+            target_enrollment=200,
+            sites=[
+                Site(
+                    site_id="SITE_001",
+                    activation_time=Triangular(30, 45, 90),
+                    enrollment_rate=Gamma(2, 1.5),
+                    dropout_rate=Bernoulli(0.15)
+                )
+            ],
+            patient_flow=branching_flow()
+        )
+        self.plan = SeedPlan.for_trial(42, self.trial)
+        self.entry = np.linspace(30, 130, 200)
+
+    def test_deterministic_per_run(self):
+        first = simulate_patient_flow(self.trial, self.entry, 720.0, self.plan, run_id=0)
+        again = simulate_patient_flow(
+            self.trial, self.entry, 720.0, self.plan, run_id=0,
+            table=compile_flow(self.trial.patient_flow)
+        )
+        other = simulate_patient_flow(self.trial, self.entry, 720.0, self.plan, run_id=1)
+
+        assert np.array_equal(first.final_times, again.final_times)
+        assert not np.array_equal(first.final_times, other.final_times)
+
+    def test_branch_probabilities_vary_between_runs(self):
+        trial = Trial(
+            trial_id="UNCERTAIN_FLOW_TRIAL",
+            target_enrollment=200,
+            sites=self.trial.sites,
+            patient_flow=uncertain_flow()
+        )
+        entry = np.zeros(5000)
+        table = compile_flow(trial.patient_flow)
+
+        dropouts = [
+            simulate_patient_flow(trial, entry, 5000.0, self.plan, run_id, table=table).dropout_count
+            for run_id in range(20)
+        ]
+        # Binomial noise alone would be ~33 patients; the per-run screening
+        # probability spreads runs far wider
+        assert np.std(dropouts) > 100
+
+    def test_fixed_probabilities_use_the_means(self):
+        seed = self.plan.seed(2, entity_key("STANDARD_FLOW"), PURPOSE_PATIENT_FLOW)
+
+        result = simulate_patient_flow(self.trial, self.entry, 720.0, self.plan, run_id=2)
+        expected = run_flow(compile_flow(self.trial.patient_flow), self.entry, 720.0, seed)
+
+        assert np.array_equal(result.final_times, expected.final_times)
@@ -0,0 +1,181 @@
+"""
+Tests for designed (Sobol / Latin hypercube) input sampling.
+
+Focus areas:
+1. Layout: Every stochastic input gets one design column
+2. Designs: Stratification and per-seed determinism
+3. Engine: Parallel == serial, designed inputs reach the timeline
+4. Variance: Designed percentiles vary less across seeds than random ones
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from seleensim.sampling import (
+    ACTIVITY_FIELDS, SITE_FIELDS, InputLayout, SampledInputs, design_uniforms
+)
+from seleensim.simulation import SimulationEngine
+from seleensim.entities import Site, Trial, PatientFlow, Activity
+from seleensim.distributions import Triangular, Gamma, Bernoulli, LogNormal
+
+
+def make_trial(num_sites=4):
+    flow = PatientFlow(
+        flow_id="FLOW",
+        states={"enrolled", "completed"},
+        initial_state="enrolled",
+        terminal_states={"completed"},
+        transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+    )
+    return Trial(
+        trial_id="TRIAL001",
+        target_enrollment=100,
+        sites=[
+            Site(
+                site_id=f"SITE{i:03d}",
+                activation_time=LogNormal(mean=60 + 10 * i, cv=0.5, bounds=(20, 300)),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(num_sites)
+        ],
+        patient_flow=flow,
+        activities=[Activity(activity_id="IRB", duration=Triangular(10, 20, 40))]
+    )
+
+
+def activation_times(run):
+    return {entity_id: time for time, _, entity_id, _ in run.timeline}
+
+
+class TestInputLayout:
+    """Test mapping of stochastic inputs to design columns."""
+
+    def test_field_major_order(self):
+        layout = InputLayout(make_trial(num_sites=3), SITE_FIELDS + ACTIVITY_FIELDS)
+
+        # 3 sites x 3 fields + 1 activity duration (no success_probability)
+        assert layout.dimension == 10
+        assert layout.column("SITE000", "activation_time") == 0
+        assert layout.column("SITE002", "activation_time") == 2
+        assert layout.column("SITE000", "enrollment_rate") == 3
+        assert layout.column("IRB", "duration") == 9
+        with pytest.raises(KeyError):
+            layout.column("IRB", "success_probability")
+
+    def test_default_layout_has_only_engine_inputs(self):
+        layout = InputLayout(make_trial(num_sites=3))
+
+        assert layout.dimension == 3
+        assert layout.keys == [(f"SITE{i:03d}", "activation_time") for i in range(3)]
+
+    def test_selected_fields(self):
+        layout = InputLayout(make_trial(num_sites=2), ("duration", "enrollment_rate"))
+
+        assert layout.keys == [
+            ("SITE000", "enrollment_rate"), ("SITE001", "enrollment_rate"), ("IRB", "duration")
+        ]
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError, match="fields must be among"):
+            InputLayout(make_trial(), ("site_id",))
+
+
+class TestDesigns:
+    """Test design generation."""
+
+    @pytest.mark.parametrize("method", ["random", "sobol", "lhs"])
+    def test_deterministic_per_seed(self, method):
+        a = design_uniforms(method, 32, 5, seed=7)
+        b = design_uniforms(method, 32, 5, seed=7)
+        c = design_uniforms(method, 32, 5, seed=8)
+
+        assert a.shape == (32, 5)
+        assert np.array_equal(a, b)
+        assert not np.array_equal(a, c)
+        assert np.all((a >= 0) & (a < 1))
+
+    @pytest.mark.parametrize("method", ["sobol", "lhs"])
+    def test_each_stratum_hit_once(self, method):
+        n = 64
+        design = design_uniforms(method, n, 6, seed=3)
+        for j in range(6):
+            strata = np.floor(design[:, j] * n).astype(int)
+            assert sorted(strata) == list(range(n))
+
+    def test_sobol_accepts_non_power_of_two(self):
+        assert design_uniforms("sobol", 100, 3, seed=1).shape == (100, 3)
+
+    def test_invalid_method(self):
+        with pytest.raises(ValueError, match="sampling must be one of"):
+            design_uniforms("halton", 10, 2, seed=1)
+
+    def test_values_respect_bounds(self):
+        inputs = SampledInputs.generate(make_trial(), 128, "sobol", seed=42)
+        column = inputs.values[:, inputs.layout.column("SITE000", "activation_time")]
+        assert column.min() >= 20 and column.max() <= 300
+
+    def test_subset_keeps_run_ids(self):
+        inputs = SampledInputs.generate(make_trial(), 20, "lhs", seed=42)
+        shard = inputs.subset(range(10, 15))
+
+        assert len(shard) == 5
+        assert shard.value(12, "SITE001", "activation_time") == \
+            inputs.value(12, "SITE001", "activation_time")
+
+
+class TestEngineSampling:
+    """Test designed sampling through SimulationEngine.run."""
+
+    def test_invalid_method_rejected(self):
+        with pytest.raises(ValueError, match="sampling must be one of"):
+            SimulationEngine(master_seed=1).run(make_trial(), num_runs=2, sampling="grid")
+
+    @pytest.mark.parametrize("method", ["sobol", "lhs"])
+    def test_activation_times_come_from_design(self, method):
+        trial = make_trial()
+        results = SimulationEngine(master_seed=42).run(trial, num_runs=16, sampling=method)
+        inputs = SampledInputs.generate(trial, 16, method, seed=42)
+
+        assert results.sampling == method
+        for run in results.run_results:
+            times = activation_times(run)
+            for site in trial.sites:
+                assert times[site.site_id] == inputs.value(run.run_id, site.site_id, "activation_time")
+
+    def test_parallel_matches_serial(self):
+        trial = make_trial()
+        serial = SimulationEngine(master_seed=42).run(trial, num_runs=24, sampling="sobol")
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            parallel = SimulationEngine(master_seed=42).run(
+                trial, num_runs=24, sampling="sobol", executor=executor, workers=3
+            )
+
+        assert [r.completion_time for r in parallel.run_results] == \
+            [r.completion_time for r in serial.run_results]
+
+    def test_random_is_default_and_unchanged(self):
+        trial = make_trial()
+        default = SimulationEngine(master_seed=42).run(trial, num_runs=5)
+        explicit = SimulationEngine(master_seed=42).run(trial, num_runs=5, sampling="random")
+
+        assert default.sampling == "random"
+        assert [r.completion_time for r in default.run_results] == \
+            [r.completion_time for r in explicit.run_results]
+
+    def test_designed_p90_varies_less_across_seeds(self):
+        trial = make_trial()
+
+        def p90_spread(method):
+            p90s = [
+                SimulationEngine(master_seed=seed).run(
+                    trial, num_runs=64, sampling=method
+                ).completion_time_p90
+                for seed in range(12)
+            ]
+            return np.std(p90s)
+
+        assert p90_spread("sobol") < p90_spread("random")
+        assert p90_spread("lhs") < p90_spread("random")
@@ -8,6 +8,7 @@ Focus areas:
 4. Scenario composition
 5. JSON serialization round-trip
 6. Architectural guarantees maintained
+7. Structural sharing and memoization of derived trials
 """
 
 import pytest
@@ -17,10 +18,11 @@ from seleensim.scenarios import (
     apply_scenario,
     compose_scenarios,
     diff_scenarios,
+    clear_scenario_cache,
     OverrideType
 )
 from seleensim.entities import Site, Trial, PatientFlow, Resource
-from seleensim.distributions import Triangular, Gamma, Bernoulli
+from seleensim.distributions import Triangular, Gamma, Bernoulli, LogNormal
 
 
 class TestScenarioProfile:
@@ -305,6 +307,184 @@ class TestApplyScenario:
         assert modified_trial.resources[0].capacity == 3
         assert trial_with_resources.resources[0].capacity == 5  # Base unchanged
 
+    def test_lognormal_overrides_use_stored_mean(self):
+        """LogNormal scale/shift/param overrides read the distribution's mean value."""
+        trial = Trial(
+            trial_id="LOGNORMAL",
+            target_enrollment=200,
+            sites=[
+                Site(
+                    site_id="SITE_001",
+                    activation_time=LogNormal(mean=60, cv=0.4),
+                    enrollment_rate=Gamma(2, 1.5),
+                    dropout_rate=Bernoulli(0.15)
+                )
+            ],
+            patient_flow=self.base_trial.patient_flow
+        )
+
+        def override(spec):
+            scenario = ScenarioProfile(
+                scenario_id=f"LN_{spec['type']}",
+                description="LogNormal override",
+                version="1.0.0",
+                site_overrides={"SITE_001": {"activation_time": spec}}
+            )
+            return apply_scenario(trial, scenario).sites[0].activation_time
+
+        assert override({"type": "distribution_scale", "parameters": {"scale_factor": 1.5}}).mean_val == pytest.approx(90)
+        assert override({"type": "distribution_shift", "parameters": {"shift": 10}}).mean_val == pytest.approx(70)
+        modified = override({"type": "distribution_param", "parameters": {"cv": 0.8}})
+        assert modified.mean_val == pytest.approx(60)
+        assert modified.cv == pytest.approx(0.8)
+
+
+def make_large_trial(num_sites=50):
+    return Trial(
+        trial_id="LARGE",
+        target_enrollment=500,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:04d}",
+                activation_time=Triangular(30, 45, 90),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(num_sites)
+        ],
+        patient_flow=PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(90, 180, 365)}
+        ),
+        resources=[Resource(resource_id="CRA", resource_type="staff", capacity=5)]
+    )
+
+
+def scale_site(site_id, scale_factor=1.2, scenario_id="SCALED"):
+    return ScenarioProfile(
+        scenario_id=scenario_id,
+        description="Scale one site",
+        version="1.0.0",
+        site_overrides={
+            site_id: {
+                "activation_time": {
+                    "type": "distribution_scale",
+                    "parameters": {"scale_factor": scale_factor}
+                }
+            }
+        }
+    )
+
+
+class TestStructuralSharing:
+    """Test that apply_scenario() reuses unchanged structure."""
+
+    def setup_method(self):
+        clear_scenario_cache()
+        self.base_trial = make_large_trial()
+
+    def test_unchanged_entities_shared_by_reference(self):
+        modified = apply_scenario(self.base_trial, scale_site("SITE_0007"))
+
+        assert modified.sites[7] is not self.base_trial.sites[7]
+        assert modified.sites[7].activation_time.mode == pytest.approx(54.0)
+        for i, site in enumerate(modified.sites):
+            if i != 7:
+                assert site is self.base_trial.sites[i]
+        assert modified.patient_flow is self.base_trial.patient_flow
+        assert all(a is b for a, b in zip(modified.resources, self.base_trial.resources))
+
+    def test_equals_fully_validated_trial(self):
+        modified = apply_scenario(self.base_trial, scale_site("SITE_0007"))
+        rebuilt = Trial(
+            trial_id=modified.trial_id,
+            target_enrollment=modified.target_enrollment,
+            sites=list(modified.sites),
+            patient_flow=modified.patient_flow,
+            activities=list(modified.activities),
+            resources=list(modified.resources)
+        )
+
+        assert modified == rebuilt
+        assert modified.to_dict() == rebuilt.to_dict()
+
+    def test_trial_validation_runs_on_derived_trials(self, monkeypatch):
+        calls = []
+        original = Trial.__post_init__
+        monkeypatch.setattr(Trial, "__post_init__", lambda self: calls.append(self) or original(self))
+
+        modified = apply_scenario(self.base_trial, scale_site("SITE_0001"))
+
+        assert modified in calls
+
+    def test_base_mutated_in_place_is_rejected(self):
+        # Trial lists are mutable; a base broken after construction must not
+        # yield a derived trial that skipped validation
+        self.base_trial.sites.append(self.base_trial.sites[0])
+        with pytest.raises(ValueError, match="Duplicate site_ids"):
+            apply_scenario(self.base_trial, scale_site("SITE_0001"))
+
+    def test_trial_level_overrides_still_validated(self):
+        scenario = ScenarioProfile(
+            scenario_id="NO_ENROLLMENT",
+            description="Invalid target",
+            version="1.0.0",
+            trial_overrides={"target_enrollment": {"type": "direct_value", "value": 0}}
+        )
+        with pytest.raises(ValueError, match="target_enrollment"):
+            apply_scenario(self.base_trial, scenario)
+
+
+class TestScenarioMemoization:
+    """Test memoization of derived trials."""
+
+    def setup_method(self):
+        clear_scenario_cache()
+
+    def test_repeated_application_is_memoized(self):
+        base = make_large_trial()
+        first = apply_scenario(base, scale_site("SITE_0003"))
+
+        # The rebuilt entity is reused rather than rebuilt
+        assert apply_scenario(base, scale_site("SITE_0003")).sites[3] is first.sites[3]
+        # Equal content, different objects: same fingerprints
+        assert apply_scenario(make_large_trial(), scale_site("SITE_0003")).sites[3] is first.sites[3]
+
+    def test_results_are_independent_copies(self):
+        base = make_large_trial()
+        first = apply_scenario(base, scale_site("SITE_0003"))
+        first.sites.clear()
+        first.resources.append(first.resources[0])
+
+        second = apply_scenario(base, scale_site("SITE_0003"))
+
+        assert second is not first
+        assert len(second.sites) == 50
+        assert len(second.resources) == len(base.resources)
+        assert second.to_dict() == apply_scenario(make_large_trial(), scale_site("SITE_0003")).to_dict()
+
+    def test_different_content_not_confused(self):
+        base = make_large_trial()
+        a = apply_scenario(base, scale_site("SITE_0003", scale_factor=1.2))
+        b = apply_scenario(base, scale_site("SITE_0003", scale_factor=1.5))
+        c = apply_scenario(make_large_trial(num_sites=51), scale_site("SITE_0003", scale_factor=1.2))
+
+        assert a is not b and a is not c
+        assert b.sites[3].activation_time.mode == pytest.approx(67.5)
+        assert len(c.sites) == 51
+
+    def test_clear_cache(self):
+        base = make_large_trial()
+        first = apply_scenario(base, scale_site("SITE_0003"))
+        clear_scenario_cache()
+
+        second = apply_scenario(base, scale_site("SITE_0003"))
+        assert second.sites[3] is not first.sites[3]
+        assert second.to_dict() == first.to_dict()
+
 
 class TestScenarioComposition:
     """Test explicit scenario composition."""
@@ -0,0 +1,268 @@
+"""
+Tests for pending-event schedulers.
+
+Focus areas:
+1. Ordering: Every scheduler pops by (time, insertion order)
+2. Rescheduling: The popped event is moved in place, not copied
+3. Calendar queue: Bucket lifecycle, far-future and infinite times, past pushes
+4. Engine: Results are identical whichever scheduler runs them
+"""
+
+import math
+import random
+
+import pytest
+
+from seleensim.scheduler import (
+    SCHEDULERS,
+    CalendarScheduler,
+    HeapScheduler,
+    Scheduler,
+    scheduler_factory,
+)
+from seleensim.simulation import Event, SimulationEngine
+from seleensim.constraints import Constraint, ConstraintResult
+from seleensim.entities import Site, Trial, PatientFlow
+from seleensim.distributions import Triangular, Gamma, Bernoulli
+
+
+ALL_SCHEDULERS = [HeapScheduler, CalendarScheduler, lambda: CalendarScheduler(bucket_width=0.25)]
+
+
+def make_event(event_id, time):
+    return Event(event_id, "type", "entity", time=time)
+
+
+@pytest.mark.parametrize("make_scheduler", ALL_SCHEDULERS)
+class TestSchedulerContract:
+    def test_pops_in_time_then_insertion_order(self, make_scheduler):
+        queue = make_scheduler()
+        for event_id, t in [("a", 5.0), ("b", 1.0), ("c", 5.0), ("d", 3.0)]:
+            queue.push(make_event(event_id, t))
+
+        assert len(queue) == 4
+        popped = [queue.pop().event_id for _ in range(4)]
+        assert popped == ["b", "d", "a", "c"]
+        assert not queue
+
+    def test_reschedule_moves_event_in_place(self, make_scheduler):
+        queue = make_scheduler()
+        first = make_event("a", 1.0)
+        queue.push(first)
+        queue.push(make_event("b", 2.0))
+
+        event = queue.pop()
+        queue.reschedule(event, 3.0)
+
+        assert event is first and first.time == 3.0
+        assert [queue.pop().event_id for _ in range(2)] == ["b", "a"]
+        # Rescheduling reused the popped event's table slot
+        assert len(queue._events) == 2
+
+    def test_reschedule_of_other_event_pushes_it(self, make_scheduler):
+        queue = make_scheduler()
+        queue.push(make_event("a", 1.0))
+        queue.pop()
+
+        queue.reschedule(make_event("b", 0.0), 4.0)
+
+        assert queue.pop().time == 4.0
+
+    def test_push_before_drained_bucket(self, make_scheduler):
+        queue = make_scheduler()
+        queue.push(make_event("a", 5.5))
+        queue.push(make_event("b", 7.5))
+        assert queue.pop().time == 5.5
+
+        queue.push(make_event("c", 3.5))
+
+        assert [queue.pop().time for _ in range(2)] == [3.5, 7.5]
+        assert not queue
+
+    def test_infinite_times_pop_last_in_insertion_order(self, make_scheduler):
+        queue = make_scheduler()
+        queue.push(make_event("never_1", math.inf))
+        queue.push(make_event("a", 2.5))
+        queue.push(make_event("first", -math.inf))
+        queue.push(make_event("b", 1e300))
+        event = queue.pop()
+        queue.reschedule(event, math.inf)
+        queue.push(make_event("c", 4.0))
+
+        popped = [queue.pop().event_id for _ in range(5)]
+
+        assert event.event_id == "first"
+        assert popped == ["a", "c", "b", "never_1", "first"]
+        assert not queue
+
+    def test_table_reuses_popped_slots(self, make_scheduler):
+        queue = make_scheduler()
+        for i in range(10):
+            queue.push(make_event(f"e{i}", float(i)))
+
+        for step in range(1000):
+            event = queue.pop()
+            if step % 2:
+                queue.reschedule(event, event.time + 3.0)
+            else:
+                queue.push(make_event(f"n{step}", event.time + 7.0))
+
+        assert len(queue) == 10
+        assert len(queue._events) <= 11
+
+    def test_matches_sorted_order_under_random_holds(self, make_scheduler):
+        rng = random.Random(3)
+        queue = make_scheduler()
+        reference = []
+        seq = 0
+        for i in range(200):
+            t = float(rng.randint(0, 30))
+            queue.push(make_event(f"e{i}", t))
+            reference.append((t, seq, f"e{i}"))
+            seq += 1
+
+        for step in range(2000):
+            event = queue.pop()
+            reference.sort()
+            assert reference.pop(0)[2] == event.event_id
+            if step < 1500:
+                # Hold: reschedule the popped event into the future (day granularity,
+                # occasionally far ahead)
+                new_time = event.time + (rng.randint(0, 5) if step % 50 else 500.0 + rng.random())
+                queue.reschedule(event, new_time)
+                reference.append((new_time, seq, event.event_id))
+                seq += 1
+            if not queue:
+                break
+
+        assert len(queue) == len(reference)
+
+
+class TestCalendarScheduler:
+    def test_drained_buckets_are_dropped(self):
+        queue = CalendarScheduler()
+        for i in range(100):
+            queue.push(make_event(f"e{i}", i % 37 + 0.5))
+
+        assert len(queue._buckets) == 37
+
+        times = [queue.pop().time for _ in range(100)]
+        assert times == sorted(times)
+        assert len(queue._buckets) <= 1
+
+    def test_jumps_to_far_future_events(self):
+        queue = CalendarScheduler()
+        queue.push(make_event("near", 1.0))
+        queue.push(make_event("far", 10000.5))
+
+        assert [queue.pop().event_id for _ in range(2)] == ["near", "far"]
+
+    def test_push_before_current_day(self):
+        queue = CalendarScheduler()
+        queue.push(make_event("a", 50.0))
+        queue.push(make_event("a2", 50.5))
+        queue.push(make_event("b", 60.0))
+        queue.pop()
+
+        queue.push(make_event("early", 10.0))
+
+        assert [queue.pop().event_id for _ in range(3)] == ["early", "a2", "b"]
+
+    def test_drained_bucket_dropped_on_earlier_push(self):
+        queue = CalendarScheduler()
+        queue.push(make_event("a", 5.5))
+        queue.pop()
+        queue.push(make_event("b", 3.5))
+
+        assert 5 not in queue._buckets
+        assert queue.pop().event_id == "b"
+
+    def test_empty_pop_raises(self):
+        with pytest.raises(IndexError):
+            CalendarScheduler().pop()
+
+    def test_rejects_invalid_bucket_width(self):
+        with pytest.raises(ValueError, match="bucket_width"):
+            CalendarScheduler(bucket_width=0)
+
+
+class TestSchedulerFactory:
+    def test_interface_is_abstract(self):
+        with pytest.raises(TypeError):
+            Scheduler()
+
+    def test_names_and_factories(self):
+        assert scheduler_factory("heap") is HeapScheduler
+        assert scheduler_factory("calendar") is CalendarScheduler
+        assert scheduler_factory(CalendarScheduler) is CalendarScheduler
+        assert set(SCHEDULERS) == {"heap", "calendar"}
+
+    def test_unknown_name_rejected(self):
+        with pytest.raises(ValueError, match="scheduler must be one of"):
+            scheduler_factory("ladder")
+        with pytest.raises(ValueError, match="scheduler must be one of"):
+            SimulationEngine(scheduler=3)
+
+
+class StepDelay(Constraint):
+    def evaluate(self, state, event):
+        if event.time < 120:
+            return ConstraintResult.delayed_by(1.0, "Step delay")
+        return ConstraintResult.satisfied("Past step delay")
+
+
+class TestEngineSchedulers:
+    def setup_method(self):
+        self.trial = Trial(
+            trial_id="SCHEDULER_TRIAL",
+            target_enrollment=100,
+            sites=[
+                Site(
+                    site_id=f"SITE_{i:03d}",
+                    activation_time=Triangular(30 + i, 45 + i, 90 + i),
+                    enrollment_rate=Gamma(2, 1.5),
+                    dropout_rate=Bernoulli(0.15)
+                )
+                for i in range(12)
+            ],
+            patient_flow=PatientFlow(
+                flow_id="FLOW",
+                states={"enrolled", "completed"},
+                initial_state="enrolled",
+                terminal_states={"completed"},
+                transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+            )
+        )
+
+    def test_calendar_matches_heap(self):
+        heap = SimulationEngine(master_seed=42, constraints=[StepDelay()])
+        calendar = SimulationEngine(master_seed=42, constraints=[StepDelay()], scheduler="calendar")
+
+        expected = heap.run(self.trial, num_runs=10, progress=None)
+        actual = calendar.run(self.trial, num_runs=10, progress=None)
+
+        assert actual == expected
+        assert [list(r.timeline) for r in actual.run_results] == \
+            [list(r.timeline) for r in expected.run_results]
+
+    def test_calendar_matches_heap_with_reschedules_to_inf(self):
+        from seleensim.constraints import TemporalPrecedenceConstraint
+        # site_activation waits for an enrollment that is never scheduled
+        constraints = [TemporalPrecedenceConstraint("enrollment", "site_activation")]
+        heap = SimulationEngine(master_seed=42, constraints=constraints)
+        calendar = SimulationEngine(master_seed=42, constraints=constraints, scheduler="calendar")
+
+        expected = heap.run(self.trial, num_runs=4, progress=None)
+        actual = calendar.run(self.trial, num_runs=4, progress=None)
+
+        assert actual.incomplete_runs == 4
+        assert [list(r.timeline) for r in actual.run_results] == \
+            [list(r.timeline) for r in expected.run_results]
+
+    def test_calendar_engine_runs_in_process_pool(self):
+        engine = SimulationEngine(master_seed=42, scheduler=CalendarScheduler)
+
+        expected = SimulationEngine(master_seed=42).run(self.trial, num_runs=6, progress=None)
+        actual = engine.run(self.trial, num_runs=6, workers=2, progress=None)
+
+        assert actual == expected
@@ -0,0 +1,142 @@
+"""
+Tests for global sensitivity analysis.
+
+Focus areas:
+1. Design points: Parameters map to distribution_param scenario overrides
+2. Rankings: Tornado, Morris and Sobol agree on the dominant parameter
+3. Sobol indices: Known values on an analytic output, bootstrap CIs
+4. Determinism and validation
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from seleensim import sensitivity
+from seleensim.sensitivity import (
+    SensitivityParameter,
+    evaluate_design,
+    morris_screening,
+    sobol_indices,
+    tornado,
+)
+from seleensim.entities import Site, Trial, PatientFlow
+from seleensim.distributions import Triangular, Gamma, Bernoulli
+
+
+def make_trial():
+    def site(site_id, activation_time):
+        return Site(
+            site_id=site_id,
+            activation_time=activation_time,
+            enrollment_rate=Gamma(2, 1.5),
+            dropout_rate=Bernoulli(0.15)
+        )
+
+    return Trial(
+        trial_id="SA_TRIAL",
+        target_enrollment=100,
+        sites=[
+            site("SITE_SLOW", Triangular(100, 150, 300)),
+            site("SITE_FAST", Triangular(30, 45, 90)),
+        ],
+        patient_flow=PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+    )
+
+
+PARAMETERS = [
+    SensitivityParameter("site", "SITE_SLOW", "activation_time", "high", 200, 400),
+    SensitivityParameter("site", "SITE_FAST", "activation_time", "mode", 40, 60),
+    SensitivityParameter("site", "SITE_SLOW", "enrollment_rate", "shape", 1, 3),
+]
+
+
+class TestDesignEvaluation:
+    """Test evaluation of design points."""
+
+    def test_point_values_reach_trial(self):
+        # SITE_SLOW high at 400 (unit 1.0) vs 200 (unit 0.0)
+        outputs = evaluate_design(
+            make_trial(), PARAMETERS[:1], np.array([[0.0], [1.0]]), num_runs=30
+        )
+        assert outputs[1] > outputs[0]
+
+    def test_shape_mismatch_rejected(self):
+        with pytest.raises(ValueError, match="shape"):
+            evaluate_design(make_trial(), PARAMETERS, np.zeros((2, 1)))
+
+    def test_unknown_entity_rejected(self):
+        bad = SensitivityParameter("site", "SITE_NONE", "activation_time", "mode", 1, 2)
+        with pytest.raises(ValueError, match="SITE_NONE"):
+            evaluate_design(make_trial(), [bad], np.zeros((1, 1)))
+
+    def test_parameter_validation(self):
+        with pytest.raises(ValueError, match="entity_type"):
+            SensitivityParameter("patient", "P1", "duration", "mode", 1, 2)
+        with pytest.raises(ValueError, match="low must be < high"):
+            SensitivityParameter("site", "S", "activation_time", "mode", 2, 1)
+
+
+class TestRankings:
+    """Test that methods identify the dominant parameter."""
+
+    def test_tornado(self):
+        result = tornado(make_trial(), PARAMETERS, num_runs=30)
+
+        assert result.ranking()[0] == "SITE_SLOW.activation_time.high"
+        assert result.effect("SITE_SLOW.enrollment_rate.shape").swing == 0.0
+        assert result.num_evaluations == 7
+        assert "swing" in result.summary()
+
+    def test_morris(self):
+        result = morris_screening(make_trial(), PARAMETERS, num_trajectories=6, num_runs=20)
+
+        assert result.ranking()[0] == "SITE_SLOW.activation_time.high"
+        assert result.effect("SITE_SLOW.enrollment_rate.shape").mu_star == 0.0
+        assert result.num_evaluations == 24
+
+    def test_sobol(self):
+        result = sobol_indices(make_trial(), PARAMETERS, num_samples=16, num_runs=20)
+
+        dominant = result.effect("SITE_SLOW.activation_time.high")
+        inert = result.effect("SITE_SLOW.enrollment_rate.shape")
+        assert result.ranking()[0] == dominant.parameter
+        assert dominant.total_order > 0.8
+        assert dominant.total_order_ci[0] <= dominant.total_order <= dominant.total_order_ci[1]
+        assert inert.first_order == 0.0 and inert.total_order == 0.0
+        assert result.num_evaluations == 16 * 5
+
+    def test_deterministic_and_parallel_safe(self):
+        serial = sobol_indices(make_trial(), PARAMETERS[:2], num_samples=8, num_runs=10)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            parallel = sobol_indices(
+                make_trial(), PARAMETERS[:2], num_samples=8, num_runs=10,
+                workers=2, executor=executor
+            )
+
+        assert parallel.effects == serial.effects
+
+
+class TestSobolEstimators:
+    """Test index estimators on an analytic function."""
+
+    def test_additive_function(self):
+        # f = 4·x0 + 1·x1 on uniform inputs: S0 = 16/17, S1 = 1/17, no interaction
+        design = sensitivity.design_uniforms("sobol", 4096, 4, seed=3)
+        a, b = design[:, :2], design[:, 2:]
+
+        def f(x):
+            return 4 * x[:, 0] + x[:, 1]
+
+        f_ab = np.array([f(np.where(np.arange(2) == i, b, a)) for i in range(2)])
+        first, total = sensitivity._sobol_estimates(f(a), f(b), f_ab)
+
+        assert first == pytest.approx([16 / 17, 1 / 17], abs=0.02)
+        assert total == pytest.approx([16 / 17, 1 / 17], abs=0.02)
@@ -7,11 +7,21 @@ Focus areas:
 3. Aggregated results compute percentiles correctly
 4. Event queue processes in time order
 5. State tracking works correctly
+6. Parallel execution matches serial execution exactly
+7. Incremental (run_iter) and async (arun) execution match run()
 """
 
+import asyncio
+import pickle
+import threading
+import time
+
+import numpy as np
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from seleensim.simulation import (
     Event,
+    EventCatalog,
     SimulationState,
     RunResult,
     SimulationResults,
@@ -20,6 +30,7 @@ from seleensim.simulation import (
 )
 from seleensim.entities import Site, Trial, PatientFlow
 from seleensim.distributions import Triangular, Gamma, Bernoulli
+from seleensim.aggregation import PrecisionReport
 
 
 class TestEvent:
@@ -59,6 +70,82 @@ class TestEvent:
 
         assert event.duration == 30.0
 
+    def test_event_is_slotted(self):
+        event = Event("e1", "type", "entity", time=50.0)
+
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.undeclared = 1
+
+    def test_event_reschedule_shares_containers(self):
+        original = Event("e1", "type", "entity", time=50.0, required_resources={"CRA"})
+        rescheduled = original.reschedule(60.0)
+
+        assert original.time == 50.0
+        assert rescheduled.required_resources is original.required_resources
+        assert rescheduled.execution_parameters is original.execution_parameters
+
+
+class TestEventCatalog:
+    """Shared, immutable event specs of a trial."""
+
+    def setup_method(self):
+        self.trial = Trial(
+            trial_id="TRIAL001",
+            target_enrollment=100,
+            sites=[
+                Site(
+                    site_id=f"SITE{i:03d}",
+                    activation_time=Triangular(30, 45, 90),
+                    enrollment_rate=Gamma(2, 1.5),
+                    dropout_rate=Bernoulli(0.15)
+                )
+                for i in range(3)
+            ],
+            patient_flow=PatientFlow(
+                flow_id="FLOW",
+                states={"enrolled", "completed"},
+                initial_state="enrolled",
+                terminal_states={"completed"},
+                transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+            )
+        )
+
+    def test_catalog_interns_types_and_entities(self):
+        catalog = EventCatalog.for_trial(self.trial)
+
+        assert len(catalog) == 3
+        assert catalog.event_types == ["site_activation"]
+        assert catalog.entities == ["SITE000", "SITE001", "SITE002"]
+        event = catalog.event(2, time=40.0, seed=7)
+        assert (event.event_id, event.entity_id, event.time, event.seed) == \
+            ("activation_SITE002", "SITE002", 40.0, 7)
+        assert (event.type_code, event.entity_code) == (0, 2)
+
+    def test_events_share_read_only_metadata(self):
+        catalog = EventCatalog.for_trial(self.trial)
+        first = catalog.event(0, time=40.0)
+        second = catalog.event(0, time=55.0)
+
+        assert first.metadata is second.metadata
+        assert first.metadata["site"] is self.trial.sites[0]
+        with pytest.raises(TypeError):
+            first.metadata["site"] = None
+
+    def test_overrides_copy_shared_metadata(self):
+        catalog = EventCatalog.for_trial(self.trial)
+        event = catalog.event(0, time=40.0)
+
+        event.apply_overrides({"priority": "high"})
+
+        assert event.metadata["priority"] == "high"
+        assert "priority" not in catalog.event(0, time=40.0).metadata
+
+    def test_catalog_pickles(self):
+        catalog = pickle.loads(pickle.dumps(EventCatalog.for_trial(self.trial)))
+
+        assert catalog.event(1, time=40.0).metadata["site"].site_id == "SITE001"
+
 
 class TestSimulationState:
     """Test SimulationState tracking."""
@@ -506,6 +593,40 @@ class TestConstraintIntegration:
             assert run.completion_time > 0
             assert run.events_rescheduled == 0  # No constraints, no rescheduling
 
+    @pytest.mark.parametrize("retain_runs", ["all", "none"])
+    def test_unsatisfiable_precedence_runs_to_completion(self, retain_runs):
+        """Events rescheduled to inf leave runs incomplete, not crashed."""
+        from seleensim.constraints import TemporalPrecedenceConstraint
+        trial = Trial(
+            trial_id="TRIAL001",
+            target_enrollment=200,
+            sites=[
+                Site(
+                    site_id=f"SITE{i:03d}",
+                    activation_time=Triangular(30, 45, 90),
+                    enrollment_rate=Gamma(2, 1.5),
+                    dropout_rate=Bernoulli(0.15)
+                )
+                for i in range(5)
+            ],
+            patient_flow=self.flow
+        )
+        # site_activation waits for an enrollment that is never scheduled
+        engine = SimulationEngine(
+            master_seed=42,
+            constraints=[TemporalPrecedenceConstraint("enrollment", "site_activation")]
+        )
+
+        results = engine.run(trial, num_runs=5, retain_runs=retain_runs)
+
+        assert results.num_runs == 5
+        assert results.incomplete_runs == 5
+        assert results.completion_time_p50 == float('inf') or np.isnan(results.completion_time_p50)
+        assert results.total_cost_p50 == 0.0
+        for run in results.run_results:
+            assert run.completion_time == float('inf')
+            assert any("Rescheduled to inf" in entry[3] for entry in run.timeline)
+
     def test_engine_with_empty_constraints_list(self):
         """Engine with empty constraints list runs normally."""
         engine = SimulationEngine(master_seed=42, constraints=[])
@@ -539,6 +660,48 @@ class TestConstraintIntegration:
         # Verify constraint was called (should be called for each event processed)
         assert mock.call_count > 0
 
+    def test_constraint_index_built_once_per_run_call(self, monkeypatch):
+        """Dispatch tables are built per job, not per simulation run."""
+        import seleensim.simulation as simulation
+
+        built = []
+        original = simulation.ConstraintIndex
+
+        def counting_index(constraints):
+            built.append(constraints)
+            return original(constraints)
+
+        monkeypatch.setattr(simulation, "ConstraintIndex", counting_index)
+        engine = SimulationEngine(master_seed=42, constraints=[self.temporal_constraint])
+        engine.run(self.trial, num_runs=5, progress=None)
+
+        assert len(built) == 1
+
+    def test_inapplicable_constraints_are_not_evaluated(self):
+        """Engine dispatch skips constraints that declare they don't apply."""
+        from seleensim.constraints import Applicability, ConstraintResult, Constraint
+
+        class EnrollmentOnly(Constraint):
+            def __init__(self):
+                self.call_count = 0
+
+            def applicability(self):
+                return Applicability(event_types=frozenset(["enrollment"]))
+
+            def evaluate(self, state, event):
+                self.call_count += 1
+                return ConstraintResult.satisfied("Enrollment checked")
+
+        constraint = EnrollmentOnly()
+        engine = SimulationEngine(master_seed=42, constraints=[constraint])
+        baseline = SimulationEngine(master_seed=42).run(self.trial, num_runs=3)
+        results = engine.run(self.trial, num_runs=3)
+
+        # Only site_activation events exist, so the constraint never runs
+        assert constraint.call_count == 0
+        assert [r.completion_time for r in results.run_results] == \
+            [r.completion_time for r in baseline.run_results]
+
     def test_validity_constraint_reschedules_events(self):
         """Validity constraints cause event rescheduling."""
         from seleensim.constraints import TemporalPrecedenceConstraint
@@ -770,3 +933,231 @@ class TestMetricsInvariant:
                 "\n\nThis violates: Metrics observe, never influence.\n"
                 "See ENGINE_ORCHESTRATION.md Invariant #4."
             )
+
+
+class TestParallelExecution:
+    """Parallel run sharding must be indistinguishable from serial runs."""
+
+    def setup_method(self):
+        from seleensim.constraints import (
+            TemporalPrecedenceConstraint,
+            BudgetThrottlingConstraint,
+            LinearResponseCurve
+        )
+
+        sites = [
+            Site(
+                site_id=f"SITE{i:03d}",
+                activation_time=Triangular(30 + i, 45 + i, 90 + i),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(4)
+        ]
+        flow = PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+        self.trial = Trial(
+            trial_id="TRIAL001",
+            target_enrollment=200,
+            sites=sites,
+            patient_flow=flow
+        )
+        self.constraints = [
+            TemporalPrecedenceConstraint("site_activation", "enrollment"),
+            BudgetThrottlingConstraint(10000.0, LinearResponseCurve(min_speed_ratio=0.5))
+        ]
+
+    def test_process_pool_matches_serial(self):
+        engine = SimulationEngine(master_seed=42, constraints=self.constraints)
+
+        serial = engine.run(self.trial, num_runs=23)
+        parallel = engine.run(self.trial, num_runs=23, workers=2)
+
+        assert parallel == serial
+
+    @pytest.mark.parametrize("workers", [1, 3, 8])
+    def test_results_independent_of_worker_count(self, workers):
+        engine = SimulationEngine(master_seed=7)
+
+        serial = engine.run(self.trial, num_runs=17)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            sharded = engine.run(self.trial, num_runs=17, workers=workers, executor=pool)
+
+        assert [r.run_id for r in sharded.run_results] == list(range(17))
+        assert sharded == serial
+
+    def test_invalid_worker_count_rejected(self):
+        engine = SimulationEngine(master_seed=42)
+        with pytest.raises(ValueError, match="workers must be >= 1"):
+            engine.run(self.trial, num_runs=2, workers=0)
+
+
+class TestIncrementalExecution:
+    """run_iter and arun yield progress but must return run()'s results."""
+
+    def setup_method(self):
+        sites = [
+            Site(
+                site_id=f"SITE{i:03d}",
+                activation_time=Triangular(30 + i, 45 + i, 90 + i),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(4)
+        ]
+        flow = PatientFlow(
+            flow_id="FLOW",
+            states={"enrolled", "completed"},
+            initial_state="enrolled",
+            terminal_states={"completed"},
+            transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+        )
+        self.trial = Trial(
+            trial_id="TRIAL001",
+            target_enrollment=200,
+            sites=sites,
+            patient_flow=flow
+        )
+        self.engine = SimulationEngine(master_seed=42)
+
+    def test_run_iter_matches_run(self):
+        expected = self.engine.run(self.trial, num_runs=25, progress=None)
+
+        updates = list(self.engine.run_iter(self.trial, num_runs=25, update_every=10))
+
+        assert [u.stage for u in updates] == ["started", "runs_completed", "runs_completed", "finished"]
+        assert [u.completed_runs for u in updates] == [0, 10, 20, 25]
+        assert updates[0].results is None
+        assert updates[1].results.num_runs == 10
+        assert updates[-1].results == expected
+
+    def test_run_iter_exact_partial_results_are_prefixes(self):
+        expected = self.engine.run(self.trial, num_runs=20, progress=None)
+
+        for update in self.engine.run_iter(
+            self.trial, num_runs=20, update_every=5, exact_updates=True, measure_precision=True
+        ):
+            if update.results is not None:
+                assert update.results.run_results == expected.run_results[:update.completed_runs]
+                assert update.results.precision is not None
+
+    def test_run_iter_interim_updates_are_sketch_estimates(self, monkeypatch):
+        measured = []
+        original = PrecisionReport.measure
+
+        def measure(aggregator, *args, **kwargs):
+            measured.append(aggregator.num_runs)
+            return original(aggregator, *args, **kwargs)
+
+        monkeypatch.setattr(PrecisionReport, "measure", staticmethod(measure))
+
+        updates = list(self.engine.run_iter(self.trial, num_runs=20, update_every=5, measure_precision=True))
+
+        # Only the final update pays for exact aggregation
+        assert measured == [20]
+        interim = updates[1].results
+        assert interim.num_runs == 5
+        assert interim.retain_runs == "none" and interim.run_results == []
+        assert interim.precision is None
+        assert interim.sketches["completion_time"].count == 5
+        # Later updates do not change earlier snapshots
+        assert updates[2].results.sketches["completion_time"].count == 10
+
+    def test_run_iter_on_executor_matches_run(self):
+        expected = self.engine.run(self.trial, num_runs=30, progress=None)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            updates = list(self.engine.run_iter(
+                self.trial, num_runs=30, workers=3, executor=pool, update_every=1
+            ))
+
+        assert updates[-1].stage == "finished"
+        assert updates[-1].results == expected
+        completed = [u.completed_runs for u in updates]
+        assert completed == sorted(completed)
+
+    def test_run_iter_cancellation(self):
+        cancel = threading.Event()
+        updates = []
+        for update in self.engine.run_iter(self.trial, num_runs=100, update_every=5, cancel=cancel):
+            updates.append(update)
+            if update.completed_runs >= 10:
+                cancel.set()
+
+        assert updates[-1].stage == "cancelled"
+        assert updates[-1].completed_runs == 11
+        assert updates[-1].results.num_runs == 11
+
+    def test_run_iter_close_stops_execution(self):
+        calls = []
+        original = self.engine._execute_single_run
+
+        def execute(*args, **kwargs):
+            calls.append(args[1])
+            return original(*args, **kwargs)
+
+        self.engine._execute_single_run = execute
+        updates = self.engine.run_iter(self.trial, num_runs=100, update_every=5)
+        for update in updates:
+            if update.completed_runs >= 5:
+                break
+        updates.close()
+
+        assert calls == list(range(5))
+
+    def test_run_iter_rejects_invalid_update_interval(self):
+        with pytest.raises(ValueError, match="update_every"):
+            list(self.engine.run_iter(self.trial, num_runs=5, update_every=0))
+
+    def test_arun_matches_run(self):
+        expected = self.engine.run(self.trial, num_runs=25, progress=None)
+        updates = []
+
+        async def report(update):
+            updates.append(update.stage)
+
+        results = asyncio.run(self.engine.arun(self.trial, num_runs=25, progress=report))
+
+        assert results == expected
+        assert updates == ["started", "runs_completed", "runs_completed", "finished"]
+
+    def test_arun_cancellation_stops_runs(self):
+        calls = []
+        original = self.engine._execute_single_run
+
+        def execute(*args, **kwargs):
+            calls.append(args[1])
+            return original(*args, **kwargs)
+
+        self.engine._execute_single_run = execute
+
+        async def main():
+            cancelled = asyncio.Event()
+
+            def report(update):
+                if update.completed_runs >= 10:
+                    cancelled.set()
+
+            task = asyncio.create_task(
+                self.engine.arun(self.trial, num_runs=100000, update_every=10, progress=report)
+            )
+            await cancelled.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+
+        # The background thread had already stopped when arun returned
+        stopped_at = len(calls)
+        time.sleep(0.05)
+        assert len(calls) == stopped_at < 100000
+
+    def test_arun_propagates_errors(self):
+        with pytest.raises(ValueError, match="workers must be >= 1"):
+            asyncio.run(self.engine.arun(self.trial, num_runs=5, workers=0))
@@ -0,0 +1,204 @@
+"""
+Tests for scenario sweeps.
+
+Focus areas:
+1. Grids: Cartesian composition of scenario axes
+2. Equivalence: Sweep rows equal running each scenario by hand
+3. Parallelism: Process pool and foreign executors match the serial sweep
+4. Tidy output: Rows keyed by scenario, summaries from sketches
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from seleensim.sweep import BASELINE_ID, iter_sweep, run_sweep, scenario_grid
+from seleensim.scenarios import ScenarioProfile, apply_scenario
+from seleensim.simulation import SimulationEngine
+from seleensim.entities import Site, Trial, PatientFlow
+from seleensim.distributions import Triangular, Gamma, Bernoulli
+from seleensim.constraints import Constraint, ConstraintResult
+
+
+def make_trial():
+    flow = PatientFlow(
+        flow_id="FLOW",
+        states={"enrolled", "completed"},
+        initial_state="enrolled",
+        terminal_states={"completed"},
+        transition_times={("enrolled", "completed"): Triangular(30, 60, 120)}
+    )
+    return Trial(
+        trial_id="TRIAL001",
+        target_enrollment=100,
+        sites=[
+            Site(
+                site_id=f"SITE_{i:03d}",
+                activation_time=Triangular(30 + 5 * i, 60 + 5 * i, 150 + 5 * i),
+                enrollment_rate=Gamma(2, 1.5),
+                dropout_rate=Bernoulli(0.15)
+            )
+            for i in range(4)
+        ],
+        patient_flow=flow
+    )
+
+
+def delay(scenario_id, scale_factor):
+    return ScenarioProfile(
+        scenario_id=scenario_id,
+        description=f"Activation x{scale_factor}",
+        version="1.0.0",
+        site_overrides={
+            "SITE_000": {
+                "activation_time": {
+                    "type": "distribution_scale",
+                    "parameters": {"scale_factor": scale_factor}
+                }
+            }
+        }
+    )
+
+
+def budget(scenario_id, amount):
+    return ScenarioProfile(
+        scenario_id=scenario_id,
+        description=f"Budget {amount}",
+        version="1.0.0",
+        trial_overrides={"initial_budget": amount}
+    )
+
+
+class TestScenarioGrid:
+    """Test scenario_grid composition."""
+
+    def test_cartesian_product(self):
+        grid = scenario_grid(
+            [delay("D10", 1.1), delay("D20", 1.2)],
+            [budget("LOW", 1000.0), budget("HIGH", 5000.0)]
+        )
+
+        assert [s.scenario_id for s in grid] == [
+            "D10__AND__LOW", "D10__AND__HIGH", "D20__AND__LOW", "D20__AND__HIGH"
+        ]
+        assert grid[3].site_overrides == delay("D20", 1.2).site_overrides
+        assert grid[3].trial_overrides == {"initial_budget": 5000.0}
+
+    def test_empty_axis_rejected(self):
+        with pytest.raises(ValueError, match="non-empty"):
+            scenario_grid([delay("D10", 1.1)], [])
+
+
+class TestRunSweep:
+    """Test sweep execution."""
+
+    def setup_method(self):
+        self.trial = make_trial()
+        self.scenarios = [delay("D20", 1.2), delay("D50", 1.5)]
+
+    def test_rows_match_running_by_hand(self):
+        sweep = run_sweep(self.trial, self.scenarios, num_runs=12, master_seed=7)
+
+        assert sweep.scenario_ids == [BASELINE_ID, "D20", "D50"]
+        assert len(sweep.rows) == 36
+
+        engine = SimulationEngine(master_seed=7)
+        for scenario in self.scenarios:
+            by_hand = engine.run(apply_scenario(self.trial, scenario), num_runs=12)
+            rows = sweep.runs_for(scenario.scenario_id)
+            assert [row["run_id"] for row in rows] == list(range(12))
+            assert [row["completion_time"] for row in rows] == \
+                [r.completion_time for r in by_hand.run_results]
+
+    def test_runs_by_scenario_groups_every_scenario(self):
+        sweep = run_sweep(self.trial, self.scenarios, num_runs=5, master_seed=7)
+        grouped = sweep.runs_by_scenario()
+
+        assert list(grouped) == sweep.scenario_ids
+        for scenario_id in sweep.scenario_ids:
+            assert grouped[scenario_id] == sweep.runs_for(scenario_id)
+
+    def test_foreign_executor_matches_serial(self):
+        serial = run_sweep(self.trial, self.scenarios, num_runs=10)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            parallel = run_sweep(self.trial, self.scenarios, num_runs=10, workers=3, executor=executor)
+
+        assert parallel.rows == serial.rows
+        assert parallel.summary_rows() == serial.summary_rows()
+
+    def test_process_pool_matches_serial(self):
+        serial = run_sweep(self.trial, self.scenarios, num_runs=6, sampling="sobol")
+        parallel = run_sweep(self.trial, self.scenarios, num_runs=6, workers=2, sampling="sobol")
+
+        assert parallel.rows == serial.rows
+
+    def test_engine_options_pass_through(self):
+        sweep = run_sweep(
+            self.trial, self.scenarios, num_runs=6, master_seed=7,
+            seed_scheme="legacy", scheduler="calendar", include_baseline=False
+        )
+
+        engine = SimulationEngine(master_seed=7, seed_scheme="legacy")
+        for scenario in self.scenarios:
+            by_hand = engine.run(apply_scenario(self.trial, scenario), num_runs=6, progress=None)
+            assert [row["completion_time"] for row in sweep.runs_for(scenario.scenario_id)] == \
+                [r.completion_time for r in by_hand.run_results]
+
+        with pytest.raises(ValueError, match="seed_scheme"):
+            run_sweep(self.trial, self.scenarios, num_runs=2, seed_scheme="sha1")
+
+    def test_closing_stream_cancels_pending_units(self, monkeypatch):
+        import seleensim.sweep as sweep_module
+
+        started = []
+        original = sweep_module._run_unit
+
+        def run_unit(context, index, run_ids):
+            started.append((index, run_ids))
+            return original(context, index, run_ids)
+
+        monkeypatch.setattr(sweep_module, "_run_unit", run_unit)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            units = iter_sweep(self.trial, self.scenarios, num_runs=20, workers=2, executor=executor)
+            next(units)
+            units.close()
+
+        # One unit finished, at most one more was already running
+        assert len(started) <= 2
+
+    def test_budget_override_applies_per_scenario(self):
+        class BudgetRecorder(Constraint):
+            def __init__(self):
+                self.seen = set()
+
+            def evaluate(self, state, event):
+                self.seen.add(state.budget_available)
+                return ConstraintResult.satisfied()
+
+        recorder = BudgetRecorder()
+        run_sweep(
+            self.trial, [budget("TIGHT", 1234.0)], num_runs=2,
+            initial_budget=5000.0, constraints=[recorder]
+        )
+
+        assert recorder.seen == {5000.0, 1234.0}
+
+    def test_streaming_yields_units(self):
+        units = list(iter_sweep(self.trial, self.scenarios, num_runs=5, include_baseline=False))
+
+        assert sorted(scenario_id for scenario_id, _, _ in units) == ["D20", "D50"]
+        for scenario_id, rows, aggregator in units:
+            assert aggregator.num_runs == len(rows) == 5
+            assert all(row["scenario_id"] == scenario_id for row in rows)
+
+    def test_summary(self):
+        sweep = run_sweep(self.trial, self.scenarios, num_runs=20)
+        summary = {row["scenario_id"]: row for row in sweep.summary_rows()}
+
+        assert summary["D50"]["num_runs"] == 20
+        assert summary["D50"]["completion_time_p90"] >= summary[BASELINE_ID]["completion_time_p10"]
+        assert "D50" in sweep.summary()
+
+    def test_duplicate_ids_rejected(self):
+        with pytest.raises(ValueError, match="unique"):
+            run_sweep(self.trial, [delay("D", 1.1), delay("D", 1.2)], num_runs=2)
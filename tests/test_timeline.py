@@ -0,0 +1,110 @@
+"""
+Tests for columnar timeline storage.
+
+Focus areas:
+1. Compatibility: Rows read back as (time, event_type, entity_id, description)
+2. Interning: Repeated strings stored once, codes index the tables
+3. Growth and compaction preserve contents
+4. Pickling (runs are returned from worker processes)
+"""
+
+import pickle
+
+import pytest
+
+from seleensim.timeline import Timeline
+
+
+class TestTimelineRows:
+    """Test tuple-compatible row access."""
+
+    def test_completion_row_renders_like_legacy_tuple(self):
+        timeline = Timeline()
+        timeline.record(12.5, "site_activation", "SITE001")
+
+        assert timeline[0] == (12.5, "site_activation", "SITE001", "site_activation completed")
+
+    def test_reschedule_and_modify_rows(self):
+        timeline = Timeline()
+        timeline.record(3.0, "site_activation", "S1", Timeline.RESCHEDULED,
+                        arg=45.25, detail="Waiting for predecessor")
+        timeline.record(4.0, "site_activation", "S1", Timeline.MODIFIED,
+                        detail="Budget throttled")
+
+        assert timeline[0] == (
+            3.0, "site_activation_rescheduled", "S1",
+            "Rescheduled to 45.2: Waiting for predecessor"
+        )
+        assert timeline[1] == (
+            4.0, "site_activation_modified", "S1", "Parameters modified: Budget throttled"
+        )
+
+    def test_detail_rendered_lazily(self):
+        class Detail:
+            rendered = 0
+
+            def __str__(self):
+                Detail.rendered += 1
+                return "late"
+
+        timeline = Timeline()
+        timeline.record(1.0, "e", "x", Timeline.MODIFIED, detail=Detail())
+        assert Detail.rendered == 0
+        assert timeline[0][3] == "Parameters modified: late"
+        assert Detail.rendered == 1
+
+    def test_append_custom_tuple(self):
+        timeline = Timeline()
+        timeline.append((7.0, "note", "TRIAL", "free text"))
+
+        assert list(timeline) == [(7.0, "note", "TRIAL", "free text")]
+
+    def test_sequence_protocol(self):
+        timeline = Timeline()
+        for i in range(10):
+            timeline.record(float(i), "e", f"S{i % 3}")
+
+        assert len(timeline) == 10
+        assert timeline[-1][0] == 9.0
+        assert [row[0] for row in timeline[2:5]] == [2.0, 3.0, 4.0]
+        assert [entry[0] for entry in timeline] == [float(i) for i in range(10)]
+        with pytest.raises(IndexError):
+            timeline[10]
+
+
+class TestTimelineColumns:
+    """Test columnar and interned storage."""
+
+    def test_strings_interned(self):
+        timeline = Timeline()
+        for i in range(100):
+            timeline.record(float(i), "site_activation", f"S{i % 4}")
+
+        assert timeline.event_types == ["site_activation"]
+        assert timeline.entities == ["S0", "S1", "S2", "S3"]
+        assert timeline.entity_codes.tolist() == [i % 4 for i in range(100)]
+
+    def test_growth_and_compaction_preserve_rows(self):
+        timeline = Timeline(capacity=2)
+        for i in range(50):
+            timeline.record(i * 0.5, "e", "x")
+        before = list(timeline)
+        timeline.compact()
+
+        assert list(timeline) == before
+        assert timeline.times.tolist() == [i * 0.5 for i in range(50)]
+
+    def test_column_views_are_read_only(self):
+        timeline = Timeline()
+        timeline.record(1.0, "e", "x")
+        with pytest.raises(ValueError):
+            timeline.times[0] = 2.0
+
+    def test_pickle_round_trip(self):
+        timeline = Timeline()
+        timeline.record(1.0, "e", "x")
+        timeline.record(2.0, "e", "y", Timeline.RESCHEDULED, arg=3.0, detail="later")
+
+        restored = pickle.loads(pickle.dumps(timeline))
+        assert restored == timeline
+        assert list(restored) == list(timeline)